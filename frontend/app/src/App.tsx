@@ -79,12 +79,15 @@ import {
   FileURLsResponse,
   ForwardMsg,
   ForwardMsgMetadata,
+  getSupportedArrowCompressions,
   GitInfo,
   IAppPage,
   IGitInfo,
   Initialize,
   Logo,
   NewSession,
+  OptionList,
+  OptionListCache,
   PageConfig,
   PageInfo,
   PageNotFound,
@@ -229,6 +232,12 @@ export class App extends PureComponent<Props, State> {
 
   private pendingElementsTimerRunning: boolean
 
+  /**
+   * Large widget option lists, which the server sends in their own
+   * ForwardMsg and the widgets refer to by hash.
+   */
+  private readonly optionListCache = new OptionListCache()
+
   private readonly componentRegistry: ComponentRegistry
 
   private readonly embeddingId: string = generateUID()
@@ -645,6 +654,8 @@ export class App extends PureComponent<Props, State> {
         parentMessage: (parentMessage: ParentMessage) =>
           this.handleCustomParentMessage(parentMessage),
         logo: (logo: Logo) => this.setState({ appLogo: logo }),
+        optionList: (optionList: OptionList) =>
+          this.optionListCache.add(msgProto.hash, optionList),
       })
     } catch (e) {
       const err = ensureError(e)
@@ -1165,6 +1176,8 @@ export class App extends PureComponent<Props, State> {
         this.widgetMgr.removeInactive(activeWidgetIds)
       }
 
+      this.optionListCache.incrementRunCount()
+
       // Tell the ConnectionManager to increment the message cache run
       // count. This will result in expired ForwardMsgs being removed from
       // the cache.
@@ -1241,6 +1254,7 @@ export class App extends PureComponent<Props, State> {
     deltaMsg: Delta,
     metadataMsg: ForwardMsgMetadata
   ): void => {
+    this.optionListCache.resolveOptions(deltaMsg)
     this.pendingElementsBuffer = this.pendingElementsBuffer.applyDelta(
       this.state.scriptRunId,
       deltaMsg,
@@ -1427,6 +1441,7 @@ export class App extends PureComponent<Props, State> {
           pageScriptHash,
           pageName,
           fragmentId,
+          supportedArrowCompressions: getSupportedArrowCompressions(),
         },
       })
     )
@@ -298,6 +298,51 @@ describe("DefaultStreamlitEndpoints", () => {
     })
   })
 
+  describe("fetchTableRows()", () => {
+    let axiosMock: MockAdapter
+    let endpoints: DefaultStreamlitEndpoints
+
+    beforeEach(() => {
+      axiosMock = new MockAdapter(axios)
+      endpoints = new DefaultStreamlitEndpoints({
+        getServerUri: () => MOCK_SERVER_URI,
+        csrfEnabled: false,
+      })
+    })
+
+    afterEach(() => {
+      axiosMock.restore()
+    })
+
+    it("calls the appropriate endpoint", async () => {
+      const mockRows = new Uint8Array([1, 2, 3])
+
+      axiosMock
+        .onGet(
+          "http://streamlit.mock:80/mock/base/path/_stcore/table?id=mockId&start=10&end=20"
+        )
+        .reply(() => [200, mockRows])
+
+      await expect(endpoints.fetchTableRows("mockId", 10, 20)).resolves.toEqual(
+        mockRows
+      )
+    })
+
+    it("passes the sort order", async () => {
+      const mockRows = new Uint8Array([1, 2, 3])
+
+      axiosMock
+        .onGet(
+          "http://streamlit.mock:80/mock/base/path/_stcore/table?id=mockId&start=0&end=5&sort_column=2&ascending=false"
+        )
+        .reply(() => [200, mockRows])
+
+      await expect(
+        endpoints.fetchTableRows("mockId", 0, 5, 2, false)
+      ).resolves.toEqual(mockRows)
+    })
+  })
+
   // Test our private csrfRequest() API, which is responsible for setting
   // the "X-Xsrftoken" header.
   describe("csrfRequest()", () => {
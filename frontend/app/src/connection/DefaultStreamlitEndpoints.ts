@@ -33,6 +33,7 @@ const MEDIA_ENDPOINT = "/media"
 const UPLOAD_FILE_ENDPOINT = "/_stcore/upload_file"
 const COMPONENT_ENDPOINT_BASE = "/component"
 const FORWARD_MSG_CACHE_ENDPOINT = "/_stcore/message"
+const TABLE_ENDPOINT = "/_stcore/table"
 
 /** Default Streamlit server implementation of the StreamlitEndpoints interface. */
 export class DefaultStreamlitEndpoints implements StreamlitEndpoints {
@@ -161,6 +162,29 @@ export class DefaultStreamlitEndpoints implements StreamlitEndpoints {
     return new Uint8Array(rsp.data)
   }
 
+  public async fetchTableRows(
+    tableId: string,
+    start: number,
+    end: number,
+    sortColumn?: number,
+    ascending = true
+  ): Promise<Uint8Array> {
+    const sortParams =
+      sortColumn === undefined
+        ? ""
+        : `&sort_column=${sortColumn}&ascending=${ascending}`
+    const rsp = await axios.request({
+      url: buildHttpUri(
+        this.requireServerUri(),
+        `${TABLE_ENDPOINT}?id=${tableId}&start=${start}&end=${end}${sortParams}`
+      ),
+      method: "GET",
+      responseType: "arraybuffer",
+    })
+
+    return new Uint8Array(rsp.data)
+  }
+
   /**
    * Fetch the server URI. If our server is disconnected, default to the most
    * recent cached value of the URI. If we're disconnected and have no cached
@@ -20,6 +20,7 @@ import axios from "axios"
 import {
   IHostConfigResponse,
   ForwardMsgCache,
+  decompressArrowData,
   logError,
   logMessage,
   logWarning,
@@ -565,10 +566,9 @@ export class WebsocketConnection {
       len: data.byteLength,
     })
 
-    this.messageQueue[messageIndex] = await this.cache.processMessagePayload(
-      msg,
-      encodedMsg
-    )
+    const payloadMsg = await this.cache.processMessagePayload(msg, encodedMsg)
+    await decompressArrowData(payloadMsg)
+    this.messageQueue[messageIndex] = payloadMsg
 
     PerformanceEvents.record({ name: "GotCachedPayload", messageIndex })
 
@@ -444,6 +444,61 @@ describe("ElementNode.arrowAddRows", () => {
     })
   })
 
+  describe("streamed rows", () => {
+    const schemaLength =
+      8 + new DataView(UNICODE.buffer, UNICODE.byteOffset).getInt32(4, true)
+    const MOCK_STREAMED_DATASET = {
+      hasName: false,
+      name: "",
+      data: { data: UNICODE },
+      maxRows: 3,
+    } as ArrowNamedDataSet
+    const MOCK_STREAMED_DATASET_WITHOUT_SCHEMA = {
+      hasName: false,
+      name: "",
+      data: { data: UNICODE.slice(schemaLength) },
+      maxRows: 3,
+      schemaOmitted: true,
+    } as ArrowNamedDataSet
+
+    test("addRows keeps the last maxRows rows", () => {
+      const node = arrowDataFrame()
+      const newNode = node.arrowAddRows(MOCK_STREAMED_DATASET, NO_SCRIPT_RUN_ID)
+      const q = newNode.quiverElement
+
+      expect(q.index).toEqual([vectorFromArray(["i2", "i1", "i2"])])
+      expect(q.data.toArray().map(a => a?.toArray())).toEqual([
+        ["bar", "2"],
+        ["foo", "1"],
+        ["bar", "2"],
+      ])
+    })
+
+    test("addRows reads rows without a schema with the last schema", () => {
+      const node = arrowDataFrame()
+        .arrowAddRows(MOCK_STREAMED_DATASET, NO_SCRIPT_RUN_ID)
+        .arrowAddRows(MOCK_STREAMED_DATASET_WITHOUT_SCHEMA, NO_SCRIPT_RUN_ID)
+      const q = node.quiverElement
+
+      expect(q.index).toEqual([vectorFromArray(["i2", "i1", "i2"])])
+      expect(q.data.toArray().map(a => a?.toArray())).toEqual([
+        ["bar", "2"],
+        ["foo", "1"],
+        ["bar", "2"],
+      ])
+    })
+
+    test("addRows throws an error for rows without a schema", () => {
+      const node = arrowDataFrame()
+      expect(() =>
+        node.arrowAddRows(
+          MOCK_STREAMED_DATASET_WITHOUT_SCHEMA,
+          NO_SCRIPT_RUN_ID
+        )
+      ).toThrow('The schema of the rows added to "" is missing.')
+    })
+  })
+
   describe("arrowVegaLiteChart", () => {
     const getVegaLiteChart = (
       datasets?: ArrowNamedDataSet[],
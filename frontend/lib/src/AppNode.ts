@@ -142,6 +142,13 @@ export class ElementNode implements AppNode {
 
   private lazyVegaLiteChartElement?: VegaLiteChartElement
 
+  /**
+   * The Arrow schema messages of the datasets that rows are streamed to
+   * (with `add_rows(max_rows=...)`), by dataset name. Rows streamed to a
+   * dataset are only sent with their schema if it changed.
+   */
+  private streamedSchemas: Map<string, Uint8Array> = new Map()
+
   /** Create a new ElementNode. */
   public constructor(
     element: Element,
@@ -263,13 +270,16 @@ export class ElementNode implements AppNode {
       scriptRunId,
       this.fragmentId
     )
+    newNode.streamedSchemas = new Map(this.streamedSchemas)
+    const data = newNode.getAddRowsData(namedDataSet)
 
     switch (elementType) {
       case "arrowTable":
       case "arrowDataFrame": {
         newNode.lazyQuiverElement = ElementNode.quiverAddRowsHelper(
           this.quiverElement,
-          namedDataSet
+          namedDataSet,
+          data
         )
         break
       }
@@ -277,7 +287,8 @@ export class ElementNode implements AppNode {
         newNode.lazyVegaLiteChartElement =
           ElementNode.vegaLiteChartAddRowsHelper(
             this.vegaLiteChartElement,
-            namedDataSet
+            namedDataSet,
+            data
           )
         break
       }
@@ -292,9 +303,39 @@ export class ElementNode implements AppNode {
     return newNode
   }
 
+  /**
+   * Return the Arrow data of the rows to add. If the rows were streamed to
+   * the dataset without their schema, the schema of the rows streamed before
+   * them is prepended to their record batches.
+   */
+  private getAddRowsData(namedDataSet: ArrowNamedDataSet): IArrow {
+    const data = namedDataSet.data as IArrow
+    if (!namedDataSet.maxRows || !data.data) {
+      return data
+    }
+
+    const name = namedDataSet.hasName ? namedDataSet.name : ""
+    if (!namedDataSet.schemaOmitted) {
+      this.streamedSchemas.set(name, getSchemaMessage(data.data))
+      return data
+    }
+
+    const schema = this.streamedSchemas.get(name)
+    if (schema === undefined) {
+      // This should never happen!
+      throw new Error(`The schema of the rows added to "${name}" is missing.`)
+    }
+
+    const stream = new Uint8Array(schema.length + data.data.length)
+    stream.set(schema)
+    stream.set(data.data, schema.length)
+    return { ...data, data: stream }
+  }
+
   private static quiverAddRowsHelper(
     element: Quiver,
-    namedDataSet: ArrowNamedDataSet
+    namedDataSet: ArrowNamedDataSet,
+    data: IArrow
   ): Quiver {
     if (namedDataSet.hasName) {
       throw new Error(
@@ -302,30 +343,58 @@ export class ElementNode implements AppNode {
       )
     }
 
-    const newQuiver = new Quiver(namedDataSet.data as IArrow)
-    return element.addRows(newQuiver)
+    const newQuiver = new Quiver(data)
+    return limitRows(element.addRows(newQuiver), namedDataSet.maxRows)
   }
 
   private static vegaLiteChartAddRowsHelper(
     element: VegaLiteChartElement,
-    namedDataSet: ArrowNamedDataSet
+    namedDataSet: ArrowNamedDataSet,
+    data: IArrow
   ): VegaLiteChartElement {
     const newDataSetName = namedDataSet.hasName ? namedDataSet.name : null
-    const newDataSetQuiver = new Quiver(namedDataSet.data as IArrow)
+    const newDataSetQuiver = new Quiver(data)
+    const { maxRows } = namedDataSet
 
     return produce(element, (draft: VegaLiteChartElement) => {
       const existingDataSet = getNamedDataSet(draft.datasets, newDataSetName)
       if (existingDataSet) {
-        existingDataSet.data = existingDataSet.data.addRows(newDataSetQuiver)
+        existingDataSet.data = limitRows(
+          existingDataSet.data.addRows(newDataSetQuiver),
+          maxRows
+        )
       } else {
-        draft.data = draft.data
-          ? draft.data.addRows(newDataSetQuiver)
-          : newDataSetQuiver
+        draft.data = limitRows(
+          draft.data ? draft.data.addRows(newDataSetQuiver) : newDataSetQuiver,
+          maxRows
+        )
       }
     })
   }
 }
 
+/**
+ * Keep the last maxRows rows of a dataset that rows are streamed to.
+ * A maxRows of 0 means that the dataset isn't limited.
+ */
+function limitRows(quiver: Quiver, maxRows: number): Quiver {
+  return maxRows > 0 ? quiver.lastRows(maxRows) : quiver
+}
+
+/**
+ * Return the schema message that starts an Arrow IPC stream.
+ *
+ * An encapsulated message starts with a 0xFFFFFFFF continuation marker and
+ * the int32 length of its metadata. A schema message has no body.
+ * See https://arrow.apache.org/docs/format/Columnar.html#encapsulated-message-format
+ */
+function getSchemaMessage(stream: Uint8Array): Uint8Array {
+  const view = new DataView(stream.buffer, stream.byteOffset, stream.byteLength)
+  const prefixLength = view.getInt32(0, true) === -1 ? 8 : 4
+  const metadataLength = view.getInt32(prefixLength - 4, true)
+  return stream.slice(0, prefixLength + metadataLength)
+}
+
 /**
  * If there is only one NamedDataSet, return it.
  * If there is a NamedDataset that matches the given name, return it.
@@ -0,0 +1,76 @@
+/**
+ * Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import { Delta, OptionList } from "./proto"
+import { OptionListCache } from "./OptionListCache"
+
+function createSelectboxDelta(optionsHash: string): Delta {
+  return Delta.fromObject({
+    newElement: { selectbox: { label: "label", optionsHash } },
+  })
+}
+
+test("resolves options by hash", () => {
+  const cache = new OptionListCache()
+  cache.add("hash", OptionList.fromObject({ options: ["a", "b"] }))
+
+  const delta = createSelectboxDelta("hash")
+  cache.resolveOptions(delta)
+  expect(delta.newElement?.selectbox?.options).toEqual(["a", "b"])
+})
+
+test("resolves options of multiselect and radio widgets", () => {
+  const cache = new OptionListCache()
+  cache.add("hash", OptionList.fromObject({ options: ["a", "b"] }))
+
+  const multiselectDelta = Delta.fromObject({
+    newElement: { multiselect: { optionsHash: "hash" } },
+  })
+  cache.resolveOptions(multiselectDelta)
+  expect(multiselectDelta.newElement?.multiselect?.options).toEqual(["a", "b"])
+
+  const radioDelta = Delta.fromObject({
+    newElement: { radio: { optionsHash: "hash" } },
+  })
+  cache.resolveOptions(radioDelta)
+  expect(radioDelta.newElement?.radio?.options).toEqual(["a", "b"])
+})
+
+test("leaves inline options unchanged", () => {
+  const cache = new OptionListCache()
+  cache.add("hash", OptionList.fromObject({ options: ["a", "b"] }))
+
+  const delta = Delta.fromObject({
+    newElement: { selectbox: { options: ["c"] } },
+  })
+  cache.resolveOptions(delta)
+  expect(delta.newElement?.selectbox?.options).toEqual(["c"])
+})
+
+test("expires option lists after two script runs", () => {
+  const cache = new OptionListCache()
+  cache.add("hash", OptionList.fromObject({ options: ["a", "b"] }))
+
+  cache.incrementRunCount()
+  const delta = createSelectboxDelta("hash")
+  cache.resolveOptions(delta)
+  expect(delta.newElement?.selectbox?.options).toEqual(["a", "b"])
+
+  cache.incrementRunCount()
+  const expiredDelta = createSelectboxDelta("hash")
+  cache.resolveOptions(expiredDelta)
+  expect(expiredDelta.newElement?.selectbox?.options).toEqual([])
+})
@@ -0,0 +1,72 @@
+/**
+ * Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import { Delta, OptionList } from "./proto"
+import { logWarning } from "./util/log"
+
+/**
+ * Holds the large option lists of selectbox, multiselect and radio widgets.
+ *
+ * The server sends such a list in an OptionList ForwardMsg, right before
+ * the Delta of the widget that uses it. The widget only carries the hash of
+ * that ForwardMsg in its `optionsHash` field, and `resolveOptions` puts the
+ * options back into the widget before the Delta is applied.
+ */
+export class OptionListCache {
+  /** Option lists received during the current script run. */
+  private current = new Map<string, string[]>()
+
+  /** Option lists received during the previous script run. */
+  private previous = new Map<string, string[]>()
+
+  /**
+   * Store the options of an OptionList ForwardMsg with the given hash.
+   */
+  public add(hash: string, optionList: OptionList): void {
+    this.current.set(hash, optionList.options)
+  }
+
+  /**
+   * If the Delta is a widget that refers to an option list by hash, fill in
+   * its options.
+   */
+  public resolveOptions(delta: Delta): void {
+    const element = delta.newElement
+    const widget = element?.selectbox || element?.multiselect || element?.radio
+    if (!widget?.optionsHash) {
+      return
+    }
+
+    const options =
+      this.current.get(widget.optionsHash) ??
+      this.previous.get(widget.optionsHash)
+    if (options === undefined) {
+      logWarning(`Missing option list [hash=${widget.optionsHash}]`)
+      return
+    }
+    widget.options = options
+  }
+
+  /**
+   * Remove the option lists that weren't received during the current or the
+   * previous script run. This should be called after the script has finished
+   * running.
+   */
+  public incrementRunCount(): void {
+    this.previous = this.current
+    this.current = new Map()
+  }
+}
@@ -100,6 +100,25 @@ export interface StreamlitEndpoints {
    */
   fetchCachedForwardMsg(hash: string): Promise<Uint8Array>
 
+  /**
+   * Fetch rows of a paged table from the server.
+   *
+   * @param tableId the table's ID
+   * @param start the position of the first row to fetch
+   * @param end the position after the last row to fetch
+   * @param sortColumn optional position of the column to sort the rows by
+   * @param ascending whether to sort the rows in ascending order
+   *
+   * @return a Promise<Uint8Array> that resolves with the rows as Arrow IPC data.
+   */
+  fetchTableRows?(
+    tableId: string,
+    start: number,
+    end: number,
+    sortColumn?: number,
+    ascending?: boolean
+  ): Promise<Uint8Array>
+
   /**
    * Set JWT Header.
    * @param jwtHeader the object that contains jwtHeaderName and jwtHeaderValue
@@ -464,6 +464,7 @@ const RawElementNodeRenderer = (
         <ArrowDataFrame
           element={arrowProto}
           data={node.quiverElement as Quiver}
+          endpoints={props.endpoints}
           // Arrow dataframe can be used as a widget (data_editor) or
           // an element (dataframe). We only want to set the key in case of
           // it being used as a widget. For the non-widget usage, the id will
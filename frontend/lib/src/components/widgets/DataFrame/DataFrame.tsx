@@ -37,6 +37,7 @@ import { FormClearHelper } from "@streamlit/lib/src/components/widgets/Form"
 import { withFullScreenWrapper } from "@streamlit/lib/src/components/shared/FullScreenWrapper"
 import { Quiver } from "@streamlit/lib/src/dataframes/Quiver"
 import { Arrow as ArrowProto } from "@streamlit/lib/src/proto"
+import { StreamlitEndpoints } from "@streamlit/lib/src/StreamlitEndpoints"
 import {
   WidgetInfo,
   WidgetStateManager,
@@ -60,6 +61,7 @@ import {
   useCustomRenderer,
   useDataExporter,
   useSelectionHandler,
+  usePagedTable,
 } from "./hooks"
 import {
   BORDER_THRESHOLD,
@@ -114,6 +116,7 @@ export interface DataFrameProps {
   collapse?: () => void
   disableFullscreenMode?: boolean
   fragmentId?: string
+  endpoints?: StreamlitEndpoints
 }
 
 /**
@@ -126,6 +129,7 @@ export interface DataFrameProps {
  * @param disabled - Whether the widget is disabled
  * @param widgetMgr - The widget manager
  * @param isFullScreen - Whether the widget is in full screen mode
+ * @param endpoints - The endpoints used to fetch the rows of paged tables
  */
 function DataFrame({
   element,
@@ -139,6 +143,7 @@ function DataFrame({
   expand,
   collapse,
   fragmentId,
+  endpoints,
 }: Readonly<DataFrameProps>): ReactElement {
   const resizableRef = React.useRef<Resizable>(null)
   const dataEditorRef = React.useRef<DataEditorRef>(null)
@@ -183,9 +188,19 @@ function DataFrame({
 
   const { READ_ONLY, DYNAMIC } = ArrowProto.EditingMode
 
+  // For large tables, the server might only send the first rows. The other
+  // rows are fetched when they are displayed.
+  const { pagedTable, pagedTableVersion, setPagedTableSort } = usePagedTable(
+    element,
+    data,
+    endpoints
+  )
+
   // Number of rows of the table minus 1 for the header row:
   const dataDimensions = data.dimensions
-  const originalNumRows = Math.max(0, dataDimensions.rows - 1)
+  const originalNumRows = pagedTable
+    ? pagedTable.numRows
+    : Math.max(0, dataDimensions.rows - 1)
 
   // For empty tables, we show an extra row that
   // contains "empty" as a way to indicate that the table is empty.
@@ -258,11 +273,18 @@ function DataFrame({
     data,
     originalColumns,
     numRows,
-    editingState
+    editingState,
+    pagedTable,
+    pagedTableVersion
   )
 
   const { columns, sortColumn, getOriginalIndex, getCellContent } =
-    useColumnSort(originalNumRows, originalColumns, getOriginalCellContent)
+    useColumnSort(
+      originalNumRows,
+      originalColumns,
+      getOriginalCellContent,
+      pagedTable ? setPagedTableSort : undefined
+    )
 
   /**
    * This callback is used to synchronize the selection state with the state
@@ -716,14 +738,14 @@ function DataFrame({
             }}
           />
         )}
-        {!isLargeTable && !isEmptyTable && (
+        {!isLargeTable && !isEmptyTable && !pagedTable && (
           <ToolbarAction
             label={"Download as CSV"}
             icon={FileDownload}
             onClick={() => exportToCsv()}
           />
         )}
-        {!isEmptyTable && (
+        {!isEmptyTable && !pagedTable && (
           <ToolbarAction
             label={"Search"}
             icon={Search}
@@ -814,7 +836,11 @@ function DataFrame({
           // Search needs to be activated manually, to support search
           // via the toolbar:
           onKeyDown={event => {
-            if ((event.ctrlKey || event.metaKey) && event.key === "f") {
+            if (
+              (event.ctrlKey || event.metaKey) &&
+              event.key === "f" &&
+              !pagedTable
+            ) {
               setShowSearch(cv => !cv)
               event.stopPropagation()
               event.preventDefault()
@@ -827,9 +853,14 @@ function DataFrame({
           }}
           // Header click is used for column sorting:
           onHeaderClicked={(colIndex: number, _event) => {
-            if (isEmptyTable || isLargeTable || isColumnSelectionActivated) {
-              // Deactivate sorting for empty state, for large dataframes, or
-              // when column selection is activated.
+            if (
+              isEmptyTable ||
+              (isLargeTable && !pagedTable) ||
+              isColumnSelectionActivated
+            ) {
+              // Deactivate sorting for empty state, for large dataframes
+              // (unless the server sorts them), or when column selection is
+              // activated.
               return
             }
 
@@ -0,0 +1,119 @@
+/**
+ * Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import { TEN_BY_TEN } from "@streamlit/lib/src/mocks/arrow"
+import { Quiver } from "@streamlit/lib/src/dataframes/Quiver"
+
+import PagedTable, { MAX_CACHED_PAGES } from "./PagedTable"
+
+// Wait for the pending fetch promises to resolve.
+const flushPromises = (): Promise<void> =>
+  new Promise(resolve => setTimeout(resolve, 0))
+
+describe("PagedTable", () => {
+  // The first page has 10 rows, so all pages have 10 rows.
+  const firstPage = new Quiver({ data: TEN_BY_TEN })
+
+  let fetchRows: jest.Mock
+  let onPageLoaded: jest.Mock
+  let pagedTable: PagedTable
+
+  beforeEach(() => {
+    fetchRows = jest.fn().mockResolvedValue(TEN_BY_TEN)
+    onPageLoaded = jest.fn()
+    pagedTable = new PagedTable(
+      "tableId",
+      1000,
+      firstPage,
+      fetchRows,
+      onPageLoaded
+    )
+  })
+
+  it("returns rows of the first page without fetching", () => {
+    expect(pagedTable.getRow(5)).toEqual([firstPage, 5])
+    expect(fetchRows).not.toHaveBeenCalled()
+  })
+
+  it("fetches pages that are not loaded", async () => {
+    expect(pagedTable.getRow(25)).toBeUndefined()
+    expect(fetchRows).toHaveBeenCalledWith(
+      "tableId",
+      20,
+      30,
+      undefined,
+      undefined
+    )
+
+    await flushPromises()
+
+    expect(onPageLoaded).toHaveBeenCalledTimes(1)
+    const row = pagedTable.getRow(25)
+    expect(row).toBeDefined()
+    expect(row?.[1]).toBe(5)
+  })
+
+  it("fetches a page only once", async () => {
+    pagedTable.getRow(25)
+    pagedTable.getRow(26)
+    await flushPromises()
+    pagedTable.getRow(27)
+
+    expect(fetchRows).toHaveBeenCalledTimes(1)
+  })
+
+  it("fetches sorted pages and ignores pages of the previous sort", async () => {
+    pagedTable.getRow(25)
+    expect(pagedTable.setSort({ column: 2, ascending: false })).toBe(true)
+    await flushPromises()
+
+    expect(onPageLoaded).not.toHaveBeenCalled()
+    expect(pagedTable.getRow(5)).toBeUndefined()
+    expect(fetchRows).toHaveBeenLastCalledWith("tableId", 0, 10, 2, false)
+
+    // Sorting in the same order again keeps the loaded pages:
+    await flushPromises()
+    expect(pagedTable.setSort({ column: 2, ascending: false })).toBe(false)
+    expect(pagedTable.getRow(5)).toBeDefined()
+
+    // Removing the sort restores the first page:
+    pagedTable.setSort(undefined)
+    expect(pagedTable.getRow(5)).toEqual([firstPage, 5])
+  })
+
+  it("drops the least recently used pages", async () => {
+    for (let page = 1; page <= MAX_CACHED_PAGES; page++) {
+      pagedTable.getRow(page * 10)
+      // eslint-disable-next-line no-await-in-loop
+      await flushPromises()
+    }
+
+    // The first page was dropped:
+    expect(pagedTable.getRow(0)).toBeUndefined()
+    expect(pagedTable.getRow(MAX_CACHED_PAGES * 10)).toBeDefined()
+  })
+
+  it("doesn't fetch a failed page again", async () => {
+    fetchRows.mockRejectedValue(new Error("Not found"))
+
+    pagedTable.getRow(25)
+    await flushPromises()
+    pagedTable.getRow(25)
+
+    expect(fetchRows).toHaveBeenCalledTimes(1)
+    expect(onPageLoaded).not.toHaveBeenCalled()
+  })
+})
@@ -0,0 +1,163 @@
+/**
+ * Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import { Quiver } from "@streamlit/lib/src/dataframes/Quiver"
+import { IArrow } from "@streamlit/lib/src/proto"
+import { logWarning } from "@streamlit/lib/src/util/log"
+
+// The maximum number of pages kept in memory. The least recently used pages
+// are dropped first.
+export const MAX_CACHED_PAGES = 20
+
+/**
+ * The sort order of a paged table.
+ */
+export interface PagedTableSort {
+  // The position of the column in the Arrow data (index columns first):
+  column: number
+  ascending: boolean
+}
+
+export type FetchTableRows = (
+  tableId: string,
+  start: number,
+  end: number,
+  sortColumn?: number,
+  ascending?: boolean
+) => Promise<Uint8Array>
+
+/**
+ * A table whose rows are kept on the server. The rows are fetched in pages
+ * when they are displayed, and only a bounded number of pages is kept in
+ * memory. The server sorts the rows.
+ */
+class PagedTable {
+  private readonly tableId: string
+
+  public readonly numRows: number
+
+  private readonly firstPage: Quiver
+
+  // The number of rows of each page, which is the number of rows that the
+  // server sent along with the element.
+  private readonly pageRows: number
+
+  private readonly fetchRows: FetchTableRows
+
+  private readonly onPageLoaded: () => void
+
+  // Map of page index -> page, in the order the pages were last used:
+  private pages = new Map<number, Quiver>()
+
+  private requestedPages = new Set<number>()
+
+  private sort?: PagedTableSort
+
+  // Incremented whenever the sort order changes, to ignore the pages that
+  // were requested with the previous sort order.
+  private sortVersion = 0
+
+  constructor(
+    tableId: string,
+    numRows: number,
+    firstPage: Quiver,
+    fetchRows: FetchTableRows,
+    onPageLoaded: () => void
+  ) {
+    this.tableId = tableId
+    this.numRows = numRows
+    this.firstPage = firstPage
+    this.pageRows = Math.max(1, firstPage.dimensions.dataRows)
+    this.fetchRows = fetchRows
+    this.onPageLoaded = onPageLoaded
+    this.pages.set(0, firstPage)
+  }
+
+  /**
+   * Return the page that contains the given row and the position of the row
+   * in the page, or undefined if the page is not loaded yet. In that case,
+   * the page is requested from the server.
+   */
+  public getRow(row: number): [Quiver, number] | undefined {
+    const pageIndex = Math.floor(row / this.pageRows)
+    const page = this.pages.get(pageIndex)
+    if (page === undefined) {
+      this.requestPage(pageIndex)
+      return undefined
+    }
+
+    // Move the page to the end of the map, as the most recently used one:
+    this.pages.delete(pageIndex)
+    this.pages.set(pageIndex, page)
+    return [page, row - pageIndex * this.pageRows]
+  }
+
+  /**
+   * Change the sort order of the rows. The loaded pages are dropped if the
+   * sort order changed.
+   *
+   * @returns true if the sort order changed.
+   */
+  public setSort(sort: PagedTableSort | undefined): boolean {
+    if (
+      this.sort?.column === sort?.column &&
+      this.sort?.ascending === sort?.ascending
+    ) {
+      return false
+    }
+
+    this.sort = sort
+    this.sortVersion += 1
+    this.pages = new Map()
+    this.requestedPages = new Set()
+    if (sort === undefined) {
+      this.pages.set(0, this.firstPage)
+    }
+    return true
+  }
+
+  private requestPage(pageIndex: number): void {
+    if (this.requestedPages.has(pageIndex)) {
+      return
+    }
+    this.requestedPages.add(pageIndex)
+
+    const { sortVersion, sort } = this
+    const start = pageIndex * this.pageRows
+    const end = Math.min(start + this.pageRows, this.numRows)
+    this.fetchRows(this.tableId, start, end, sort?.column, sort?.ascending)
+      .then(data => {
+        if (sortVersion !== this.sortVersion) {
+          return
+        }
+
+        this.pages.set(pageIndex, new Quiver({ data } as IArrow))
+        this.requestedPages.delete(pageIndex)
+        while (this.pages.size > MAX_CACHED_PAGES) {
+          // Drop the least recently used page:
+          this.pages.delete(this.pages.keys().next().value)
+        }
+        this.onPageLoaded()
+      })
+      .catch(error => {
+        // The page stays requested, so that it isn't fetched over and over
+        // again while it's displayed.
+        logWarning(`Unable to fetch rows of table ${this.tableId}: ${error}`)
+      })
+  }
+}
+
+export default PagedTable
@@ -25,3 +25,4 @@ export { default as useTooltips } from "./useTooltips"
 export { default as useCustomRenderer } from "./useCustomRenderer"
 export { default as useDataExporter } from "./useDataExporter"
 export { default as useSelectionHandler } from "./useSelectionHandler"
+export { default as usePagedTable } from "./usePagedTable"
@@ -27,6 +27,7 @@ import {
   BaseColumn,
   toGlideColumn,
 } from "@streamlit/lib/src/components/widgets/DataFrame/columns"
+import { PagedTableSort } from "@streamlit/lib/src/components/widgets/DataFrame/PagedTable"
 
 /**
  * Configuration type for column sorting hook.
@@ -75,6 +76,9 @@ type ColumnSortReturn = {
  *
  * @param numRows - The number of rows in the table.
  * @param columns - The columns of the table.
+ * @param getCellContent - The function that returns the content of a cell.
+ * @param onServerSort - If defined, the rows are sorted by the server instead,
+ *   and this function is called whenever the sort order changes.
  *
  * @returns An object containing the following properties:
  * - `columns`: The updated list of columns.
@@ -85,7 +89,8 @@ type ColumnSortReturn = {
 function useColumnSort(
   numRows: number,
   columns: BaseColumn[],
-  getCellContent: ([col, row]: readonly [number, number]) => GridCell
+  getCellContent: ([col, row]: readonly [number, number]) => GridCell,
+  onServerSort?: (sort: PagedTableSort | undefined) => void
 ): ColumnSortReturn {
   const [sort, setSort] = React.useState<ColumnSortConfig>()
 
@@ -94,9 +99,26 @@ function useColumnSort(
       columns: columns.map(column => toGlideColumn(column)),
       getCellContent,
       rows: numRows,
-      sort,
+      // Sorting on the client requires the content of all cells:
+      sort: onServerSort ? undefined : sort,
     })
 
+  React.useEffect(() => {
+    if (!onServerSort) {
+      return
+    }
+    const sortedColumn =
+      sort && columns.find(column => column.id === sort.column.id)
+    onServerSort(
+      sortedColumn
+        ? {
+            column: sortedColumn.indexNumber,
+            ascending: sort?.direction !== "desc",
+          }
+        : undefined
+    )
+  }, [sort, columns, onServerSort])
+
   const updatedColumns = React.useMemo(() => {
     return updateSortingHeader(columns, sort)
   }, [columns, sort])
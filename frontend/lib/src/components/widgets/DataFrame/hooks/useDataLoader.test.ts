@@ -28,6 +28,7 @@ import {
   isErrorCell,
 } from "@streamlit/lib/src/components/widgets/DataFrame/columns"
 import EditingState from "@streamlit/lib/src/components/widgets/DataFrame/EditingState"
+import PagedTable from "@streamlit/lib/src/components/widgets/DataFrame/PagedTable"
 
 import useDataLoader from "./useDataLoader"
 
@@ -163,4 +164,37 @@ describe("useDataLoader hook", () => {
       MOCK_COLUMNS[1].getCellValue(result.current.getCellContent([1, 0]))
     ).toEqual("bar")
   })
+
+  it("loads the rows of a paged table", () => {
+    const element = ArrowProto.create({
+      data: UNICODE,
+    })
+    const data = new Quiver(element)
+    const fetchRows = jest.fn().mockReturnValue(new Promise(() => {}))
+    // The first page has 2 rows:
+    const pagedTable = new PagedTable("tableId", 4, data, fetchRows, jest.fn())
+
+    const { result } = renderHook(() => {
+      const editingState = React.useRef<EditingState>(new EditingState(4))
+      return useDataLoader(data, MOCK_COLUMNS, 4, editingState, pagedTable, 0)
+    })
+
+    // Rows of the first page:
+    expect(
+      MOCK_COLUMNS[1].getCellValue(result.current.getCellContent([1, 1]))
+    ).toBe("bar")
+    expect(fetchRows).not.toHaveBeenCalled()
+
+    // Rows of the second page are loading:
+    expect(result.current.getCellContent([1, 2]).kind).toBe(
+      GridCellKind.Loading
+    )
+    expect(fetchRows).toHaveBeenCalledWith(
+      "tableId",
+      2,
+      4,
+      undefined,
+      undefined
+    )
+  })
 })
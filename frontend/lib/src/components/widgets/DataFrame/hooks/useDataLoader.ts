@@ -16,12 +16,17 @@
 
 import React from "react"
 
-import { GridCell, DataEditorProps } from "@glideapps/glide-data-grid"
+import {
+  GridCell,
+  GridCellKind,
+  DataEditorProps,
+} from "@glideapps/glide-data-grid"
 
 import { notNullOrUndefined } from "@streamlit/lib/src/util/utils"
 import { Quiver } from "@streamlit/lib/src/dataframes/Quiver"
 import { getCellFromArrow } from "@streamlit/lib/src/components/widgets/DataFrame/arrowUtils"
 import EditingState from "@streamlit/lib/src/components/widgets/DataFrame/EditingState"
+import PagedTable from "@streamlit/lib/src/components/widgets/DataFrame/PagedTable"
 import {
   BaseColumn,
   getErrorCell,
@@ -36,6 +41,8 @@ type DataLoaderReturn = Pick<DataEditorProps, "getCellContent">
  * @param data - The Arrow data extracted from the proto message
  * @param numRows - The number of rows of the current state (includes row additions/deletions)
  * @param editingState - The editing state of the data editor
+ * @param pagedTable - The paged table to load the rows from, if the table is paged
+ * @param pagedTableVersion - Changes whenever rows of the paged table were loaded
  *
  * @returns the columns and the cell content getter compatible with glide-data-grid.
  */
@@ -43,7 +50,9 @@ function useDataLoader(
   data: Quiver,
   columns: BaseColumn[],
   numRows: number,
-  editingState: React.MutableRefObject<EditingState>
+  editingState: React.MutableRefObject<EditingState>,
+  pagedTable?: PagedTable,
+  pagedTableVersion?: number
 ): DataLoaderReturn {
   const getCellContent = React.useCallback(
     ([col, row]: readonly [number, number]): GridCell => {
@@ -85,6 +94,18 @@ function useDataLoader(
       }
 
       try {
+        if (pagedTable) {
+          const pagedRow = pagedTable.getRow(originalRow)
+          if (pagedRow === undefined) {
+            // The row is being fetched from the server.
+            return { kind: GridCellKind.Loading, allowOverlay: false }
+          }
+          const [page, pageRow] = pagedRow
+          // Arrow has the header in first row
+          const arrowCell = page.getCell(pageRow + 1, originalCol)
+          return getCellFromArrow(column, arrowCell, page.cssStyles)
+        }
+
         // Arrow has the header in first row
         const arrowCell = data.getCell(originalRow + 1, originalCol)
         return getCellFromArrow(column, arrowCell, data.cssStyles)
@@ -95,7 +116,10 @@ function useDataLoader(
         )
       }
     },
-    [columns, numRows, data, editingState]
+    // pagedTableVersion is a dependency to redraw the cells once rows were
+    // loaded:
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+    [columns, numRows, data, editingState, pagedTable, pagedTableVersion]
   )
 
   return {
@@ -0,0 +1,85 @@
+/**
+ * Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import React from "react"
+
+import { Quiver } from "@streamlit/lib/src/dataframes/Quiver"
+import { Arrow as ArrowProto } from "@streamlit/lib/src/proto"
+import { StreamlitEndpoints } from "@streamlit/lib/src/StreamlitEndpoints"
+import PagedTable, {
+  PagedTableSort,
+} from "@streamlit/lib/src/components/widgets/DataFrame/PagedTable"
+
+type PagedTableReturn = {
+  pagedTable: PagedTable | undefined
+  // Incremented whenever rows were loaded or the sort order changed, so that
+  // the displayed cells are redrawn:
+  pagedTableVersion: number
+  setPagedTableSort: (sort: PagedTableSort | undefined) => void
+}
+
+/**
+ * Custom hook that creates the paged table of the element, if the server
+ * only sent the first rows of the table.
+ *
+ * @param element - The element's proto message
+ * @param data - The Arrow data extracted from the proto message (the first page)
+ * @param endpoints - The endpoints used to fetch the other rows
+ *
+ * @returns the paged table, or undefined if the table isn't paged.
+ */
+function usePagedTable(
+  element: ArrowProto,
+  data: Quiver,
+  endpoints?: StreamlitEndpoints
+): PagedTableReturn {
+  const [pagedTableVersion, setPagedTableVersion] = React.useState(0)
+
+  const tableId = element.pagedTable?.id
+  const numRows = element.pagedTable?.numRows ?? 0
+
+  const pagedTable = React.useMemo(() => {
+    if (!tableId || !endpoints?.fetchTableRows) {
+      // Without the endpoint, only the first page is displayed.
+      return undefined
+    }
+
+    return new PagedTable(
+      tableId,
+      numRows,
+      data,
+      endpoints.fetchTableRows.bind(endpoints),
+      () => setPagedTableVersion(version => version + 1)
+    )
+  }, [tableId, numRows, data, endpoints])
+
+  const setPagedTableSort = React.useCallback(
+    (sort: PagedTableSort | undefined) => {
+      if (pagedTable?.setSort(sort)) {
+        setPagedTableVersion(version => version + 1)
+      }
+    },
+    [pagedTable]
+  )
+
+  return {
+    pagedTable,
+    pagedTableVersion,
+    setPagedTableSort,
+  }
+}
+
+export default usePagedTable
@@ -1833,4 +1833,61 @@ describe("Quiver", () => {
       })
     })
   })
+
+  describe("Last rows", () => {
+    test("range", () => {
+      const mockElement = { data: RANGE }
+      const q = new Quiver(mockElement)
+
+      const qq = q.addRows(q).lastRows(3)
+
+      expect(qq.index).toEqual([[1, 2, 3]])
+      expect(qq.data.toArray().map(a => a?.toArray())).toEqual([
+        ["bar", "2"],
+        ["foo", "1"],
+        ["bar", "2"],
+      ])
+      expect(qq.types.index[0].meta).toEqual({
+        start: 1,
+        step: 1,
+        stop: 4,
+        kind: "range",
+        name: null,
+      })
+
+      // Rows added after the last rows continue the range index.
+      expect(qq.addRows(q).index).toEqual([[1, 2, 3, 4, 5]])
+    })
+
+    test("unicode", () => {
+      const mockElement = { data: UNICODE }
+      const q = new Quiver(mockElement)
+
+      const qq = q.addRows(q).lastRows(3)
+
+      expect(qq.index).toEqual([vectorFromArray(["i2", "i1", "i2"])])
+      expect(qq.columns).toEqual([["c1", "c2"]])
+      expect(qq.data.toArray().map(a => a?.toArray())).toEqual([
+        ["bar", "2"],
+        ["foo", "1"],
+        ["bar", "2"],
+      ])
+    })
+
+    it("returns the same table if it has at most maxRows rows", () => {
+      const mockElement = { data: UNICODE }
+      const q = new Quiver(mockElement)
+
+      expect(q.lastRows(2)).toBe(q)
+    })
+
+    it("does not mutate the original element", () => {
+      const mockElement = { data: UNICODE }
+      const q = new Quiver(mockElement)
+      const qClone = cloneDeep(q)
+
+      q.lastRows(1)
+      expect(q).toEqual(qClone)
+    })
+  })
 })
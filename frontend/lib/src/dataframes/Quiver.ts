@@ -467,7 +467,20 @@ export class Quiver {
       // This should never happen!
       throw new Error("Table schema is missing.")
     }
-    return JSON.parse(schema)
+    const parsedSchema: Schema = JSON.parse(schema)
+
+    // Rows that are streamed to a dataset can be read with the schema of
+    // other rows of the dataset, so the stop of a "range" index is set from
+    // the number of rows of the table.
+    parsedSchema.index_columns = parsedSchema.index_columns.map(indexName =>
+      Quiver.isRangeIndex(indexName)
+        ? {
+            ...indexName,
+            stop: indexName.start + table.numRows * indexName.step,
+          }
+        : indexName
+    )
+    return parsedSchema
   }
 
   /** Get unprocessed column names for data columns. Needed for selecting
@@ -1410,6 +1423,40 @@ st.add_rows(my_styler.data)
     })
   }
 
+  /**
+   * Keep the last maxRows rows of this table (data + indexes), and drop the
+   * rows before them.
+   */
+  public lastRows(maxRows: number): Quiver {
+    const numRows = this._data.numRows
+    if (numRows <= maxRows) {
+      return this
+    }
+
+    const offset = numRows - maxRows
+    const index = this._index.map(indexValue => indexValue.slice(offset))
+    const data = this._data.slice(offset)
+    const types = {
+      ...this._types,
+      index: this._types.index.map(indexType => {
+        if (indexType.pandas_type !== IndexTypeName.RangeIndex) {
+          return indexType
+        }
+        const { start, step } = indexType.meta as RangeIndex
+        return {
+          ...indexType,
+          meta: { ...indexType.meta, start: start + offset * step },
+        }
+      }),
+    }
+
+    return produce(this, (draft: Quiver) => {
+      draft._index = index
+      draft._data = data
+      draft._types = types
+    })
+  }
+
   private static parseFields(schema: ArrowSchema): Record<string, Field> {
     // None-index data columns are listed first, and all index columns listed last
     // within the fields array in arrow.
@@ -0,0 +1,123 @@
+/**
+ * Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import { gzipSync } from "zlib"
+import { DecompressionStream as NodeDecompressionStream } from "stream/web"
+
+import { Arrow, ForwardMsg } from "@streamlit/lib/src/proto"
+
+import {
+  decompressArrowData,
+  getSupportedArrowCompressions,
+} from "./arrowDataCompression"
+
+const DATA = new Uint8Array([1, 2, 3, 4, 5, 6, 7, 8])
+
+describe("arrowDataCompression", () => {
+  const originalDecompressionStream = globalThis.DecompressionStream
+
+  beforeAll(() => {
+    // jsdom doesn't provide DecompressionStream, but node does.
+    globalThis.DecompressionStream =
+      NodeDecompressionStream as unknown as typeof DecompressionStream
+  })
+
+  afterAll(() => {
+    globalThis.DecompressionStream = originalDecompressionStream
+  })
+
+  it("supports gzip if the browser can decompress it", () => {
+    expect(getSupportedArrowCompressions()).toEqual([
+      Arrow.DataCompression.GZIP,
+    ])
+  })
+
+  it("decompresses the data of a dataframe", async () => {
+    const msg = ForwardMsg.fromObject({
+      delta: {
+        newElement: {
+          arrowDataFrame: {
+            data: gzipSync(DATA),
+            dataCompression: Arrow.DataCompression.GZIP,
+          },
+        },
+      },
+    })
+
+    await decompressArrowData(msg)
+
+    const arrow = msg.delta?.newElement?.arrowDataFrame
+    expect(arrow?.data).toEqual(DATA)
+    expect(arrow?.dataCompression).toBe(Arrow.DataCompression.NONE)
+  })
+
+  it("decompresses the data and datasets of a chart", async () => {
+    const msg = ForwardMsg.fromObject({
+      delta: {
+        newElement: {
+          arrowVegaLiteChart: {
+            data: {
+              data: gzipSync(DATA),
+              dataCompression: Arrow.DataCompression.GZIP,
+            },
+            datasets: [
+              {
+                name: "dataset",
+                data: {
+                  data: gzipSync(DATA),
+                  dataCompression: Arrow.DataCompression.GZIP,
+                },
+              },
+            ],
+          },
+        },
+      },
+    })
+
+    await decompressArrowData(msg)
+
+    const chart = msg.delta?.newElement?.arrowVegaLiteChart
+    expect(chart?.data?.data).toEqual(DATA)
+    expect(chart?.datasets?.[0].data?.data).toEqual(DATA)
+  })
+
+  it("decompresses added rows", async () => {
+    const msg = ForwardMsg.fromObject({
+      delta: {
+        arrowAddRows: {
+          data: {
+            data: gzipSync(DATA),
+            dataCompression: Arrow.DataCompression.GZIP,
+          },
+        },
+      },
+    })
+
+    await decompressArrowData(msg)
+
+    expect(msg.delta?.arrowAddRows?.data?.data).toEqual(DATA)
+  })
+
+  it("leaves uncompressed data unchanged", async () => {
+    const msg = ForwardMsg.fromObject({
+      delta: { newElement: { arrowTable: { data: DATA } } },
+    })
+
+    await decompressArrowData(msg)
+
+    expect(msg.delta?.newElement?.arrowTable?.data).toEqual(DATA)
+  })
+})
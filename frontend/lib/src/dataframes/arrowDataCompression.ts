@@ -0,0 +1,98 @@
+/**
+ * Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import { Arrow, ForwardMsg, IArrow } from "@streamlit/lib/src/proto"
+
+/**
+ * Return the compressions of Arrow data that the browser can decompress, to
+ * send them to the server in the ClientState.
+ */
+export function getSupportedArrowCompressions(): Arrow.DataCompression[] {
+  return typeof DecompressionStream === "undefined"
+    ? []
+    : [Arrow.DataCompression.GZIP]
+}
+
+/** Return the Arrow protos of the message, which may have compressed data. */
+function getArrowProtos(msg: ForwardMsg): IArrow[] {
+  const { delta } = msg
+  if (!delta) {
+    return []
+  }
+
+  if (delta.arrowAddRows?.data) {
+    return [delta.arrowAddRows.data]
+  }
+
+  const element = delta.newElement
+  if (element?.arrowDataFrame) {
+    return [element.arrowDataFrame]
+  }
+  if (element?.arrowTable) {
+    return [element.arrowTable]
+  }
+  if (element?.arrowVegaLiteChart) {
+    const chart = element.arrowVegaLiteChart
+    const datasets = (chart.datasets ?? []).map(dataset => dataset.data)
+    return [chart.data, ...datasets].filter(
+      (data): data is IArrow => data != null
+    )
+  }
+  return []
+}
+
+async function gunzip(data: Uint8Array): Promise<Uint8Array> {
+  const stream = new DecompressionStream("gzip")
+  const writer = stream.writable.getWriter()
+  // Don't await the write: it only resolves once the output is read.
+  writer.write(data).catch(() => {})
+  writer.close().catch(() => {})
+
+  const chunks: Uint8Array[] = []
+  const reader = stream.readable.getReader()
+  for (;;) {
+    // eslint-disable-next-line no-await-in-loop
+    const { done, value } = await reader.read()
+    if (done) {
+      break
+    }
+    chunks.push(value)
+  }
+
+  const result = new Uint8Array(
+    chunks.reduce((length, chunk) => length + chunk.length, 0)
+  )
+  let offset = 0
+  chunks.forEach(chunk => {
+    result.set(chunk, offset)
+    offset += chunk.length
+  })
+  return result
+}
+
+/**
+ * Decompress the Arrow data of a dataframe or chart message in place, if the
+ * server compressed it. The elements can then read the data as usual.
+ */
+export async function decompressArrowData(msg: ForwardMsg): Promise<void> {
+  for (const arrow of getArrowProtos(msg)) {
+    if (arrow.dataCompression === Arrow.DataCompression.GZIP && arrow.data) {
+      // eslint-disable-next-line no-await-in-loop
+      arrow.data = await gunzip(arrow.data)
+      arrow.dataCompression = Arrow.DataCompression.NONE
+    }
+  }
+}
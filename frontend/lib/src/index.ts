@@ -82,6 +82,11 @@ export {
 } from "./components/shared/BaseButton"
 export { PerformanceEvents } from "./profiler/PerformanceEvents"
 export { ForwardMsgCache } from "./ForwardMessageCache"
+export { OptionListCache } from "./OptionListCache"
+export {
+  decompressArrowData,
+  getSupportedArrowCompressions,
+} from "./dataframes/arrowDataCompression"
 export { default as Resolver } from "./util/Resolver"
 export {
   mockSessionInfo,
@@ -633,6 +633,75 @@ _create_option(
     type_=str,
 )
 
+_create_option(
+    "runner.maxCacheSize",
+    description="""
+        Max total size, in megabytes, of the values that st.cache_data and
+        st.cache_resource functions keep in memory.
+
+        When the caches use more memory than this, Streamlit removes the
+        least-recently-used entries from the cache of the function that uses
+        the most memory. st.cache_resource functions only count toward this
+        limit if they set max_bytes. Set to 0 to disable the limit.
+    """,
+    default_val=0,
+    type_=int,
+)
+
+_create_option(
+    "runner.maxDiskCacheSize",
+    description="""
+        Max total size, in megabytes, of the values that st.cache_data
+        functions with persist="disk" keep on disk.
+
+        When the disk cache uses more space than this, Streamlit removes the
+        least-recently-used entries of all cached functions. Set to 0 to
+        disable the limit.
+    """,
+    default_val=0,
+    type_=int,
+)
+
+_create_option(
+    "runner.sharedCachePath",
+    description="""
+        Path of a database file in which st.cache_data functions keep their
+        entries, shared by every Streamlit process that uses the same path.
+
+        With several Streamlit processes on one host, a value computed by one
+        process is then a cache hit for the others, and processes don't each
+        keep their own copy of every entry. Entries are kept across restarts,
+        and are removed by `streamlit cache clear`.
+
+        Leave unset to keep entries in the memory of each process (and in
+        ~/.streamlit/cache for functions with persist="disk").
+    """,
+    default_val=None,
+    type_=str,
+)
+
+_create_option(
+    "runner.sharedCacheLeaseTimeout",
+    description="""
+        With runner.sharedCachePath, how long, in seconds, the other Streamlit
+        processes wait for the process computing a missing st.cache_data
+        value before computing it themselves.
+    """,
+    default_val=60,
+    type_=int,
+)
+
+_create_option(
+    "runner.sharedCacheStaleWhileRevalidate",
+    description="""
+        With runner.sharedCachePath, whether st.cache_data functions return
+        their expired value while another process recomputes it, rather than
+        waiting for the new value.
+    """,
+    default_val=False,
+    type_=bool,
+)
+
 # Config Section: Server #
 
 _create_section("server", "Settings for the Streamlit server")
@@ -807,6 +876,23 @@ _create_option(
     type_=int,
 )
 
+_create_option(
+    "server.maxWebsocketBufferSize",
+    description="""
+        Max size, in megabytes, of the data waiting to be written to each WebSocket
+        connection.
+
+        When a client can't keep up and its connection has more than this much data
+        waiting, Streamlit stops sending it new messages until it catches up. In the
+        meantime, newer updates to an element replace older, unsent ones, and once
+        the unsent messages of a session exceed this size too, its script pauses
+        until they're sent.
+        Set to 0 to disable the limit.
+        """,
+    default_val=16,
+    type_=int,
+)
+
 _create_option(
     "server.enableArrowTruncation",
     description="""
@@ -819,6 +905,71 @@ _create_option(
     type_=bool,
 )
 
+_create_option(
+    "server.arrowTruncationMode",
+    description="""
+        Which rows are kept when a table is truncated because of
+        `server.enableArrowTruncation`.
+
+        Allowed values:
+        * "head"     : Keep the first rows.
+        * "headTail" : Keep the first and the last rows.
+        * "sample"   : Keep rows evenly spread over the table.
+        """,
+    visibility="hidden",
+    default_val="head",
+    scriptable=True,
+    type_=str,
+)
+
+_create_option(
+    "server.enableArrowPaging",
+    description="""
+        Enable sending only the first rows of large tables displayed with `st.dataframe`.
+        The server keeps the tables, and the frontend fetches the other rows when they
+        are scrolled into view, sorting them on the server.
+        """,
+    visibility="hidden",
+    default_val=False,
+    scriptable=True,
+    type_=bool,
+)
+
+_create_option(
+    "server.enableArrowChunking",
+    description="""
+        Enable sending large tables displayed with `st.dataframe` in chunks of rows.
+        The first chunk is sent with the element, and the other chunks are appended
+        to it as they are serialized.
+        """,
+    visibility="hidden",
+    default_val=False,
+    scriptable=True,
+    type_=bool,
+)
+
+_create_option(
+    "server.enableArrowCompression",
+    description="""
+        Enable compressing the Arrow data of dataframes and charts before it's sent
+        to the browser, if the browser supports decompressing it.
+        """,
+    visibility="hidden",
+    default_val=False,
+    type_=bool,
+)
+
+_create_option(
+    "server.arrowCompressionThreshold",
+    description="""
+        The minimum size, in bytes, of the Arrow data of a dataframe or chart to
+        compress it. Only used if server.enableArrowCompression is set.
+        """,
+    visibility="hidden",
+    default_val=1_000_000,
+    type_=int,
+)
+
 _create_option(
     "server.enableWebsocketCompression",
     description="""
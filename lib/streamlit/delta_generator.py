@@ -556,6 +556,8 @@ class DeltaGenerator(
     def _arrow_add_rows(
         self: DG,
         data: Data = None,
+        *,
+        max_rows: int | None = None,
         **kwargs: (
             DataFrame | npt.NDArray[Any] | Iterable[Any] | dict[Hashable, Any] | None
         ),
@@ -571,6 +573,13 @@ class DeltaGenerator(
             The named dataset to concat. Optional. You can only pass in 1
             dataset (including the one in the data parameter).
 
+        max_rows : int or None
+            If set, keep only the last ``max_rows`` rows of the dataset after
+            adding the rows to it. Use this to stream data to a live chart or
+            table, without its data growing without limit. The rows of such
+            streams are also sent to the browser more compactly. If None
+            (default), all rows are kept.
+
         Example
         -------
         >>> import streamlit as st
@@ -620,6 +629,11 @@ class DeltaGenerator(
         if not self._cursor.is_locked:
             raise StreamlitAPIException("Only existing elements can `add_rows`.")
 
+        if max_rows is not None and max_rows < 1:
+            raise StreamlitAPIException(
+                f"The max_rows of add_rows must be at least 1, not {max_rows}."
+            )
+
         # Accept syntax st._arrow_add_rows(df).
         if data is not None and len(kwargs) == 0:
             name = ""
@@ -657,8 +671,17 @@ class DeltaGenerator(
 
         import streamlit.elements.arrow as arrow_proto
 
-        default_uuid = str(hash(self._get_delta_path_str()))
-        arrow_proto.marshall(msg.delta.arrow_add_rows.data, new_data, default_uuid)
+        # Remember the schema last sent for each dataset that rows are streamed to,
+        # so that it's only sent to the client again if it changes.
+        schemas = self._cursor.props.setdefault("add_rows_schemas", {})
+        if max_rows is None:
+            default_uuid = str(hash(self._get_delta_path_str()))
+            arrow_proto.marshall(msg.delta.arrow_add_rows.data, new_data, default_uuid)
+            schemas.pop(name, None)
+        else:
+            schemas[name] = arrow_proto.marshall_streamed_rows(
+                msg.delta.arrow_add_rows, new_data, max_rows, schemas.get(name)
+            )
 
         if name:
             msg.delta.arrow_add_rows.name = name
@@ -668,6 +691,22 @@ class DeltaGenerator(
 
         return self
 
+    def _enqueue_arrow_rows(self, data: bytes) -> None:
+        """Append rows that are already serialized to Arrow IPC bytes to the
+        element of this DeltaGenerator.
+
+        This is used to send a large table in chunks, so it doesn't go through
+        the checks and conversions of `add_rows`.
+        """
+        if self._root_container is None or self._cursor is None:
+            return
+
+        msg = ForwardMsg_pb2.ForwardMsg()
+        msg.metadata.delta_path[:] = self._cursor.delta_path
+        msg.delta.arrow_add_rows.data.data = data
+        msg.delta.arrow_add_rows.is_chunk = True
+        _enqueue_message(msg)
+
 
 main_dg = DeltaGenerator(root_container=RootContainer.MAIN)
 sidebar_dg = DeltaGenerator(root_container=RootContainer.SIDEBAR, parent=main_dg)
@@ -701,6 +740,11 @@ def _prep_data_for_add_rows(
     add_rows_metadata: AddRowsMetadata | None,
 ) -> tuple[Data, AddRowsMetadata | None]:
     if not add_rows_metadata:
+        if type_util.is_arrow_data_object(data):
+            # Arrow data is marshalled directly, without converting it to pandas.
+            table = type_util.try_convert_arrow_data_object_to_table(data)
+            if table is not None:
+                return table, None
         # When calling add_rows on st.table or st.dataframe we want styles to pass through.
         return type_util.convert_anything_to_df(data, allow_styler=True), None
 
@@ -22,6 +22,7 @@ from typing import (
     Dict,
     Final,
     Iterable,
+    Iterator,
     List,
     Literal,
     Set,
@@ -33,7 +34,7 @@ from typing import (
 
 from typing_extensions import TypeAlias
 
-from streamlit import type_util
+from streamlit import config, runtime, type_util
 from streamlit.elements.lib.column_config_utils import (
     INDEX_IDENTIFIER,
     ColumnConfigMappingInput,
@@ -46,6 +47,9 @@ from streamlit.elements.lib.event_utils import AttributeDictionary
 from streamlit.elements.lib.pandas_styler_utils import marshall_styler
 from streamlit.errors import StreamlitAPIException
 from streamlit.proto.Arrow_pb2 import Arrow as ArrowProto
+from streamlit.proto.ArrowNamedDataSet_pb2 import (
+    ArrowNamedDataSet as ArrowNamedDataSetProto,
+)
 from streamlit.runtime.metrics_util import gather_metrics
 from streamlit.runtime.scriptrunner import get_script_run_ctx
 from streamlit.runtime.state import WidgetCallback, register_widget
@@ -72,6 +76,14 @@ Data: TypeAlias = Union[
     None,
 ]
 
+# With server.enableArrowPaging, tables with more rows than this are paged.
+_PAGED_TABLE_MIN_ROWS: Final = 10000
+# The number of rows sent along with a paged table.
+_PAGED_TABLE_FIRST_PAGE_ROWS: Final = 1000
+# With server.enableArrowChunking, tables whose data is larger than this are sent
+# in chunks of about this size.
+_ARROW_CHUNK_BYTES: Final = 4 * 1024 * 1024
+
 SelectionMode: TypeAlias = Literal[
     "single-row", "multi-row", "single-column", "multi-column"
 ]
@@ -409,9 +421,37 @@ class ArrowMixin:
 
         proto.editing_mode = ArrowProto.EditingMode.READ_ONLY
 
+        # Row selections refer to the rows displayed by the frontend, so
+        # they can't be used with paged tables, which the server sorts.
+        is_paging_enabled = (
+            not is_selection_activated
+            and config.get_option("server.enableArrowPaging")
+            and runtime.exists()
+        )
+        # The ID of a dataframe with selections is computed from its data, so
+        # all of its rows are sent along with the element.
+        is_chunking_enabled = (
+            not is_selection_activated
+            and config.get_option("server.enableArrowChunking")
+            and runtime.exists()
+        )
+        # The chunks of rows that are appended to the element after it's sent:
+        remaining_chunks: Iterator[bytes] = iter(())
+
+        if type_util.is_arrow_data_object(data):
+            # Serialize Arrow data directly, without converting it to pandas.
+            table = type_util.try_convert_arrow_data_object_to_table(data)
+            if table is not None:
+                data = table
+
         if isinstance(data, pa.Table):
-            # For pyarrow tables, we can just serialize the table directly
-            proto.data = type_util.pyarrow_table_to_bytes(data)
+            if is_paging_enabled and _is_pageable(data):
+                marshall_paged_table(proto, data, self.dg._get_delta_path_str())
+            elif is_chunking_enabled and data.nbytes > _ARROW_CHUNK_BYTES:
+                remaining_chunks = marshall_chunked_table(proto, data)
+            else:
+                # For pyarrow tables, we can just serialize the table directly
+                proto.data = type_util.pyarrow_table_to_bytes(data)
         else:
             # For all other data formats, we need to convert them to a pandas.DataFrame
             # thereby, we also apply some data specific configs
@@ -435,8 +475,27 @@ class ArrowMixin:
                 data_format,
                 check_arrow_compatibility=False,
             )
-            # Serialize the data to bytes:
-            proto.data = type_util.data_frame_to_bytes(data_df)
+            if (
+                is_paging_enabled
+                and not type_util.is_pandas_styler(data)
+                and data_df.shape[0] > _PAGED_TABLE_MIN_ROWS
+            ):
+                # Store the index in the table's columns, so that each window
+                # of rows keeps its index values.
+                marshall_paged_table(
+                    proto,
+                    type_util.data_frame_to_pyarrow_table(data_df, preserve_index=True),
+                    self.dg._get_delta_path_str(),
+                )
+            elif is_chunking_enabled and not type_util.is_pandas_styler(data):
+                table = type_util.data_frame_to_pyarrow_table(data_df)
+                if table.nbytes > _ARROW_CHUNK_BYTES:
+                    remaining_chunks = marshall_chunked_table(proto, table)
+                else:
+                    proto.data = type_util.pyarrow_table_to_bytes(table)
+            else:
+                # Serialize the data to bytes:
+                proto.data = type_util.data_frame_to_bytes(data_df)
 
         if hide_index is not None:
             update_column_config(
@@ -483,7 +542,12 @@ class ArrowMixin:
             self.dg._enqueue("arrow_data_frame", proto)
             return cast(DataframeState, widget_state.value)
         else:
-            return self.dg._enqueue("arrow_data_frame", proto)
+            element_dg = self.dg._enqueue("arrow_data_frame", proto)
+            # Enqueueing a chunk waits until it's written to the client, so the
+            # next chunk is only serialized after that.
+            for chunk in remaining_chunks:
+                element_dg._enqueue_arrow_rows(chunk)
+            return element_dg
 
     @gather_metrics("table")
     def table(self, data: Data = None) -> DeltaGenerator:
@@ -529,7 +593,9 @@ class ArrowMixin:
         return self.dg._enqueue("arrow_table", proto)
 
     @gather_metrics("add_rows")
-    def add_rows(self, data: Data = None, **kwargs) -> DeltaGenerator | None:
+    def add_rows(
+        self, data: Data = None, *, max_rows: int | None = None, **kwargs
+    ) -> DeltaGenerator | None:
         """Concatenate a dataframe to the bottom of the current one.
 
         Parameters
@@ -541,6 +607,13 @@ class ArrowMixin:
             The named dataset to concat. Optional. You can only pass in 1
             dataset (including the one in the data parameter).
 
+        max_rows : int or None
+            If set, keep only the last ``max_rows`` rows of the dataset after
+            adding the rows to it. Use this to stream data to a live chart or
+            table, without its data growing without limit. The rows of such
+            streams are also sent to the browser more compactly. If None
+            (default), all rows are kept.
+
         Example
         -------
         >>> import streamlit as st
@@ -580,7 +653,7 @@ class ArrowMixin:
         >>> my_chart.add_rows(some_fancy_name=df2)  # <-- name used as keyword
 
         """
-        return self.dg._arrow_add_rows(data, **kwargs)
+        return self.dg._arrow_add_rows(data, max_rows=max_rows, **kwargs)
 
     @property
     def dg(self) -> DeltaGenerator:
@@ -615,8 +688,127 @@ def marshall(proto: ArrowProto, data: Data, default_uuid: str | None = None) ->
         ), "Default UUID must be a string for Styler data."
         marshall_styler(proto, data, default_uuid)
 
+    if type_util.is_arrow_data_object(data):
+        # Serialize Arrow data directly, without converting it to pandas.
+        table = type_util.try_convert_arrow_data_object_to_table(data)
+        if table is not None:
+            data = table
+
     if isinstance(data, pa.Table):
         proto.data = type_util.pyarrow_table_to_bytes(data)
     else:
         df = type_util.convert_anything_to_df(data)
         proto.data = type_util.data_frame_to_bytes(df)
+
+
+def marshall_streamed_rows(
+    proto: ArrowNamedDataSetProto,
+    data: Data,
+    max_rows: int,
+    previous_schema: bytes | None,
+) -> bytes | None:
+    """Marshall the last max_rows rows of data into the ArrowNamedDataSet proto
+    of an add_rows that streams to a dataset, and return the schema to pass as
+    previous_schema for the next rows of the dataset.
+
+    Parameters
+    ----------
+    proto : proto.ArrowNamedDataSet
+        Output. The protobuf for the dataset of the add_rows.
+
+    data : pandas.DataFrame, pyarrow.Table, numpy.ndarray, Iterable, dict, or None
+        Something that is or can be converted to a dataframe. Styles of a
+        pandas.Styler are dropped.
+
+    max_rows : int
+        The maximum number of rows of the dataset.
+
+    previous_schema : bytes or None
+        The schema returned for the previous rows of the dataset, if any. If the
+        rows have the same schema, it isn't sent again.
+
+    """
+    import pyarrow as pa
+
+    if type_util.is_arrow_data_object(data):
+        table = type_util.try_convert_arrow_data_object_to_table(data)
+        if table is not None:
+            data = table
+
+    if isinstance(data, pa.Table):
+        table = data
+    else:
+        df = type_util.convert_anything_to_df(data)
+        table = type_util.data_frame_to_pyarrow_table(df)
+
+    (
+        proto.data.data,
+        schema,
+        proto.schema_omitted,
+    ) = type_util.pyarrow_table_to_streamed_rows_bytes(table, max_rows, previous_schema)
+    proto.max_rows = max_rows
+    # Slicing keeps the batches of the table, so these are the batches that
+    # were serialized.
+    proto.batch_rows.extend(
+        batch.num_rows
+        for batch in table.slice(max(table.num_rows - max_rows, 0)).to_batches()
+    )
+    return schema
+
+
+def marshall_chunked_table(proto: ArrowProto, table: pa.Table) -> Iterator[bytes]:
+    """Marshall the first chunk of rows of a pyarrow.Table into an Arrow proto,
+    and return the other chunks, which are serialized when they are requested.
+
+    Parameters
+    ----------
+    proto : proto.Arrow
+        Output. The protobuf for Streamlit Arrow proto.
+
+    table : pyarrow.Table
+        The table to display.
+
+    """
+    chunks = type_util.pyarrow_table_to_bytes_chunks(table, _ARROW_CHUNK_BYTES)
+    proto.data = next(chunks)
+    return chunks
+
+
+def _is_pageable(table: pa.Table) -> bool:
+    """Return True if the table has enough rows to be paged, and its index is
+    stored in its columns.
+    """
+    pandas_metadata = table.schema.pandas_metadata
+    return (
+        table.num_rows > _PAGED_TABLE_MIN_ROWS
+        and pandas_metadata is not None
+        and all(
+            # A RangeIndex is only stored as metadata.
+            isinstance(index_column, str)
+            for index_column in pandas_metadata.get("index_columns", [])
+        )
+    )
+
+
+def marshall_paged_table(proto: ArrowProto, table: pa.Table, coordinates: str) -> None:
+    """Marshall the first rows of a pyarrow.Table into an Arrow proto, and keep
+    the table on the server, so that the frontend can fetch the other rows.
+
+    Parameters
+    ----------
+    proto : proto.Arrow
+        Output. The protobuf for Streamlit Arrow proto.
+
+    table : pyarrow.Table
+        The table to display. Its index must be stored in its columns.
+
+    coordinates : str
+        The location of the element in the app.
+
+    """
+    table_id = runtime.get_instance().paged_table_mgr.add(table, coordinates)
+    proto.paged_table.id = table_id
+    proto.paged_table.num_rows = table.num_rows
+    proto.data = type_util.pyarrow_table_to_bytes(
+        table.slice(0, _PAGED_TABLE_FIRST_PAGE_ROWS)
+    )
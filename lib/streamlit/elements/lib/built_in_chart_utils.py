@@ -25,11 +25,14 @@ from typing import (
     Collection,
     Final,
     Hashable,
+    Literal,
     Sequence,
     TypedDict,
     cast,
 )
 
+from typing_extensions import TypeAlias
+
 from streamlit import type_util
 from streamlit.color_util import (
     Color,
@@ -42,12 +45,17 @@ from streamlit.errors import Error, StreamlitAPIException
 
 if TYPE_CHECKING:
     import altair as alt
+    import numpy as np
+    import numpy.typing as npt
     import pandas as pd
 
     from streamlit.elements.arrow import Data
     from streamlit.type_util import DataFrameCompatible
 
 
+DownsampleMethod: TypeAlias = Literal["lttb", "min-max"]
+
+
 class PrepDataColumns(TypedDict):
     """Columns used for the prep_data step in Altair Arrow charts."""
 
@@ -106,6 +114,10 @@ _SEPARATED_INDEX_COLUMN_NAME: Final = _SEPARATED_INDEX_COLUMN_TITLE + _PROTECTIO
 _MELTED_Y_COLUMN_NAME: Final = _MELTED_Y_COLUMN_TITLE + _PROTECTION_SUFFIX
 _MELTED_COLOR_COLUMN_NAME: Final = _MELTED_COLOR_COLUMN_TITLE + _PROTECTION_SUFFIX
 
+# Number of points each series is downsampled to when the chart's width isn't set. This
+# is about the width of a wide-mode chart, in pixels.
+_DEFAULT_DOWNSAMPLED_POINTS: Final = 1000
+
 # Name we use for a column we know doesn't exist in the data, to address a Vega-Lite rendering bug
 # where empty charts need x, y encodings set in order to take up space.
 _NON_EXISTENT_COLUMN_NAME: Final = "DOES_NOT_EXIST" + _PROTECTION_SUFFIX
@@ -120,10 +132,17 @@ def generate_chart(
     size_from_user: str | float | None = None,
     width: int = 0,
     height: int = 0,
+    downsample: DownsampleMethod | None = None,
 ) -> tuple[alt.Chart, AddRowsMetadata]:
     """Function to use the chart's type, data columns and indices to figure out the chart's spec."""
     import altair as alt
 
+    if downsample not in (None, "lttb", "min-max"):
+        raise StreamlitAPIException(
+            f'Invalid downsample value: "{downsample}". '
+            'Must be "lttb", "min-max" or None.'
+        )
+
     df = type_util.convert_anything_to_df(data, ensure_copy=True)
 
     # From now on, use "df" instead of "data". Deleting "data" to guarantee we follow this.
@@ -157,21 +176,40 @@ def generate_chart(
     # At this point, all foo_column variables are either None/empty or contain actual
     # columns that are guaranteed to exist.
 
-    df, x_column, y_column, color_column, size_column = _prep_data(
+    df, x_column, y_column, color_column, size_column, columns_to_fold = _prep_data(
         df, x_column, y_column_list, color_column, size_column
     )
 
     # At this point, x_column is only None if user did not provide one AND df is empty.
 
+    if downsample is not None:
+        df = _downsample(
+            df,
+            x_column,
+            columns_to_fold or ([] if y_column is None else [y_column]),
+            color_column,
+            downsample,
+            width if width > 0 else _DEFAULT_DOWNSAMPLED_POINTS,
+        )
+
     # Create a Chart with x and y encodings.
     chart = alt.Chart(
         data=df,
         mark=chart_type.value["mark_type"],
         width=width,
         height=height,
-    ).encode(
+    )
+
+    # Let Vega-Lite convert the data from wide format into long format.
+    if columns_to_fold:
+        chart = chart.transform_fold(
+            [_escape_field_name(column) for column in columns_to_fold],
+            as_=[_MELTED_COLOR_COLUMN_NAME, _MELTED_Y_COLUMN_NAME],
+        )
+
+    chart = chart.encode(
         x=_get_x_encoding(df, x_column, x_from_user, chart_type),
-        y=_get_y_encoding(df, y_column, y_from_user),
+        y=_get_y_encoding(df, y_column, y_from_user, columns_to_fold),
     )
 
     # Set up opacity encoding.
@@ -212,8 +250,9 @@ def prep_chart_data_for_add_rows(
 ) -> tuple[Data, AddRowsMetadata]:
     """Prepares the data for add_rows on our built-in charts.
 
-    This includes aspects like conversion of the data to Pandas DataFrame,
-    changes to the index, and melting the data if needed.
+    This includes aspects like conversion of the data to Pandas DataFrame and
+    changes to the index. The data stays in wide format, like the chart's data,
+    since the chart's spec converts it into long format.
     """
     import pandas as pd
 
@@ -255,11 +294,13 @@ def _prep_data(
     y_column_list: list[str],
     color_column: str | None,
     size_column: str | None,
-) -> tuple[pd.DataFrame, str | None, str | None, str | None, str | None]:
+) -> tuple[pd.DataFrame, str | None, str | None, str | None, str | None, list[str]]:
     """Prepares the data for charting. This is also used in add_rows.
 
     Returns the prepared dataframe and the new names of the x column (taking the index reset into
-    consideration) and y, color, and size columns.
+    consideration) and y, color, and size columns. If several y columns are charted, the
+    last returned value is the list of columns that the chart needs to fold into the
+    returned y and color columns.
     """
 
     # If y is provided, but x is not, we'll use the index as x.
@@ -284,13 +325,170 @@ def _prep_data(
         selected_data, x_column, y_column_list, color_column, size_column
     )
 
-    # Maybe melt data from wide format into long format.
-    melted_data, y_column, color_column = _maybe_melt(
-        selected_data, x_column, y_column_list, color_column, size_column
+    # Maybe fold the data from wide format into long format in the chart.
+    y_column, color_column, columns_to_fold = _maybe_fold(
+        selected_data, x_column, y_column_list, color_column
     )
 
     # Return the data, but also the new names to use for x, y, and color.
-    return melted_data, x_column, y_column, color_column, size_column
+    return (
+        selected_data,
+        x_column,
+        y_column,
+        color_column,
+        size_column,
+        columns_to_fold,
+    )
+
+
+def _downsample(
+    df: pd.DataFrame,
+    x_column: str | None,
+    y_columns: list[str],
+    color_column: str | None,
+    method: DownsampleMethod,
+    num_points: int,
+) -> pd.DataFrame:
+    """Reduce each series of the chart to about num_points points.
+
+    A series is a y column, or the rows of a y column with the same value in the color
+    column. The returned data has the union of the rows picked for each series. Data
+    that can't be placed on a numeric x axis, like strings, isn't downsampled.
+    """
+    import numpy as np
+
+    if x_column is None or not y_columns or len(df) <= num_points:
+        return df
+
+    x_values = _get_numeric_values(df[x_column])
+    y_values_list = [_get_numeric_values(df[y_column]) for y_column in y_columns]
+    if x_values is None or any(y_values is None for y_values in y_values_list):
+        return df
+
+    if color_column is not None and color_column in df.columns:
+        groups = list(
+            df.groupby(color_column, sort=False, dropna=False).indices.values()
+        )
+    else:
+        groups = [np.arange(len(df))]
+
+    pick_indices = _lttb_indices if method == "lttb" else _min_max_indices
+    picked_rows = []
+
+    for rows in groups:
+        # Both algorithms walk through the points of a series in order of x.
+        rows = rows[np.argsort(x_values[rows], kind="stable")]
+        for y_values in y_values_list:
+            indices = pick_indices(
+                x_values[rows],
+                cast("npt.NDArray[np.float64]", y_values)[rows],
+                num_points,
+            )
+            picked_rows.append(rows[indices])
+
+    return df.iloc[np.unique(np.concatenate(picked_rows))].reset_index(drop=True)
+
+
+def _get_numeric_values(series: pd.Series) -> npt.NDArray[np.float64] | None:
+    """Return the values of the series as floats, or None if they aren't numbers or
+    datetimes."""
+    import numpy as np
+    from pandas.api.types import (
+        is_bool_dtype,
+        is_datetime64_any_dtype,
+        is_numeric_dtype,
+    )
+
+    if is_datetime64_any_dtype(series):
+        values = series.to_numpy(dtype="datetime64[ns]")
+        return np.where(np.isnat(values), np.nan, values.view(np.int64)).astype(
+            np.float64
+        )
+    if is_numeric_dtype(series) and not is_bool_dtype(series):
+        return cast(
+            "npt.NDArray[np.float64]",
+            series.to_numpy(dtype=np.float64, na_value=np.nan),
+        )
+    return None
+
+
+def _lttb_indices(
+    x: npt.NDArray[np.float64], y: npt.NDArray[np.float64], num_points: int
+) -> npt.NDArray[np.intp]:
+    """Pick num_points points of a series with the Largest-Triangle-Three-Buckets
+    algorithm, which keeps the visual shape of the line.
+
+    The first and last points are always kept. The points in between are split into
+    buckets, and each bucket keeps the point that forms the largest triangle with the
+    point kept in the previous bucket and the average of the next bucket.
+    """
+    import numpy as np
+
+    num_values = len(x)
+    if num_points >= num_values or num_points < 3:
+        return np.arange(num_values)
+
+    # Bucket i covers the points in [edges[i], edges[i + 1]).
+    edges = np.linspace(1, num_values - 1, num_points - 1).astype(np.intp)
+    counts = np.diff(edges)
+    # Average point of each bucket, followed by the last point.
+    average_x = np.append(np.add.reduceat(x[:-1], edges[:-1]) / counts, x[-1])
+    average_y = np.append(np.add.reduceat(y[:-1], edges[:-1]) / counts, y[-1])
+
+    indices = np.empty(num_points, dtype=np.intp)
+    indices[0] = 0
+    indices[-1] = num_values - 1
+    previous = 0
+
+    for bucket in range(num_points - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        previous_x, previous_y = x[previous], y[previous]
+        # Twice the triangle areas, which is enough to compare them.
+        areas = np.abs(
+            (previous_x - average_x[bucket + 1]) * (y[start:end] - previous_y)
+            - (previous_x - x[start:end]) * (average_y[bucket + 1] - previous_y)
+        )
+        previous = start + int(np.argmax(areas))
+        indices[bucket + 1] = previous
+
+    return indices
+
+
+def _min_max_indices(
+    x: npt.NDArray[np.float64], y: npt.NDArray[np.float64], num_points: int
+) -> npt.NDArray[np.intp]:
+    """Pick about num_points points of a series by splitting it into buckets and
+    keeping the points with the smallest and largest y of each bucket, which keeps
+    every peak of the line.
+    """
+    import numpy as np
+
+    num_values = len(x)
+    num_buckets = num_points // 2
+    if num_points >= num_values or num_buckets < 1:
+        return np.arange(num_values)
+
+    edges = np.linspace(0, num_values, num_buckets + 1).astype(np.intp)[:-1]
+    counts = np.diff(edges, append=num_values)
+    bucket_ids = np.repeat(np.arange(num_buckets), counts)
+
+    # fmin and fmax ignore NaNs, unlike minimum and maximum.
+    indices = [
+        _first_index_per_bucket(y == np.repeat(extremes, counts), bucket_ids)
+        for extremes in (np.fmin.reduceat(y, edges), np.fmax.reduceat(y, edges))
+    ]
+    return cast("npt.NDArray[np.intp]", np.unique(np.concatenate(indices)))
+
+
+def _first_index_per_bucket(
+    mask: npt.NDArray[np.bool_], bucket_ids: npt.NDArray[np.intp]
+) -> npt.NDArray[np.intp]:
+    """Return the index of the first True value of the mask in each bucket."""
+    import numpy as np
+
+    indices = np.flatnonzero(mask)
+    buckets = bucket_ids[indices]
+    return indices[np.flatnonzero(np.diff(buckets, prepend=-1))]
 
 
 def _last_index_for_melted_dataframes(
@@ -332,87 +530,36 @@ def _is_date_column(df: pd.DataFrame, name: str | None) -> bool:
     return isinstance(column.iloc[0], date)
 
 
-def _melt_data(
-    df: pd.DataFrame,
-    columns_to_leave_alone: list[str],
-    columns_to_melt: list[str] | None,
-    new_y_column_name: str,
-    new_color_column_name: str,
-) -> pd.DataFrame:
-    """Converts a wide-format dataframe to a long-format dataframe.
-
-    You can find more info about melting on the Pandas documentation:
-    https://pandas.pydata.org/docs/reference/api/pandas.melt.html
-
-    Parameters
-    ----------
-    df : pd.DataFrame
-        The dataframe to melt.
-    columns_to_leave_alone : list[str]
-        The columns to leave as they are.
-    columns_to_melt : list[str]
-        The columns to melt.
-    new_y_column_name : str
-        The name of the new column that will store the values of the melted columns.
-    new_color_column_name : str
-        The name of column that will store the original column names.
-
-    Returns
-    -------
-    pd.DataFrame
-        The melted dataframe.
-
-
-    Examples
-    --------
-
-    >>> import pandas as pd
-    >>> df = pd.DataFrame({
-    ...     "a": [1, 2, 3],
-    ...     "b": [4, 5, 6],
-    ...     "c": [7, 8, 9],
-    ... })
-    >>> _melt_data(df, ["a"], ["b", "c"], "value", "color")
-    >>>    a color  value
-    >>> 0  1        b      4
-    >>> 1  2        b      5
-    >>> 2  3        b      6
-    >>> ...
-
+def _check_columns_to_fold(df: pd.DataFrame, columns_to_fold: list[str]) -> None:
+    """Raise an exception if the columns to fold into a single y column mix
+    numbers with many other values, which can't be charted together.
     """
-    import pandas as pd
-    from pandas.api.types import infer_dtype
-
-    melted_df = pd.melt(
-        df,
-        id_vars=columns_to_leave_alone,
-        value_vars=columns_to_melt,
-        var_name=new_color_column_name,
-        value_name=new_y_column_name,
-    )
+    vegalite_types = {
+        type_util.infer_vegalite_type(df[column]) for column in columns_to_fold
+    }
+    if len(vegalite_types) <= 1:
+        return
 
-    y_series = melted_df[new_y_column_name]
-    if (
-        y_series.dtype == "object"
-        and "mixed" in infer_dtype(y_series)
-        and len(y_series.unique()) > 100
-    ):
+    num_non_quantitative_values = sum(
+        df[column].nunique()
+        for column in columns_to_fold
+        if type_util.infer_vegalite_type(df[column]) != "quantitative"
+    )
+    if num_non_quantitative_values > 100:
         raise StreamlitAPIException(
             "The columns used for rendering the chart contain too many values with mixed types. Please select the columns manually via the y parameter."
         )
 
-    # Arrow has problems with object types after melting two different dtypes
-    # pyarrow.lib.ArrowTypeError: "Expected a <TYPE> object, got a object"
-    fixed_df = type_util.fix_arrow_incompatible_column_types(
-        melted_df,
-        selected_columns=[
-            *columns_to_leave_alone,
-            new_color_column_name,
-            new_y_column_name,
-        ],
-    )
 
-    return fixed_df
+def _escape_field_name(column: str) -> str:
+    """Escape a column name for use as a Vega-Lite field, in which dots and
+    brackets would otherwise access nested fields."""
+    return (
+        column.replace("\\", "\\\\")
+        .replace(".", "\\.")
+        .replace("[", "\\[")
+        .replace("]", "\\]")
+    )
 
 
 def _maybe_reset_index_in_place(
@@ -569,11 +716,16 @@ def _get_opacity_encoding(
     return None
 
 
-def _get_axis_config(df: pd.DataFrame, column_name: str | None, grid: bool) -> alt.Axis:
+def _get_axis_config(
+    df: pd.DataFrame, column_names: Sequence[str | None], grid: bool
+) -> alt.Axis:
     import altair as alt
     from pandas.api.types import is_integer_dtype
 
-    if column_name is not None and is_integer_dtype(df[column_name]):
+    if all(
+        column_name is not None and is_integer_dtype(df[column_name])
+        for column_name in column_names
+    ):
         # Use a max tick size of 1 for integer columns (prevents zoom into float numbers)
         # and deactivate grid lines for x-axis
         return alt.Axis(tickMinStep=1, grid=grid)
@@ -581,38 +733,37 @@ def _get_axis_config(df: pd.DataFrame, column_name: str | None, grid: bool) -> a
     return alt.Axis(grid=grid)
 
 
-def _maybe_melt(
+def _maybe_fold(
     df: pd.DataFrame,
     x_column: str | None,
     y_column_list: list[str],
     color_column: str | None,
-    size_column: str | None,
-) -> tuple[pd.DataFrame, str | None, str | None]:
-    """If multiple columns are set for y, melt the dataframe into long format."""
+) -> tuple[str | None, str | None, list[str]]:
+    """If multiple columns are set for y, return the names of the y and color
+    columns that the chart folds them into, and the columns to fold.
+
+    The data isn't melted into long format here, since that would repeat the x
+    value of every row for each y column. Instead, the chart's Vega-Lite spec
+    folds the columns on the client.
+    """
     y_column: str | None
+    columns_to_fold: list[str] = []
 
     if len(y_column_list) == 0:
         y_column = None
     elif len(y_column_list) == 1:
         y_column = y_column_list[0]
     elif x_column is not None:
+        _check_columns_to_fold(df, y_column_list)
+
         # Pick column names that are unlikely to collide with user-given names.
         y_column = _MELTED_Y_COLUMN_NAME
         color_column = _MELTED_COLOR_COLUMN_NAME
+        columns_to_fold = y_column_list
+    else:
+        y_column = None
 
-        columns_to_leave_alone = [x_column]
-        if size_column:
-            columns_to_leave_alone.append(size_column)
-
-        df = _melt_data(
-            df=df,
-            columns_to_leave_alone=columns_to_leave_alone,
-            columns_to_melt=y_column_list,
-            new_y_column_name=y_column,
-            new_color_column_name=color_column,
-        )
-
-    return df, y_column, color_column
+    return y_column, color_column, columns_to_fold
 
 
 def _get_x_encoding(
@@ -651,7 +802,7 @@ def _get_x_encoding(
         title=x_title,
         type=_get_x_encoding_type(df, chart_type, x_column),
         scale=alt.Scale(),
-        axis=_get_axis_config(df, x_column, grid=False),
+        axis=_get_axis_config(df, [x_column], grid=False),
     )
 
 
@@ -659,6 +810,7 @@ def _get_y_encoding(
     df: pd.DataFrame,
     y_column: str | None,
     y_from_user: str | Sequence[str] | None,
+    columns_to_fold: list[str],
 ) -> alt.Y:
     import altair as alt
 
@@ -688,9 +840,9 @@ def _get_y_encoding(
     return alt.Y(
         field=y_field,
         title=y_title,
-        type=_get_y_encoding_type(df, y_column),
+        type=_get_y_encoding_type(df, y_column, columns_to_fold),
         scale=alt.Scale(),
-        axis=_get_axis_config(df, y_column, grid=True),
+        axis=_get_axis_config(df, columns_to_fold or [y_column], grid=True),
     )
 
 
@@ -874,8 +1026,15 @@ def _get_x_encoding_type(
 
 
 def _get_y_encoding_type(
-    df: pd.DataFrame, y_column: str | None
+    df: pd.DataFrame, y_column: str | None, columns_to_fold: list[str]
 ) -> type_util.VegaLiteType:
+    if columns_to_fold:
+        vegalite_types = {
+            type_util.infer_vegalite_type(df[column]) for column in columns_to_fold
+        }
+        # Columns of different types are folded into a column of mixed values.
+        return vegalite_types.pop() if len(vegalite_types) == 1 else "nominal"
+
     if y_column:
         return type_util.infer_vegalite_type(df[y_column])
 
@@ -40,6 +40,7 @@ from streamlit import type_util
 from streamlit.elements.lib.built_in_chart_utils import (
     AddRowsMetadata,
     ChartType,
+    DownsampleMethod,
     generate_chart,
 )
 from streamlit.elements.lib.event_utils import AttributeDictionary
@@ -178,6 +179,15 @@ def _serialize_data(data: Any) -> bytes:
     return type_util.data_frame_to_bytes(df)
 
 
+def _get_named_dataset(data: Any) -> tuple[str, bytes]:
+    """Serialize the data of a chart to Arrow IPC format (bytes) and return it
+    with a stable name, the md5 hash of the bytes.
+    """
+    data_bytes = _serialize_data(data)
+    name = hashlib.new("md5", data_bytes, **HASHLIB_KWARGS).hexdigest()
+    return name, data_bytes
+
+
 def _marshall_chart_data(
     proto: ArrowVegaLiteChartProto,
     spec: VegaLiteSpec,
@@ -245,14 +255,7 @@ def _convert_altair_to_vega_lite_spec(altair_chart: alt.Chart) -> VegaLiteSpec:
         stores the bytes into the datasets mapping and
         returns this name to have it be used in Altair.
         """
-        # Already serialize the data to be able to create a stable
-        # dataset name:
-        data_bytes = _serialize_data(data)
-        # Use the md5 hash of the data as the name:
-        h = hashlib.new("md5", **HASHLIB_KWARGS)
-        h.update(str(data_bytes).encode("utf-8"))
-        name = h.hexdigest()
-
+        name, data_bytes = _get_named_dataset(data)
         datasets[name] = data_bytes
         return {"name": name}
 
@@ -464,6 +467,7 @@ class VegaChartsMixin:
         width: int = 0,
         height: int = 0,
         use_container_width: bool = True,
+        downsample: DownsampleMethod | None = None,
     ) -> DeltaGenerator:
         """Display a line chart.
 
@@ -539,6 +543,19 @@ class VegaChartsMixin:
             If True, set the chart width to the column width. This takes
             precedence over the width argument.
 
+        downsample : "lttb", "min-max", or None
+            How to reduce each data series to about as many points as the
+            chart is wide (the width argument, or 1000 if it's 0), for faster
+            charts of large data. This only applies to data with a numeric or
+            datetime x-axis and numeric y values. Rows added with
+            ``add_rows`` aren't downsampled. This can be one of the following:
+
+            * None (default), to send all the data to the chart.
+            * ``"lttb"``, to keep the points that best preserve the shape of
+              each series, using the Largest-Triangle-Three-Buckets algorithm.
+            * ``"min-max"``, to keep the smallest and largest value of each
+              bucket of points, which preserves all peaks and is faster.
+
         Examples
         --------
         >>> import streamlit as st
@@ -604,6 +621,7 @@ class VegaChartsMixin:
             size_from_user=None,
             width=width,
             height=height,
+            downsample=downsample,
         )
         return cast(
             "DeltaGenerator",
@@ -626,6 +644,7 @@ class VegaChartsMixin:
         width: int = 0,
         height: int = 0,
         use_container_width: bool = True,
+        downsample: DownsampleMethod | None = None,
     ) -> DeltaGenerator:
         """Display an area chart.
 
@@ -701,6 +720,19 @@ class VegaChartsMixin:
             If True, set the chart width to the column width. This takes
             precedence over the width argument.
 
+        downsample : "lttb", "min-max", or None
+            How to reduce each data series to about as many points as the
+            chart is wide (the width argument, or 1000 if it's 0), for faster
+            charts of large data. This only applies to data with a numeric or
+            datetime x-axis and numeric y values. Rows added with
+            ``add_rows`` aren't downsampled. This can be one of the following:
+
+            * None (default), to send all the data to the chart.
+            * ``"lttb"``, to keep the points that best preserve the shape of
+              each series, using the Largest-Triangle-Three-Buckets algorithm.
+            * ``"min-max"``, to keep the smallest and largest value of each
+              bucket of points, which preserves all peaks and is faster.
+
         Examples
         --------
         >>> import streamlit as st
@@ -766,6 +798,7 @@ class VegaChartsMixin:
             size_from_user=None,
             width=width,
             height=height,
+            downsample=downsample,
         )
         return cast(
             "DeltaGenerator",
@@ -953,6 +986,7 @@ class VegaChartsMixin:
         width: int = 0,
         height: int = 0,
         use_container_width: bool = True,
+        downsample: DownsampleMethod | None = None,
     ) -> DeltaGenerator:
         """Display a scatterplot chart.
 
@@ -1037,6 +1071,19 @@ class VegaChartsMixin:
             If True, set the chart width to the column width. This takes
             precedence over the width argument.
 
+        downsample : "lttb", "min-max", or None
+            How to reduce each data series to about as many points as the
+            chart is wide (the width argument, or 1000 if it's 0), for faster
+            charts of large data. This only applies to data with a numeric or
+            datetime x-axis and numeric y values. Rows added with
+            ``add_rows`` aren't downsampled. This can be one of the following:
+
+            * None (default), to send all the data to the chart.
+            * ``"lttb"``, to keep the points that best preserve the shape of
+              each series, using the Largest-Triangle-Three-Buckets algorithm.
+            * ``"min-max"``, to keep the smallest and largest value of each
+              bucket of points, which preserves all peaks and is faster.
+
         Examples
         --------
         >>> import streamlit as st
@@ -1107,6 +1154,7 @@ class VegaChartsMixin:
             size_from_user=size,
             width=width,
             height=height,
+            downsample=downsample,
         )
         return cast(
             "DeltaGenerator",
@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import json
+import re
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import (
@@ -243,6 +244,157 @@ def _parse_value(
     return value
 
 
+def _parse_values(
+    values: list[str | int | float | bool | None],
+    column_data_kind: ColumnDataKind,
+) -> list[Any]:
+    """Convert the values of a column to the correct type.
+
+    This returns the same values as calling `_parse_value` on each value, but
+    converts string, boolean and number columns, and ISO 8601 date and time
+    strings, with vectorized pandas operations.
+
+    Parameters
+    ----------
+    values : list[str | int | float | bool | None]
+        The values to convert.
+
+    column_data_kind : ColumnDataKind
+        The determined data kind of the column.
+
+    Returns
+    -------
+    The converted values.
+    """
+    if column_data_kind in [
+        ColumnDataKind.DATETIME,
+        ColumnDataKind.DATE,
+        ColumnDataKind.TIME,
+    ]:
+        timestamps = _parse_iso_timestamps(values)
+        if timestamps is not None:
+            import pandas as pd
+
+            if column_data_kind == ColumnDataKind.DATE:
+                timestamps = timestamps.dt.date
+            elif column_data_kind == ColumnDataKind.TIME:
+                timestamps = timestamps.dt.time
+            return cast(
+                List[Any],
+                timestamps.astype("object").where(timestamps.notna(), None).tolist(),
+            )
+
+    if column_data_kind in [
+        ColumnDataKind.STRING,
+        ColumnDataKind.BOOLEAN,
+        ColumnDataKind.INTEGER,
+        ColumnDataKind.FLOAT,
+    ]:
+        parsed_values = _parse_scalar_values(values, column_data_kind)
+        if parsed_values is not None:
+            return parsed_values
+
+    return [_parse_value(value, column_data_kind) for value in values]
+
+
+def _parse_scalar_values(
+    values: list[str | int | float | bool | None],
+    column_data_kind: ColumnDataKind,
+) -> list[Any] | None:
+    """Convert the values of a string, boolean, integer or float column with
+    vectorized pandas operations, like `_parse_value` converts each value.
+
+    Returns None for integer and float columns with string values, since pandas
+    and Python parse numbers from strings differently.
+    """
+    import numpy as np
+    import pandas as pd
+
+    series = pd.Series(values, dtype="object")
+    non_null = series[series.notna()]
+
+    if column_data_kind == ColumnDataKind.STRING:
+        parsed = non_null.astype(str)
+    elif column_data_kind == ColumnDataKind.BOOLEAN:
+        parsed = non_null.astype(bool)
+    else:
+        if pd.api.types.infer_dtype(non_null, skipna=False) not in (
+            "empty",
+            "boolean",
+            "integer",
+            "floating",
+            "mixed-integer-float",
+        ):
+            return None
+        parsed = pd.to_numeric(non_null)
+        if column_data_kind == ColumnDataKind.FLOAT:
+            parsed = parsed.astype("float64")
+        else:
+            if parsed.dtype.kind == "f":
+                # Like int(), truncate floats. Infinite values can't be parsed.
+                parsed = np.trunc(parsed[np.isfinite(parsed)])
+            if (parsed.abs() >= 2**63).any():
+                # Integers beyond the int64 range can't be converted at once.
+                return None
+            parsed = parsed.astype("int64")
+
+    if len(parsed) == len(series):
+        return cast(List[Any], parsed.tolist())
+
+    result = np.full(len(series), None, dtype="object")
+    result[parsed.index.to_numpy()] = parsed.to_numpy(dtype="object")
+    return cast(List[Any], result.tolist())
+
+
+# Matches the UTC offset at the end of an ISO 8601 date and time string.
+_ISO_UTC_OFFSET_PATTERN: Final = re.compile(r"(Z|[+-]\d{2}:?\d{2})$")
+
+
+def _parse_iso_timestamps(
+    values: list[str | int | float | bool | None],
+) -> pd.Series | None:
+    """Parse a list of ISO 8601 strings (or None) into a datetime Series.
+
+    Returns None if the values can't all be parsed this way, for example
+    because they aren't all strings, or have different UTC offsets.
+    """
+    import pandas as pd
+
+    utc_offsets = set()
+    for value in values:
+        if value is None:
+            continue
+        if not isinstance(value, str):
+            return None
+        match = _ISO_UTC_OFFSET_PATTERN.search(value)
+        utc_offsets.add(match.group(0) if match else None)
+    if len(utc_offsets) > 1:
+        # pandas can't parse different UTC offsets into a single Series.
+        return None
+
+    try:
+        return pd.to_datetime(
+            pd.Series(values, dtype="object"), format="ISO8601", errors="raise"
+        )
+    except (ValueError, OverflowError, pd.errors.ParserError):
+        return None
+
+
+def _group_edits_by_column(
+    edits: Iterable[tuple[int, Mapping[str, Any]]],
+) -> dict[str, tuple[list[int], list[Any]]]:
+    """Group row edits (row position, column name -> value) into
+    column name -> (row positions, values).
+    """
+    column_edits: dict[str, tuple[list[int], list[Any]]] = {}
+    for row_pos, row_changes in edits:
+        for col_name, value in row_changes.items():
+            positions, values = column_edits.setdefault(col_name, ([], []))
+            positions.append(row_pos)
+            values.append(value)
+    return column_edits
+
+
 def _apply_cell_edits(
     df: pd.DataFrame,
     edited_rows: Mapping[int, Mapping[str, str | int | float | bool | None]],
@@ -250,6 +402,9 @@ def _apply_cell_edits(
 ) -> None:
     """Apply cell edits to the provided dataframe (inplace).
 
+    The edits are grouped by column, and each column is converted and
+    assigned at once.
+
     Parameters
     ----------
     df : pd.DataFrame
@@ -261,29 +416,41 @@ def _apply_cell_edits(
     dataframe_schema: DataframeSchema
         The schema of the dataframe.
     """
-    for row_id, row_changes in edited_rows.items():
-        row_pos = int(row_id)
-        for col_name, value in row_changes.items():
-            if col_name == INDEX_IDENTIFIER:
-                # The edited cell is part of the index
-                # TODO(lukasmasuch): To support multi-index in the future:
-                # use a tuple of values here instead of a single value
-                df.index.values[row_pos] = _parse_value(
-                    value, dataframe_schema[INDEX_IDENTIFIER]
-                )
-            else:
-                col_pos = df.columns.get_loc(col_name)
-                df.iat[row_pos, col_pos] = _parse_value(
-                    value, dataframe_schema[col_name]
-                )
+    import numpy as np
+
+    column_edits = _group_edits_by_column(
+        (int(row_id), row_changes) for row_id, row_changes in edited_rows.items()
+    )
+    for col_name, (row_positions, values) in column_edits.items():
+        parsed_values = _parse_values(values, dataframe_schema[col_name])
+        if col_name == INDEX_IDENTIFIER:
+            # The edited cells are part of the index
+            # TODO(lukasmasuch): To support multi-index in the future:
+            # use a tuple of values here instead of a single value
+            for row_pos, parsed_value in zip(row_positions, parsed_values):
+                df.index.values[row_pos] = parsed_value
+        else:
+            col_pos = df.columns.get_loc(col_name)
+            if df[col_name].dtype.kind in "iuf" and None in parsed_values:
+                # Like assigning a single cell, store missing values in numeric
+                # columns as NaN and upcast integer columns to float.
+                parsed_values = [
+                    np.nan if value is None else value for value in parsed_values
+                ]
+                if df[col_name].dtype.kind in "iu":
+                    df[col_name] = df[col_name].astype("float64")
+            df.iloc[row_positions, col_pos] = parsed_values
 
 
 def _apply_row_additions(
     df: pd.DataFrame,
     added_rows: list[dict[str, Any]],
     dataframe_schema: DataframeSchema,
-) -> None:
-    """Apply row additions to the provided dataframe (inplace).
+) -> pd.DataFrame:
+    """Return the provided dataframe with the row additions appended.
+
+    The added rows are converted column by column, and concatenated to the
+    dataframe at once.
 
     Parameters
     ----------
@@ -296,46 +463,110 @@ def _apply_row_additions(
 
     dataframe_schema: DataframeSchema
         The schema of the dataframe.
+
+    Returns
+    -------
+    pd.DataFrame
+        The dataframe with the added rows. Unless there aren't any added rows,
+        this is a new dataframe.
     """
 
     if not added_rows:
-        return
+        return df
 
     import pandas as pd
 
-    # This is only used if the dataframe has a range index:
-    # There seems to be a bug in older pandas versions with RangeIndex in
-    # combination with loc. As a workaround, we manually track the values here:
-    range_index_stop = None
-    range_index_step = None
+    column_edits = _group_edits_by_column(enumerate(added_rows))
+    parsed_columns: dict[str, list[Any]] = {}
+    for col_name, (row_positions, values) in column_edits.items():
+        column = [None] * len(added_rows)
+        for row_pos, parsed_value in zip(
+            row_positions, _parse_values(values, dataframe_schema[col_name])
+        ):
+            column[row_pos] = parsed_value
+        parsed_columns[col_name] = column
+
     if isinstance(df.index, pd.RangeIndex):
-        range_index_stop = df.index.stop
-        range_index_step = df.index.step
-
-    for added_row in added_rows:
-        index_value = None
-        new_row: list[Any] = [None for _ in range(df.shape[1])]
-        for col_name in added_row.keys():
-            value = added_row[col_name]
-            if col_name == INDEX_IDENTIFIER:
-                # TODO(lukasmasuch): To support multi-index in the future:
-                # use a tuple of values here instead of a single value
-                index_value = _parse_value(value, dataframe_schema[INDEX_IDENTIFIER])
-            else:
-                col_pos = df.columns.get_loc(col_name)
-                new_row[col_pos] = _parse_value(value, dataframe_schema[col_name])
-        # Append the new row to the dataframe
-        if range_index_stop is not None:
-            df.loc[range_index_stop, :] = new_row
-            # Increment to the next range index value
-            range_index_stop += range_index_step
-        elif index_value is not None:
-            # TODO(lukasmasuch): we are only adding rows that have a non-None index
-            # value to prevent issues in the frontend component. Also, it just overwrites
-            # the row in case the index value already exists in the dataframe.
-            # In the future, it would be better to require users to provide unique
-            # non-None values for the index with some kind of visual indications.
-            df.loc[index_value, :] = new_row
+        # Continue the range index.
+        new_index: pd.Index = pd.RangeIndex(
+            df.index.stop,
+            df.index.stop + len(added_rows) * df.index.step,
+            df.index.step,
+        )
+        row_positions = list(range(len(added_rows)))
+    else:
+        # TODO(lukasmasuch): we are only adding rows that have a non-None index
+        # value to prevent issues in the frontend component. Also, it just overwrites
+        # the row in case the index value already exists in the dataframe.
+        # In the future, it would be better to require users to provide unique
+        # non-None values for the index with some kind of visual indications.
+        # TODO(lukasmasuch): To support multi-index in the future:
+        # use a tuple of values here instead of a single value
+        index_values = parsed_columns.get(INDEX_IDENTIFIER, [None] * len(added_rows))
+        # The last row added with an index value replaces the earlier ones.
+        row_positions_by_index_value = {
+            index_value: row_pos
+            for row_pos, index_value in enumerate(index_values)
+            if index_value is not None
+        }
+        if not row_positions_by_index_value:
+            return df
+        new_index = pd.Index(list(row_positions_by_index_value.keys()))
+        row_positions = list(row_positions_by_index_value.values())
+
+    added_df = pd.DataFrame(
+        {
+            col_pos: _get_added_column(
+                df.iloc[:, col_pos],
+                [
+                    parsed_columns[col_name][row_pos] if col_name in parsed_columns
+                    # Cells that weren't filled in are empty:
+                    else None
+                    for row_pos in row_positions
+                ],
+                new_index,
+            )
+            for col_pos, col_name in enumerate(df.columns)
+        },
+        index=new_index,
+    )
+    added_df.columns = df.columns
+
+    existing_rows = added_df.index.isin(df.index)
+    if existing_rows.any():
+        # Rows whose index value is already in the dataframe overwrite the
+        # existing rows.
+        df = df.copy()
+        df.loc[added_df.index[existing_rows], :] = added_df[existing_rows]
+        added_df = added_df[~existing_rows]
+
+    return pd.concat([df, added_df])
+
+
+def _get_added_column(
+    column: pd.Series, values: list[Any], index: pd.Index
+) -> pd.Series:
+    """Create a Series of the values added to the column.
+
+    The Series gets the column's dtype if it can hold all the values, so that
+    concatenating it doesn't change the column's dtype.
+    """
+    import pandas as pd
+
+    if any(value is None for value in values):
+        if all(value is None for value in values) and (
+            pd.api.types.is_numeric_dtype(column.dtype)
+            and not pd.api.types.is_bool_dtype(column.dtype)
+        ):
+            # Empty cells of numeric columns are NaN, like after assigning None
+            # to them.
+            return pd.Series(float("nan"), index=index, dtype="float64")
+        return pd.Series(values, index=index)
+
+    try:
+        return pd.Series(values, index=index, dtype=column.dtype)
+    except (ValueError, TypeError):
+        return pd.Series(values, index=index)
 
 
 def _apply_row_deletions(df: pd.DataFrame, deleted_rows: list[int]) -> None:
@@ -357,10 +588,12 @@ def _apply_dataframe_edits(
     df: pd.DataFrame,
     data_editor_state: EditingState,
     dataframe_schema: DataframeSchema,
-) -> None:
-    """Apply edits to the provided dataframe (inplace).
+) -> pd.DataFrame:
+    """Apply edits to the provided dataframe.
 
-    This includes cell edits, row additions and row deletions.
+    This includes cell edits, row additions and row deletions. Cell edits and
+    row deletions are applied inplace, but row additions create a new
+    dataframe.
 
     Parameters
     ----------
@@ -372,16 +605,23 @@ def _apply_dataframe_edits(
 
     dataframe_schema: DataframeSchema
         The schema of the dataframe.
+
+    Returns
+    -------
+    pd.DataFrame
+        The edited dataframe.
     """
     if data_editor_state.get("edited_rows"):
         _apply_cell_edits(df, data_editor_state["edited_rows"], dataframe_schema)
 
     if data_editor_state.get("added_rows"):
-        _apply_row_additions(df, data_editor_state["added_rows"], dataframe_schema)
+        df = _apply_row_additions(df, data_editor_state["added_rows"], dataframe_schema)
 
     if data_editor_state.get("deleted_rows"):
         _apply_row_deletions(df, data_editor_state["deleted_rows"])
 
+    return df
+
 
 def _is_supported_index(df_index: pd.Index) -> bool:
     """Check if the index is supported by the data editor component.
@@ -934,7 +1174,7 @@ class DataEditorMixin:
             ctx=ctx,
         )
 
-        _apply_dataframe_edits(data_df, widget_state.value, dataframe_schema)
+        data_df = _apply_dataframe_edits(data_df, widget_state.value, dataframe_schema)
         self.dg._enqueue("arrow_data_frame", proto)
         return type_util.convert_df_to_data_format(data_df, data_format)
 
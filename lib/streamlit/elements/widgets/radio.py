@@ -263,11 +263,12 @@ class RadioMixin:
         opt = ensure_indexable(options)
         check_python_comparable(opt)
 
+        formatted_options = [str(format_func(option)) for option in opt]
         id = compute_widget_id(
             "radio",
             user_key=key,
             label=label,
-            options=[str(format_func(option)) for option in opt],
+            options=formatted_options,
             index=index,
             key=key,
             help=help,
@@ -306,7 +307,7 @@ class RadioMixin:
         radio_proto.label = label
         if index is not None:
             radio_proto.default = index
-        radio_proto.options[:] = [str(format_func(option)) for option in opt]
+        radio_proto.options[:] = formatted_options
         radio_proto.form_id = current_form_id(self.dg)
         radio_proto.horizontal = horizontal
         radio_proto.disabled = disabled
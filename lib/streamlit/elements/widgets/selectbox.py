@@ -243,11 +243,12 @@ class SelectboxMixin:
         opt = ensure_indexable(options)
         check_python_comparable(opt)
 
+        formatted_options = [str(format_func(option)) for option in opt]
         id = compute_widget_id(
             "selectbox",
             user_key=key,
             label=label,
-            options=[str(format_func(option)) for option in opt],
+            options=formatted_options,
             index=index,
             key=key,
             help=help,
@@ -275,7 +276,7 @@ class SelectboxMixin:
         selectbox_proto.label = label
         if index is not None:
             selectbox_proto.default = index
-        selectbox_proto.options[:] = [str(format_func(option)) for option in opt]
+        selectbox_proto.options[:] = formatted_options
         selectbox_proto.form_id = current_form_id(self.dg)
         selectbox_proto.placeholder = placeholder
         selectbox_proto.disabled = disabled
@@ -18,6 +18,7 @@ import contextlib
 import errno
 import io
 import os
+import uuid
 from pathlib import Path
 
 from streamlit import env_util, util
@@ -87,7 +88,7 @@ def streamlit_read(path, binary=False):
 
 
 @contextlib.contextmanager
-def streamlit_write(path, binary=False):
+def streamlit_write(path, binary=False, atomic=False):
     """Opens a file for writing within the streamlit path, and
     ensuring that the path exists. For example:
 
@@ -99,15 +100,21 @@ def streamlit_write(path, binary=False):
 
     path   - the path to write to (within the streamlit directory)
     binary - set to True for binary IO
+    atomic - set to True to write to a temporary file that only replaces the
+             file once it has been fully written, so that readers never see a
+             partially-written file
     """
     mode = "w"
     if binary:
         mode += "b"
     path = get_streamlit_file_path(path)
     os.makedirs(os.path.dirname(path), exist_ok=True)
+    write_path = f"{path}.{uuid.uuid4().hex}.tmp" if atomic else path
     try:
-        with open(path, mode) as handle:
+        with open(write_path, mode) as handle:
             yield handle
+        if atomic:
+            os.replace(write_path, path)
     except OSError as e:
         msg = ["Unable to write file: %s" % os.path.abspath(path)]
         if e.errno == errno.EINVAL and env_util.IS_DARWIN:
@@ -116,6 +123,10 @@ def streamlit_write(path, binary=False):
                 "See https://bugs.python.org/issue24658"
             )
         raise util.Error("\n".join(msg))
+    finally:
+        if atomic:
+            with contextlib.suppress(OSError):
+                os.remove(write_path)
 
 
 def get_static_dir() -> str:
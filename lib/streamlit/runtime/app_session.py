@@ -16,6 +16,7 @@ from __future__ import annotations
 
 import asyncio
 import sys
+import threading
 import uuid
 from enum import Enum
 from typing import TYPE_CHECKING, Callable, Final
@@ -37,9 +38,19 @@ from streamlit.proto.NewSession_pb2 import (
 )
 from streamlit.proto.PagesChanged_pb2 import PagesChanged
 from streamlit.runtime import caching, legacy_caching
+from streamlit.runtime.forward_msg_cache import (
+    populate_hash_if_needed,
+    serialize_forward_msg_payload,
+)
 from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
 from streamlit.runtime.fragment import FragmentStorage, MemoryFragmentStorage
 from streamlit.runtime.metrics_util import Installation
+from streamlit.runtime.runtime_util import (
+    compress_arrow_data,
+    extract_option_list,
+    is_arrow_chunk_msg,
+    is_cacheable_msg,
+)
 from streamlit.runtime.script_data import ScriptData
 from streamlit.runtime.scriptrunner import RerunData, ScriptRunner, ScriptRunnerEvent
 from streamlit.runtime.scriptrunner.script_cache import ScriptCache
@@ -53,6 +64,10 @@ if TYPE_CHECKING:
 
 _LOGGER: Final = get_logger(__name__)
 
+# How often a script that waits for the browser queue checks whether it should
+# stop waiting.
+_SCRIPT_WAIT_TIMEOUT_SECS: Final = 0.5
+
 
 class AppSessionState(Enum):
     APP_NOT_RUNNING = "APP_NOT_RUNNING"
@@ -82,7 +97,7 @@ class AppSession:
         script_data: ScriptData,
         uploaded_file_manager: UploadedFileManager,
         script_cache: ScriptCache,
-        message_enqueued_callback: Callable[[], None] | None,
+        message_enqueued_callback: Callable[[str], None] | None,
         user_info: dict[str, str | None],
         session_id_override: str | None = None,
     ) -> None:
@@ -102,7 +117,8 @@ class AppSession:
             on each rerun.
 
         message_enqueued_callback
-            After enqueuing a message, this callable notification will be invoked.
+            After enqueuing a message, this callable notification will be invoked
+            with the session's ID.
 
         user_info
             A dict that contains information about the current user. For now,
@@ -133,6 +149,16 @@ class AppSession:
         # this queue and delivers its contents to the browser.
         self._browser_queue = ForwardMsgQueue()
         self._message_enqueued_callback = message_enqueued_callback
+        # Set while the browser queue is below its high-water mark. The script
+        # thread waits for it before it enqueues more messages, so that a script
+        # can't fill the queue faster than the client receives it.
+        self._browser_queue_has_room = threading.Event()
+        self._browser_queue_has_room.set()
+        # Set when the chunk of a large table that the script enqueued has been
+        # flushed to the client. The script only produces the next chunk after
+        # that, so that it doesn't keep more than one chunk at a time in memory
+        # besides the table.
+        self._chunk_written_events: list[threading.Event] = []
 
         self._state = AppSessionState.APP_NOT_RUNNING
 
@@ -140,6 +166,11 @@ class AppSession:
         # due to the source code changing we need to pass in the previous client state.
         self._client_state = ClientState()
 
+        # The compressions of Arrow data that the client can decompress. It's
+        # sent with every rerun request of the client, and kept for the reruns
+        # that the server starts.
+        self._supported_arrow_compressions: list[int] = []
+
         self._local_sources_watcher: LocalSourcesWatcher | None = None
         self._stop_config_listener: Callable[[], bool] | None = None
         self._stop_pages_listener: Callable[[], None] | None = None
@@ -224,7 +255,36 @@ class AppSession:
             be delivered to the browser.
 
         """
-        return self._browser_queue.flush()
+        msgs = self._browser_queue.flush()
+        self._on_browser_queue_flushed()
+        return msgs
+
+    def flush_browser_queue_with_payloads(
+        self,
+    ) -> list[tuple[ForwardMsg, bytes | None]]:
+        """Clear the forward message queue and return the messages it contained,
+        with the encoded payloads of those that were serialized when they were
+        enqueued (see `serialize_forward_msg_payload`).
+        """
+        msgs = self._browser_queue.flush_with_payloads()
+        self._on_browser_queue_flushed()
+        return msgs
+
+    def _on_browser_queue_flushed(self) -> None:
+        self._browser_queue_has_room.set()
+        self._set_chunks_written()
+
+    def _set_chunks_written(self) -> None:
+        for chunk_written in self._chunk_written_events:
+            chunk_written.set()
+        self._chunk_written_events.clear()
+
+    def _release_waiting_script(self) -> None:
+        """Let a script that waits for the browser queue to be flushed go on,
+        e.g. so that it can handle a stop request.
+        """
+        self._browser_queue_has_room.set()
+        self._set_chunks_written()
 
     def shutdown(self) -> None:
         """Shut down the AppSession.
@@ -242,6 +302,8 @@ class AppSession:
                 rt = runtime.get_instance()
                 rt.media_file_mgr.clear_session_refs(self.id)
                 rt.media_file_mgr.remove_orphaned_files()
+                rt.paged_table_mgr.clear_session_refs(self.id)
+                rt.paged_table_mgr.remove_orphaned_tables()
 
             # Shut down the ScriptRunner, if one is active.
             # self._state must not be set to SHUTDOWN_REQUESTED until
@@ -267,14 +329,41 @@ class AppSession:
 
         """
         if not config.get_option("client.displayEnabled"):
+            if is_arrow_chunk_msg(msg):
+                # The chunk won't be written, so don't keep the script waiting.
+                self._set_chunks_written()
             return
 
+        # Send large widget option lists in their own message, which the
+        # ForwardMsg cache de-dupes across reruns, widgets and sessions.
+        option_list = extract_option_list(msg)
+        if option_list is not None:
+            option_list_msg, option_list_payload = option_list
+            self._browser_queue.enqueue(option_list_msg, option_list_payload)
+
+        # Compress large dataframes and charts, before the message is hashed.
+        compress_arrow_data(msg, self._supported_arrow_compressions)
+
         if self._debug_last_backmsg_id:
             msg.debug_last_backmsg_id = self._debug_last_backmsg_id
 
-        self._browser_queue.enqueue(msg)
+        # Hash large messages now, and keep their encoded payload with them in
+        # the queue, so that they're only serialized once. The Runtime also uses
+        # the hash to find the payload in its ForwardMsgCache, so content shared
+        # by many sessions is only encoded once.
+        payload = None
+        if is_cacheable_msg(msg):
+            payload = serialize_forward_msg_payload(msg)
+            populate_hash_if_needed(msg, payload)
+
+        self._browser_queue.enqueue(msg, payload)
+        max_queue_size = _get_max_browser_queue_size()
+        if max_queue_size and self._browser_queue.byte_size > max_queue_size:
+            # The client isn't keeping up. Pause the script until the queue is
+            # flushed (see _on_scriptrunner_event).
+            self._browser_queue_has_room.clear()
         if self._message_enqueued_callback:
-            self._message_enqueued_callback()
+            self._message_enqueued_callback(self.id)
 
     def handle_backmsg(self, msg: BackMsg) -> None:
         """Process a BackMsg."""
@@ -351,8 +440,14 @@ class AppSession:
             _LOGGER.warning("Discarding rerun request after shutdown")
             return
 
+        # Let a script that's waiting for the browser queue handle the request.
+        self._release_waiting_script()
+
         if client_state:
             fragment_id = client_state.fragment_id
+            self._supported_arrow_compressions = list(
+                client_state.supported_arrow_compressions
+            )
 
             rerun_data = RerunData(
                 client_state.query_string,
@@ -395,6 +490,8 @@ class AppSession:
         """
         if self._scriptrunner is not None:
             self._scriptrunner.request_stop()
+        # Let a script that's waiting for the browser queue handle the request.
+        self._release_waiting_script()
 
     def _create_scriptrunner(self, initial_rerun_data: RerunData) -> None:
         """Create and run a new ScriptRunner with the given RerunData."""
@@ -462,6 +559,7 @@ class AppSession:
 
     def _clear_queue(self) -> None:
         self._browser_queue.clear(retain_lifecycle_msgs=True)
+        self._release_waiting_script()
 
     def _on_scriptrunner_event(
         self,
@@ -478,9 +576,31 @@ class AppSession:
         This is generally called from the sender ScriptRunner's script thread.
         We forward the event on to _handle_scriptrunner_event_on_event_loop,
         which will be called on the main thread.
+
+        While the browser queue is above its high-water mark, the script thread
+        waits for it to be flushed before it enqueues another message. After it
+        enqueues a chunk of a large table, it waits for the chunk to be flushed.
         """
-        self._event_loop.call_soon_threadsafe(
-            lambda: self._handle_scriptrunner_event_on_event_loop(
+        is_script_msg = (
+            event == ScriptRunnerEvent.ENQUEUE_FORWARD_MSG
+            and not self._is_on_event_loop_thread()
+        )
+        if is_script_msg:
+            self._wait_on_script_thread(self._browser_queue_has_room, sender)
+
+        chunk_written = (
+            threading.Event()
+            if is_script_msg
+            and forward_msg is not None
+            and is_arrow_chunk_msg(forward_msg)
+            else None
+        )
+
+        def handle_event() -> None:
+            if chunk_written is not None:
+                # The chunk is enqueued below, so it's written with the next flush.
+                self._chunk_written_events.append(chunk_written)
+            self._handle_scriptrunner_event_on_event_loop(
                 sender,
                 event,
                 forward_msg,
@@ -489,7 +609,30 @@ class AppSession:
                 page_script_hash,
                 fragment_ids_this_run,
             )
-        )
+
+        self._event_loop.call_soon_threadsafe(handle_event)
+
+        if chunk_written is not None:
+            self._wait_on_script_thread(chunk_written, sender)
+
+    def _wait_on_script_thread(
+        self, event: threading.Event, sender: ScriptRunner | None
+    ) -> None:
+        """Wait until the event is set, or until the script doesn't need to wait
+        anymore because the session is shutting down, or the script is going to
+        stop or rerun.
+        """
+        while not event.wait(_SCRIPT_WAIT_TIMEOUT_SECS):
+            if self._state == AppSessionState.SHUTDOWN_REQUESTED or (
+                sender is not None and sender.is_stop_or_rerun_requested()
+            ):
+                return
+
+    def _is_on_event_loop_thread(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._event_loop
+        except RuntimeError:
+            return False
 
     def _handle_scriptrunner_event_on_event_loop(
         self,
@@ -633,6 +776,7 @@ class AppSession:
                 # Only clear media files if the script is done running AND the
                 # session is actually shutting down.
                 runtime.get_instance().media_file_mgr.clear_session_refs(self.id)
+                runtime.get_instance().paged_table_mgr.clear_session_refs(self.id)
 
             self._client_state = client_state
             self._scriptrunner = None
@@ -922,3 +1066,11 @@ def _populate_app_pages(msg: NewSession | PagesChanged, main_script_path: str) -
         page_proto.page_script_hash = page_script_hash
         page_proto.page_name = page_info["page_name"]
         page_proto.icon = page_info["icon"]
+
+
+def _get_max_browser_queue_size() -> int:
+    """The high-water mark of a session's browser queue, in bytes, or 0 if
+    there's none.
+    """
+    max_buffer_size_mb: int = config.get_option("server.maxWebsocketBufferSize")
+    return max(max_buffer_size_mb, 0) * int(1e6)
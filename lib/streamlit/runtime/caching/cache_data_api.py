@@ -16,6 +16,8 @@
 
 from __future__ import annotations
 
+import dataclasses
+import math
 import pickle
 import threading
 import types
@@ -25,11 +27,16 @@ from typing import Any, Callable, Final, Literal, TypeVar, Union, cast, overload
 from typing_extensions import TypeAlias
 
 import streamlit as st
-from streamlit import runtime
+from streamlit import runtime, type_util
 from streamlit.deprecation_util import show_deprecation_warning
 from streamlit.errors import StreamlitAPIException
 from streamlit.logger import get_logger
+from streamlit.runtime.caching import pickle_util
 from streamlit.runtime.caching.cache_errors import CacheError, CacheKeyNotFoundError
+from streamlit.runtime.caching.cache_memory_budget import (
+    CACHE_MEMORY_BUDGET,
+    BoundedTTLCache,
+)
 from streamlit.runtime.caching.cache_type import CacheType
 from streamlit.runtime.caching.cache_utils import (
     Cache,
@@ -43,12 +50,13 @@ from streamlit.runtime.caching.cached_message_replay import (
     MsgData,
     MultiCacheResults,
 )
-from streamlit.runtime.caching.hashing import HashFuncsDict
+from streamlit.runtime.caching.hashing import HashFuncsDict, HashMode
 from streamlit.runtime.caching.storage import (
     CacheStorage,
     CacheStorageContext,
     CacheStorageError,
     CacheStorageKeyNotFoundError,
+    CacheStorageLeaseProvider,
     CacheStorageManager,
 )
 from streamlit.runtime.caching.storage.cache_storage_protocol import (
@@ -57,6 +65,9 @@ from streamlit.runtime.caching.storage.cache_storage_protocol import (
 from streamlit.runtime.caching.storage.dummy_cache_storage import (
     MemoryCacheStorageManager,
 )
+from streamlit.runtime.caching.storage.in_memory_cache_storage_wrapper import (
+    InMemoryCacheStorageWrapper,
+)
 from streamlit.runtime.metrics_util import gather_metrics
 from streamlit.runtime.scriptrunner.script_run_context import get_script_run_ctx
 from streamlit.runtime.stats import CacheStat, CacheStatsProvider, group_stats
@@ -82,16 +93,22 @@ class CachedDataFuncInfo(CachedFuncInfo):
         ttl: float | timedelta | str | None,
         allow_widgets: bool,
         hash_funcs: HashFuncsDict | None = None,
+        keep_unpickled: bool = False,
+        max_bytes: int | None = None,
+        hash_mode: HashMode = "sample",
     ):
         super().__init__(
             func,
             show_spinner=show_spinner,
             allow_widgets=allow_widgets,
             hash_funcs=hash_funcs,
+            hash_mode=hash_mode,
         )
         self.persist = persist
         self.max_entries = max_entries
         self.ttl = ttl
+        self.keep_unpickled = keep_unpickled
+        self.max_bytes = max_bytes
 
         self.validate_params()
 
@@ -116,6 +133,8 @@ class CachedDataFuncInfo(CachedFuncInfo):
             ttl=self.ttl,
             display_name=self.display_name,
             allow_widgets=self.allow_widgets,
+            keep_unpickled=self.keep_unpickled,
+            max_bytes=self.max_bytes,
         )
 
     def validate_params(self) -> None:
@@ -130,6 +149,7 @@ class CachedDataFuncInfo(CachedFuncInfo):
             persist=self.persist,
             max_entries=self.max_entries,
             ttl=self.ttl,
+            max_bytes=self.max_bytes,
         )
 
 
@@ -148,6 +168,8 @@ class DataCaches(CacheStatsProvider):
         ttl: int | float | timedelta | str | None,
         display_name: str,
         allow_widgets: bool,
+        keep_unpickled: bool = False,
+        max_bytes: int | None = None,
     ) -> DataCache:
         """Return the mem cache for the given key.
 
@@ -165,6 +187,8 @@ class DataCaches(CacheStatsProvider):
                 and cache.ttl_seconds == ttl_seconds
                 and cache.max_entries == max_entries
                 and cache.persist == persist
+                and cache.keep_unpickled == keep_unpickled
+                and cache.max_bytes == max_bytes
             ):
                 return cache
 
@@ -196,6 +220,7 @@ class DataCaches(CacheStatsProvider):
                 ttl_seconds=ttl_seconds,
                 max_entries=max_entries,
                 persist=persist,
+                max_bytes=max_bytes,
             )
             cache_storage_manager = self.get_storage_manager()
             storage = cache_storage_manager.create(cache_context)
@@ -208,6 +233,8 @@ class DataCaches(CacheStatsProvider):
                 ttl_seconds=ttl_seconds,
                 display_name=display_name,
                 allow_widgets=allow_widgets,
+                keep_unpickled=keep_unpickled,
+                max_bytes=max_bytes,
             )
             self._function_caches[key] = cache
             return cache
@@ -244,6 +271,7 @@ class DataCaches(CacheStatsProvider):
         persist: CachePersistType,
         max_entries: int | None,
         ttl: int | float | timedelta | str | None,
+        max_bytes: int | None = None,
     ) -> None:
         """Validate that the cache params are valid for given storage.
 
@@ -262,6 +290,7 @@ class DataCaches(CacheStatsProvider):
             ttl_seconds=ttl_seconds,
             max_entries=max_entries,
             persist=persist,
+            max_bytes=max_bytes,
         )
         try:
             self.get_storage_manager().check_context(cache_context)
@@ -281,6 +310,7 @@ class DataCaches(CacheStatsProvider):
         persist: CachePersistType,
         ttl_seconds: float | None,
         max_entries: int | None,
+        max_bytes: int | None = None,
     ) -> CacheStorageContext:
         return CacheStorageContext(
             function_key=function_key,
@@ -288,6 +318,7 @@ class DataCaches(CacheStatsProvider):
             ttl_seconds=ttl_seconds,
             max_entries=max_entries,
             persist=persist,
+            max_bytes=max_bytes,
         )
 
     def get_storage_manager(self) -> CacheStorageManager:
@@ -353,10 +384,13 @@ class CacheDataAPI:
         *,
         ttl: float | timedelta | str | None = None,
         max_entries: int | None = None,
+        max_bytes: int | None = None,
         show_spinner: bool | str = True,
         persist: CachePersistType | bool = None,
         experimental_allow_widgets: bool = False,
         hash_funcs: HashFuncsDict | None = None,
+        experimental_keep_unpickled: bool = False,
+        experimental_hash_mode: HashMode = "sample",
     ) -> Callable[[F], F]:
         ...
 
@@ -366,19 +400,25 @@ class CacheDataAPI:
         *,
         ttl: float | timedelta | str | None = None,
         max_entries: int | None = None,
+        max_bytes: int | None = None,
         show_spinner: bool | str = True,
         persist: CachePersistType | bool = None,
         experimental_allow_widgets: bool = False,
         hash_funcs: HashFuncsDict | None = None,
+        experimental_keep_unpickled: bool = False,
+        experimental_hash_mode: HashMode = "sample",
     ):
         return self._decorator(
             func,
             ttl=ttl,
             max_entries=max_entries,
+            max_bytes=max_bytes,
             persist=persist,
             show_spinner=show_spinner,
             experimental_allow_widgets=experimental_allow_widgets,
             hash_funcs=hash_funcs,
+            experimental_keep_unpickled=experimental_keep_unpickled,
+            experimental_hash_mode=experimental_hash_mode,
         )
 
     def _decorator(
@@ -387,10 +427,13 @@ class CacheDataAPI:
         *,
         ttl: float | timedelta | str | None,
         max_entries: int | None,
+        max_bytes: int | None,
         show_spinner: bool | str,
         persist: CachePersistType | bool,
         experimental_allow_widgets: bool,
         hash_funcs: HashFuncsDict | None = None,
+        experimental_keep_unpickled: bool = False,
+        experimental_hash_mode: HashMode = "sample",
     ):
         """Decorator to cache functions that return data (e.g. dataframe transforms, database queries, ML inference).
 
@@ -421,13 +464,25 @@ class CacheDataAPI:
               <https://docs.python.org/3/library/datetime.html#timedelta-objects>`_,
               e.g. ``timedelta(days=1)``.
 
-            Note that ``ttl`` will be ignored if ``persist="disk"`` or ``persist=True``.
+            With ``persist="disk"`` or ``persist=True``, expired entries are
+            also removed from disk.
 
         max_entries : int or None
             The maximum number of entries to keep in the cache, or None
             for an unbounded cache. When a new entry is added to a full cache,
             the oldest cached entry will be removed. Defaults to None.
 
+        max_bytes : int or None
+            The maximum total size, in bytes, of the entries to keep in memory
+            for this function, or None for no limit. An entry's size is the
+            size of its pickled form. When a new entry makes the cache go over
+            this size, the least-recently-used entries are removed from memory.
+            (With ``persist="disk"``, they're still read from disk later.)
+            Defaults to None.
+
+            All cached functions together are also limited by the
+            ``runner.maxCacheSize`` config option.
+
         show_spinner : bool or str
             Enable the spinner. Default is True to show a spinner when there is
             a "cache miss" and the cached data is being created. If string,
@@ -438,6 +493,9 @@ class CacheDataAPI:
             will persist the cached data to the local disk. None (or False) will disable
             persistence. The default is None.
 
+            All persisted functions together are limited by the
+            ``runner.maxDiskCacheSize`` config option.
+
         experimental_allow_widgets : bool
             Allow widgets to be used in the cached function. Defaults to False.
             Support for widgets in cached functions is currently experimental.
@@ -453,6 +511,30 @@ class CacheDataAPI:
             the provided function to generate a hash for it. See below for an example
             of how this can be used.
 
+        experimental_keep_unpickled : bool
+            Keep the unpickled return value in memory, and hand each caller a fast
+            copy of it on cache hits instead of unpickling the cached data again.
+            This makes cache hits on large NumPy arrays and Pandas DataFrames much
+            cheaper, at the cost of keeping both the pickled and the unpickled
+            value in memory. Only values that can be copied quickly benefit:
+            immutable values (e.g. strings, tuples of numbers, or PyArrow tables)
+            are returned as is, and NumPy arrays and Pandas objects are copied
+            with ``.copy()``. Note that the copy of a Pandas object shares the
+            Python objects stored in its object-dtype columns with the cached
+            value. Other values are unpickled on every cache hit, as usual.
+            Defaults to False.
+
+        experimental_hash_mode : "sample" or "exact"
+            How Pandas DataFrames and Series and NumPy arrays passed to the
+            function are hashed. If "sample" (default), Streamlit only hashes a
+            sample of the rows of dataframes with 100,000 or more rows, and of
+            the values of arrays with 1,000,000 or more values. This is fast, but
+            two large inputs that only differ outside of the sample share a cache
+            entry. If "exact", Streamlit hashes every value. The values of
+            numeric columns and arrays are hashed directly from memory, so this
+            is still fast for large inputs. PyArrow Tables and Polars DataFrames
+            are hashed by their Arrow data.
+
         Example
         -------
         >>> import streamlit as st
@@ -569,6 +651,9 @@ class CacheDataAPI:
                     ttl=ttl,
                     allow_widgets=experimental_allow_widgets,
                     hash_funcs=hash_funcs,
+                    keep_unpickled=experimental_keep_unpickled,
+                    max_bytes=max_bytes,
+                    hash_mode=experimental_hash_mode,
                 )
             )
 
@@ -584,6 +669,9 @@ class CacheDataAPI:
                 ttl=ttl,
                 allow_widgets=experimental_allow_widgets,
                 hash_funcs=hash_funcs,
+                keep_unpickled=experimental_keep_unpickled,
+                max_bytes=max_bytes,
+                hash_mode=experimental_hash_mode,
             )
         )
 
@@ -613,6 +701,8 @@ class DataCache(Cache):
         ttl_seconds: float | None,
         display_name: str,
         allow_widgets: bool = False,
+        keep_unpickled: bool = False,
+        max_bytes: int | None = None,
     ):
         super().__init__()
         self.key = key
@@ -622,6 +712,29 @@ class DataCache(Cache):
         self.max_entries = max_entries
         self.persist = persist
         self.allow_widgets = allow_widgets
+        self.keep_unpickled = keep_unpickled
+        self.max_bytes = max_bytes
+
+        # When keep_unpickled is set, we hold on to the unpickled results of the
+        # entries we've read or written, so that cache hits don't have to
+        # unpickle them again. This sits in front of self.storage, which still
+        # gets every entry in pickled form, and expires and evicts entries the
+        # same way. Values are (entry, size of the pickled entry) tuples.
+        # Only storages that keep their own per-process memory tier get this:
+        # other storages (e.g. SharedCacheStorage) can have their entries
+        # replaced by other processes, which we would never see here.
+        self._use_unpickled_entries = keep_unpickled and isinstance(
+            storage, InMemoryCacheStorageWrapper
+        )
+        self._unpickled_entries = BoundedTTLCache(
+            max_entries=max_entries if max_entries is not None else math.inf,
+            ttl_seconds=ttl_seconds if ttl_seconds is not None else math.inf,
+            max_bytes=max_bytes if max_bytes is not None else math.inf,
+            getsizeof=lambda item: item[1],
+        )
+        self._unpickled_entries_lock = threading.Lock()
+        if self._use_unpickled_entries:
+            CACHE_MEMORY_BUDGET.register(self)
 
     def get_stats(self) -> list[CacheStat]:
         if isinstance(self.storage, CacheStatsProvider):
@@ -633,6 +746,12 @@ class DataCache(Cache):
         if the value doesn't exist, and `CacheError` if the value exists but can't
         be unpickled.
         """
+        if self._use_unpickled_entries:
+            try:
+                return self._read_unpickled_result(key)
+            except CacheKeyNotFoundError:
+                pass
+
         try:
             pickled_entry = self.storage.get(key)
         except CacheStorageKeyNotFoundError as e:
@@ -641,7 +760,7 @@ class DataCache(Cache):
             raise CacheError(str(e)) from e
 
         try:
-            entry = pickle.loads(pickled_entry)
+            entry = pickle_util.loads(pickled_entry)
             if not isinstance(entry, MultiCacheResults):
                 # Loaded an old cache file format, remove it and let the caller
                 # rerun the function.
@@ -654,7 +773,14 @@ class DataCache(Cache):
 
             widget_key = entry.get_current_widget_key(ctx, CacheType.DATA)
             if widget_key in entry.results:
-                return entry.results[widget_key]
+                result = entry.results[widget_key]
+                if self._use_unpickled_entries:
+                    # Keep our own copy of the entry: the caller is free to
+                    # mutate the value we return.
+                    self._maybe_write_unpickled_entry(
+                        key, entry, result, len(pickled_entry)
+                    )
+                return result
             else:
                 raise CacheKeyNotFoundError()
         except pickle.UnpicklingError as exc:
@@ -698,18 +824,106 @@ class DataCache(Cache):
         multi_cache_results.results[widget_key] = result
 
         try:
-            pickled_entry = pickle.dumps(multi_cache_results)
+            # Persisted entries keep their buffers out of band, so that disk
+            # cache hits can unpickle them without copying the buffers.
+            pickled_entry = pickle_util.dumps(
+                multi_cache_results, out_of_band=self.persist == "disk"
+            )
         except (pickle.PicklingError, TypeError) as exc:
             raise CacheError(f"Failed to pickle {key}") from exc
 
         self.storage.set(key, pickled_entry)
 
+        if self._use_unpickled_entries:
+            self._maybe_write_unpickled_entry(
+                key, multi_cache_results, result, len(pickled_entry)
+            )
+
+    def acquire_compute_lease(self, value_key: str) -> bool:
+        if isinstance(self.storage, CacheStorageLeaseProvider):
+            return self.storage.acquire_lease(value_key)
+        return True
+
+    def release_compute_lease(self, value_key: str) -> None:
+        if isinstance(self.storage, CacheStorageLeaseProvider):
+            self.storage.release_lease(value_key)
+
     def _clear(self, key: str | None = None) -> None:
+        with self._unpickled_entries_lock:
+            if not key:
+                self._unpickled_entries.clear()
+            else:
+                self._unpickled_entries.pop(key, None)
+
         if not key:
             self.storage.clear()
         else:
             self.storage.delete(key)
 
+    def _read_unpickled_result(self, key: str) -> CachedResult:
+        """Return a copy of the result for the current widget values from our
+        unpickled entries. Raise `CacheKeyNotFoundError` if there's no such
+        result, or if its value can't be copied quickly.
+        """
+        ctx = get_script_run_ctx()
+        if not ctx:
+            raise CacheKeyNotFoundError()
+
+        with self._unpickled_entries_lock:
+            item = self._unpickled_entries.get(key)
+        if item is None:
+            raise CacheKeyNotFoundError()
+
+        entry, _ = item
+
+        widget_key = entry.get_current_widget_key(ctx, CacheType.DATA)
+        result = entry.results.get(widget_key)
+        if result is None:
+            raise CacheKeyNotFoundError()
+
+        if not _can_fast_copy(result.value):
+            raise CacheKeyNotFoundError()
+        return cast(
+            CachedResult, dataclasses.replace(result, value=_fast_copy(result.value))
+        )
+
+    def _maybe_write_unpickled_entry(
+        self,
+        key: str,
+        entry: MultiCacheResults,
+        result: CachedResult,
+        pickled_size: int,
+    ) -> None:
+        """Keep a copy of an entry that's just been read or written, if the
+        value of its current result can be copied quickly.
+        """
+        if not _can_fast_copy(result.value):
+            # Don't hold on to values we'd have to unpickle anyway.
+            with self._unpickled_entries_lock:
+                self._unpickled_entries.pop(key, None)
+            return
+
+        entry_copy = _copy_multi_cache_results(entry)
+        with self._unpickled_entries_lock:
+            self._unpickled_entries[key] = (entry_copy, pickled_size)
+        CACHE_MEMORY_BUDGET.enforce()
+
+    def get_memory_usage(self) -> int:
+        """Return the total size of the unpickled entries we're holding on to,
+        measured by the size of their pickled form.
+        """
+        with self._unpickled_entries_lock:
+            return self._unpickled_entries.size_bytes
+
+    def evict_lru_entry(self) -> int:
+        """Drop our least-recently-used unpickled entry. It stays in storage."""
+        with self._unpickled_entries_lock:
+            try:
+                _, (_, pickled_size) = self._unpickled_entries.popitem()
+            except KeyError:
+                return 0
+        return cast(int, pickled_size)
+
     def _read_multi_results_from_storage(self, key: str) -> MultiCacheResults:
         """Look up the results from storage and ensure it has the right type.
 
@@ -721,10 +935,76 @@ class DataCache(Cache):
         except CacheStorageKeyNotFoundError as e:
             raise CacheKeyNotFoundError(str(e)) from e
 
-        maybe_results = pickle.loads(pickled)
+        maybe_results = pickle_util.loads(pickled)
 
         if isinstance(maybe_results, MultiCacheResults):
             return maybe_results
         else:
             self.storage.delete(key)
             raise CacheKeyNotFoundError()
+
+
+_IMMUTABLE_TYPES: Final = (
+    type(None),
+    bool,
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    range,
+)
+
+_PANDAS_TYPE_STRS: Final = (
+    "pandas.core.frame.DataFrame",
+    "pandas.core.series.Series",
+    "pandas.core.indexes.base.Index",
+)
+
+
+def _can_fast_copy(value: Any) -> bool:
+    """True if `_fast_copy` can copy the value faster than unpickling it."""
+    if _is_immutable(value):
+        return True
+    if type_util.is_type(value, "numpy.ndarray"):
+        return bool(value.dtype != object)
+    return type_util.get_fqn_type(value) in _PANDAS_TYPE_STRS
+
+
+def _fast_copy(value: Any) -> Any:
+    """Return a copy of a cached value that the caller can safely mutate.
+    The value must satisfy `_can_fast_copy`.
+    """
+    if _is_immutable(value):
+        return value
+    if type_util.is_type(value, "numpy.ndarray"):
+        return value.copy()
+    return value.copy(deep=True)
+
+
+def _is_immutable(value: Any) -> bool:
+    if isinstance(value, _IMMUTABLE_TYPES):
+        return True
+    if type(value) in (tuple, frozenset):
+        return all(_is_immutable(item) for item in value)
+    # PyArrow tables and arrays can't be modified in place.
+    return type_util.is_type(value, "pyarrow.lib.Table") or type_util.is_type(
+        value, "pyarrow.lib.ChunkedArray"
+    )
+
+
+def _copy_multi_cache_results(entry: MultiCacheResults) -> MultiCacheResults:
+    """Copy the values of an entry's results that can be copied quickly.
+
+    Results whose values can't be copied quickly are left as they are: they're
+    never handed out from our unpickled entries.
+    """
+    results = {
+        widget_key: (
+            dataclasses.replace(result, value=_fast_copy(result.value))
+            if _can_fast_copy(result.value)
+            else result
+        )
+        for widget_key, result in entry.results.items()
+    }
+    return MultiCacheResults(widget_ids=set(entry.widget_ids), results=results)
@@ -0,0 +1,171 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Memory limits for the in-memory caches of @st.cache_data and @st.cache_resource.
+
+Each cached function's in-memory cache can be limited with the decorators'
+`max_bytes` param, which `BoundedTTLCache` enforces.
+
+All the in-memory caches together can be limited with the `runner.maxCacheSize`
+config option, which `CacheMemoryBudget` enforces: while the caches use more
+memory than that, it evicts the least-recently-used entry of the cache that uses
+the most memory.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+import weakref
+from abc import abstractmethod
+from typing import Any, Callable, Final, Protocol, Tuple, cast
+
+from cachetools import TTLCache
+
+from streamlit import config
+from streamlit.logger import get_logger
+from streamlit.runtime.caching import cache_utils
+
+_LOGGER: Final = get_logger(__name__)
+
+
+class BoundedTTLCache(TTLCache):
+    """A TTLCache that's limited by its number of entries and, if it is given a
+    `getsizeof` function, by the total size of its values.
+
+    When either limit is exceeded, entries are evicted least-recently-used first.
+    A value that's bigger than `max_bytes` on its own isn't stored at all.
+    """
+
+    def __init__(
+        self,
+        max_entries: float,
+        ttl_seconds: float,
+        max_bytes: float = math.inf,
+        getsizeof: Callable[[Any], int] | None = None,
+    ):
+        if getsizeof is None and not math.isinf(max_bytes):
+            raise ValueError("A getsizeof function is required to limit max_bytes")
+
+        super().__init__(
+            maxsize=max_bytes if getsizeof is not None else max_entries,
+            ttl=ttl_seconds,
+            timer=cache_utils.TTLCACHE_TIMER,
+            getsizeof=getsizeof,
+        )
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.is_sized = getsizeof is not None
+        # The number of entries that were removed to stay within our limits.
+        self.evictions = 0
+
+    @property
+    def size_bytes(self) -> int:
+        """The total size of our values, or 0 if we don't measure them."""
+        return int(self.currsize) if self.is_sized else 0
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        try:
+            super().__setitem__(key, value)
+        except ValueError:
+            # The value is bigger than max_bytes on its own.
+            _LOGGER.debug("Value for key %s exceeds the cache's max_bytes", key)
+            self.pop(key, None)
+            self.evictions += 1
+            return
+
+        while len(self) > self.max_entries:
+            self.popitem()
+
+    def popitem(self) -> tuple[Any, Any]:
+        item = cast(Tuple[Any, Any], super().popitem())
+        self.evictions += 1
+        return item
+
+
+class BudgetedCache(Protocol):
+    """An in-memory cache whose memory counts against the CacheMemoryBudget."""
+
+    @abstractmethod
+    def get_memory_usage(self) -> int:
+        """Return the total size of the cache's entries, in bytes.
+
+        Threading: SAFE. May be called on any thread.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def evict_lru_entry(self) -> int:
+        """Remove the cache's least-recently-used entry, and return its size in
+        bytes. Return 0 if the cache is empty.
+
+        Threading: SAFE. May be called on any thread.
+        """
+        raise NotImplementedError
+
+
+class CacheMemoryBudget:
+    """Limits the total memory used by all the in-memory caches of cached
+    functions to `runner.maxCacheSize`.
+
+    Notes
+    -----
+    Threading: SAFE. `enforce` must not be called while holding the lock of one
+    of the registered caches, because it acquires their locks to evict entries.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Caches that are dropped without being unregistered (e.g. when all
+        # caches are cleared) must not be kept alive by the budget.
+        self._caches: weakref.WeakSet[BudgetedCache] = weakref.WeakSet()
+
+    def register(self, cache: BudgetedCache) -> None:
+        with self._lock:
+            self._caches.add(cache)
+
+    def unregister(self, cache: BudgetedCache) -> None:
+        with self._lock:
+            self._caches.discard(cache)
+
+    def enforce(self) -> None:
+        """Evict entries until the registered caches fit within the budget."""
+        max_bytes = get_max_cache_size_bytes()
+        if max_bytes is None:
+            return
+
+        with self._lock:
+            usage = {cache: cache.get_memory_usage() for cache in self._caches}
+            total_bytes = sum(usage.values())
+            while total_bytes > max_bytes and usage:
+                largest = max(usage, key=usage.__getitem__)
+                freed_bytes = largest.evict_lru_entry()
+                if freed_bytes == 0:
+                    # Nothing left to evict from this cache.
+                    del usage[largest]
+                    continue
+                usage[largest] -= freed_bytes
+                total_bytes -= freed_bytes
+
+
+def get_max_cache_size_bytes() -> int | None:
+    """Return `runner.maxCacheSize` in bytes, or None if it is disabled."""
+    max_cache_size_mb: int = config.get_option("runner.maxCacheSize")
+    if max_cache_size_mb <= 0:
+        return None
+    return max_cache_size_mb * int(1e6)
+
+
+# Singleton CacheMemoryBudget instance
+CACHE_MEMORY_BUDGET: Final = CacheMemoryBudget()
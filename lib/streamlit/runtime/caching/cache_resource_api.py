@@ -22,14 +22,16 @@ import types
 from datetime import timedelta
 from typing import Any, Callable, Final, TypeVar, cast, overload
 
-from cachetools import TTLCache
 from typing_extensions import TypeAlias
 
 import streamlit as st
 from streamlit.deprecation_util import show_deprecation_warning
 from streamlit.logger import get_logger
-from streamlit.runtime.caching import cache_utils
 from streamlit.runtime.caching.cache_errors import CacheKeyNotFoundError
+from streamlit.runtime.caching.cache_memory_budget import (
+    CACHE_MEMORY_BUDGET,
+    BoundedTTLCache,
+)
 from streamlit.runtime.caching.cache_type import CacheType
 from streamlit.runtime.caching.cache_utils import (
     Cache,
@@ -43,7 +45,7 @@ from streamlit.runtime.caching.cached_message_replay import (
     MsgData,
     MultiCacheResults,
 )
-from streamlit.runtime.caching.hashing import HashFuncsDict
+from streamlit.runtime.caching.hashing import HashFuncsDict, HashMode
 from streamlit.runtime.metrics_util import gather_metrics
 from streamlit.runtime.scriptrunner.script_run_context import get_script_run_ctx
 from streamlit.runtime.stats import CacheStat, CacheStatsProvider, group_stats
@@ -81,6 +83,7 @@ class ResourceCaches(CacheStatsProvider):
         ttl: float | timedelta | str | None,
         validate: ValidateFunc | None,
         allow_widgets: bool,
+        max_bytes: int | float | None = None,
     ) -> ResourceCache:
         """Return the mem cache for the given key.
 
@@ -89,6 +92,9 @@ class ResourceCaches(CacheStatsProvider):
         if max_entries is None:
             max_entries = math.inf
 
+        if max_bytes is None:
+            max_bytes = math.inf
+
         ttl_seconds = time_to_seconds(ttl)
 
         # Get the existing cache, if it exists, and validate that its params
@@ -99,6 +105,7 @@ class ResourceCaches(CacheStatsProvider):
                 cache is not None
                 and cache.ttl_seconds == ttl_seconds
                 and cache.max_entries == max_entries
+                and cache.max_bytes == max_bytes
                 and _equal_validate_funcs(cache.validate, validate)
             ):
                 return cache
@@ -112,6 +119,7 @@ class ResourceCaches(CacheStatsProvider):
                 ttl_seconds=ttl_seconds,
                 validate=validate,
                 allow_widgets=allow_widgets,
+                max_bytes=max_bytes,
             )
             self._function_caches[key] = cache
             return cache
@@ -154,16 +162,20 @@ class CachedResourceFuncInfo(CachedFuncInfo):
         validate: ValidateFunc | None,
         allow_widgets: bool,
         hash_funcs: HashFuncsDict | None = None,
+        max_bytes: int | None = None,
+        hash_mode: HashMode = "sample",
     ):
         super().__init__(
             func,
             show_spinner=show_spinner,
             allow_widgets=allow_widgets,
             hash_funcs=hash_funcs,
+            hash_mode=hash_mode,
         )
         self.max_entries = max_entries
         self.ttl = ttl
         self.validate = validate
+        self.max_bytes = max_bytes
 
     @property
     def cache_type(self) -> CacheType:
@@ -186,6 +198,7 @@ class CachedResourceFuncInfo(CachedFuncInfo):
             ttl=self.ttl,
             validate=self.validate,
             allow_widgets=self.allow_widgets,
+            max_bytes=self.max_bytes,
         )
 
 
@@ -232,10 +245,12 @@ class CacheResourceAPI:
         *,
         ttl: float | timedelta | str | None = None,
         max_entries: int | None = None,
+        max_bytes: int | None = None,
         show_spinner: bool | str = True,
         validate: ValidateFunc | None = None,
         experimental_allow_widgets: bool = False,
         hash_funcs: HashFuncsDict | None = None,
+        experimental_hash_mode: HashMode = "sample",
     ) -> Callable[[F], F]:
         ...
 
@@ -245,19 +260,23 @@ class CacheResourceAPI:
         *,
         ttl: float | timedelta | str | None = None,
         max_entries: int | None = None,
+        max_bytes: int | None = None,
         show_spinner: bool | str = True,
         validate: ValidateFunc | None = None,
         experimental_allow_widgets: bool = False,
         hash_funcs: HashFuncsDict | None = None,
+        experimental_hash_mode: HashMode = "sample",
     ):
         return self._decorator(
             func,
             ttl=ttl,
             max_entries=max_entries,
+            max_bytes=max_bytes,
             show_spinner=show_spinner,
             validate=validate,
             experimental_allow_widgets=experimental_allow_widgets,
             hash_funcs=hash_funcs,
+            experimental_hash_mode=experimental_hash_mode,
         )
 
     def _decorator(
@@ -266,10 +285,12 @@ class CacheResourceAPI:
         *,
         ttl: float | timedelta | str | None,
         max_entries: int | None,
+        max_bytes: int | None,
         show_spinner: bool | str,
         validate: ValidateFunc | None,
         experimental_allow_widgets: bool,
         hash_funcs: HashFuncsDict | None = None,
+        experimental_hash_mode: HashMode = "sample",
     ):
         """Decorator to cache functions that return global resources (e.g. database connections, ML models).
 
@@ -307,6 +328,18 @@ class CacheResourceAPI:
             for an unbounded cache. When a new entry is added to a full cache,
             the oldest cached entry will be removed. Defaults to None.
 
+        max_bytes : int or None
+            The maximum total size, in bytes, of the entries to keep in the cache,
+            or None for no limit. Entries are measured with ``asizeof``, which
+            follows all the objects they reference, so measuring large or
+            complex objects can be slow. When a new entry makes the cache go over
+            this size, the least-recently-used entries are removed. Defaults to
+            None.
+
+            Only functions with ``max_bytes`` count toward the
+            ``runner.maxCacheSize`` config option, which limits all cached
+            functions together: the entries of other functions aren't measured.
+
         show_spinner : bool or str
             Enable the spinner. Default is True to show a spinner when there is
             a "cache miss" and the cached resource is being created. If string,
@@ -335,6 +368,17 @@ class CacheResourceAPI:
             the provided function to generate a hash for it. See below for an example
             of how this can be used.
 
+        experimental_hash_mode : "sample" or "exact"
+            How Pandas DataFrames and Series and NumPy arrays passed to the
+            function are hashed. If "sample" (default), Streamlit only hashes a
+            sample of the rows of dataframes with 100,000 or more rows, and of
+            the values of arrays with 1,000,000 or more values. This is fast, but
+            two large inputs that only differ outside of the sample share a cache
+            entry. If "exact", Streamlit hashes every value. The values of
+            numeric columns and arrays are hashed directly from memory, so this
+            is still fast for large inputs. PyArrow Tables and Polars DataFrames
+            are hashed by their Arrow data.
+
         Example
         -------
         >>> import streamlit as st
@@ -431,6 +475,8 @@ class CacheResourceAPI:
                     validate=validate,
                     allow_widgets=experimental_allow_widgets,
                     hash_funcs=hash_funcs,
+                    max_bytes=max_bytes,
+                    hash_mode=experimental_hash_mode,
                 )
             )
 
@@ -443,6 +489,8 @@ class CacheResourceAPI:
                 validate=validate,
                 allow_widgets=experimental_allow_widgets,
                 hash_funcs=hash_funcs,
+                max_bytes=max_bytes,
+                hash_mode=experimental_hash_mode,
             )
         )
 
@@ -471,20 +519,36 @@ class ResourceCache(Cache):
         validate: ValidateFunc | None,
         display_name: str,
         allow_widgets: bool,
+        max_bytes: float = math.inf,
     ):
         super().__init__()
         self.key = key
         self.display_name = display_name
-        self._mem_cache: TTLCache[str, MultiCacheResults] = TTLCache(
-            maxsize=max_entries, ttl=ttl_seconds, timer=cache_utils.TTLCACHE_TIMER
+        # Measuring resources is potentially expensive, so we only do it if
+        # the function limits their size. Caches without max_bytes report no
+        # memory usage to the CACHE_MEMORY_BUDGET.
+        if not math.isinf(max_bytes):
+            getsizeof = _get_resource_size
+        else:
+            getsizeof = None
+        self._mem_cache = BoundedTTLCache(
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+            max_bytes=max_bytes,
+            getsizeof=getsizeof,
         )
         self._mem_cache_lock = threading.Lock()
         self.validate = validate
         self.allow_widgets = allow_widgets
+        CACHE_MEMORY_BUDGET.register(self)
 
     @property
     def max_entries(self) -> float:
-        return cast(float, self._mem_cache.maxsize)
+        return self._mem_cache.max_entries
+
+    @property
+    def max_bytes(self) -> float:
+        return self._mem_cache.max_bytes
 
     @property
     def ttl_seconds(self) -> float:
@@ -552,6 +616,8 @@ class ResourceCache(Cache):
             multi_results.results[widget_key] = result
             self._mem_cache[key] = multi_results
 
+        CACHE_MEMORY_BUDGET.enforce()
+
     def _clear(self, key: str | None = None) -> None:
         with self._mem_cache_lock:
             if key is None:
@@ -565,15 +631,43 @@ class ResourceCache(Cache):
         # the lock.
         with self._mem_cache_lock:
             cache_entries = list(self._mem_cache.values())
+            evictions = self._mem_cache.evictions
 
-        # Lazy-load vendored package to prevent import of numpy
-        from streamlit.vendor.pympler.asizeof import asizeof
-
-        return [
+        stats = [
             CacheStat(
                 category_name="st_cache_resource",
                 cache_name=self.display_name,
-                byte_length=asizeof(entry),
+                byte_length=_get_resource_size(entry),
             )
             for entry in cache_entries
         ]
+        if evictions > 0:
+            stats.append(
+                CacheStat(
+                    category_name="st_cache_resource",
+                    cache_name=self.display_name,
+                    byte_length=0,
+                    evictions=evictions,
+                )
+            )
+        return stats
+
+    def get_memory_usage(self) -> int:
+        with self._mem_cache_lock:
+            return self._mem_cache.size_bytes
+
+    def evict_lru_entry(self) -> int:
+        with self._mem_cache_lock:
+            size_bytes = self._mem_cache.size_bytes
+            try:
+                self._mem_cache.popitem()
+            except KeyError:
+                return 0
+            return size_bytes - self._mem_cache.size_bytes
+
+
+def _get_resource_size(entry: MultiCacheResults) -> int:
+    # Lazy-load vendored package to prevent import of numpy
+    from streamlit.vendor.pympler.asizeof import asizeof
+
+    return cast(int, asizeof(entry))
@@ -19,15 +19,20 @@ from __future__ import annotations
 import functools
 import hashlib
 import inspect
+import os
 import threading
 import time
 import types
 from abc import abstractmethod
 from collections import defaultdict
-from typing import Any, Callable, Final
+from dataclasses import dataclass
+from typing import Any, Callable, Final, Sequence
+
+from cachetools import LRUCache
 
 from streamlit import type_util
 from streamlit.elements.spinner import spinner
+from streamlit.errors import StreamlitAPIException
 from streamlit.logger import get_logger
 from streamlit.runtime.caching.cache_errors import (
     CacheError,
@@ -45,7 +50,7 @@ from streamlit.runtime.caching.cached_message_replay import (
     MsgData,
     replay_cached_messages,
 )
-from streamlit.runtime.caching.hashing import HashFuncsDict, update_hash
+from streamlit.runtime.caching.hashing import HashFuncsDict, HashMode, update_hash
 from streamlit.type_util import UNEVALUATED_DATAFRAME_TYPES
 from streamlit.util import HASHLIB_KWARGS
 
@@ -55,6 +60,10 @@ _LOGGER: Final = get_logger(__name__)
 # is exposed here as a constant so that it can be patched in unit tests.
 TTLCACHE_TIMER = time.monotonic
 
+# How often to check whether another process has written the value we're
+# waiting for, while it holds the lease to compute it.
+COMPUTE_LEASE_POLL_INTERVAL_SECONDS: Final = 0.1
+
 
 class Cache:
     """Function cache interface. Caches persist across script runs."""
@@ -94,6 +103,19 @@ class Cache:
         with self._value_locks_lock:
             return self._value_locks[value_key]
 
+    def acquire_compute_lease(self, value_key: str) -> bool:
+        """Try to take the lease, shared with other processes, to compute a new
+        cached value. Return False if another process holds it: it's computing
+        the value, which will show up in the cache.
+
+        Must be called while holding the value's compute_value_lock. Caches
+        that aren't shared with other processes always return True.
+        """
+        return True
+
+    def release_compute_lease(self, value_key: str) -> None:
+        """Release the lease taken by acquire_compute_lease, if we hold it."""
+
     def clear(self, key: str | None = None):
         """Clear values from this cache.
         If no argument is passed, all items are cleared from the cache.
@@ -124,11 +146,18 @@ class CachedFuncInfo:
         show_spinner: bool | str,
         allow_widgets: bool,
         hash_funcs: HashFuncsDict | None,
+        hash_mode: HashMode = "sample",
     ):
+        if hash_mode not in ("sample", "exact"):
+            raise StreamlitAPIException(
+                f"Unsupported hash mode '{hash_mode}'. Valid values are 'sample' or 'exact'."
+            )
+
         self.func = func
         self.show_spinner = show_spinner
         self.allow_widgets = allow_widgets
         self.hash_funcs = hash_funcs
+        self.hash_mode = hash_mode
 
     @property
     def cache_type(self) -> CacheType:
@@ -174,7 +203,9 @@ def make_cached_func_wrapper(info: CachedFuncInfo) -> Callable[..., Any]:
 class CachedFunc:
     def __init__(self, info: CachedFuncInfo):
         self._info = info
-        self._function_key = _make_function_key(info.cache_type, info.func)
+        call_plan = _get_call_plan(info.cache_type, info.func)
+        self._function_key = call_plan.function_key
+        self._positional_arg_names = call_plan.positional_arg_names
 
     def __call__(self, *args, **kwargs) -> Any:
         """The wrapper. We'll only call our underlying function on a cache miss."""
@@ -210,7 +241,9 @@ class CachedFunc:
             func=self._info.func,
             func_args=func_args,
             func_kwargs=func_kwargs,
+            positional_arg_names=self._positional_arg_names,
             hash_funcs=self._info.hash_funcs,
+            hash_mode=self._info.hash_mode,
         )
 
         try:
@@ -258,6 +291,12 @@ class CachedFunc:
         #   no lock is acquired. But the unhappy path ("cache entry needs to be recomputed") is
         #   a wee bit slower, because we do two lookups for the entry.
 
+        #
+        # - If the cache is shared with other processes, we also take a "compute lease",
+        #   shared with those processes, while holding the lock. If another process holds
+        #   it, we poll the cache until that process has written the value, or until its
+        #   lease expires and we can take it.
+
         with cache.compute_value_lock(value_key):
             # We've acquired the lock - but another thread may have acquired it first
             # and already computed the value. So we need to test for a cache hit again,
@@ -270,38 +309,62 @@ class CachedFunc:
             except CacheKeyNotFoundError:
                 pass
 
-            # We acquired the lock before any other thread. Compute the value!
-            with self._info.cached_message_replay_ctx.calling_cached_function(
-                self._info.func, self._info.allow_widgets
-            ):
-                computed_value = self._info.func(*func_args, **func_kwargs)
+            while not cache.acquire_compute_lease(value_key):
+                time.sleep(COMPUTE_LEASE_POLL_INTERVAL_SECONDS)
+                try:
+                    cached_result = cache.read_result(value_key)
+                    # Another process computed the value. Early exit!
+                    return self._handle_cache_hit(cached_result)
+                except CacheKeyNotFoundError:
+                    pass
 
-            # We've computed our value, and now we need to write it back to the cache
-            # along with any "replay messages" that were generated during value computation.
-            messages = self._info.cached_message_replay_ctx._most_recent_messages
             try:
-                cache.write_result(value_key, computed_value, messages)
-                return computed_value
-            except (CacheError, RuntimeError):
-                # An exception was thrown while we tried to write to the cache. Report it to the user.
-                # (We catch `RuntimeError` here because it will be raised by Apache Spark if we do not
-                # collect dataframe before using `st.cache_data`.)
-                if True in [
-                    type_util.is_type(computed_value, type_name)
-                    for type_name in UNEVALUATED_DATAFRAME_TYPES
-                ]:
-                    # If the returned value is an unevaluated dataframe, raise an error.
-                    # Unevaluated dataframes are not yet in the local memory, which also
-                    # means they cannot be properly cached (serialized).
-                    raise UnevaluatedDataFrameError(
-                        f"""
+                return self._compute_and_write_value(
+                    cache, value_key, func_args, func_kwargs
+                )
+            finally:
+                cache.release_compute_lease(value_key)
+
+    def _compute_and_write_value(
+        self,
+        cache: Cache,
+        value_key: str,
+        func_args: tuple[Any, ...],
+        func_kwargs: dict[str, Any],
+    ) -> Any:
+        """Compute a new cached value, write it back to the cache, and return it."""
+        # We acquired the lock before any other thread. Compute the value!
+        with self._info.cached_message_replay_ctx.calling_cached_function(
+            self._info.func, self._info.allow_widgets
+        ):
+            computed_value = self._info.func(*func_args, **func_kwargs)
+
+        # We've computed our value, and now we need to write it back to the cache
+        # along with any "replay messages" that were generated during value computation.
+        messages = self._info.cached_message_replay_ctx._most_recent_messages
+        try:
+            cache.write_result(value_key, computed_value, messages)
+            return computed_value
+        except (CacheError, RuntimeError):
+            # An exception was thrown while we tried to write to the cache. Report it to the user.
+            # (We catch `RuntimeError` here because it will be raised by Apache Spark if we do not
+            # collect dataframe before using `st.cache_data`.)
+            if True in [
+                type_util.is_type(computed_value, type_name)
+                for type_name in UNEVALUATED_DATAFRAME_TYPES
+            ]:
+                # If the returned value is an unevaluated dataframe, raise an error.
+                # Unevaluated dataframes are not yet in the local memory, which also
+                # means they cannot be properly cached (serialized).
+                raise UnevaluatedDataFrameError(
+                    f"""
                         The function {get_cached_func_name_md(self._info.func)} is decorated with `st.cache_data` but it returns an unevaluated dataframe
                         of type `{type_util.get_fqn_type(computed_value)}`. Please call `collect()` or `to_pandas()` on the dataframe before returning it,
                         so `st.cache_data` can serialize and cache it."""
-                    )
-                raise UnserializableReturnValueError(
-                    return_value=computed_value, func=self._info.func
                 )
+            raise UnserializableReturnValueError(
+                return_value=computed_value, func=self._info.func
+            )
 
     def clear(self, *args, **kwargs):
         """Clear the cached function's associated cache.
@@ -345,7 +408,9 @@ class CachedFunc:
                 func=self._info.func,
                 func_args=args,
                 func_kwargs=kwargs,
+                positional_arg_names=self._positional_arg_names,
                 hash_funcs=self._info.hash_funcs,
+                hash_mode=self._info.hash_mode,
             )
         else:
             key = None
@@ -357,12 +422,17 @@ def _make_value_key(
     func: types.FunctionType,
     func_args: tuple[Any, ...],
     func_kwargs: dict[str, Any],
+    positional_arg_names: Sequence[str],
     hash_funcs: HashFuncsDict | None,
+    hash_mode: HashMode = "sample",
 ) -> str:
     """Create the key for a value within a cache.
 
     This key is generated from the function's arguments. All arguments
-    will be hashed, except for those named with a leading "_".
+    will be hashed, except for those named with a leading "_". Dataframes and
+    arrays are hashed according to hash_mode. positional_arg_names are the
+    names of the function's named positional parameters, see
+    `_get_positional_arg_names`.
 
     Raises
     ------
@@ -375,7 +445,12 @@ def _make_value_key(
     # function.
     arg_pairs: list[tuple[str | None, Any]] = []
     for arg_idx in range(len(func_args)):
-        arg_name = _get_positional_arg_name(func, arg_idx)
+        # Positional args without a name are passed to *args.
+        arg_name = (
+            positional_arg_names[arg_idx]
+            if arg_idx < len(positional_arg_names)
+            else None
+        )
         arg_pairs.append((arg_name, func_args[arg_idx]))
 
     for kw_name, kw_val in func_kwargs.items():
@@ -408,6 +483,7 @@ def _make_value_key(
                 hasher=args_hasher,
                 cache_type=cache_type,
                 hash_funcs=hash_funcs,
+                hash_mode=hash_mode,
                 hash_source=func,
             )
         except UnhashableTypeError as exc:
@@ -458,24 +534,73 @@ def _make_function_key(cache_type: CacheType, func: types.FunctionType) -> str:
     return cache_key
 
 
-def _get_positional_arg_name(func: types.FunctionType, arg_index: int) -> str | None:
-    """Return the name of a function's positional argument.
+def _get_positional_arg_names(func: types.FunctionType) -> tuple[str, ...]:
+    """Return the names of a function's named positional parameters, in order.
 
-    If arg_index is out of range, or refers to a parameter that is not a
-    named positional argument (e.g. an *args, **kwargs, or keyword-only param),
-    return None instead.
+    Positional arguments after these are passed to the function's *args, if it
+    has any.
+    """
+    names: list[str] = []
+    for param in inspect.signature(func).parameters.values():
+        if param.kind not in (
+            inspect.Parameter.POSITIONAL_OR_KEYWORD,
+            inspect.Parameter.POSITIONAL_ONLY,
+        ):
+            break
+        names.append(param.name)
+    return tuple(names)
+
+
+@dataclass(frozen=True)
+class _CallPlan:
+    """The parts of the keys of a cached function's values that don't depend on
+    the arguments of a call.
     """
-    if arg_index < 0:
-        return None
 
-    params: list[inspect.Parameter] = list(inspect.signature(func).parameters.values())
-    if arg_index >= len(params):
-        return None
+    function_key: str
+    positional_arg_names: tuple[str, ...]
 
-    if params[arg_index].kind in (
-        inspect.Parameter.POSITIONAL_OR_KEYWORD,
-        inspect.Parameter.POSITIONAL_ONLY,
-    ):
-        return params[arg_index].name
 
-    return None
+# The call plans of cached functions, by the function's module, qualified name
+# and code, and the modification time of the file the code was compiled from.
+# All the functions created from a definition (e.g. a function defined in a
+# method that is called many times) share its code, and a script's functions
+# compile to equal code on each rerun, unless they're changed. Checking the
+# file's modification time keeps function keys in sync with source code changes
+# that don't change the code, like comments.
+_call_plans: LRUCache[tuple[Any, ...], _CallPlan] = LRUCache(maxsize=1000)
+_call_plans_lock = threading.Lock()
+
+
+def _get_call_plan(cache_type: CacheType, func: types.FunctionType) -> _CallPlan:
+    """Return the call plan of a cached function.
+
+    Building a call plan reads and tokenizes the function's source code, so call
+    plans are only built once for the functions created from a definition.
+    """
+    # The source and signature of a decorated function are the ones of the
+    # function it wraps.
+    code = getattr(inspect.unwrap(func), "__code__", None)
+    if code is None:
+        return _make_call_plan(cache_type, func)
+
+    try:
+        mtime: int | None = os.stat(code.co_filename).st_mtime_ns
+    except (OSError, ValueError):
+        mtime = None
+
+    plan_key = (cache_type, func.__module__, func.__qualname__, code, mtime)
+    with _call_plans_lock:
+        call_plan = _call_plans.get(plan_key)
+    if call_plan is None:
+        call_plan = _make_call_plan(cache_type, func)
+        with _call_plans_lock:
+            _call_plans[plan_key] = call_plan
+    return call_plan
+
+
+def _make_call_plan(cache_type: CacheType, func: types.FunctionType) -> _CallPlan:
+    return _CallPlan(
+        function_key=_make_function_key(cache_type, func),
+        positional_arg_names=_get_positional_arg_names(func),
+    )
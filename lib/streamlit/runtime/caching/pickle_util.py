@@ -0,0 +1,119 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Pickling of @st.cache_data entries, with large buffers kept out of band.
+
+`pickle.dumps` copies the buffers of objects like NumPy arrays and pandas
+DataFrames into the pickle stream, and `pickle.loads` copies them out again.
+With `dumps(obj, out_of_band=True)`, those buffers are instead laid out after
+the pickle stream (using pickle protocol 5), each aligned to
+`_BUFFER_ALIGNMENT`:
+
+    header | (offset, length) for each buffer | pickle stream | buffers
+
+`loads` rebuilds the objects on top of the buffers. If the data it's given is
+writable, e.g. a private memory-mapping of a disk cache file, the buffers aren't
+copied at all. Read-only data (e.g. `bytes`) has its buffers copied once, so
+that the objects we return are writable, as they would be with `pickle.loads`.
+"""
+
+from __future__ import annotations
+
+import pickle
+import struct
+from typing import Any, Final
+
+# Pickle streams start with the PROTO opcode (0x80), so they can't be mistaken
+# for this.
+_MAGIC: Final = b"\x00STPKL5\x00"
+
+# magic, pickle stream length, number of buffers
+_HEADER: Final = struct.Struct("<8sQQ")
+
+# offset, length
+_BUFFER_HEADER: Final = struct.Struct("<QQ")
+
+# Align buffers to cache lines (and so to every NumPy dtype's alignment).
+_BUFFER_ALIGNMENT: Final = 64
+
+
+def dumps(obj: Any, out_of_band: bool = False) -> bytes:
+    """Pickle an object. If `out_of_band` is True, lay the buffers that support
+    pickle protocol 5 out of band, so that `loads` can avoid copying them.
+
+    Raises
+    ------
+    pickle.PicklingError, TypeError
+        If the object can't be pickled.
+    """
+    if not out_of_band:
+        return pickle.dumps(obj)
+
+    buffers: list[pickle.PickleBuffer] = []
+    data = pickle.dumps(obj, protocol=5, buffer_callback=buffers.append)
+    if not buffers:
+        return data
+
+    raw_buffers = [buffer.raw() for buffer in buffers]
+    offset = _HEADER.size + _BUFFER_HEADER.size * len(raw_buffers) + len(data)
+    buffer_headers: list[bytes] = []
+    chunks: list[bytes | memoryview] = []
+    for raw_buffer in raw_buffers:
+        padding = -offset % _BUFFER_ALIGNMENT
+        offset += padding
+        buffer_headers.append(_BUFFER_HEADER.pack(offset, raw_buffer.nbytes))
+        chunks.append(bytes(padding))
+        chunks.append(raw_buffer)
+        offset += raw_buffer.nbytes
+
+    return b"".join(
+        [
+            _HEADER.pack(_MAGIC, len(data), len(raw_buffers)),
+            *buffer_headers,
+            data,
+            *chunks,
+        ]
+    )
+
+
+def loads(data: bytes | memoryview) -> Any:
+    """Unpickle an object pickled by `dumps`.
+
+    Raises
+    ------
+    pickle.UnpicklingError
+        If the data can't be unpickled.
+    """
+    view = memoryview(data)
+    if bytes(view[: len(_MAGIC)]) != _MAGIC:
+        return pickle.loads(view)
+
+    try:
+        _, data_length, buffer_count = _HEADER.unpack_from(view)
+        buffers: list[bytearray | memoryview] = []
+        for i in range(buffer_count):
+            start, length = _BUFFER_HEADER.unpack_from(
+                view, _HEADER.size + i * _BUFFER_HEADER.size
+            )
+            buffer = view[start : start + length]
+            if len(buffer) != length:
+                raise ValueError("Truncated buffer")
+            buffers.append(bytearray(buffer) if view.readonly else buffer)
+
+        data_start = _HEADER.size + buffer_count * _BUFFER_HEADER.size
+        return pickle.loads(
+            view[data_start : data_start + data_length], buffers=buffers
+        )
+    except (struct.error, ValueError) as ex:
+        raise pickle.UnpicklingError("Malformed pickled entry") from ex
@@ -17,6 +17,7 @@ from streamlit.runtime.caching.storage.cache_storage_protocol import (
     CacheStorageContext,
     CacheStorageError,
     CacheStorageKeyNotFoundError,
+    CacheStorageLeaseProvider,
     CacheStorageManager,
 )
 
@@ -25,5 +26,6 @@ __all__ = [
     "CacheStorageContext",
     "CacheStorageError",
     "CacheStorageKeyNotFoundError",
+    "CacheStorageLeaseProvider",
     "CacheStorageManager",
 ]
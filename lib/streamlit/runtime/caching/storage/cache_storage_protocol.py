@@ -57,7 +57,7 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from dataclasses import dataclass
-from typing import Literal, Protocol
+from typing import Literal, Protocol, runtime_checkable
 
 
 class CacheStorageError(Exception):
@@ -102,6 +102,12 @@ class CacheStorageContext:
         Legacy parameter, that used in Streamlit current cache storage implementation.
         Could be ignored by cache storage implementation, if storage does not support
         persistence or it persistent by default.
+
+    max_bytes : int or None
+        The maximum total size, in bytes, of the values kept in memory by the
+        cache storage. If None, the cache storage will not limit their size.
+        Could be ignored by cache storage implementations that don't keep
+        values in memory.
     """
 
     function_key: str
@@ -109,6 +115,7 @@ class CacheStorageContext:
     ttl_seconds: float | None = None
     max_entries: int | None = None
     persist: Literal["disk"] | None = None
+    max_bytes: int | None = None
 
 
 class CacheStorage(Protocol):
@@ -126,9 +133,13 @@ class CacheStorage(Protocol):
     """
 
     @abstractmethod
-    def get(self, key: str) -> bytes:
+    def get(self, key: str) -> bytes | memoryview:
         """Returns the stored value for the key.
 
+        The value may be returned as a writable memoryview (e.g. of a private
+        memory-mapping of a file) that the caller then owns: the cached
+        values unpickled from it may use its memory without copying it.
+
         Raises
         ------
         CacheStorageKeyNotFoundError
@@ -159,6 +170,35 @@ class CacheStorage(Protocol):
         pass
 
 
+@runtime_checkable
+class CacheStorageLeaseProvider(Protocol):
+    """Optional protocol for cache storages that are shared by several
+    processes, so that only one of them computes a missing value, while the
+    others wait for it to be written to the storage.
+
+    Notes
+    -----
+    Threading: The methods of this protocol could be called from multiple
+    threads, but the same key is never leased by two threads of the same
+    process at once.
+    """
+
+    @abstractmethod
+    def acquire_lease(self, key: str) -> bool:
+        """Try to take the lease to compute the value for the key. Return True
+        if this process now holds it, or False if another process holds it.
+
+        A lease must expire on its own after some time, so that a process that
+        dies while holding it doesn't block the others forever.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    def release_lease(self, key: str) -> None:
+        """Release the lease for the key, if this process holds it."""
+        raise NotImplementedError
+
+
 class CacheStorageManager(Protocol):
     """Cache storage manager protocol, that should be implemented by the concrete
     cache storage managers.
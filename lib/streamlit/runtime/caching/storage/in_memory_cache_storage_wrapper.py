@@ -16,10 +16,11 @@ from __future__ import annotations
 import math
 import threading
 
-from cachetools import TTLCache
-
 from streamlit.logger import get_logger
-from streamlit.runtime.caching import cache_utils
+from streamlit.runtime.caching.cache_memory_budget import (
+    CACHE_MEMORY_BUDGET,
+    BoundedTTLCache,
+)
 from streamlit.runtime.caching.storage.cache_storage_protocol import (
     CacheStorage,
     CacheStorageContext,
@@ -41,7 +42,10 @@ class InMemoryCacheStorageWrapper(CacheStorage):
     automatically removed if a given time to live (TTL) has passed.
 
     The in-memory cache is also an LRU cache, which means that the entries
-    are automatically removed if the cache size exceeds a given maxsize.
+    are automatically removed if the cache size exceeds a given maxsize, or if
+    the total size of the entries exceeds a given max_bytes. The in-memory cache
+    also counts against the process-wide `runner.maxCacheSize` budget. Entries
+    removed from the in-memory cache stay in the underlying storage.
 
     If the storage implements its strategy for maxsize, it is recommended
     (but not necessary) that the storage implement the same LRU strategy,
@@ -62,13 +66,16 @@ class InMemoryCacheStorageWrapper(CacheStorage):
         self.function_display_name = context.function_display_name
         self._ttl_seconds = context.ttl_seconds
         self._max_entries = context.max_entries
-        self._mem_cache: TTLCache[str, bytes] = TTLCache(
-            maxsize=self.max_entries,
-            ttl=self.ttl_seconds,
-            timer=cache_utils.TTLCACHE_TIMER,
+        self._max_bytes = context.max_bytes
+        self._mem_cache = BoundedTTLCache(
+            max_entries=self.max_entries,
+            ttl_seconds=self.ttl_seconds,
+            max_bytes=self.max_bytes,
+            getsizeof=len,
         )
         self._mem_cache_lock = threading.Lock()
         self._persist_storage = persist_storage
+        CACHE_MEMORY_BUDGET.register(self)
 
     @property
     def ttl_seconds(self) -> float:
@@ -78,7 +85,11 @@ class InMemoryCacheStorageWrapper(CacheStorage):
     def max_entries(self) -> float:
         return float(self._max_entries) if self._max_entries is not None else math.inf
 
-    def get(self, key: str) -> bytes:
+    @property
+    def max_bytes(self) -> float:
+        return float(self._max_bytes) if self._max_bytes is not None else math.inf
+
+    def get(self, key: str) -> bytes | memoryview:
         """
         Returns the stored value for the key or raise CacheStorageKeyNotFoundError if
         the key is not found
@@ -86,7 +97,13 @@ class InMemoryCacheStorageWrapper(CacheStorage):
         try:
             entry_bytes = self._read_from_mem_cache(key)
         except CacheStorageKeyNotFoundError:
-            entry_bytes = self._persist_storage.get(key)
+            persisted_entry = self._persist_storage.get(key)
+            if isinstance(persisted_entry, memoryview):
+                # The caller owns memoryviews (e.g. memory-mapped files), and
+                # may mutate them through the values unpickled from them, so
+                # they must not be shared with later reads.
+                return persisted_entry
+            entry_bytes = persisted_entry
             self._write_to_mem_cache(key, entry_bytes)
         return entry_bytes
 
@@ -119,10 +136,38 @@ class InMemoryCacheStorageWrapper(CacheStorage):
                         byte_length=len(item),
                     )
                 )
+            evictions = self._mem_cache.evictions
+
+        if evictions > 0:
+            stats.append(
+                CacheStat(
+                    category_name="st_cache_data",
+                    cache_name=self.function_display_name,
+                    byte_length=0,
+                    evictions=evictions,
+                )
+            )
         return stats
 
+    def get_memory_usage(self) -> int:
+        """Returns the total size of the entries in the memory cache, in bytes"""
+        with self._mem_cache_lock:
+            return self._mem_cache.size_bytes
+
+    def evict_lru_entry(self) -> int:
+        """Removes the least-recently-used entry from the memory cache, but not
+        from the persistent storage, and returns its size in bytes
+        """
+        with self._mem_cache_lock:
+            try:
+                _, entry_bytes = self._mem_cache.popitem()
+            except KeyError:
+                return 0
+        return len(entry_bytes)
+
     def close(self) -> None:
         """Closes the cache storage"""
+        CACHE_MEMORY_BUDGET.unregister(self)
         self._persist_storage.close()
 
     def _read_from_mem_cache(self, key: str) -> bytes:
@@ -139,6 +184,7 @@ class InMemoryCacheStorageWrapper(CacheStorage):
     def _write_to_mem_cache(self, key: str, entry_bytes: bytes) -> None:
         with self._mem_cache_lock:
             self._mem_cache[key] = entry_bytes
+        CACHE_MEMORY_BUDGET.enforce()
 
     def _remove_from_mem_cache(self, key: str) -> None:
         with self._mem_cache_lock:
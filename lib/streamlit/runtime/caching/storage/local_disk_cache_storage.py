@@ -33,6 +33,15 @@ if the context is not valid.
 entries from disk for a single `@st.cache_data` decorated function if `persist="disk"`
 is used in CacheStorageContext.
 
+- DiskCacheIndex : the SQLite index shared by all LocalDiskCacheStorage instances
+(and all Streamlit processes using the same cache folder). It records the size,
+creation time and last access time of every entry on disk, which is what lets
+LocalDiskCacheStorage expire entries after `ttl`, keep at most `max_entries`
+entries per function, and keep the whole folder within `runner.maxDiskCacheSize`.
+
+Each function's entries live in their own `<function_key>` sub-folder of the cache
+folder, so that clearing a function removes a single folder.
+
 
     ┌───────────────────────────────┐
     │  LocalDiskCacheStorageManager │
@@ -48,7 +57,7 @@ is used in CacheStorageContext.
        └────────────────►                              │
                         │    ┌─────────────────────┐   │
                         │    │                     │   │
-                        │    │   LocalDiskStorage  │   │
+                        │    │   LocalDiskStorage  ├───┼───► DiskCacheIndex
                         │    │                     │   │
                         │    └─────────────────────┘   │
                         │                              │
@@ -58,12 +67,19 @@ is used in CacheStorageContext.
 
 from __future__ import annotations
 
+import contextlib
+import functools
 import math
+import mmap
 import os
 import shutil
-from typing import Final
+import sqlite3
+import sys
+import threading
+import time
+from typing import Any, Callable, Final, Iterator, NamedTuple, TypeVar, cast
 
-from streamlit import util
+from streamlit import config, env_util, util
 from streamlit.file_util import get_streamlit_file_path, streamlit_read, streamlit_write
 from streamlit.logger import get_logger
 from streamlit.runtime.caching.storage.cache_storage_protocol import (
@@ -88,6 +104,49 @@ _CACHE_DIR_NAME: Final = "cache"
 # (`@st.cache_data` was originally called `@st.memo`)
 _CACHED_FILE_EXTENSION: Final = "memo"
 
+# The name of the DiskCacheIndex database, inside the cache folder.
+_INDEX_FILE_NAME: Final = "index.db"
+
+# How long to wait for another thread or process to release the index.
+_INDEX_TIMEOUT_SECONDS: Final = 5.0
+
+_INDEX_SCHEMA: Final = (
+    """
+    CREATE TABLE IF NOT EXISTS entries (
+        function_key TEXT NOT NULL,
+        value_key TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        created_at REAL NOT NULL,
+        accessed_at REAL NOT NULL,
+        PRIMARY KEY (function_key, value_key)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS entries_accessed_at ON entries (accessed_at)",
+)
+
+# Values at least this big are memory-mapped rather than read into bytes.
+_MMAP_MIN_SIZE: Final = 1024 * 1024
+
+# Windows can't replace or remove a file while it's mapped. Before Python 3.13,
+# a mapping keeps a duplicate of the file's descriptor open for as long as it
+# lives, i.e. as long as the objects unpickled on top of it. Values that are
+# kept around (e.g. in the session state of many sessions) could then use up
+# the process's file descriptors. Big values are then read into bytes like
+# small ones, which the in-memory cache layer keeps, so that later hits don't
+# read the file again.
+_CAN_MMAP: Final = not env_util.IS_WINDOWS and sys.version_info >= (3, 13)
+
+# Access times are recorded in memory, and written to the index at most this
+# often, or when an eviction needs them.
+_ACCESS_TIMES_WRITE_INTERVAL_SECONDS: Final = 5.0
+
+# Python 3.13+ can map a file without keeping its file descriptor open.
+_MMAP_KWARGS: Final[dict[str, Any]] = (
+    {"trackfd": False} if sys.version_info >= (3, 13) else {}
+)
+
+_T = TypeVar("_T")
+
 
 class LocalDiskCacheStorageManager(CacheStorageManager):
     def create(self, context: CacheStorageContext) -> CacheStorage:
@@ -100,19 +159,13 @@ class LocalDiskCacheStorageManager(CacheStorageManager):
     def clear_all(self) -> None:
         cache_path = get_cache_folder_path()
         if os.path.isdir(cache_path):
+            _close_idle_connections()
             shutil.rmtree(cache_path)
 
     def check_context(self, context: CacheStorageContext) -> None:
-        if (
-            context.persist == "disk"
-            and context.ttl_seconds is not None
-            and not math.isinf(context.ttl_seconds)
-        ):
-            _LOGGER.warning(
-                f"The cached function '{context.function_display_name}' has a TTL "
-                "that will be ignored. Persistent cached functions currently don't "
-                "support TTL."
-            )
+        # The ttl and max_entries of persisted functions are enforced by the
+        # disk index, so every context is valid.
+        pass
 
 
 class LocalDiskCacheStorage(CacheStorage):
@@ -125,6 +178,8 @@ class LocalDiskCacheStorage(CacheStorage):
         self.persist = context.persist
         self._ttl_seconds = context.ttl_seconds
         self._max_entries = context.max_entries
+        self._index = DiskCacheIndex()
+        self._legacy_files_moved = False
 
     @property
     def ttl_seconds(self) -> float:
@@ -134,20 +189,42 @@ class LocalDiskCacheStorage(CacheStorage):
     def max_entries(self) -> float:
         return float(self._max_entries) if self._max_entries is not None else math.inf
 
-    def get(self, key: str) -> bytes:
+    def get(self, key: str) -> bytes | memoryview:
         """
         Returns the stored value for the key if persisted,
         raise CacheStorageKeyNotFoundError if not found, or not configured
         with persist="disk"
+
+        Big values are returned as a private memory-mapping of their file where
+        files can be mapped, so that the objects unpickled from them can share
+        its memory.
         """
         if self.persist == "disk":
+            self._move_legacy_cache_files()
+            index_entry = self._index.touch(self.function_key, key, time.time())
+            if index_entry is not None and self._is_expired(index_entry.created_at):
+                _LOGGER.debug("Disk cache EXPIRED: %s", key)
+                self.delete(key)
+                raise CacheStorageKeyNotFoundError("Key expired in disk cache")
+
             path = self._get_cache_file_path(key)
             try:
+                if (
+                    _CAN_MMAP
+                    and index_entry is not None
+                    and index_entry.size >= _MMAP_MIN_SIZE
+                ):
+                    value = _map_cache_file(path)
+                    _LOGGER.debug("Disk cache HIT (mapped): %s", key)
+                    return value
                 with streamlit_read(path, binary=True) as input:
                     value = input.read()
                     _LOGGER.debug("Disk cache HIT: %s", key)
                     return bytes(value)
             except FileNotFoundError:
+                if index_entry is not None:
+                    # The file was removed behind our back.
+                    self._index.remove(self.function_key, key)
                 raise CacheStorageKeyNotFoundError("Key not found in disk cache")
             except Exception as ex:
                 _LOGGER.error(ex)
@@ -160,64 +237,443 @@ class LocalDiskCacheStorage(CacheStorage):
     def set(self, key: str, value: bytes) -> None:
         """Sets the value for a given key"""
         if self.persist == "disk":
+            self._move_legacy_cache_files()
             path = self._get_cache_file_path(key)
             try:
-                with streamlit_write(path, binary=True) as output:
+                # Write atomically, so that other threads or processes reading
+                # this entry never see a partially-written file.
+                with streamlit_write(path, binary=True, atomic=True) as output:
                     output.write(value)
             except util.Error as e:
                 _LOGGER.debug(e)
-                # Clean up file so we don't leave zero byte files.
-                try:
-                    os.remove(path)
-                except (FileNotFoundError, OSError):
-                    # If we can't remove the file, it's not a big deal.
-                    pass
                 raise CacheStorageError("Unable to write to cache") from e
 
+            now = time.time()
+            self._index.add(self.function_key, key, len(value), now)
+            self._evict(now)
+
     def delete(self, key: str) -> None:
         """Delete a cache file from disk. If the file does not exist on disk,
         return silently. If another exception occurs, log it. Does not throw.
         """
         if self.persist == "disk":
-            path = self._get_cache_file_path(key)
-            try:
-                os.remove(path)
-            except FileNotFoundError:
-                # The file is already removed.
-                pass
-            except Exception as ex:
-                _LOGGER.exception(
-                    "Unable to remove a file from the disk cache", exc_info=ex
-                )
+            self._move_legacy_cache_files()
+            self._index.remove(self.function_key, key)
+            _remove_cache_file(self._get_cache_file_path(key))
 
     def clear(self) -> None:
         """Delete all keys for the current storage"""
-        cache_dir = get_cache_folder_path()
-
-        if os.path.isdir(cache_dir):
-            # We try to remove all files in the cache directory that start with
-            # the function key, whether `clear` called for `self.persist`
-            # storage or not, to avoid leaving orphaned files in the cache directory.
-            for file_name in os.listdir(cache_dir):
-                if self._is_cache_file(file_name):
-                    os.remove(os.path.join(cache_dir, file_name))
+        # We remove this function's folder whether `clear` is called for
+        # `self.persist` storage or not, to avoid leaving orphaned files in the
+        # cache directory.
+        self._move_legacy_cache_files()
+        self._index.remove_function(self.function_key)
+        function_dir = _get_function_folder_path(self.function_key)
+        if os.path.isdir(function_dir):
+            shutil.rmtree(function_dir, ignore_errors=True)
 
     def close(self) -> None:
         """Dummy implementation of close, we don't need to actually "close" anything"""
 
     def _get_cache_file_path(self, value_key: str) -> str:
         """Return the path of the disk cache file for the given value."""
-        cache_dir = get_cache_folder_path()
-        return os.path.join(
-            cache_dir, f"{self.function_key}-{value_key}.{_CACHED_FILE_EXTENSION}"
+        return _get_cache_file_path(self.function_key, value_key)
+
+    def _move_legacy_cache_files(self) -> None:
+        """Move the function's cache files that were written to the cache folder
+        itself, before each function had its own folder, into the function's
+        folder and the index. This is done once per storage.
+        """
+        if self._legacy_files_moved:
+            return
+        self._legacy_files_moved = True
+
+        prefix = f"{self.function_key}-"
+        suffix = f".{_CACHED_FILE_EXTENSION}"
+        try:
+            with os.scandir(get_cache_folder_path()) as entries:
+                legacy_files = [
+                    entry
+                    for entry in entries
+                    if entry.name.startswith(prefix)
+                    and entry.name.endswith(suffix)
+                    and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return
+        except OSError as ex:
+            _LOGGER.debug("Unable to list the disk cache folder: %s", ex)
+            return
+
+        for entry in legacy_files:
+            value_key = entry.name[len(prefix) : -len(suffix)]
+            path = self._get_cache_file_path(value_key)
+            try:
+                stat = entry.stat()
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                os.replace(entry.path, path)
+            except OSError as ex:
+                _LOGGER.debug("Unable to move a legacy disk cache file: %s", ex)
+                continue
+            self._index.add(self.function_key, value_key, stat.st_size, stat.st_mtime)
+
+    def _is_expired(self, created_at: float) -> bool:
+        return time.time() - created_at > self.ttl_seconds
+
+    def _evict(self, now: float) -> None:
+        """Remove the entries that exceed this function's ttl and max_entries,
+        then the least-recently-used entries of all functions that exceed
+        `runner.maxDiskCacheSize`.
+        """
+        if not math.isinf(self.ttl_seconds):
+            expired = self._index.remove_expired(
+                self.function_key, now - self.ttl_seconds
+            )
+            for value_key in expired:
+                _remove_cache_file(self._get_cache_file_path(value_key))
+
+        if not math.isinf(self.max_entries):
+            excess = self._index.remove_excess(self.function_key, int(self.max_entries))
+            for value_key in excess:
+                _remove_cache_file(self._get_cache_file_path(value_key))
+
+        max_bytes = get_max_disk_cache_size_bytes()
+        if max_bytes is not None:
+            for function_key, value_key in self._index.remove_lru(max_bytes):
+                _remove_cache_file(_get_cache_file_path(function_key, value_key))
+
+
+def _ignore_index_errors(default: Any) -> Callable[[_T], _T]:
+    """Decorator for DiskCacheIndex methods: return `default` instead of raising
+    if the index can't be used.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(*args, **kwargs):
+            try:
+                return method(*args, **kwargs)
+            except sqlite3.Error as ex:
+                _LOGGER.debug("Unable to use the disk cache index: %s", ex)
+                return default() if callable(default) else default
+
+        return wrapper
+
+    return cast(Callable[[_T], _T], decorator)
+
+
+class DiskCacheIndexEntry(NamedTuple):
+    size: int
+    created_at: float
+
+
+class DiskCacheIndex:
+    """The index of the entries in the disk cache folder, stored in a SQLite
+    database next to them.
+
+    The cache files remain the source of truth for cached values: if the index
+    can't be used (e.g. the cache folder doesn't exist yet, or is read-only),
+    its methods log the error and behave as if the index were empty, which only
+    disables expiry and eviction.
+
+    Access times are recorded in memory and written to the index in batches
+    (see `_ACCESS_TIMES_WRITE_INTERVAL_SECONDS`), so that cache hits don't write
+    to the index every time. The evictions of this index write them first, while
+    other indexes see them a little late.
+
+    Notes
+    -----
+    Threading: SAFE. Every method runs in its own transaction, on a connection
+    that no other thread uses at the same time, so the index may be used from
+    any thread, and from several processes sharing the cache folder.
+    """
+
+    def __init__(self) -> None:
+        self._access_times_lock = threading.Lock()
+        # The access times that weren't written to the index yet, by
+        # (function_key, value_key).
+        self._access_times: dict[tuple[str, str], float] = {}
+        self._access_times_written_at = 0.0
+
+    @_ignore_index_errors(default=None)
+    def touch(
+        self, function_key: str, value_key: str, now: float
+    ) -> DiskCacheIndexEntry | None:
+        """Record an access to an entry. Return the entry, or None if it isn't
+        in the index.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT size, created_at FROM entries"
+                " WHERE function_key = ? AND value_key = ?",
+                (function_key, value_key),
+            ).fetchone()
+        if row is None:
+            return None
+
+        with self._access_times_lock:
+            self._access_times[(function_key, value_key)] = now
+            write_access_times = (
+                now - self._access_times_written_at
+                >= _ACCESS_TIMES_WRITE_INTERVAL_SECONDS
+            )
+            if write_access_times:
+                self._access_times_written_at = now
+        if write_access_times:
+            with self._connect() as conn:
+                self._write_access_times(conn)
+        return DiskCacheIndexEntry(size=row[0], created_at=row[1])
+
+    @_ignore_index_errors(default=None)
+    def add(self, function_key: str, value_key: str, size: int, now: float) -> None:
+        """Add an entry to the index, or replace it if it already exists."""
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                (function_key, value_key, size, now, now),
+            )
+
+    @_ignore_index_errors(default=None)
+    def remove(self, function_key: str, value_key: str) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "DELETE FROM entries WHERE function_key = ? AND value_key = ?",
+                (function_key, value_key),
+            )
+
+    @_ignore_index_errors(default=None)
+    def remove_function(self, function_key: str) -> None:
+        with self._connect() as conn:
+            conn.execute("DELETE FROM entries WHERE function_key = ?", (function_key,))
+
+    @_ignore_index_errors(default=list)
+    def remove_expired(self, function_key: str, created_before: float) -> list[str]:
+        """Remove the function's entries created before `created_before`, and
+        return their value keys.
+        """
+        with self._connect() as conn:
+            value_keys = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT value_key FROM entries"
+                    " WHERE function_key = ? AND created_at < ?",
+                    (function_key, created_before),
+                )
+            ]
+            self._delete_rows(conn, [(function_key, key) for key in value_keys])
+            return value_keys
+
+    @_ignore_index_errors(default=list)
+    def remove_excess(self, function_key: str, max_entries: int) -> list[str]:
+        """Remove the function's least-recently-used entries beyond its
+        `max_entries` most recently used ones, and return their value keys.
+        """
+        with self._connect() as conn:
+            self._write_access_times(conn)
+            value_keys = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT value_key FROM entries WHERE function_key = ?"
+                    " ORDER BY accessed_at DESC LIMIT -1 OFFSET ?",
+                    (function_key, max_entries),
+                )
+            ]
+            self._delete_rows(conn, [(function_key, key) for key in value_keys])
+            return value_keys
+
+    @_ignore_index_errors(default=list)
+    def remove_lru(self, max_bytes: int) -> list[tuple[str, str]]:
+        """Remove the least-recently-used entries of all functions until the
+        entries' total size is at most `max_bytes`, and return their
+        (function_key, value_key) pairs.
+        """
+        with self._connect() as conn:
+            self._write_access_times(conn)
+            total_bytes = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()[0]
+            if total_bytes <= max_bytes:
+                return []
+
+            removed = []
+            for function_key, value_key, size in conn.execute(
+                "SELECT function_key, value_key, size FROM entries"
+                " ORDER BY accessed_at"
+            ):
+                removed.append((function_key, value_key))
+                total_bytes -= size
+                if total_bytes <= max_bytes:
+                    break
+            self._delete_rows(conn, removed)
+            return removed
+
+    def _write_access_times(self, conn: sqlite3.Connection) -> None:
+        """Write the recorded access times to the index. An entry that was
+        replaced in the meantime keeps its newer access time.
+        """
+        with self._access_times_lock:
+            access_times = [
+                (accessed_at, function_key, value_key)
+                for (function_key, value_key), accessed_at in self._access_times.items()
+            ]
+            self._access_times.clear()
+        conn.executemany(
+            "UPDATE entries SET accessed_at = MAX(accessed_at, ?)"
+            " WHERE function_key = ? AND value_key = ?",
+            access_times,
         )
 
-    def _is_cache_file(self, fname: str) -> bool:
-        """Return true if the given file name is a cache file for this storage."""
-        return fname.startswith(f"{self.function_key}-") and fname.endswith(
-            f".{_CACHED_FILE_EXTENSION}"
+    @staticmethod
+    def _delete_rows(conn: sqlite3.Connection, keys: list[tuple[str, str]]) -> None:
+        conn.executemany(
+            "DELETE FROM entries WHERE function_key = ? AND value_key = ?", keys
         )
 
+    @staticmethod
+    @contextlib.contextmanager
+    def _connect() -> Iterator[sqlite3.Connection]:
+        """Take a connection to the index from the pool of idle connections, or
+        open one, and run the block in a transaction.
+        """
+        path = os.path.join(get_cache_folder_path(), _INDEX_FILE_NAME)
+        conn = _take_idle_connection(path)
+        if conn is None:
+            conn = _open_index_connection(path)
+        try:
+            with conn:
+                yield conn
+        except BaseException:
+            conn.close()
+            raise
+        _put_idle_connection(path, conn)
+
+
+# Idle connections to the index, which any thread can reuse. Only those of the
+# index in the current cache folder are kept.
+_idle_connections: list[tuple[sqlite3.Connection, int]] = []
+_idle_connections_path: str | None = None
+_idle_connections_lock = threading.Lock()
+
+# The most connections to the index that are kept open while they're idle.
+_MAX_IDLE_CONNECTIONS: Final = 4
+
+
+def _open_index_connection(path: str) -> sqlite3.Connection:
+    """Open a connection to the index, and create its tables if needed."""
+    conn = sqlite3.connect(
+        path, timeout=_INDEX_TIMEOUT_SECONDS, check_same_thread=False
+    )
+    try:
+        # Don't wait for the disk on every transaction: a crash can only lose
+        # the latest changes to the index, which we can do without.
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        with conn:
+            for statement in _INDEX_SCHEMA:
+                conn.execute(statement)
+    except BaseException:
+        conn.close()
+        raise
+    return conn
+
+
+def _get_file_id(path: str) -> int | None:
+    try:
+        return os.stat(path).st_ino
+    except OSError:
+        return None
+
+
+def _take_idle_connection(path: str) -> sqlite3.Connection | None:
+    """Return an idle connection to the index at `path`, or None if there's
+    none. Connections to an index file that was removed since (e.g. by
+    clearing the cache folder) are closed instead.
+    """
+    file_id = _get_file_id(path)
+    with _idle_connections_lock:
+        if path != _idle_connections_path:
+            return None
+        while _idle_connections:
+            conn, conn_file_id = _idle_connections.pop()
+            if conn_file_id == file_id:
+                return conn
+            conn.close()
+    return None
+
+
+def _put_idle_connection(path: str, conn: sqlite3.Connection) -> None:
+    """Keep a connection that's done with its transaction for reuse, or close
+    it if enough connections are idle.
+    """
+    global _idle_connections_path
+
+    file_id = _get_file_id(path)
+    with _idle_connections_lock:
+        if path != _idle_connections_path:
+            _close_idle_connections_locked()
+            _idle_connections_path = path
+        if file_id is not None and len(_idle_connections) < _MAX_IDLE_CONNECTIONS:
+            _idle_connections.append((conn, file_id))
+            return
+    conn.close()
+
+
+def _close_idle_connections() -> None:
+    """Close the idle connections to the index, e.g. before its folder is
+    removed.
+    """
+    with _idle_connections_lock:
+        _close_idle_connections_locked()
+
+
+def _close_idle_connections_locked() -> None:
+    for conn, _ in _idle_connections:
+        conn.close()
+    _idle_connections.clear()
+
+
+def _map_cache_file(path: str) -> memoryview:
+    """Return a private, copy-on-write memory-mapping of a cache file.
+
+    Writes to it (e.g. to a NumPy array unpickled on top of it) only change the
+    caller's copy of the pages they touch, never the file.
+    """
+    with open(path, "rb") as file:
+        mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_COPY, **_MMAP_KWARGS)
+    return memoryview(mapping)
+
+
+def _remove_cache_file(path: str) -> None:
+    """Remove a cache file. Log errors other than a missing file."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        # The file is already removed.
+        pass
+    except Exception as ex:
+        _LOGGER.exception("Unable to remove a file from the disk cache", exc_info=ex)
+
+
+def _get_function_folder_path(function_key: str) -> str:
+    """Return the folder holding the disk cache files of the given function."""
+    return os.path.join(get_cache_folder_path(), function_key)
+
+
+def _get_cache_file_path(function_key: str, value_key: str) -> str:
+    """Return the path of the disk cache file for the given value."""
+    return os.path.join(
+        _get_function_folder_path(function_key),
+        f"{value_key}.{_CACHED_FILE_EXTENSION}",
+    )
+
 
 def get_cache_folder_path() -> str:
     return get_streamlit_file_path(_CACHE_DIR_NAME)
+
+
+def get_max_disk_cache_size_bytes() -> int | None:
+    """Return `runner.maxDiskCacheSize` in bytes, or None if it is disabled."""
+    max_disk_cache_size_mb: int = config.get_option("runner.maxDiskCacheSize")
+    if max_disk_cache_size_mb <= 0:
+        return None
+    return max_disk_cache_size_mb * int(1e6)
@@ -0,0 +1,385 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Declares the SharedCacheStorageManager class, which is used to create
+SharedCacheStorage instances that keep `@st.cache_data` entries in a SQLite
+database file.
+
+Every Streamlit process that uses the same database file shares the same
+entries: a value computed by one process is a cache hit for all the others, and
+no process keeps its own copy of the pickled entries in memory. SQLite's file
+locking makes this safe across processes, and each operation uses its own
+connection, which makes it safe across threads.
+
+To use it, either set the `runner.sharedCachePath` config option to the path of
+the database file, or pass a `SharedCacheStorageManager` as the
+`cache_storage_manager` of the `RuntimeConfig`.
+
+Entries are kept in the database file across restarts, whether the cached
+function uses `persist="disk"` or not. They still expire after the function's
+`ttl`, and each function keeps at most `max_entries` entries.
+
+On a cache miss, only the process that takes the value's lease (see
+`CacheStorageLeaseProvider`) computes it; the others wait for it to be written.
+With `stale_while_revalidate`, they get the expired value instead of waiting,
+while the lease holder refreshes it.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import math
+import os
+import sqlite3
+import time
+import uuid
+from typing import Final, Iterator
+
+from streamlit.logger import get_logger
+from streamlit.runtime.caching.storage.cache_storage_protocol import (
+    CacheStorage,
+    CacheStorageContext,
+    CacheStorageError,
+    CacheStorageKeyNotFoundError,
+    CacheStorageLeaseProvider,
+    CacheStorageManager,
+)
+from streamlit.runtime.stats import CacheStat, CacheStatsProvider
+
+_LOGGER: Final = get_logger(__name__)
+
+# How long to wait for another thread or process to release the database.
+_TIMEOUT_SECONDS: Final = 30.0
+
+_SCHEMA: Final = (
+    """
+    CREATE TABLE IF NOT EXISTS entries (
+        function_key TEXT NOT NULL,
+        value_key TEXT NOT NULL,
+        value BLOB NOT NULL,
+        created_at REAL NOT NULL,
+        accessed_at REAL NOT NULL,
+        PRIMARY KEY (function_key, value_key)
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS entries_function_accessed_at
+    ON entries (function_key, accessed_at)
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS leases (
+        function_key TEXT NOT NULL,
+        value_key TEXT NOT NULL,
+        owner TEXT NOT NULL,
+        expires_at REAL NOT NULL,
+        PRIMARY KEY (function_key, value_key)
+    )
+    """,
+)
+
+# Identifies this process as the owner of its leases. (The pid tells apart
+# forked processes, which share the token.)
+_PROCESS_TOKEN: Final = uuid.uuid4().hex
+
+
+class SharedCacheStorageManager(CacheStorageManager):
+    """Creates SharedCacheStorage instances that share the database at `path`.
+
+    Parameters
+    ----------
+    path : str
+        The path of the database file.
+
+    lease_seconds : float
+        How long a process may compute a missing value before the other
+        processes stop waiting for it and compute it themselves.
+
+    stale_while_revalidate : bool
+        If True, reads of an expired value return it while another process
+        holds the lease to recompute it, rather than waiting for the new value.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        lease_seconds: float = 60.0,
+        stale_while_revalidate: bool = False,
+    ):
+        self.path = os.path.abspath(path)
+        self.lease_seconds = lease_seconds
+        self.stale_while_revalidate = stale_while_revalidate
+
+    def create(self, context: CacheStorageContext) -> CacheStorage:
+        """Creates a new cache storage instance in the shared database"""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        return SharedCacheStorage(
+            context,
+            self.path,
+            lease_seconds=self.lease_seconds,
+            stale_while_revalidate=self.stale_while_revalidate,
+        )
+
+    def clear_all(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        try:
+            with _connect(self.path) as conn:
+                conn.execute("DELETE FROM entries")
+                conn.execute("DELETE FROM leases")
+        except sqlite3.Error as ex:
+            _LOGGER.error(ex)
+            raise CacheStorageError("Unable to clear the shared cache") from ex
+
+    def check_context(self, context: CacheStorageContext) -> None:
+        pass
+
+
+class SharedCacheStorage(CacheStorage, CacheStorageLeaseProvider, CacheStatsProvider):
+    """Cache storage that keeps the entries of a single `@st.cache_data`
+    function in a SQLite database shared with other processes.
+
+    Notes
+    -----
+    Threading: SAFE. Every method uses its own connection.
+    """
+
+    def __init__(
+        self,
+        context: CacheStorageContext,
+        path: str,
+        lease_seconds: float = 60.0,
+        stale_while_revalidate: bool = False,
+    ):
+        self.function_key = context.function_key
+        self.function_display_name = context.function_display_name
+        self._ttl_seconds = context.ttl_seconds
+        self._max_entries = context.max_entries
+        self._path = path
+        self._lease_seconds = lease_seconds
+        self._stale_while_revalidate = stale_while_revalidate
+
+    @property
+    def ttl_seconds(self) -> float:
+        return self._ttl_seconds if self._ttl_seconds is not None else math.inf
+
+    @property
+    def max_entries(self) -> float:
+        return float(self._max_entries) if self._max_entries is not None else math.inf
+
+    @property
+    def _max_age_seconds(self) -> float:
+        """How long an entry is kept before it's removed from the database.
+
+        With stale_while_revalidate, expired entries are kept for another ttl
+        (and at least one lease) so they can be served while they're being
+        recomputed, but they're still removed eventually.
+        """
+        if not self._stale_while_revalidate:
+            return self.ttl_seconds
+        return self.ttl_seconds + max(self.ttl_seconds, self._lease_seconds)
+
+    def get(self, key: str) -> bytes:
+        """Returns the stored value for the key, or raise
+        CacheStorageKeyNotFoundError if it's not found or has expired.
+
+        With stale_while_revalidate, an expired value is returned while
+        another process holds the lease to recompute it.
+        """
+        now = time.time()
+        try:
+            with _connect(self._path) as conn:
+                row = conn.execute(
+                    "SELECT value, created_at FROM entries"
+                    " WHERE function_key = ? AND value_key = ?",
+                    (self.function_key, key),
+                ).fetchone()
+                if row is None:
+                    value = None
+                elif now - row[1] > self.ttl_seconds:
+                    if self._stale_while_revalidate:
+                        # Keep the expired value around to serve it while
+                        # it's being recomputed.
+                        value = row[0] if self._is_leased(conn, key, now) else None
+                    else:
+                        value = None
+                        conn.execute(
+                            "DELETE FROM entries"
+                            " WHERE function_key = ? AND value_key = ?",
+                            (self.function_key, key),
+                        )
+                else:
+                    value = row[0]
+                    conn.execute(
+                        "UPDATE entries SET accessed_at = ?"
+                        " WHERE function_key = ? AND value_key = ?",
+                        (now, self.function_key, key),
+                    )
+        except sqlite3.Error as ex:
+            _LOGGER.error(ex)
+            raise CacheStorageError("Unable to read from cache") from ex
+
+        if value is None:
+            raise CacheStorageKeyNotFoundError("Key not found in shared cache")
+
+        _LOGGER.debug("Shared cache HIT: %s", key)
+        return bytes(value)
+
+    def set(self, key: str, value: bytes) -> None:
+        """Sets the value for a given key, then removes this function's expired
+        entries, and its least-recently-used entries beyond max_entries.
+        """
+        now = time.time()
+        try:
+            with _connect(self._path) as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                    (self.function_key, key, value, now, now),
+                )
+                if not math.isinf(self.ttl_seconds):
+                    conn.execute(
+                        "DELETE FROM entries WHERE function_key = ? AND created_at < ?",
+                        (self.function_key, now - self._max_age_seconds),
+                    )
+                if not math.isinf(self.max_entries):
+                    conn.execute(
+                        "DELETE FROM entries WHERE function_key = ?"
+                        " AND value_key IN ("
+                        "  SELECT value_key FROM entries WHERE function_key = ?"
+                        "  ORDER BY accessed_at DESC LIMIT -1 OFFSET ?"
+                        ")",
+                        (self.function_key, self.function_key, int(self.max_entries)),
+                    )
+        except sqlite3.Error as ex:
+            _LOGGER.error(ex)
+            raise CacheStorageError("Unable to write to cache") from ex
+
+    def acquire_lease(self, key: str) -> bool:
+        """Try to take the lease to compute the value for the key. Leases expire
+        after lease_seconds.
+        """
+        now = time.time()
+        owner = _get_lease_owner()
+        try:
+            with _connect(self._path) as conn:
+                conn.execute(
+                    "DELETE FROM leases"
+                    " WHERE function_key = ? AND value_key = ? AND expires_at <= ?",
+                    (self.function_key, key, now),
+                )
+                conn.execute(
+                    "INSERT OR IGNORE INTO leases VALUES (?, ?, ?, ?)",
+                    (self.function_key, key, owner, now + self._lease_seconds),
+                )
+                row = conn.execute(
+                    "SELECT owner FROM leases WHERE function_key = ? AND value_key = ?",
+                    (self.function_key, key),
+                ).fetchone()
+        except sqlite3.Error as ex:
+            # Computing the value in several processes is better than not at all.
+            _LOGGER.error(ex)
+            return True
+
+        return row is not None and row[0] == owner
+
+    def release_lease(self, key: str) -> None:
+        """Release the lease for the key, if this process holds it."""
+        try:
+            with _connect(self._path) as conn:
+                conn.execute(
+                    "DELETE FROM leases"
+                    " WHERE function_key = ? AND value_key = ? AND owner = ?",
+                    (self.function_key, key, _get_lease_owner()),
+                )
+        except sqlite3.Error as ex:
+            # The lease will expire on its own.
+            _LOGGER.error(ex)
+
+    def delete(self, key: str) -> None:
+        """Delete a given key. Logs errors, does not throw."""
+        try:
+            with _connect(self._path) as conn:
+                conn.execute(
+                    "DELETE FROM entries WHERE function_key = ? AND value_key = ?",
+                    (self.function_key, key),
+                )
+        except sqlite3.Error as ex:
+            _LOGGER.exception(
+                "Unable to remove an entry from the shared cache", exc_info=ex
+            )
+
+    def clear(self) -> None:
+        """Delete all keys for the current storage"""
+        try:
+            with _connect(self._path) as conn:
+                conn.execute(
+                    "DELETE FROM entries WHERE function_key = ?", (self.function_key,)
+                )
+        except sqlite3.Error as ex:
+            _LOGGER.error(ex)
+            raise CacheStorageError("Unable to clear the shared cache") from ex
+
+    def get_stats(self) -> list[CacheStat]:
+        """Returns a list of stats in bytes for the entries of this function"""
+        try:
+            with _connect(self._path) as conn:
+                sizes = conn.execute(
+                    "SELECT LENGTH(value) FROM entries WHERE function_key = ?",
+                    (self.function_key,),
+                ).fetchall()
+        except sqlite3.Error as ex:
+            _LOGGER.debug("Unable to read the shared cache stats: %s", ex)
+            return []
+
+        return [
+            CacheStat(
+                category_name="st_cache_data",
+                cache_name=self.function_display_name,
+                byte_length=size,
+            )
+            for (size,) in sizes
+        ]
+
+    def close(self) -> None:
+        """Dummy implementation of close, every operation closes its connection"""
+
+    def _is_leased(self, conn: sqlite3.Connection, key: str, now: float) -> bool:
+        """Return True if a process holds the lease for the key."""
+        row = conn.execute(
+            "SELECT 1 FROM leases"
+            " WHERE function_key = ? AND value_key = ? AND expires_at > ?",
+            (self.function_key, key, now),
+        ).fetchone()
+        return row is not None
+
+
+def _get_lease_owner() -> str:
+    return f"{os.getpid()}-{_PROCESS_TOKEN}"
+
+
+@contextlib.contextmanager
+def _connect(path: str) -> Iterator[sqlite3.Connection]:
+    """Open a connection to the shared database, and run the block in a
+    transaction.
+    """
+    conn = sqlite3.connect(path, timeout=_TIMEOUT_SECONDS)
+    try:
+        # WAL lets readers in other processes proceed while one process writes.
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        with conn:
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            yield conn
+    finally:
+        conn.close()
@@ -30,7 +30,43 @@ if TYPE_CHECKING:
 _LOGGER: Final = get_logger(__name__)
 
 
-def populate_hash_if_needed(msg: ForwardMsg) -> str:
+def serialize_forward_msg_payload(msg: ForwardMsg) -> bytes:
+    """Serialize a ForwardMsg without its hash and metadata fields.
+
+    The payload is the part of a ForwardMsg that identifies its content. It's
+    what we hash, what we check against the message size limit, and what we
+    send over the wire, so callers should compute it once per message and pass
+    it along. The hash and metadata are serialized separately (see
+    `runtime_util.serialize_forward_msg`).
+
+    Parameters
+    ----------
+    msg : ForwardMsg
+
+    Returns
+    -------
+    bytes
+        The serialized message, minus its hash and metadata.
+
+    """
+    # Move the message's hash and metadata aside. They're not part of the
+    # payload.
+    msg_hash = msg.hash
+    has_metadata = msg.HasField("metadata")
+    metadata = msg.metadata
+    msg.ClearField("hash")
+    msg.ClearField("metadata")
+
+    try:
+        return msg.SerializeToString()
+    finally:
+        # Restore hash and metadata.
+        msg.hash = msg_hash
+        if has_metadata:
+            msg.metadata.CopyFrom(metadata)
+
+
+def populate_hash_if_needed(msg: ForwardMsg, payload: bytes | None = None) -> str:
     """Computes and assigns the unique hash for a ForwardMsg.
 
     If the ForwardMsg already has a hash, this is a no-op.
@@ -39,6 +75,10 @@ def populate_hash_if_needed(msg: ForwardMsg) -> str:
     ----------
     msg : ForwardMsg
 
+    payload : bytes or None
+        The message's serialized payload, as returned by
+        `serialize_forward_msg_payload`. If None, it will be computed here.
+
     Returns
     -------
     string
@@ -48,19 +88,14 @@ def populate_hash_if_needed(msg: ForwardMsg) -> str:
 
     """
     if msg.hash == "":
-        # Move the message's metadata aside. It's not part of the
-        # hash calculation.
-        metadata = msg.metadata
-        msg.ClearField("metadata")
+        if payload is None:
+            payload = serialize_forward_msg_payload(msg)
 
         # MD5 is good enough for what we need, which is uniqueness.
         hasher = hashlib.md5(**HASHLIB_KWARGS)
-        hasher.update(msg.SerializeToString())
+        hasher.update(payload)
         msg.hash = hasher.hexdigest()
 
-        # Restore metadata.
-        msg.metadata.CopyFrom(metadata)
-
     return msg.hash
 
 
@@ -96,6 +131,11 @@ class ForwardMsgCache(CacheStatsProvider):
     rather than the message itself, to a client. Clients can then
     request messages from this cache via another endpoint.
 
+    The cache is content-addressed: each entry holds the encoded payload of
+    its message (see `serialize_forward_msg_payload`), keyed by the message's
+    hash. When many sessions send the same message, the Runtime writes this
+    shared payload to each of them instead of encoding the message again.
+
     This cache is *not* thread safe. It's intended to only be accessed by
     the server thread.
 
@@ -104,13 +144,25 @@ class ForwardMsgCache(CacheStatsProvider):
     class Entry:
         """Cache entry.
 
-        Stores the cached message, and the set of AppSessions
-        that we've sent the cached message to.
+        Stores the cached message's encoded payload, and the set of
+        AppSessions that we've sent the cached message to.
 
         """
 
-        def __init__(self, msg: ForwardMsg | None):
-            self.msg = msg
+        def __init__(self, msg: ForwardMsg | None, payload: bytes | None = None):
+            # We store the message's payload rather than the message itself, so
+            # that it doesn't need to be serialized again each time it's sent.
+            # The hash and metadata are kept in a separate, small message.
+            self.payload: bytes | None = None
+            self._envelope: ForwardMsg | None = None
+            if msg is not None:
+                if payload is None:
+                    payload = serialize_forward_msg_payload(msg)
+                self.payload = payload
+                self._envelope = ForwardMsg(hash=msg.hash)
+                if msg.HasField("metadata"):
+                    self._envelope.metadata.CopyFrom(msg.metadata)
+
             self._session_script_run_counts: MutableMapping[
                 AppSession, int
             ] = WeakKeyDictionary()
@@ -118,6 +170,23 @@ class ForwardMsgCache(CacheStatsProvider):
         def __repr__(self) -> str:
             return util.repr_(self)
 
+        @property
+        def msg(self) -> ForwardMsg | None:
+            """The cached message, decoded from its payload."""
+            if self.payload is None or self._envelope is None:
+                return None
+            msg = ForwardMsg()
+            msg.ParseFromString(self.payload)
+            msg.MergeFrom(self._envelope)
+            return msg
+
+        @property
+        def byte_length(self) -> int:
+            """The size of the cached message, in bytes."""
+            if self.payload is None or self._envelope is None:
+                return 0
+            return len(self.payload) + self._envelope.ByteSize()
+
         def add_session_ref(self, session: AppSession, script_run_count: int) -> None:
             """Adds a reference to a AppSession that has referenced
             this Entry's message.
@@ -167,7 +236,11 @@ class ForwardMsgCache(CacheStatsProvider):
         return util.repr_(self)
 
     def add_message(
-        self, msg: ForwardMsg, session: AppSession, script_run_count: int
+        self,
+        msg: ForwardMsg,
+        session: AppSession,
+        script_run_count: int,
+        payload: bytes | None = None,
     ) -> None:
         """Add a ForwardMsg to the cache.
 
@@ -181,13 +254,16 @@ class ForwardMsgCache(CacheStatsProvider):
         session : AppSession
         script_run_count : int
             The number of times the session's script has run
+        payload : bytes or None
+            The message's encoded payload, if the caller already has it.
+            If None, it will be computed when the message is first cached.
 
         """
-        populate_hash_if_needed(msg)
+        populate_hash_if_needed(msg, payload)
         entry = self._entries.get(msg.hash, None)
         if entry is None:
             if config.get_option("global.storeCachedForwardMessagesInMemory"):
-                entry = ForwardMsgCache.Entry(msg)
+                entry = ForwardMsgCache.Entry(msg, payload)
             else:
                 entry = ForwardMsgCache.Entry(None)
             self._entries[msg.hash] = entry
@@ -209,6 +285,25 @@ class ForwardMsgCache(CacheStatsProvider):
         entry = self._entries.get(hash, None)
         return entry.msg if entry else None
 
+    def get_payload(self, hash: str) -> bytes | None:
+        """Return the encoded payload of the message with the given hash, if
+        it exists in the cache.
+
+        This is cheaper than `get_message`, which has to decode the payload.
+
+        Parameters
+        ----------
+        hash : str
+            The hash of the message whose payload to retrieve.
+
+        Returns
+        -------
+        bytes | None
+
+        """
+        entry = self._entries.get(hash, None)
+        return entry.payload if entry else None
+
     def has_message_reference(
         self, msg: ForwardMsg, session: AppSession, script_run_count: int
     ) -> bool:
@@ -291,7 +386,7 @@ class ForwardMsgCache(CacheStatsProvider):
                 CacheStat(
                     category_name="ForwardMessageCache",
                     cache_name="",
-                    byte_length=entry.msg.ByteSize() if entry.msg is not None else 0,
+                    byte_length=entry.byte_length,
                 )
             )
         return group_stats(stats)
@@ -16,6 +16,8 @@ from __future__ import annotations
 
 from typing import Any
 
+from streamlit.proto.Arrow_pb2 import Arrow
+from streamlit.proto.ArrowNamedDataSet_pb2 import ArrowNamedDataSet
 from streamlit.proto.Delta_pb2 import Delta
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 
@@ -33,28 +35,65 @@ class ForwardMsgQueue:
 
     def __init__(self):
         self._queue: list[ForwardMsg] = []
+        # The serialized size of each message in _queue, and of all the messages
+        # in the queue, including option lists.
+        self._msg_sizes: list[int] = []
+        self._byte_size = 0
         # A mapping of (delta_path -> _queue.indexof(msg)) for each
         # Delta message in the queue. We use this for coalescing
         # redundant outgoing Deltas (where a newer Delta supersedes
         # an older Delta, with the same delta_path, that's still in the
         # queue).
         self._delta_index_map: dict[tuple[int, ...], int] = dict()
+        # OptionList messages, by hash. They're flushed before the rest of the
+        # queue: a Delta that refers to an option list can take the place of
+        # an older Delta in the queue, ahead of the option list's message.
+        self._option_lists: dict[str, ForwardMsg] = dict()
+        # The encoded payloads of hashed messages in the queue, by hash, if they
+        # were serialized when they were enqueued.
+        self._payloads: dict[str, bytes] = dict()
 
     def get_debug(self) -> dict[str, Any]:
         from google.protobuf.json_format import MessageToDict
 
         return {
-            "queue": [MessageToDict(m) for m in self._queue],
+            "queue": [
+                MessageToDict(m) for m in [*self._option_lists.values(), *self._queue]
+            ],
             "ids": list(self._delta_index_map.keys()),
         }
 
     def is_empty(self) -> bool:
-        return len(self._queue) == 0
+        return len(self._queue) == 0 and len(self._option_lists) == 0
+
+    @property
+    def byte_size(self) -> int:
+        """The serialized size of the messages in the queue, in bytes."""
+        return self._byte_size
+
+    def enqueue(self, msg: ForwardMsg, payload: bytes | None = None) -> None:
+        """Add message into queue, possibly composing it with another message.
+
+        If the message's encoded payload is given (see
+        `serialize_forward_msg_payload`), it's kept with the message, so that
+        the message doesn't need to be serialized again when it's sent.
+        """
+        if payload is not None and msg.hash:
+            self._payloads[msg.hash] = payload
+        msg_size = len(payload) if payload is not None else msg.ByteSize()
+
+        if msg.WhichOneof("type") == "option_list":
+            if msg.hash not in self._option_lists:
+                self._byte_size += msg_size
+            self._option_lists[msg.hash] = msg
+            return
 
-    def enqueue(self, msg: ForwardMsg) -> None:
-        """Add message into queue, possibly composing it with another message."""
         if not _is_composable_message(msg):
-            self._queue.append(msg)
+            if msg.delta.WhichOneof("type") == "arrow_add_rows":
+                # Streamed rows that are enqueued after these rows mustn't be
+                # composed with the rows before them.
+                self._delta_index_map.pop(tuple(msg.metadata.delta_path), None)
+            self._append(msg, msg_size)
             return
 
         # If there's a Delta message with the same delta_path already in
@@ -71,13 +110,27 @@ class ForwardMsgQueue:
                 new_msg = ForwardMsg()
                 new_msg.delta.CopyFrom(composed_delta)
                 new_msg.metadata.CopyFrom(msg.metadata)
+                if composed_delta.WhichOneof("type") == "arrow_add_rows":
+                    # The rows were appended to the rows of old_msg.
+                    msg_size = new_msg.ByteSize()
+                else:
+                    # The new element or block replaces old_msg, so the new
+                    # message has the payload (and hash) of msg.
+                    new_msg.hash = msg.hash
                 self._queue[index] = new_msg
+                self._byte_size += msg_size - self._msg_sizes[index]
+                self._msg_sizes[index] = msg_size
                 return
 
         # No composition occurred. Append this message to the queue, and
         # store its index for potential future composition.
         self._delta_index_map[delta_key] = len(self._queue)
+        self._append(msg, msg_size)
+
+    def _append(self, msg: ForwardMsg, msg_size: int) -> None:
         self._queue.append(msg)
+        self._msg_sizes.append(msg_size)
+        self._byte_size += msg_size
 
     def clear(self, retain_lifecycle_msgs: bool = False) -> None:
         """Clear the queue, potentially retaining lifecycle messages.
@@ -88,12 +141,18 @@ class ForwardMsgQueue:
         not hear about important script lifecycle events (such as the script being
         stopped early in order to be rerun).
         """
+        # The Deltas that refer to option lists are never retained.
+        self._option_lists = dict()
+        # Retained lifecycle messages are small, and are serialized again
+        # without their payload.
+        self._payloads = dict()
         if not retain_lifecycle_msgs:
             self._queue = []
+            self._msg_sizes = []
         else:
-            self._queue = [
-                msg
-                for msg in self._queue
+            retained = [
+                (msg, msg_size)
+                for msg, msg_size in zip(self._queue, self._msg_sizes)
                 if msg.WhichOneof("type")
                 in {
                     "script_finished",
@@ -101,19 +160,29 @@ class ForwardMsgQueue:
                     "parent_message",
                 }
             ]
+            self._queue = [msg for msg, _ in retained]
+            self._msg_sizes = [msg_size for _, msg_size in retained]
 
+        self._byte_size = sum(self._msg_sizes)
         self._delta_index_map = dict()
 
     def flush(self) -> list[ForwardMsg]:
         """Clear the queue and return a list of the messages it contained
         before being cleared.
         """
-        queue = self._queue
+        queue = [*self._option_lists.values(), *self._queue]
         self.clear()
         return queue
 
+    def flush_with_payloads(self) -> list[tuple[ForwardMsg, bytes | None]]:
+        """Like `flush`, but return each message with its encoded payload, if
+        it was given when the message was enqueued.
+        """
+        payloads = self._payloads
+        return [(msg, payloads.get(msg.hash)) for msg in self.flush()]
+
     def __len__(self) -> int:
-        return len(self._queue)
+        return len(self._option_lists) + len(self._queue)
 
 
 def _is_composable_message(msg: ForwardMsg) -> bool:
@@ -122,11 +191,15 @@ def _is_composable_message(msg: ForwardMsg) -> bool:
         # Non-delta messages are never composable.
         return False
 
-    # We never compose add_rows messages in Python, because the add_rows
+    # We don't compose most add_rows messages in Python, because the add_rows
     # operation can raise errors, and we don't have a good way of handling
-    # those errors in the message queue.
+    # those errors in the message queue. Rows that are streamed to a dataset
+    # (with max_rows) are the exception: rows streamed without their schema have
+    # the same schema as the rows before them, so they can be appended to them.
     delta_type = msg.delta.WhichOneof("type")
-    return delta_type != "add_rows" and delta_type != "arrow_add_rows"
+    if delta_type == "arrow_add_rows":
+        return msg.delta.arrow_add_rows.max_rows > 0
+    return delta_type != "add_rows"
 
 
 def _maybe_compose_deltas(old_delta: Delta, new_delta: Delta) -> Delta | None:
@@ -162,4 +235,78 @@ def _maybe_compose_deltas(old_delta: Delta, new_delta: Delta) -> Delta | None:
     if new_delta_type == "add_block":
         return new_delta
 
+    if new_delta_type == "arrow_add_rows" and old_delta_type == "arrow_add_rows":
+        return _maybe_compose_arrow_add_rows(old_delta, new_delta)
+
     return None
+
+
+def _maybe_compose_arrow_add_rows(old_delta: Delta, new_delta: Delta) -> Delta | None:
+    """Append the record batches of new_delta, which were streamed without their
+    schema, to the rows of old_delta, if both add rows to the same dataset.
+
+    The Arrow IPC stream of old_delta, which may start with a schema message,
+    stays valid when more record batches are appended to it. The client keeps
+    the last max_rows rows of the dataset after adding them, so the oldest
+    batches beyond max_rows rows are dropped from the composed stream.
+    """
+    old_rows = old_delta.arrow_add_rows
+    new_rows = new_delta.arrow_add_rows
+    if (
+        not new_rows.schema_omitted
+        or old_rows.name != new_rows.name
+        or old_rows.has_name != new_rows.has_name
+        or old_rows.max_rows != new_rows.max_rows
+        or old_rows.data.data_compression != new_rows.data.data_compression
+        or new_rows.data.data_compression != Arrow.DataCompression.NONE
+    ):
+        return None
+
+    composed_delta = Delta()
+    composed_delta.CopyFrom(old_delta)
+    composed_rows = composed_delta.arrow_add_rows
+    composed_rows.data.data += new_rows.data.data
+    composed_rows.batch_rows.extend(new_rows.batch_rows)
+    _drop_arrow_batches_beyond_max_rows(composed_rows)
+    composed_delta.fragment_id = new_delta.fragment_id
+    return composed_delta
+
+
+def _drop_arrow_batches_beyond_max_rows(rows: ArrowNamedDataSet) -> None:
+    """Remove the oldest record batches of the dataset's Arrow IPC stream that
+    the client would drop anyway, since max_rows rows come after them.
+
+    The rows are left as they are if their batch_rows don't match the record
+    batches of the stream.
+    """
+    batch_rows = list(rows.batch_rows)
+    num_dropped = 0
+    num_rows = sum(batch_rows)
+    while (
+        num_dropped < len(batch_rows)
+        and num_rows - batch_rows[num_dropped] >= rows.max_rows
+    ):
+        num_rows -= batch_rows[num_dropped]
+        num_dropped += 1
+    if num_dropped == 0:
+        return
+
+    import pyarrow as pa
+
+    # The offsets of the record batches in the stream, which may start with
+    # a schema message.
+    source = pa.BufferReader(rows.data.data)
+    batch_offsets = []
+    offset = 0
+    for message in pa.ipc.MessageReader.open_stream(source):
+        if message.type == "record batch":
+            batch_offsets.append(offset)
+        elif batch_offsets:
+            return
+        offset = source.tell()
+    if len(batch_offsets) != len(batch_rows):
+        return
+
+    data = rows.data.data
+    rows.data.data = data[: batch_offsets[0]] + data[batch_offsets[num_dropped] :]
+    del rows.batch_rows[:num_dropped]
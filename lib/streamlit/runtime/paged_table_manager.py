@@ -0,0 +1,265 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Keeps the Arrow tables of paged dataframes, whose rows the frontend fetches
+on demand."""
+
+from __future__ import annotations
+
+import collections
+import threading
+import uuid
+from typing import TYPE_CHECKING, Final, NamedTuple
+
+from streamlit import type_util
+from streamlit.logger import get_logger
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+_LOGGER: Final = get_logger(__name__)
+
+# The maximum number of rows that can be fetched at once.
+MAX_ROWS_PER_REQUEST: Final = 10000
+
+
+class PagedTableError(Exception):
+    """Raised when rows can't be read from a paged table."""
+
+
+class _SortKey(NamedTuple):
+    column_position: int
+    ascending: bool
+
+
+class _PagedTable:
+    """A table that the PagedTableManager keeps, along with the indices of its
+    rows in the last requested sort order.
+    """
+
+    def __init__(self, table: pa.Table, session_id: str, coordinates: str):
+        self.table = table
+        self.session_id = session_id
+        self.coordinates = coordinates
+        self.sort_key: _SortKey | None = None
+        self.sort_indices: pa.Array | None = None
+
+
+def _get_session_id() -> str:
+    """Get the active AppSession's session_id."""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        # This is only None when running "python myscript.py" rather than
+        # "streamlit run myscript.py". In which case the session ID doesn't
+        # matter and can just be a constant, as there's only ever "session".
+        return "dontcare"
+    else:
+        return ctx.session_id
+
+
+def get_column_names(table: pa.Table) -> list[str]:
+    """Return the names of the table's columns in the order the frontend
+    displays them: the index columns first, then the data columns.
+    """
+    pandas_metadata = table.schema.pandas_metadata or {}
+    index_columns = [
+        name
+        for name in pandas_metadata.get("index_columns", [])
+        # A RangeIndex is only stored as metadata.
+        if isinstance(name, str)
+    ]
+    return index_columns + [
+        name for name in table.column_names if name not in index_columns
+    ]
+
+
+class PagedTableManager:
+    """Keeps the Arrow tables that are displayed by st.dataframe in paged mode,
+    and serves windows of their rows, optionally sorted by a column.
+
+    Like the MediaFileManager, it tracks which tables are displayed by which
+    session at which location of the app, so that tables can be removed once
+    no session displays them anymore.
+
+    Sorting and slicing run on the requesting thread, without holding the lock.
+    """
+
+    def __init__(self):
+        # Dict of [table_id -> _PagedTable]
+        self._tables: dict[str, _PagedTable] = dict()
+
+        # Dict[session ID][coordinates] -> table_id.
+        self._tables_by_session_and_coord: dict[
+            str, dict[str, str]
+        ] = collections.defaultdict(dict)
+
+        # PagedTableManager is used from multiple threads, so all operations
+        # need to be protected with a Lock.
+        self._lock = threading.Lock()
+
+    def add(self, table: pa.Table, coordinates: str) -> str:
+        """Add a table displayed at the given coordinates of the current
+        session, and return its ID.
+
+        If the same table was already displayed at the same coordinates, its
+        ID is reused, so that the frontend doesn't need to fetch its rows again.
+
+        Safe to call from any thread.
+        """
+        session_id = _get_session_id()
+
+        with self._lock:
+            previous_tables = [
+                (table_id, paged_table)
+                for table_id, paged_table in self._tables.items()
+                if paged_table.session_id == session_id
+                and paged_table.coordinates == coordinates
+            ]
+
+        # Comparing tables can take a moment, so we don't hold the lock.
+        table_id = next(
+            (
+                table_id
+                for table_id, paged_table in previous_tables
+                if paged_table.table.equals(table, check_metadata=True)
+            ),
+            None,
+        )
+
+        with self._lock:
+            if table_id is None or table_id not in self._tables:
+                table_id = uuid.uuid4().hex
+                self._tables[table_id] = _PagedTable(table, session_id, coordinates)
+            self._tables_by_session_and_coord[session_id][coordinates] = table_id
+
+        return table_id
+
+    def get_rows(
+        self,
+        table_id: str,
+        start: int,
+        end: int,
+        sort_column: int | None = None,
+        ascending: bool = True,
+    ) -> bytes:
+        """Return the rows [start, end) of the table as Arrow IPC bytes.
+
+        Safe to call from any thread.
+
+        Parameters
+        ----------
+        table_id : str
+            The ID of the table.
+        start : int
+            The position of the first row, in the sort order.
+        end : int
+            The position after the last row, in the sort order.
+        sort_column : int or None
+            The position of the column to sort by, in the order returned by
+            `get_column_names`. If None, the rows are in the original order.
+        ascending : bool
+            Whether to sort in ascending order.
+
+        Raises
+        ------
+        PagedTableError
+            If there is no table with the given ID, the requested rows are
+            invalid, or the table can't be sorted by the given column.
+        """
+        import pyarrow as pa
+
+        with self._lock:
+            paged_table = self._tables.get(table_id)
+            if paged_table is None:
+                raise PagedTableError(f"No table with ID {table_id}")
+            sort_key = paged_table.sort_key
+            sort_indices = paged_table.sort_indices
+
+        table = paged_table.table
+        if start < 0 or end < start or end - start > MAX_ROWS_PER_REQUEST:
+            raise PagedTableError(f"Invalid rows requested: [{start}, {end})")
+
+        if sort_column is None:
+            window = table.slice(start, end - start)
+        else:
+            requested_sort_key = _SortKey(sort_column, ascending)
+            if sort_indices is None or sort_key != requested_sort_key:
+                sort_indices = self._sort(table, requested_sort_key)
+                with self._lock:
+                    paged_table.sort_key = requested_sort_key
+                    paged_table.sort_indices = sort_indices
+            window = table.take(sort_indices.slice(start, end - start))
+
+        try:
+            return type_util.pyarrow_table_to_ipc_bytes(window)
+        except pa.ArrowException as ex:
+            raise PagedTableError(f"Unable to serialize the rows: {ex}") from ex
+
+    def _sort(self, table: pa.Table, sort_key: _SortKey) -> pa.Array:
+        """Compute the indices of the table's rows sorted by a column."""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+
+        column_names = get_column_names(table)
+        if not 0 <= sort_key.column_position < len(column_names):
+            raise PagedTableError(f"Invalid sort column: {sort_key.column_position}")
+
+        try:
+            return pc.sort_indices(
+                table,
+                sort_keys=[
+                    (
+                        column_names[sort_key.column_position],
+                        "ascending" if sort_key.ascending else "descending",
+                    )
+                ],
+                null_placement="at_end",
+            )
+        except pa.ArrowException as ex:
+            raise PagedTableError(f"Unable to sort the table: {ex}") from ex
+
+    def clear_session_refs(self, session_id: str | None = None) -> None:
+        """Remove the given session's table references.
+
+        (This does not remove any tables from the manager - you must call
+        `remove_orphaned_tables` for that.)
+
+        Should be called whenever ScriptRunner starts and when a session ends.
+
+        Safe to call from any thread.
+        """
+        if session_id is None:
+            session_id = _get_session_id()
+
+        with self._lock:
+            if session_id in self._tables_by_session_and_coord:
+                del self._tables_by_session_and_coord[session_id]
+
+    def remove_orphaned_tables(self) -> None:
+        """Remove all tables that are no longer referenced by any session.
+
+        Safe to call from any thread.
+        """
+        with self._lock:
+            table_ids = set(self._tables)
+            for (
+                session_table_ids_by_coord
+            ) in self._tables_by_session_and_coord.values():
+                table_ids.difference_update(session_table_ids_by_coord.values())
+
+            for table_id in table_ids:
+                _LOGGER.debug("Deleting paged table: %s", table_id)
+                del self._tables[table_id]
@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 import time
 import traceback
 from dataclasses import dataclass, field
@@ -39,12 +40,14 @@ from streamlit.runtime.forward_msg_cache import (
     ForwardMsgCache,
     create_reference_msg,
     populate_hash_if_needed,
+    serialize_forward_msg_payload,
 )
 from streamlit.runtime.legacy_caching.caching import _mem_caches
 from streamlit.runtime.media_file_manager import MediaFileManager
 from streamlit.runtime.media_file_storage import MediaFileStorage
 from streamlit.runtime.memory_session_storage import MemorySessionStorage
-from streamlit.runtime.runtime_util import is_cacheable_msg
+from streamlit.runtime.paged_table_manager import PagedTableManager
+from streamlit.runtime.runtime_util import is_cacheable_msg, serialize_forward_msg
 from streamlit.runtime.script_data import ScriptData
 from streamlit.runtime.scriptrunner.script_cache import ScriptCache
 from streamlit.runtime.session_manager import (
@@ -92,7 +95,8 @@ class RuntimeConfig:
     # The upload file manager
     uploaded_file_manager: UploadedFileManager
 
-    # The cache storage backend for Streamlit's st.cache_data.
+    # The cache storage backend for Streamlit's st.cache_data. Pass a
+    # SharedCacheStorageManager to share cached entries between processes.
     cache_storage_manager: CacheStorageManager = field(
         default_factory=LocalDiskCacheStorageManager
     )
@@ -140,7 +144,8 @@ class AsyncObjects(NamedTuple):
     # Set when a client connects; cleared when we have no connected clients.
     has_connection: asyncio.Event
 
-    # Set after a ForwardMsg is enqueued; cleared when we flush ForwardMsgs.
+    # Set after a ForwardMsg is enqueued (and when must_stop is set); cleared
+    # when we flush ForwardMsgs.
     need_send_data: asyncio.Event
 
     # Completed when the Runtime has started.
@@ -200,11 +205,19 @@ class Runtime:
 
         self._state = RuntimeState.INITIAL
 
+        # The IDs of sessions that have enqueued ForwardMsgs since we last flushed
+        # them, in the order they did so. (This is a dict used as an ordered set.)
+        # Sessions add themselves from their ScriptRunner threads, so access is
+        # guarded by a lock.
+        self._sessions_with_pending_msgs: dict[str, None] = {}
+        self._sessions_with_pending_msgs_lock = threading.Lock()
+
         # Initialize managers
         self._component_registry = config.component_registry
         self._message_cache = ForwardMsgCache()
         self._uploaded_file_mgr = config.uploaded_file_manager
         self._media_file_mgr = MediaFileManager(storage=config.media_file_storage)
+        self._paged_table_mgr = PagedTableManager()
         self._cache_storage_manager = config.cache_storage_manager
         self._script_cache = ScriptCache()
 
@@ -247,6 +260,10 @@ class Runtime:
     def media_file_mgr(self) -> MediaFileManager:
         return self._media_file_mgr
 
+    @property
+    def paged_table_mgr(self) -> PagedTableManager:
+        return self._paged_table_mgr
+
     @property
     def stats_mgr(self) -> StatsManager:
         return self._stats_mgr
@@ -322,6 +339,8 @@ class Runtime:
             _LOGGER.debug("Runtime stopping...")
             self._set_state(RuntimeState.STOPPING)
             async_objs.must_stop.set()
+            # Wake up our loop if it's waiting for messages to send.
+            async_objs.need_send_data.set()
 
         async_objs.eventloop.call_soon_threadsafe(stop_on_eventloop)
 
@@ -393,6 +412,10 @@ class Runtime:
         self._set_state(RuntimeState.ONE_OR_MORE_SESSIONS_CONNECTED)
         self._get_async_objs().has_connection.set()
 
+        # If we're reconnecting to an existing session, it may have enqueued
+        # messages while it was disconnected. Make sure they get sent.
+        self._enqueued_some_message(session_id)
+
         return session_id
 
     def create_session(
@@ -500,6 +523,21 @@ class Runtime:
 
         session_info.session.handle_backmsg(msg)
 
+    def handle_session_client_drained(self, session_id: str) -> None:
+        """Resume sending messages to a session whose client had reported a
+        full write buffer (see `SessionClient.is_write_buffer_full`).
+
+        Parameters
+        ----------
+        session_id
+            The session's unique ID.
+
+        Notes
+        -----
+        Threading: SAFE. May be called on any thread.
+        """
+        self._enqueued_some_message(session_id)
+
     def handle_backmsg_deserialization_exception(
         self, session_id: str, exc: BaseException
     ) -> None:
@@ -629,42 +667,54 @@ class Runtime:
                     for task in pending_tasks:
                         task.cancel()
                 elif self._state == RuntimeState.ONE_OR_MORE_SESSIONS_CONNECTED:
+                    # Clear the event *before* taking the pending sessions, so that
+                    # a session enqueueing a message while we flush wakes us up
+                    # again.
                     async_objs.need_send_data.clear()
 
-                    for active_session_info in self._session_mgr.list_active_sessions():
-                        msg_list = active_session_info.session.flush_browser_queue()
-                        for msg in msg_list:
+                    # Only visit the sessions that actually have messages to send,
+                    # rather than every connected session.
+                    for session_id in self._pop_sessions_with_pending_msgs():
+                        active_session_info = self._session_mgr.get_active_session_info(
+                            session_id
+                        )
+                        if active_session_info is None:
+                            # The session was disconnected or closed after it
+                            # enqueued its messages. If it reconnects, they'll be
+                            # sent then.
+                            continue
+
+                        if active_session_info.client.is_write_buffer_full():
+                            # The client isn't keeping up. Leave the messages in
+                            # the session's queue, where superseded Deltas get
+                            # replaced rather than piling up in the client's
+                            # write buffer. The client will tell us when it has
+                            # drained (see handle_session_client_drained). If the
+                            # queue grows past its high-water mark meanwhile, the
+                            # session's script waits for it to be flushed.
+                            continue
+
+                        session = active_session_info.session
+                        msg_list = session.flush_browser_queue_with_payloads()
+                        for msg, payload in msg_list:
                             try:
-                                self._send_message(active_session_info, msg)
+                                self._send_message(active_session_info, msg, payload)
                             except SessionClientDisconnectedError:
-                                self._session_mgr.disconnect_session(
-                                    active_session_info.session.id
-                                )
-
-                            # Yield for a tick after sending a message.
-                            await asyncio.sleep(0)
+                                self._session_mgr.disconnect_session(session_id)
+                                break
 
-                    # Yield for a few milliseconds between session message
-                    # flushing.
-                    await asyncio.sleep(0.01)
+                        # Yield for a tick after sending a session's batch of
+                        # messages, so that sessions with lots of them don't
+                        # starve the eventloop.
+                        await asyncio.sleep(0)
                 else:
                     # Break out of the thread loop if we encounter any other state.
                     break
 
-                # Wait for new proto messages that need to be sent out:
-                _, pending_tasks = await asyncio.wait(
-                    (
-                        asyncio.create_task(async_objs.must_stop.wait()),
-                        asyncio.create_task(async_objs.need_send_data.wait()),
-                    ),
-                    return_when=asyncio.FIRST_COMPLETED,
-                )
-                # We need to cancel the pending tasks (the `must_stop` one in most situations).
-                # Otherwise, this would stack up one waiting task per loop
-                # (e.g. per forward message). These tasks cannot be garbage collected
-                # causing an increase in memory (-> memory leak).
-                for task in pending_tasks:
-                    task.cancel()
+                # Wait for new proto messages that need to be sent out. (`stop`
+                # also sets this event, so we don't need to wait on `must_stop`
+                # separately.)
+                await async_objs.need_send_data.wait()
 
             # Shut down all AppSessions.
             for session_info in self._session_mgr.list_sessions():
@@ -685,7 +735,12 @@ Please report this bug at https://github.com/streamlit/streamlit/issues.
 """
             )
 
-    def _send_message(self, session_info: ActiveSessionInfo, msg: ForwardMsg) -> None:
+    def _send_message(
+        self,
+        session_info: ActiveSessionInfo,
+        msg: ForwardMsg,
+        payload: bytes | None = None,
+    ) -> None:
         """Send a message to a client.
 
         If the client is likely to have already cached the message, we may
@@ -698,15 +753,30 @@ Please report this bug at https://github.com/streamlit/streamlit/issues.
             The ActiveSessionInfo associated with websocket
         msg : ForwardMsg
             The message to send to the client
+        payload : bytes or None
+            The message's encoded payload, if it was serialized when it was
+            enqueued.
 
         Notes
         -----
         Threading: UNSAFE. Must be called on the eventloop thread.
         """
-        msg.metadata.cacheable = is_cacheable_msg(msg)
+        # Large messages are hashed and encoded when they're enqueued (see
+        # AppSession._enqueue_forward_msg). If another session already sent the
+        # same content, reuse its encoded payload from our message cache rather
+        # than encoding the message again.
+        if payload is None and msg.hash:
+            payload = self._message_cache.get_payload(msg.hash)
+
+        # Otherwise, serialize the message body exactly once. The same bytes
+        # are used to hash the message, check its size, and write it to the
+        # client.
+        if payload is None:
+            payload = serialize_forward_msg_payload(msg)
+        msg.metadata.cacheable = is_cacheable_msg(msg, payload)
         msg_to_send = msg
         if msg.metadata.cacheable:
-            populate_hash_if_needed(msg)
+            populate_hash_if_needed(msg, payload)
 
             if self._message_cache.has_message_reference(
                 msg, session_info.session, session_info.script_run_count
@@ -721,7 +791,7 @@ Please report this bug at https://github.com/streamlit/streamlit/issues.
             # age.
             _LOGGER.debug("Caching message (hash=%s)", msg.hash)
             self._message_cache.add_message(
-                msg, session_info.session, session_info.script_run_count
+                msg, session_info.session, session_info.script_run_count, payload
             )
 
         # If this was a `script_finished` message, we increment the
@@ -742,19 +812,47 @@ Please report this bug at https://github.com/streamlit/streamlit/issues.
             )
 
         # Ship it off!
-        session_info.client.write_forward_msg(msg_to_send)
+        if msg_to_send is msg:
+            msg_bytes = serialize_forward_msg(msg, payload)
+        else:
+            msg_bytes = serialize_forward_msg(msg_to_send)
+        session_info.client.write_serialized_forward_msg(msg_to_send, msg_bytes)
 
-    def _enqueued_some_message(self) -> None:
+    def _enqueued_some_message(self, session_id: str) -> None:
         """Callback called by AppSession after the AppSession has enqueued a
-        message. Sets the "needs_send_data" event, which causes our core
-        loop to wake up and flush client message queues.
+        message.
+
+        Marks the session as having messages to send. If it's the first
+        session to be marked since our core loop last flushed messages, this
+        also sets the "needs_send_data" event, which causes the loop to wake up
+        and flush the queues of the marked sessions.
 
         Notes
         -----
         Threading: SAFE. May be called on any thread.
         """
         async_objs = self._get_async_objs()
-        async_objs.eventloop.call_soon_threadsafe(async_objs.need_send_data.set)
+        with self._sessions_with_pending_msgs_lock:
+            needs_wakeup = len(self._sessions_with_pending_msgs) == 0
+            self._sessions_with_pending_msgs[session_id] = None
+
+        # If other sessions were already marked, the loop has been woken up and
+        # will see this one too, since it takes all marked sessions at once.
+        if needs_wakeup:
+            async_objs.eventloop.call_soon_threadsafe(async_objs.need_send_data.set)
+
+    def _pop_sessions_with_pending_msgs(self) -> list[str]:
+        """Return the IDs of the sessions that have enqueued messages since the
+        last call, and unmark them.
+
+        Notes
+        -----
+        Threading: SAFE. May be called on any thread.
+        """
+        with self._sessions_with_pending_msgs_lock:
+            session_ids = list(self._sessions_with_pending_msgs)
+            self._sessions_with_pending_msgs.clear()
+        return session_ids
 
     def _get_async_objs(self) -> AsyncObjects:
         """Return our AsyncObjects instance. If the Runtime hasn't been
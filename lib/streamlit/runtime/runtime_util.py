@@ -16,12 +16,17 @@
 
 from __future__ import annotations
 
-from typing import Any
+import gzip
+from typing import Any, Final, Iterable, Iterator
 
 from streamlit import config
 from streamlit.errors import MarkdownFormattedException, StreamlitAPIException
+from streamlit.proto.Arrow_pb2 import Arrow as ArrowProto
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
-from streamlit.runtime.forward_msg_cache import populate_hash_if_needed
+from streamlit.runtime.forward_msg_cache import (
+    populate_hash_if_needed,
+    serialize_forward_msg_payload,
+)
 
 
 class MessageSizeError(MarkdownFormattedException):
@@ -65,32 +70,156 @@ class BadDurationStringError(StreamlitAPIException):
         )
 
 
-def is_cacheable_msg(msg: ForwardMsg) -> bool:
-    """True if the given message qualifies for caching."""
+def is_cacheable_msg(msg: ForwardMsg, payload: bytes | None = None) -> bool:
+    """True if the given message qualifies for caching.
+
+    If the message's serialized payload is given, its length is used as the
+    message size instead of measuring the message again.
+    """
     if msg.WhichOneof("type") in {"ref_hash", "initialize"}:
         # Some message types never get cached
         return False
-    return msg.ByteSize() >= int(config.get_option("global.minCachedMessageSize"))
+    if is_arrow_chunk_msg(msg):
+        # The chunks of a large table are only sent once, so caching them would
+        # only keep another copy of the table in memory.
+        return False
+    msg_size = len(payload) if payload is not None else msg.ByteSize()
+    # Messages over the size limit are replaced by an error when they're
+    # serialized (see serialize_forward_msg), so there's no point in caching them.
+    return (
+        int(config.get_option("global.minCachedMessageSize"))
+        <= msg_size
+        <= get_max_message_size_bytes()
+    )
+
+
+def is_arrow_chunk_msg(msg: ForwardMsg) -> bool:
+    """True if the message appends a chunk of rows of a large table to its
+    element (see `DeltaGenerator._enqueue_arrow_rows`).
+    """
+    return (
+        msg.WhichOneof("type") == "delta"
+        and msg.delta.WhichOneof("type") == "arrow_add_rows"
+        and msg.delta.arrow_add_rows.is_chunk
+    )
+
+
+# The widgets whose options can be sent in their own OptionList ForwardMsg.
+_OPTION_LIST_ELEMENT_TYPES: Final = frozenset({"selectbox", "multiselect", "radio"})
+
 
+def extract_option_list(msg: ForwardMsg) -> tuple[ForwardMsg, bytes] | None:
+    """Move the options of a selectbox, multiselect or radio widget into their
+    own ForwardMsg, if they're large enough to be cached.
 
-def serialize_forward_msg(msg: ForwardMsg) -> bytes:
+    The widget's options are replaced by the hash of the returned OptionList
+    message, which must be sent before the widget's Delta. The OptionList is
+    de-duped by the ForwardMsg cache like any other message, so an unchanged
+    option list is only sent to the client once, even when the widget's value
+    or label changes, or when several widgets share it.
+
+    Returns the OptionList message with its encoded payload (see
+    `serialize_forward_msg_payload`), or None, leaving the message unchanged,
+    if it isn't such a widget, or if its options are too small to be cached.
+    """
+    if msg.WhichOneof("type") != "delta":
+        return None
+    element = msg.delta.new_element
+    element_type = element.WhichOneof("type")
+    if element_type not in _OPTION_LIST_ELEMENT_TYPES:
+        return None
+
+    widget = getattr(element, element_type)
+    option_list_msg = ForwardMsg()
+    option_list_msg.option_list.options.extend(widget.options)
+    payload = serialize_forward_msg_payload(option_list_msg)
+    if not is_cacheable_msg(option_list_msg, payload):
+        return None
+
+    widget.options_hash = populate_hash_if_needed(option_list_msg, payload)
+    del widget.options[:]
+    return option_list_msg, payload
+
+
+def _get_arrow_protos(msg: ForwardMsg) -> Iterator[ArrowProto]:
+    """Yield the Arrow protos of a dataframe, table or chart Delta."""
+    if msg.WhichOneof("type") != "delta":
+        return
+    delta_type = msg.delta.WhichOneof("type")
+    if delta_type == "arrow_add_rows":
+        yield msg.delta.arrow_add_rows.data
+    elif delta_type == "new_element":
+        element = msg.delta.new_element
+        element_type = element.WhichOneof("type")
+        if element_type == "arrow_data_frame":
+            yield element.arrow_data_frame
+        elif element_type == "arrow_table":
+            yield element.arrow_table
+        elif element_type == "arrow_vega_lite_chart":
+            yield element.arrow_vega_lite_chart.data
+            for dataset in element.arrow_vega_lite_chart.datasets:
+                yield dataset.data
+
+
+def compress_arrow_data(msg: ForwardMsg, supported_compressions: Iterable[int]) -> None:
+    """Compress the Arrow data of a dataframe, table or chart message in place,
+    if the client supports it and the data is large enough.
+
+    The whole serialized table is gzip compressed, which browsers decompress
+    natively. It's fast to compress at the lowest level, and Arrow tables with
+    repeated values or strings shrink a lot. The compression doesn't depend on
+    the time, so the ForwardMsg cache still de-dupes the compressed messages.
+
+    Does nothing unless `server.enableArrowCompression` is set.
+    """
+    if not config.get_option("server.enableArrowCompression"):
+        return
+    if ArrowProto.DataCompression.GZIP not in supported_compressions:
+        return
+
+    threshold = int(config.get_option("server.arrowCompressionThreshold"))
+    for arrow_proto in _get_arrow_protos(msg):
+        if (
+            arrow_proto.data_compression == ArrowProto.DataCompression.NONE
+            and len(arrow_proto.data) >= threshold
+        ):
+            arrow_proto.data = gzip.compress(arrow_proto.data, compresslevel=1, mtime=0)
+            arrow_proto.data_compression = ArrowProto.DataCompression.GZIP
+
+
+def serialize_forward_msg(msg: ForwardMsg, payload: bytes | None = None) -> bytes:
     """Serialize a ForwardMsg to send to a client.
 
     If the message is too large, it will be converted to an exception message
     instead.
+
+    The message body is only serialized once: the payload (as returned by
+    `serialize_forward_msg_payload`) is used for the hash, the size check and
+    the returned bytes. Pass it in if the caller already has it. The hash and
+    metadata are serialized on their own and appended to it, which protobuf
+    parsers treat the same as a single serialized message.
     """
-    populate_hash_if_needed(msg)
-    msg_str = msg.SerializeToString()
+    if payload is None:
+        payload = serialize_forward_msg_payload(msg)
+    populate_hash_if_needed(msg, payload)
 
-    if len(msg_str) > get_max_message_size_bytes():
+    if len(payload) > get_max_message_size_bytes():
         import streamlit.elements.exception as exception
 
         # Overwrite the offending ForwardMsg.delta with an error to display.
         # This assumes that the size limit wasn't exceeded due to metadata.
-        exception.marshall(msg.delta.new_element.exception, MessageSizeError(msg_str))
-        msg_str = msg.SerializeToString()
+        exception.marshall(msg.delta.new_element.exception, MessageSizeError(payload))
+        payload = serialize_forward_msg_payload(msg)
+
+    return payload + _serialize_forward_msg_envelope(msg)
+
 
-    return msg_str
+def _serialize_forward_msg_envelope(msg: ForwardMsg) -> bytes:
+    """Serialize just the hash and metadata fields of a ForwardMsg."""
+    envelope = ForwardMsg(hash=msg.hash)
+    if msg.HasField("metadata"):
+        envelope.metadata.CopyFrom(msg.metadata)
+    return envelope.SerializeToString()
 
 
 # This needs to be initialized lazily to avoid calling config.get_option() and
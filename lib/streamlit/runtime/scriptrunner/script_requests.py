@@ -149,6 +149,16 @@ class ScriptRequests:
             # We'll never get here
             raise RuntimeError(f"Unrecognized ScriptRunnerState: {self._state}")
 
+    def is_stop_or_rerun_requested(self) -> bool:
+        """True if we have a STOP request, or a RERUN request that the ScriptRunner
+        will handle at its next yield point (see `on_scriptrunner_yield`).
+        """
+        with self._lock:
+            return self._state == ScriptRequestType.STOP or (
+                self._state == ScriptRequestType.RERUN
+                and not self._rerun_data.fragment_id_queue
+            )
+
     def on_scriptrunner_yield(self) -> ScriptRequest | None:
         """Called by the ScriptRunner when it's at a yield point.
 
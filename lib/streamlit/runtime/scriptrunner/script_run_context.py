@@ -17,7 +17,7 @@ from __future__ import annotations
 import collections
 import threading
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Callable, Counter, Dict, Final, Union
+from typing import TYPE_CHECKING, Any, Callable, Counter, Dict, Final, Union
 from urllib import parse
 
 from typing_extensions import TypeAlias
@@ -228,6 +228,14 @@ class ScriptRunner:
         """
         return self._requests.request_rerun(rerun_data)
 
+    def is_stop_or_rerun_requested(self) -> bool:
+        """True if the ScriptRunner was asked to stop, or to rerun its script,
+        and will handle the request when it reaches an interrupt point.
+
+        Safe to call from any thread.
+        """
+        return self._requests.is_stop_or_rerun_requested()
+
     def start(self) -> None:
         """Start a new thread to process the ScriptEventQueue.
 
@@ -423,8 +431,9 @@ class ScriptRunner:
             start_time: float = timer()
             prep_time: float = 0  # This will be overwritten once preparations are done.
 
-            # Reset DeltaGenerators, widgets, media files.
+            # Reset DeltaGenerators, widgets, media files, paged tables.
             runtime.get_instance().media_file_mgr.clear_session_refs()
+            runtime.get_instance().paged_table_mgr.clear_session_refs()
 
             main_script_path = self._main_script_path
             pages = source_util.get_pages(main_script_path)
@@ -683,6 +692,7 @@ class ScriptRunner:
         # Remove orphaned files now that the script has run and files in use
         # are marked as active.
         runtime.get_instance().media_file_mgr.remove_orphaned_files()
+        runtime.get_instance().paged_table_mgr.remove_orphaned_tables()
 
         # Force garbage collection to run, to help avoid memory use building up
         # This is usually not an issue, but sometimes GC takes time to kick in and
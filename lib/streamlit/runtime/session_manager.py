@@ -41,6 +41,33 @@ class SessionClient(Protocol):
         """
         raise NotImplementedError
 
+    def write_serialized_forward_msg(self, msg: ForwardMsg, msg_bytes: bytes) -> None:
+        """Deliver a ForwardMsg that has already been serialized to the client.
+
+        `msg_bytes` is the wire representation of `msg`, as returned by
+        `runtime_util.serialize_forward_msg`. Clients that send bytes over the
+        wire should write them as is rather than serializing `msg` again. The
+        default implementation ignores them and calls `write_forward_msg`.
+
+        If the SessionClient has been disconnected, it should raise a
+        SessionClientDisconnectedError.
+        """
+        self.write_forward_msg(msg)
+
+    def is_write_buffer_full(self) -> bool:
+        """True if the client has more data waiting to be delivered than it
+        should buffer.
+
+        While this is True, the Runtime leaves the session's messages in its
+        queue, where newer Deltas replace older ones for the same element. Once
+        the buffer has drained, the client should call
+        `Runtime.handle_session_client_drained` so that the Runtime resumes
+        sending messages.
+
+        The default implementation never reports a full buffer.
+        """
+        return False
+
 
 @dataclass
 class ActiveSessionInfo:
@@ -210,7 +237,7 @@ class SessionManager(Protocol):
         session_storage: SessionStorage,
         uploaded_file_manager: UploadedFileManager,
         script_cache: ScriptCache,
-        message_enqueued_callback: Callable[[], None] | None,
+        message_enqueued_callback: Callable[[str], None] | None,
     ) -> None:
         """Initialize a SessionManager with the given SessionStorage.
 
@@ -226,7 +253,8 @@ class SessionManager(Protocol):
             ScriptCache instance. Caches user script bytecode.
 
         message_enqueued_callback
-            A callback invoked after a message is enqueued to be sent to a web client.
+            A callback invoked with a session's ID after the session enqueues a
+            message to be sent to a web client.
         """
         raise NotImplementedError
 
@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import hashlib
+import struct
 from dataclasses import dataclass, field
 from datetime import date, datetime, time, timedelta
 from typing import (
@@ -205,10 +206,43 @@ def compute_widget_id(
     # consistent order; dicts are always in insertion order.
     for k, v in kwargs.items():
         h.update(str(k).encode("utf-8"))
-        h.update(str(v).encode("utf-8"))
+        _update_widget_id_hash(h, v)
     return f"{GENERATED_WIDGET_ID_PREFIX}-{h.hexdigest()}-{user_key}"
 
 
+def _update_widget_id_hash(h: Any, value: Any) -> None:
+    """Feed a widget argument to the widget id hash.
+
+    Bytes and strings are fed directly, and lists and tuples item by item,
+    rather than through their `str()`, which for big arguments (like a
+    data_editor's Arrow bytes, or a long list of options) is both slow to
+    build and several times bigger than the value itself. Every value is
+    prefixed by its type and length, so that different arguments can't produce
+    the same input to the hash.
+    """
+    if isinstance(value, str):
+        encoded = value.encode("utf-8")
+        h.update(b"s%d:" % len(encoded))
+        h.update(encoded)
+    elif isinstance(value, (bytes, bytearray)):
+        h.update(b"b%d:" % len(value))
+        h.update(value)
+    elif isinstance(value, (list, tuple)):
+        h.update(b"l%d:" % len(value))
+        if all(type(item) is str for item in value):
+            # Fast path for lists of options: hash all the lengths, then all the
+            # strings, with a few calls rather than a few per string.
+            h.update(struct.pack(f"<{len(value)}Q", *map(len, value)))
+            h.update("".join(value).encode("utf-8"))
+        else:
+            for item in value:
+                _update_widget_id_hash(h, item)
+    else:
+        encoded = str(value).encode("utf-8")
+        h.update(b"r%d:" % len(encoded))
+        h.update(encoded)
+
+
 def user_key_from_widget_id(widget_id: str) -> str | None:
     """Return the user key portion of a widget id, or None if the id does not
     have a user key.
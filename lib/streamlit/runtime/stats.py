@@ -37,17 +37,36 @@ class CacheStat(NamedTuple):
         multiple separate cache instances, this can just be the empty string.
     byte_length : int
         The entry's memory footprint in bytes.
+    evictions : int
+        The number of entries that the cache has removed to stay within its
+        size limits. Caches report this with a single stat that has a
+        byte_length of 0.
     """
 
     category_name: str
     cache_name: str
     byte_length: int
+    evictions: int = 0
 
     def to_metric_str(self) -> str:
         return f'cache_memory_bytes{{cache_type="{self.category_name}",cache="{self.cache_name}"}} {self.byte_length}'
 
+    def to_evictions_metric_str(self) -> str:
+        return f'cache_evictions_total{{cache_type="{self.category_name}",cache="{self.cache_name}"}} {self.evictions}'
+
     def marshall_metric_proto(self, metric: MetricProto) -> None:
         """Fill an OpenMetrics `Metric` protobuf object."""
+        self._marshall_metric_labels(metric)
+        metric_point = metric.metric_points.add()
+        metric_point.gauge_value.int_value = self.byte_length
+
+    def marshall_evictions_metric_proto(self, metric: MetricProto) -> None:
+        """Fill an OpenMetrics `Metric` protobuf object with the evictions count."""
+        self._marshall_metric_labels(metric)
+        metric_point = metric.metric_points.add()
+        metric_point.counter_value.int_value = self.evictions
+
+    def _marshall_metric_labels(self, metric: MetricProto) -> None:
         label = metric.labels.add()
         label.name = "cache_type"
         label.value = self.category_name
@@ -56,12 +75,11 @@ class CacheStat(NamedTuple):
         label.name = "cache"
         label.value = self.cache_name
 
-        metric_point = metric.metric_points.add()
-        metric_point.gauge_value.int_value = self.byte_length
-
 
 def group_stats(stats: list[CacheStat]) -> list[CacheStat]:
-    """Group a list of CacheStats by category_name and cache_name and sum byte_length"""
+    """Group a list of CacheStats by category_name and cache_name and sum
+    byte_length and evictions
+    """
 
     def key_function(individual_stat):
         return individual_stat.category_name, individual_stat.cache_name
@@ -72,11 +90,13 @@ def group_stats(stats: list[CacheStat]) -> list[CacheStat]:
     grouped_stats = itertools.groupby(sorted_stats, key=key_function)
 
     for (category_name, cache_name), single_group_stats in grouped_stats:
+        group = list(single_group_stats)
         result.append(
             CacheStat(
                 category_name=category_name,
                 cache_name=cache_name,
-                byte_length=sum(map(lambda item: item.byte_length, single_group_stats)),
+                byte_length=sum(map(lambda item: item.byte_length, group)),
+                evictions=sum(map(lambda item: item.evictions, group)),
             )
         )
     return result
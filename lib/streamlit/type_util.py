@@ -18,7 +18,6 @@ from __future__ import annotations
 
 import contextlib
 import copy
-import math
 import re
 import types
 from enum import Enum, EnumMeta, auto
@@ -27,6 +26,7 @@ from typing import (
     Any,
     Final,
     Iterable,
+    Iterator,
     Literal,
     NamedTuple,
     Protocol,
@@ -50,6 +50,7 @@ from streamlit.errors import StreamlitAPIException
 if TYPE_CHECKING:
     import graphviz
     import numpy as np
+    import numpy.typing as npt
     import pyarrow as pa
     import sympy
     from pandas import DataFrame, Index, Series
@@ -280,6 +281,7 @@ class DataFormat(Enum):
     PYSPARK_OBJECT = auto()  # pyspark.DataFrame
     MODIN_OBJECT = auto()  # Modin DataFrame, Series
     SNOWPANDAS_OBJECT = auto()  # Snowpandas DataFrame, Series
+    ARROW_OBJECT = auto()  # Objects that export Arrow data, e.g. Polars DataFrame
     PANDAS_STYLER = auto()  # pandas Styler
     LIST_OF_RECORDS = auto()  # List[Dict[str, Scalar]]
     LIST_OF_ROWS = auto()  # List[List[Scalar]]
@@ -358,6 +360,72 @@ def is_snowpandas_data_object(obj: object) -> bool:
     )
 
 
+def is_arrow_data_object(obj: object) -> bool:
+    """True if obj exports its data as Arrow data, either through the Arrow
+    PyCapsule stream interface (`__arrow_c_stream__`) or a `to_arrow()`
+    method. This includes Polars DataFrames and DuckDB relations.
+
+    Pandas objects, unevaluated data objects and pyarrow arrays are not
+    considered Arrow data objects, even if they implement one of these
+    interfaces, since only tabular data can be read into a pyarrow.Table.
+    """
+    import pyarrow as pa
+
+    if (
+        is_dataframe_like(obj)
+        or is_unevaluated_data_object(obj)
+        or isinstance(obj, (pa.Array, pa.ChunkedArray))
+    ):
+        return False
+
+    return (
+        # Reading Arrow PyCapsule streams is supported as of pyarrow 15.
+        hasattr(obj, "__arrow_c_stream__")
+        and hasattr(pa.RecordBatchReader, "from_stream")
+    ) or callable(getattr(obj, "to_arrow", None))
+
+
+def convert_arrow_data_object_to_table(obj: object) -> pa.Table:
+    """Read the data of an Arrow data object (see `is_arrow_data_object`) into
+    a pyarrow.Table, without converting it to pandas.
+    """
+    import pyarrow as pa
+
+    if isinstance(obj, pa.Table):
+        return obj
+
+    if hasattr(obj, "__arrow_c_stream__") and hasattr(
+        pa.RecordBatchReader, "from_stream"
+    ):
+        return pa.RecordBatchReader.from_stream(obj).read_all()
+
+    table = obj.to_arrow()  # type: ignore[attr-defined]
+    if isinstance(table, pa.RecordBatchReader):
+        table = table.read_all()
+    if not isinstance(table, pa.Table):
+        raise errors.StreamlitAPIException(
+            f"Unable to convert object of type `{type(obj)}` to `pyarrow.Table`: "
+            f"`to_arrow()` returned an object of type `{type(table)}`."
+        )
+    return table
+
+
+def try_convert_arrow_data_object_to_table(obj: object) -> pa.Table | None:
+    """Read the data of an Arrow data object into a pyarrow.Table like
+    `convert_arrow_data_object_to_table`, or return None if the object exports
+    data that isn't tabular, e.g. the single column of a Polars Series.
+
+    Reading such a stream fails before it's consumed, so the object can still be
+    converted to pandas instead.
+    """
+    import pyarrow as pa
+
+    try:
+        return convert_arrow_data_object_to_table(obj)
+    except pa.ArrowInvalid:
+        return None
+
+
 def is_dataframe_compatible(obj: object) -> TypeGuard[DataFrameCompatible]:
     """True if type that can be passed to convert_anything_to_df."""
     return is_dataframe_like(obj) or type(obj) in _DATAFRAME_COMPATIBLE_TYPES
@@ -664,6 +732,19 @@ def convert_anything_to_df(
             )
         return cast(pd.DataFrame, data)
 
+    if is_arrow_data_object(data):
+        # Read the data as Arrow, which only converts it to pandas once.
+        table = try_convert_arrow_data_object_to_table(data)
+        if table is not None:
+            return table.to_pandas()
+
+        if hasattr(data, "to_pandas"):
+            # The data isn't tabular, e.g. the single column of a Polars Series.
+            data = data.to_pandas()
+            if isinstance(data, pd.Series):
+                data = data.to_frame()
+            return cast(pd.DataFrame, data)
+
     # This is inefficient when data is a pyarrow.Table as it will be converted
     # back to Arrow when marshalled to protobuf, but area/bar/line charts need
     # DataFrame magic to generate the correct output.
@@ -855,80 +936,253 @@ def is_version_less_than(v1: str, v2: str) -> bool:
     return version.parse(v1) < version.parse(v2)
 
 
-def _maybe_truncate_table(
-    table: pa.Table, truncated_rows: int | None = None
-) -> pa.Table:
+# The values of the server.arrowTruncationMode config option.
+_ARROW_TRUNCATION_MODES: Final = ("head", "headTail", "sample")
+
+
+def _maybe_truncate_table(table: pa.Table) -> pa.Table:
     """Experimental feature to automatically truncate tables that
     are larger than the maximum allowed message size. It needs to be enabled
     via the server.enableArrowTruncation config option.
 
+    The size of each row is computed from the column buffers in a single pass,
+    and the number of rows to keep is found with a binary search on the
+    cumulative row sizes. The server.arrowTruncationMode config option selects
+    which rows are kept: the first rows ("head"), the first and the last rows
+    ("headTail"), or rows evenly spread over the table ("sample").
+
     Parameters
     ----------
     table : pyarrow.Table
         A table to truncate.
 
-    truncated_rows : int or None
-        The number of rows that have been truncated so far. This is used by
-        the recursion logic to keep track of the total number of truncated
-        rows.
+    """
+    import numpy as np
+    import pyarrow as pa
+
+    if not config.get_option("server.enableArrowTruncation"):
+        return table
+
+    mode = config.get_option("server.arrowTruncationMode")
+    if mode not in _ARROW_TRUNCATION_MODES:
+        raise StreamlitAPIException(
+            "Config 'server.arrowTruncationMode' expects to have one of the "
+            f"following values: {', '.join(_ARROW_TRUNCATION_MODES)}. "
+            f"Current value: {mode}"
+        )
+
+    # The maximum size allowed for protobuf messages in bytes:
+    max_message_size = int(config.get_option("server.maxMessageSize") * 1e6)
+    # We keep 1 MB for other overhead related to the protobuf message.
+    # This is a very conservative estimate, but it should be good enough.
+    max_table_size = max_message_size - int(1e6)
+    table_rows = table.num_rows
+
+    if table_rows <= 1 or table.nbytes <= max_table_size:
+        return table
+
+    # Taking rows from anywhere in the table changes their position, so the
+    # index values have to be stored.
+    rows_table = table if mode == "head" else _materialize_range_index(table)
+
+    row_sizes = _get_row_sizes(rows_table)
+    if row_sizes.sum() <= max_table_size:
+        return table
+
+    if mode == "headTail":
+        head_rows = _count_rows_that_fit(row_sizes, max_table_size / 2)
+        tail_rows = _count_rows_that_fit(
+            row_sizes[::-1], max_table_size - row_sizes[:head_rows].sum()
+        )
+        truncated_table = pa.concat_tables(
+            [
+                rows_table.slice(0, max(head_rows, 1)),
+                rows_table.slice(table_rows - tail_rows, tail_rows),
+            ]
+        )
+        caption = "Showing the first and last {displayed_rows} out of {total_rows} rows"
+    elif mode == "sample":
+        truncated_table = rows_table.take(_sample_rows(row_sizes, max_table_size))
+        caption = "Showing a sample of {displayed_rows} out of {total_rows} rows"
+    else:
+        truncated_table = _slice_table(
+            table, 0, max(_count_rows_that_fit(row_sizes, max_table_size), 1)
+        )
+        caption = "Showing {displayed_rows} out of {total_rows} rows"
+
+    displayed_rows = string_util.simplify_number(truncated_table.num_rows)
+    total_rows = string_util.simplify_number(table_rows)
+
+    if displayed_rows == total_rows:
+        # If the simplified numbers are the same,
+        # we just display the exact numbers.
+        displayed_rows = str(truncated_table.num_rows)
+        total_rows = str(table_rows)
 
+    st.caption(
+        "⚠️ "
+        + caption.format(displayed_rows=displayed_rows, total_rows=total_rows)
+        + " due to data size limitations."
+    )
+    return truncated_table
+
+
+def _get_row_sizes(table: pa.Table) -> npt.NDArray[np.float64]:
+    """Return the number of bytes that each row of the table takes up in the
+    column buffers.
+
+    Fixed-width values are charged their width, and variable-size strings and
+    binaries their length plus their offset. Nested and dictionary-encoded
+    columns are charged their average size per row.
     """
+    import numpy as np
+    import pyarrow.compute as pc
+    import pyarrow.types as pa_types
+
+    row_sizes = np.zeros(table.num_rows, dtype=np.float64)
+    for column in table.columns:
+        column_type = column.type
+        if column.null_count > 0:
+            # The validity bitmap:
+            row_sizes += 1 / 8
+
+        if pa_types.is_string(column_type) or pa_types.is_binary(column_type):
+            row_sizes += pc.binary_length(column).fill_null(0).to_numpy() + 4
+        elif pa_types.is_large_string(column_type) or pa_types.is_large_binary(
+            column_type
+        ):
+            row_sizes += pc.binary_length(column).fill_null(0).to_numpy() + 8
+        else:
+            try:
+                row_sizes += column_type.bit_width / 8
+            except ValueError:
+                # The type doesn't have a fixed width.
+                row_sizes += column.nbytes / table.num_rows
+
+    return row_sizes
 
-    if config.get_option("server.enableArrowTruncation"):
-        # This is an optimization problem: We don't know at what row
-        # the perfect cut-off is to comply with the max size. But we want to figure
-        # it out in as few iterations as possible. We almost always will cut out
-        # more than required to keep the iterations low.
-
-        # The maximum size allowed for protobuf messages in bytes:
-        max_message_size = int(config.get_option("server.maxMessageSize") * 1e6)
-        # We add 1 MB for other overhead related to the protobuf message.
-        # This is a very conservative estimate, but it should be good enough.
-        table_size = int(table.nbytes + 1 * 1e6)
-        table_rows = table.num_rows
-
-        if table_rows > 1 and table_size > max_message_size:
-            # targeted rows == the number of rows the table should be truncated to.
-            # Calculate an approximation of how many rows we need to truncate to.
-            targeted_rows = math.ceil(table_rows * (max_message_size / table_size))
-            # Make sure to cut out at least a couple of rows to avoid running
-            # this logic too often since it is quite inefficient and could lead
-            # to infinity recursions without these precautions.
-            targeted_rows = math.floor(
-                max(
-                    min(
-                        # Cut out:
-                        # an additional 5% of the estimated num rows to cut out:
-                        targeted_rows - math.floor((table_rows - targeted_rows) * 0.05),
-                        # at least 1% of table size:
-                        table_rows - (table_rows * 0.01),
-                        # at least 5 rows:
-                        table_rows - 5,
-                    ),
-                    1,  # but it should always have at least 1 row
-                )
-            )
-            sliced_table = table.slice(0, targeted_rows)
-            return _maybe_truncate_table(
-                sliced_table, (truncated_rows or 0) + (table_rows - targeted_rows)
-            )
 
-        if truncated_rows:
-            displayed_rows = string_util.simplify_number(table.num_rows)
-            total_rows = string_util.simplify_number(table.num_rows + truncated_rows)
+def _count_rows_that_fit(row_sizes: npt.NDArray[np.float64], max_size: float) -> int:
+    """Return how many rows from the start fit into the given size, using a
+    binary search on the cumulative row sizes.
+    """
+    import numpy as np
 
-            if displayed_rows == total_rows:
-                # If the simplified numbers are the same,
-                # we just display the exact numbers.
-                displayed_rows = str(table.num_rows)
-                total_rows = str(table.num_rows + truncated_rows)
+    return int(np.searchsorted(np.cumsum(row_sizes), max_size, side="right"))
 
-            st.caption(
-                f"⚠️ Showing {displayed_rows} out of {total_rows} "
-                "rows due to data size limitations."
-            )
 
-    return table
+def _sample_rows(
+    row_sizes: npt.NDArray[np.float64], max_size: float
+) -> npt.NDArray[np.int64]:
+    """Return the positions of as many rows evenly spread over the table as fit
+    into the given size. At least one row is returned.
+    """
+    import numpy as np
+
+    def get_positions(num_rows: int) -> npt.NDArray[np.int64]:
+        # Rows are at least one position apart, so rounding keeps them unique.
+        return np.linspace(0, len(row_sizes) - 1, num_rows).round().astype(np.int64)
+
+    # Binary search for the largest number of rows that fit:
+    low, high = 1, len(row_sizes)
+    while low < high:
+        middle = (low + high + 1) // 2
+        if row_sizes[get_positions(middle)].sum() <= max_size:
+            low = middle
+        else:
+            high = middle - 1
+    return get_positions(low)
+
+
+def _get_range_index(table: pa.Table) -> dict[str, Any] | None:
+    """Return the RangeIndex stored in the pandas metadata of the table, or
+    None if the table doesn't have one.
+    """
+    pandas_metadata = table.schema.pandas_metadata or {}
+    index_columns = pandas_metadata.get("index_columns", [])
+    if (
+        len(index_columns) == 1
+        and isinstance(index_columns[0], dict)
+        and index_columns[0].get("kind") == "range"
+    ):
+        return cast("dict[str, Any]", index_columns[0])
+    return None
+
+
+def _with_pandas_metadata(table: pa.Table, pandas_metadata: dict[str, Any]) -> pa.Table:
+    """Replace the pandas metadata of the table."""
+    import json
+
+    return table.replace_schema_metadata(
+        {
+            **(table.schema.metadata or {}),
+            b"pandas": json.dumps(pandas_metadata).encode(),
+        }
+    )
+
+
+def _slice_table(table: pa.Table, offset: int, length: int) -> pa.Table:
+    """Slice a pyarrow.Table, adjusting a RangeIndex that is stored in its
+    pandas metadata to the rows of the slice.
+    """
+    sliced_table = table.slice(offset, length)
+    range_index = _get_range_index(table)
+    if range_index is None:
+        return sliced_table
+
+    start = range_index["start"] + offset * range_index["step"]
+    return _with_pandas_metadata(
+        sliced_table,
+        {
+            **table.schema.pandas_metadata,
+            "index_columns": [
+                {
+                    **range_index,
+                    "start": start,
+                    "stop": start + sliced_table.num_rows * range_index["step"],
+                }
+            ],
+        },
+    )
+
+
+def _materialize_range_index(table: pa.Table) -> pa.Table:
+    """Store a RangeIndex that is only stored in the pandas metadata of the
+    table in a column, so that rows keep their index values when they are
+    taken from anywhere in the table.
+    """
+    import numpy as np
+
+    range_index = _get_range_index(table)
+    if range_index is None:
+        return table
+
+    index_column_name = "__index_level_0__"
+    pandas_metadata = table.schema.pandas_metadata
+    table = table.append_column(
+        index_column_name,
+        [
+            np.arange(table.num_rows, dtype=np.int64) * range_index["step"]
+            + range_index["start"]
+        ],
+    )
+    return _with_pandas_metadata(
+        table,
+        {
+            **pandas_metadata,
+            "index_columns": [index_column_name],
+            "columns": [
+                *pandas_metadata.get("columns", []),
+                {
+                    "name": range_index.get("name"),
+                    "field_name": index_column_name,
+                    "pandas_type": "int64",
+                    "numpy_type": "int64",
+                    "metadata": None,
+                },
+            ],
+        },
+    )
 
 
 def pyarrow_table_to_bytes(table: pa.Table) -> bytes:
@@ -940,19 +1194,19 @@ def pyarrow_table_to_bytes(table: pa.Table) -> bytes:
         A table to convert.
 
     """
-    try:
-        table = _maybe_truncate_table(table)
-    except RecursionError as err:
-        # This is a very unlikely edge case, but we want to make sure that
-        # it doesn't lead to unexpected behavior.
-        # If there is a recursion error, we just return the table as-is
-        # which will lead to the normal message limit exceed error.
-        _LOGGER.warning(
-            "Recursion error while truncating Arrow table. This is not "
-            "supposed to happen.",
-            exc_info=err,
-        )
+    return pyarrow_table_to_ipc_bytes(_maybe_truncate_table(table))
+
+
+def pyarrow_table_to_ipc_bytes(table: pa.Table) -> bytes:
+    """Serialize pyarrow.Table to bytes in the Arrow IPC stream format, without
+    truncating it.
+
+    Parameters
+    ----------
+    table : pyarrow.Table
+        A table to convert.
 
+    """
     import pyarrow as pa
 
     # Convert table to bytes
@@ -963,6 +1217,89 @@ def pyarrow_table_to_bytes(table: pa.Table) -> bytes:
     return cast(bytes, sink.getvalue().to_pybytes())
 
 
+def pyarrow_table_to_bytes_chunks(
+    table: pa.Table, max_chunk_bytes: int
+) -> Iterator[bytes]:
+    """Serialize pyarrow.Table to bytes in chunks of rows, each of which is a
+    table in the Arrow IPC stream format.
+
+    The chunks are serialized one at a time, when they are requested, so only
+    one chunk has to be kept in memory. A RangeIndex stored in the pandas
+    metadata of the table is adjusted to the rows of each chunk, so that
+    appending the chunks to each other restores the original index.
+
+    Parameters
+    ----------
+    table : pyarrow.Table
+        A table to convert.
+
+    max_chunk_bytes : int
+        The approximate maximum size of the data of a chunk. A chunk always
+        contains at least one row.
+
+    """
+    rows_per_chunk = max(1, table.num_rows * max_chunk_bytes // max(table.nbytes, 1))
+
+    for offset in range(0, max(table.num_rows, 1), rows_per_chunk):
+        yield pyarrow_table_to_ipc_bytes(_slice_table(table, offset, rows_per_chunk))
+
+
+def pyarrow_table_to_streamed_rows_bytes(
+    table: pa.Table, max_rows: int, previous_schema: bytes | None
+) -> tuple[bytes, bytes | None, bool]:
+    """Serialize the last max_rows rows of a pyarrow.Table, to stream them to a
+    dataset with add_rows.
+
+    Returns the serialized rows, the schema to pass as previous_schema for the
+    next rows of the dataset, and whether the schema message was left out of the
+    serialized rows. It's left out if the schema equals previous_schema, in which
+    case the bytes only contain the record batches of an Arrow IPC stream, which
+    the client reads with the schema it already received.
+
+    The start and stop of a RangeIndex don't count when comparing schemas, since
+    the index of added rows continues the index of the dataset anyway.
+
+    Parameters
+    ----------
+    table : pyarrow.Table
+        A table to convert.
+
+    max_rows : int
+        The maximum number of rows to serialize.
+
+    previous_schema : bytes or None
+        The schema returned for the previous rows of the dataset, if any.
+
+    """
+    import pyarrow as pa
+
+    if table.num_rows > max_rows:
+        table = _slice_table(table, table.num_rows - max_rows, max_rows)
+
+    if any(pa.types.is_dictionary(field.type) for field in table.schema):
+        # Dictionaries are sent in their own messages of the stream.
+        return pyarrow_table_to_ipc_bytes(table), None, False
+
+    range_index = _get_range_index(table)
+    schema_table = (
+        table
+        if range_index is None
+        else _with_pandas_metadata(
+            table.slice(0, 0),
+            {
+                **table.schema.pandas_metadata,
+                "index_columns": [{**range_index, "start": 0, "stop": 0}],
+            },
+        )
+    )
+    schema = cast(bytes, schema_table.schema.serialize().to_pybytes())
+    batches = b"".join(batch.serialize().to_pybytes() for batch in table.to_batches())
+
+    if schema == previous_schema:
+        return batches, schema, True
+    return table.schema.serialize().to_pybytes() + batches, schema, False
+
+
 def is_colum_type_arrow_incompatible(column: Series[Any] | Index) -> bool:
     """Return True if the column type is known to cause issues during Arrow conversion."""
     from pandas.api.types import infer_dtype, is_dict_like, is_list_like
@@ -1077,11 +1414,30 @@ def data_frame_to_bytes(df: DataFrame) -> bytes:
     df : pandas.DataFrame
         A dataframe to convert.
 
+    """
+    return pyarrow_table_to_bytes(data_frame_to_pyarrow_table(df))
+
+
+def data_frame_to_pyarrow_table(
+    df: DataFrame, preserve_index: bool | None = None
+) -> pa.Table:
+    """Convert pandas.DataFrame to pyarrow.Table, fixing the column types that
+    are not compatible with Arrow.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+        A dataframe to convert.
+
+    preserve_index : bool or None
+        Whether to store the index as columns of the table. If None, a
+        RangeIndex is only stored as metadata.
+
     """
     import pyarrow as pa
 
     try:
-        table = pa.Table.from_pandas(df)
+        return pa.Table.from_pandas(df, preserve_index=preserve_index)
     except (pa.ArrowTypeError, pa.ArrowInvalid, pa.ArrowNotImplementedError) as ex:
         _LOGGER.info(
             "Serialization of dataframe to Arrow table was unsuccessful due to: %s. "
@@ -1089,8 +1445,7 @@ def data_frame_to_bytes(df: DataFrame) -> bytes:
             ex,
         )
         df = fix_arrow_incompatible_column_types(df)
-        table = pa.Table.from_pandas(df)
-    return pyarrow_table_to_bytes(table)
+        return pa.Table.from_pandas(df, preserve_index=preserve_index)
 
 
 def bytes_to_data_frame(source: bytes) -> DataFrame:
@@ -1154,6 +1509,8 @@ def determine_data_format(input_data: Any) -> DataFormat:
         return DataFormat.SNOWPANDAS_OBJECT
     elif is_pyspark_data_object(input_data):
         return DataFormat.PYSPARK_OBJECT
+    elif is_arrow_data_object(input_data):
+        return DataFormat.ARROW_OBJECT
     elif isinstance(input_data, (list, tuple, set)):
         if is_list_of_scalars(input_data):
             # -> one-dimensional data structure
@@ -1238,6 +1595,7 @@ def convert_df_to_data_format(
         DataFormat.PANDAS_STYLER,
         DataFormat.MODIN_OBJECT,
         DataFormat.SNOWPANDAS_OBJECT,
+        DataFormat.ARROW_OBJECT,
     ]:
         return df
     elif data_format == DataFormat.NUMPY_LIST:
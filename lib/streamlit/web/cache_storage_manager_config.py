@@ -14,10 +14,14 @@
 
 from __future__ import annotations
 
+from streamlit import config
 from streamlit.runtime.caching.storage import CacheStorageManager
 from streamlit.runtime.caching.storage.local_disk_cache_storage import (
     LocalDiskCacheStorageManager,
 )
+from streamlit.runtime.caching.storage.shared_cache_storage import (
+    SharedCacheStorageManager,
+)
 
 
 def create_default_cache_storage_manager() -> CacheStorageManager:
@@ -25,10 +29,22 @@ def create_default_cache_storage_manager() -> CacheStorageManager:
     Get the cache storage manager.
     It would be used both in server.py and in cli.py to have unified cache storage
 
+    If the `runner.sharedCachePath` config option is set, the cache storage is
+    shared with the other Streamlit processes that use the same path.
+
     Returns
     -------
     CacheStorageManager
         The cache storage manager.
 
     """
+    shared_cache_path = config.get_option("runner.sharedCachePath")
+    if shared_cache_path:
+        return SharedCacheStorageManager(
+            shared_cache_path,
+            lease_seconds=config.get_option("runner.sharedCacheLeaseTimeout"),
+            stale_while_revalidate=config.get_option(
+                "runner.sharedCacheStaleWhileRevalidate"
+            ),
+        )
     return LocalDiskCacheStorageManager()
@@ -43,6 +43,9 @@ class BrowserWebSocketHandler(WebSocketHandler, SessionClient):
     def initialize(self, runtime: Runtime) -> None:
         self._runtime = runtime
         self._session_id: str | None = None
+        # Number of bytes we've handed to Tornado that haven't been written to
+        # the socket yet.
+        self._buffered_bytes = 0
         # The XSRF cookie is normally set when xsrf_form_html is used, but in a
         # pure-Javascript application that does not use any regular forms we just
         # need to read the self.xsrf_token manually to set the cookie as a side
@@ -57,11 +60,40 @@ class BrowserWebSocketHandler(WebSocketHandler, SessionClient):
 
     def write_forward_msg(self, msg: ForwardMsg) -> None:
         """Send a ForwardMsg to the browser."""
+        self.write_serialized_forward_msg(msg, serialize_forward_msg(msg))
+
+    def write_serialized_forward_msg(self, msg: ForwardMsg, msg_bytes: bytes) -> None:
+        """Send an already-serialized ForwardMsg to the browser."""
         try:
-            self.write_message(serialize_forward_msg(msg), binary=True)
+            future = self.write_message(msg_bytes, binary=True)
         except tornado.websocket.WebSocketClosedError as e:
             raise SessionClientDisconnectedError from e
 
+        num_bytes = len(msg_bytes)
+        self._buffered_bytes += num_bytes
+        future.add_done_callback(lambda f: self._on_message_written(f, num_bytes))
+
+    def _on_message_written(self, future: Any, num_bytes: int) -> None:
+        """Called when a message has been written to the socket (or failed to)."""
+        # Retrieve the exception, if any, so that asyncio doesn't log it. A closed
+        # connection is handled by on_close.
+        if not future.cancelled():
+            future.exception()
+
+        was_full = self.is_write_buffer_full()
+        self._buffered_bytes -= num_bytes
+        if was_full and not self.is_write_buffer_full() and self._session_id:
+            self._runtime.handle_session_client_drained(self._session_id)
+
+    def is_write_buffer_full(self) -> bool:
+        """True if more than `server.maxWebsocketBufferSize` megabytes are
+        waiting to be written to the socket.
+        """
+        max_buffer_size_mb: int = config.get_option("server.maxWebsocketBufferSize")
+        if max_buffer_size_mb <= 0:
+            return False
+        return self._buffered_bytes > max_buffer_size_mb * int(1e6)
+
     def select_subprotocol(self, subprotocols: list[str]) -> str | None:
         """Return the first subprotocol in the given list.
 
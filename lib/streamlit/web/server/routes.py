@@ -17,10 +17,12 @@ from __future__ import annotations
 import os
 from typing import Final
 
+import tornado.ioloop
 import tornado.web
 
 from streamlit import config, file_util
 from streamlit.logger import get_logger
+from streamlit.runtime.paged_table_manager import PagedTableError, PagedTableManager
 from streamlit.runtime.runtime_util import serialize_forward_msg
 from streamlit.web.server.server_util import emit_endpoint_deprecation_notice
 
@@ -278,3 +280,56 @@ class MessageCacheHandler(tornado.web.RequestHandler):
         """/OPTIONS handler for preflight CORS checks."""
         self.set_status(204)
         self.finish()
+
+
+class PagedTableHandler(tornado.web.RequestHandler):
+    """Returns windows of rows of the tables kept by the PagedTableManager"""
+
+    def initialize(self, paged_table_mgr: PagedTableManager):
+        """Initializes the handler.
+
+        Parameters
+        ----------
+        paged_table_mgr : PagedTableManager
+
+        """
+        self._paged_table_mgr = paged_table_mgr
+
+    def set_default_headers(self):
+        if allow_cross_origin_requests():
+            self.set_header("Access-Control-Allow-Origin", "*")
+
+    async def get(self):
+        table_id = self.get_argument("id")
+        try:
+            start = int(self.get_argument("start"))
+            end = int(self.get_argument("end"))
+            sort_column_arg = self.get_argument("sort_column", None)
+            sort_column = int(sort_column_arg) if sort_column_arg else None
+        except ValueError:
+            self.set_status(400)
+            raise tornado.web.Finish()
+        ascending = self.get_argument("ascending", "true") == "true"
+
+        try:
+            # Sorting a large table takes a while, so we don't block the
+            # event loop.
+            data = await tornado.ioloop.IOLoop.current().run_in_executor(
+                None,
+                lambda: self._paged_table_mgr.get_rows(
+                    table_id, start, end, sort_column, ascending
+                ),
+            )
+        except PagedTableError as ex:
+            _LOGGER.debug("Unable to serve rows of paged table: %s", ex)
+            self.set_status(404)
+            raise tornado.web.Finish()
+
+        self.set_header("Content-Type", "application/octet-stream")
+        self.write(data)
+        self.set_status(200)
+
+    def options(self):
+        """/OPTIONS handler for preflight CORS checks."""
+        self.set_status(204)
+        self.finish()
@@ -47,6 +47,7 @@ from streamlit.web.server.routes import (
     HealthHandler,
     HostConfigHandler,
     MessageCacheHandler,
+    PagedTableHandler,
     StaticFileHandler,
 )
 from streamlit.web.server.server_util import DEVELOPMENT_PORT, make_url_path_regex
@@ -86,6 +87,7 @@ UPLOAD_FILE_ENDPOINT: Final = "/_stcore/upload_file"
 STREAM_ENDPOINT: Final = r"_stcore/stream"
 METRIC_ENDPOINT: Final = r"(?:st-metrics|_stcore/metrics)"
 MESSAGE_ENDPOINT: Final = r"_stcore/message"
+TABLE_ENDPOINT: Final = r"_stcore/table"
 HEALTH_ENDPOINT: Final = r"(?:healthz|_stcore/health)"
 HOST_CONFIG_ENDPOINT: Final = r"_stcore/host-config"
 SCRIPT_HEALTH_CHECK_ENDPOINT: Final = (
@@ -298,6 +300,11 @@ class Server:
                 MessageCacheHandler,
                 dict(cache=self._runtime.message_cache),
             ),
+            (
+                make_url_path_regex(base, TABLE_ENDPOINT),
+                PagedTableHandler,
+                dict(paged_table_mgr=self._runtime.paged_table_mgr),
+            ),
             (
                 make_url_path_regex(base, METRIC_ENDPOINT),
                 StatsRequestHandler,
@@ -68,6 +68,17 @@ class StatsRequestHandler(tornado.web.RequestHandler):
         # Format: header, stats, EOF
         result = [metric_type, metric_unit, metric_help]
         result.extend(stat.to_metric_str() for stat in stats)
+
+        # Only caches with size limits report evictions.
+        eviction_stats = [stat for stat in stats if stat.evictions > 0]
+        if eviction_stats:
+            result.append("# TYPE cache_evictions counter")
+            result.append(
+                "# HELP Number of entries removed from a cache to stay within "
+                "its size limits."
+            )
+            result.extend(stat.to_evictions_metric_str() for stat in eviction_stats)
+
         result.append(openmetrics_eof)
 
         return "\n".join(result)
@@ -75,7 +86,7 @@ class StatsRequestHandler(tornado.web.RequestHandler):
     @staticmethod
     def _stats_to_proto(stats: list[CacheStat]) -> MetricSetProto:
         # Lazy load the import of this proto message for better performance:
-        from streamlit.proto.openmetrics_data_model_pb2 import GAUGE
+        from streamlit.proto.openmetrics_data_model_pb2 import COUNTER, GAUGE
         from streamlit.proto.openmetrics_data_model_pb2 import (
             MetricSet as MetricSetProto,
         )
@@ -94,4 +105,17 @@ class StatsRequestHandler(tornado.web.RequestHandler):
 
         metric_set = MetricSetProto()
         metric_set.metric_families.append(metric_family)
+
+        eviction_stats = [stat for stat in stats if stat.evictions > 0]
+        if eviction_stats:
+            evictions_family = metric_set.metric_families.add()
+            evictions_family.name = "cache_evictions"
+            evictions_family.type = COUNTER
+            evictions_family.help = (
+                "Number of entries removed from a cache to stay within its size limits."
+            )
+            for stat in eviction_stats:
+                metric_proto = evictions_family.metrics.add()
+                stat.marshall_evictions_metric_proto(metric_proto)
+
         return metric_set
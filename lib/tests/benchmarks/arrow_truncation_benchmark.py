@@ -0,0 +1,111 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measures how long it takes to truncate a wide, string-heavy table to the max
+message size, and how many rows are kept, compared to the previous recursive
+truncation.
+
+The table has `--columns` string columns whose values have random lengths of
+up to `--max-length` characters. Rows are truncated until the table fits into
+`--max-message-size` megabytes.
+
+Run from the `lib` folder:
+
+    python -m tests.benchmarks.arrow_truncation_benchmark --rows 200000 --columns 50
+"""
+
+from __future__ import annotations
+
+import math
+
+import click
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from streamlit import config, logger, type_util
+from tests.benchmarks.benchmark_util import print_timings, time_call
+
+
+def _truncate_recursively(table: pa.Table, max_message_size: int) -> pa.Table:
+    """_maybe_truncate_table as it was, estimating the number of rows from
+    the size of the table and slicing until it fits."""
+    table_size = int(table.nbytes + 1 * 1e6)
+    table_rows = table.num_rows
+
+    if table_rows > 1 and table_size > max_message_size:
+        targeted_rows = math.ceil(table_rows * (max_message_size / table_size))
+        targeted_rows = math.floor(
+            max(
+                min(
+                    targeted_rows - math.floor((table_rows - targeted_rows) * 0.05),
+                    table_rows - (table_rows * 0.01),
+                    table_rows - 5,
+                ),
+                1,
+            )
+        )
+        return _truncate_recursively(table.slice(0, targeted_rows), max_message_size)
+    return table
+
+
+def _create_table(rows: int, columns: int, max_length: int) -> pa.Table:
+    rng = np.random.default_rng(0)
+    # A pool of values, so that creating the table doesn't take too long:
+    values = np.array(
+        ["x" * length for length in rng.integers(0, max_length, 10000)], dtype=object
+    )
+    df = pd.DataFrame(
+        {f"col {i}": values[rng.integers(0, len(values), rows)] for i in range(columns)}
+    )
+    return pa.Table.from_pandas(df)
+
+
+@click.command()
+@click.option("--rows", default=200_000, help="Number of rows of the table.")
+@click.option("--columns", default=50, help="Number of string columns.")
+@click.option("--max-length", default=40, help="Maximum length of the strings.")
+@click.option("--max-message-size", default=200, help="Max message size, in MB.")
+@click.option("--repeat", default=5, help="Number of truncations per scenario.")
+def main(
+    rows: int, columns: int, max_length: int, max_message_size: int, repeat: int
+) -> None:
+    config.get_config_options()
+    logger.set_log_level("error")
+    config.set_option("server.enableArrowTruncation", True)
+    config.set_option("server.maxMessageSize", max_message_size)
+
+    table = _create_table(rows, columns, max_length)
+    click.echo(f"Table: {rows} rows, {columns} columns, {table.nbytes / 1e6:.1f} MB")
+
+    recursive_table = _truncate_recursively(table, int(max_message_size * 1e6))
+    print_timings(
+        f"recursive, {recursive_table.num_rows} rows kept",
+        time_call(
+            lambda: _truncate_recursively(table, int(max_message_size * 1e6)),
+            repeat,
+        ),
+    )
+
+    for mode in ("head", "headTail", "sample"):
+        config.set_option("server.arrowTruncationMode", mode)
+        truncated_table = type_util._maybe_truncate_table(table)
+        print_timings(
+            f"{mode}, {truncated_table.num_rows} rows kept",
+            time_call(lambda: type_util._maybe_truncate_table(table), repeat),
+        )
+
+
+if __name__ == "__main__":
+    main()
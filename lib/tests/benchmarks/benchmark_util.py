@@ -0,0 +1,71 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared helpers for the scripts in tests/benchmarks.
+
+The benchmarks aren't collected by pytest. Run them as modules from the `lib`
+folder, e.g. `python -m tests.benchmarks.runtime_send_loop_benchmark`.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, NamedTuple, Sequence
+
+import click
+
+
+class Timings(NamedTuple):
+    """Summary statistics for a list of durations, in milliseconds."""
+
+    min: float
+    p50: float
+    p99: float
+    max: float
+
+    @classmethod
+    def from_seconds(cls, durations: Sequence[float]) -> Timings:
+        ms = sorted(d * 1000 for d in durations)
+        return cls(
+            min=ms[0],
+            p50=percentile(ms, 50),
+            p99=percentile(ms, 99),
+            max=ms[-1],
+        )
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Return the nearest-rank percentile of an already sorted sequence."""
+    index = max(
+        0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1)
+    )
+    return sorted_values[index]
+
+
+def time_call(func: Callable[[], Any], repeat: int) -> Timings:
+    """Call `func` `repeat` times and return how long the calls took."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return Timings.from_seconds(durations)
+
+
+def print_timings(label: str, timings: Timings) -> None:
+    """Print a row of timings, aligned with the other rows."""
+    click.echo(
+        f"{label:<40} min {timings.min:10.3f} ms   p50 {timings.p50:10.3f} ms   "
+        f"p99 {timings.p99:10.3f} ms   max {timings.max:10.3f} ms"
+    )
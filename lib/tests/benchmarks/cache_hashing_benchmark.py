@@ -0,0 +1,94 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measures how long it takes to hash dataframes and arrays for cache keys,
+with the sampling hash mode and the exact hash mode.
+
+The dataframes have `--rows` rows, with a float, an int, a datetime, a
+categorical and a string column. The array has `--rows` x 10 floats. Tables
+and arrays below the sampling thresholds are hashed in full by both modes.
+
+Run from the `lib` folder:
+
+    python -m tests.benchmarks.cache_hashing_benchmark --rows 1000000
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+import click
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from streamlit.runtime.caching.cache_errors import UnhashableTypeError
+from streamlit.runtime.caching.cache_type import CacheType
+from streamlit.runtime.caching.hashing import update_hash
+from streamlit.util import HASHLIB_KWARGS
+from tests.benchmarks.benchmark_util import print_timings, time_call
+
+
+def _hash(value: Any, hash_mode: str) -> str:
+    hasher = hashlib.new("md5", **HASHLIB_KWARGS)
+    update_hash(value, hasher, CacheType.DATA, hash_mode=hash_mode)  # type: ignore
+    return hasher.hexdigest()
+
+
+def _create_dataframe(rows: int, with_strings: bool) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {
+            "float": rng.random(rows),
+            "int": rng.integers(0, 1000, rows),
+            "date": pd.Timestamp("2024-01-01")
+            + pd.to_timedelta(rng.integers(0, 10**9, rows), unit="s"),
+            "category": pd.Categorical(rng.choice(["a", "b", "c"], rows)),
+        }
+    )
+    if with_strings:
+        df["string"] = rng.choice([f"value {i}" for i in range(1000)], rows)
+    return df
+
+
+@click.command()
+@click.option("--rows", default=1_000_000, help="Number of rows.")
+@click.option("--repeat", default=5, help="Number of hashes per scenario.")
+def main(rows: int, repeat: int) -> None:
+    numeric_df = _create_dataframe(rows, with_strings=False)
+    string_df = _create_dataframe(rows, with_strings=True)
+    array = np.random.default_rng(0).random((rows, 10))
+    scenarios = {
+        "numeric dataframe": numeric_df,
+        "dataframe with strings": string_df,
+        "ndarray": array,
+        "pyarrow table": pa.Table.from_pandas(string_df),
+    }
+
+    for name, value in scenarios.items():
+        for hash_mode in ("sample", "exact"):
+            try:
+                _hash(value, hash_mode)
+            except UnhashableTypeError:
+                click.echo(f"{name}, {hash_mode}: unhashable")
+                continue
+            print_timings(
+                f"{name}, {hash_mode}",
+                time_call(lambda: _hash(value, hash_mode), repeat),
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measures the overhead of calling cached functions when their values are
+already cached.
+
+The "cache hit" scenario calls a function with 5 positional arguments that's
+decorated once. The "decorate and call" scenario decorates a function that's
+defined in another function on each call, like `SQLConnection.query` does.
+Each scenario makes `--calls` calls.
+
+Run from the `lib` folder:
+
+    python -m tests.benchmarks.cached_call_benchmark --calls 1000
+"""
+
+from __future__ import annotations
+
+import click
+
+from streamlit.runtime.caching import cache_data
+from tests.benchmarks.benchmark_util import print_timings, time_call
+
+
+@cache_data(show_spinner=False)
+def _cached(a: int, b: int, c: int, d: int, e: int) -> int:
+    return a + b + c + d + e
+
+
+def _query(value: int) -> int:
+    def _run(value: int) -> int:
+        return value
+
+    return cache_data(show_spinner=False)(_run)(value)
+
+
+@click.command()
+@click.option("--calls", default=1000, help="Number of calls per scenario.")
+@click.option("--repeat", default=5, help="Number of runs per scenario.")
+def main(calls: int, repeat: int) -> None:
+    _cached(1, 2, 3, 4, 5)
+    _query(1)
+
+    def cache_hits() -> None:
+        for _ in range(calls):
+            _cached(1, 2, 3, 4, 5)
+
+    def decorate_and_call() -> None:
+        for _ in range(calls):
+            _query(1)
+
+    print_timings("cache hit", time_call(cache_hits, repeat))
+    print_timings("decorate and call", time_call(decorate_and_call, repeat))
+
+
+if __name__ == "__main__":
+    main()
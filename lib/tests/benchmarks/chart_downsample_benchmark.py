@@ -0,0 +1,80 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measures how long it takes to build and serialize a built-in line chart of a
+large time series, with and without downsampling.
+
+The data has a datetime x column and `--series` random-walk y columns with
+`--points` rows each. The timings include generating the chart and serializing
+its data to Arrow bytes, which is what a line chart costs the server.
+
+Run from the `lib` folder:
+
+    python -m tests.benchmarks.chart_downsample_benchmark --points 1000000 --points 10000000
+"""
+
+from __future__ import annotations
+
+import click
+import numpy as np
+import pandas as pd
+
+from streamlit.elements.lib.built_in_chart_utils import (
+    ChartType,
+    DownsampleMethod,
+    generate_chart,
+)
+from streamlit.type_util import data_frame_to_bytes
+from tests.benchmarks.benchmark_util import print_timings, time_call
+
+
+def _create_dataframe(points: int, series: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(
+        {f"series {i}": rng.standard_normal(points).cumsum() for i in range(series)}
+    )
+    df.insert(0, "time", pd.date_range("2024-01-01", periods=points, freq="s"))
+    return df
+
+
+def _chart_bytes(df: pd.DataFrame, downsample: DownsampleMethod | None) -> bytes:
+    chart, _ = generate_chart(
+        ChartType.LINE, df, x_from_user="time", downsample=downsample
+    )
+    return data_frame_to_bytes(chart.data)
+
+
+@click.command()
+@click.option(
+    "--points",
+    multiple=True,
+    type=int,
+    default=[1_000_000, 10_000_000],
+    help="Number of points per series. Can be repeated.",
+)
+@click.option("--series", default=1, help="Number of y columns.")
+@click.option("--repeat", default=3, help="Number of charts per scenario.")
+def main(points: list[int], series: int, repeat: int) -> None:
+    for num_points in points:
+        df = _create_dataframe(num_points, series)
+        for downsample in (None, "lttb", "min-max"):
+            size = len(_chart_bytes(df, downsample))
+            print_timings(
+                f"{num_points:>10,} {str(downsample):<8} {size / 1e6:8.2f} MB",
+                time_call(lambda: _chart_bytes(df, downsample), repeat),
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measures how long the Runtime takes to deliver ForwardMsgs to clients,
+depending on how many sessions are connected.
+
+Two scenarios are measured for each session count:
+  * "one active": a single session enqueues a message while all the other
+    sessions are idle (e.g. a user interacting with a widget).
+  * "fan-out": every session enqueues a message at once (e.g. all viewers of
+    a dashboard rerunning), and we wait for the last one to be delivered.
+
+Run from the `lib` folder:
+
+    python -m tests.benchmarks.runtime_send_loop_benchmark --sessions 10,100,1000
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from unittest import mock
+
+import click
+
+from streamlit import config, logger
+from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+from streamlit.runtime import Runtime, RuntimeConfig, SessionClient
+from streamlit.runtime.caching.storage.dummy_cache_storage import (
+    MemoryCacheStorageManager,
+)
+from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
+from tests.benchmarks.benchmark_util import Timings, print_timings
+from tests.streamlit.runtime.runtime_test_case import MockSessionManager
+
+
+class _TimingSessionClient(SessionClient):
+    """A SessionClient that records when it receives each message."""
+
+    def __init__(self) -> None:
+        self.waiter: asyncio.Future[float] | None = None
+
+    def write_forward_msg(self, msg: ForwardMsg) -> None:
+        if self.waiter is not None and not self.waiter.done():
+            self.waiter.set_result(time.perf_counter())
+
+
+def _create_msg(i: int) -> ForwardMsg:
+    msg = ForwardMsg()
+    msg.metadata.delta_path[:] = [0, 0]
+    msg.delta.new_element.markdown.body = f"Message {i}"
+    return msg
+
+
+async def _run_scenarios(num_sessions: int, repeat: int) -> None:
+    Runtime._instance = None
+    runtime = Runtime(
+        RuntimeConfig(
+            script_path="benchmark.py",
+            command_line=None,
+            media_file_storage=MemoryMediaFileStorage("/mock/media"),
+            uploaded_file_manager=MemoryUploadedFileManager("/mock/upload"),
+            session_manager_class=MockSessionManager,
+            session_storage=mock.MagicMock(),
+            cache_storage_manager=MemoryCacheStorageManager(),
+        )
+    )
+    await runtime.start()
+
+    clients = [_TimingSessionClient() for _ in range(num_sessions)]
+    with mock.patch("streamlit.runtime.app_session.LocalSourcesWatcher"):
+        session_ids = [
+            runtime.connect_session(client=client, user_info={}) for client in clients
+        ]
+    sessions = [
+        runtime._session_mgr.get_session_info(session_id).session
+        for session_id in session_ids
+    ]
+    # Let the Runtime loop settle after all the connections.
+    await asyncio.sleep(0.1)
+
+    loop = asyncio.get_running_loop()
+
+    # Messages from a single user arrive at random times, so pick a random
+    # session and wait a random "think time" before each message.
+    rng = random.Random(0)
+    one_active = []
+    for i in range(repeat):
+        await asyncio.sleep(rng.uniform(0, 0.02))
+        index = rng.randrange(num_sessions)
+        clients[index].waiter = loop.create_future()
+        start = time.perf_counter()
+        sessions[index]._enqueue_forward_msg(_create_msg(i))
+        one_active.append(await clients[index].waiter - start)
+
+    fan_out = []
+    for i in range(max(1, repeat // 10)):
+        for client in clients:
+            client.waiter = loop.create_future()
+        start = time.perf_counter()
+        for session in sessions:
+            session._enqueue_forward_msg(_create_msg(i))
+        delivered = await asyncio.gather(*(client.waiter for client in clients))
+        fan_out.append(max(delivered) - start)
+
+    print_timings(
+        f"{num_sessions} sessions, one active", Timings.from_seconds(one_active)
+    )
+    print_timings(f"{num_sessions} sessions, fan-out", Timings.from_seconds(fan_out))
+
+    runtime.stop()
+    await runtime.stopped
+    for session in sessions:
+        session.shutdown()
+    Runtime._instance = None
+
+
+@click.command()
+@click.option(
+    "--sessions",
+    default="1,10,100,1000",
+    help="Comma-separated list of session counts to measure.",
+)
+@click.option("--repeat", default=200, help="Number of messages to send per scenario.")
+def main(sessions: str, repeat: int) -> None:
+    # Parse our config before any AppSession subscribes to config changes.
+    config.get_config_options()
+    logger.set_log_level("error")
+    for num_sessions in (int(n) for n in sessions.split(",")):
+        asyncio.run(_run_scenarios(num_sessions, repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Measures how long compute_widget_id takes for widgets with big arguments,
+compared to hashing the `str()` of each argument.
+
+Two widgets are measured, with the arguments they pass to compute_widget_id:
+  * a `st.data_editor` whose Arrow bytes are about `--editor-mb` megabytes.
+  * a `st.multiselect` with `--options` options.
+
+Run from the `lib` folder:
+
+    python -m tests.benchmarks.widget_id_benchmark --editor-mb 50 --options 100000
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+import click
+import numpy as np
+import pandas as pd
+
+from streamlit import config, logger, type_util
+from streamlit.runtime.state.common import compute_widget_id
+from streamlit.util import HASHLIB_KWARGS
+from tests.benchmarks.benchmark_util import print_timings, time_call
+
+
+def _compute_widget_id_with_str(element_type: str, **kwargs: Any) -> str:
+    """compute_widget_id as it was, hashing the str() of every argument."""
+    h = hashlib.new("md5", **HASHLIB_KWARGS)
+    h.update(element_type.encode("utf-8"))
+    for k, v in kwargs.items():
+        h.update(str(k).encode("utf-8"))
+        h.update(str(v).encode("utf-8"))
+    return h.hexdigest()
+
+
+def _data_editor_kwargs(editor_mb: int) -> dict[str, Any]:
+    num_rows = editor_mb * 1_000_000 // (8 * 4)
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame(rng.random((num_rows, 4)), columns=["a", "b", "c", "d"])
+    return dict(
+        data=type_util.data_frame_to_bytes(df),
+        width=None,
+        height=None,
+        use_container_width=False,
+        column_order=None,
+        column_config_mapping="{}",
+        num_rows="fixed",
+        key=None,
+        form_id="",
+        page="",
+    )
+
+
+def _multiselect_kwargs(num_options: int) -> dict[str, Any]:
+    return dict(
+        label="Pick some",
+        options=[f"Option {i}" for i in range(num_options)],
+        default=[0, 1, 2],
+        key=None,
+        help=None,
+        max_selections=None,
+        placeholder="Choose an option",
+        form_id="",
+        page="",
+    )
+
+
+@click.command()
+@click.option("--editor-mb", default=50, help="Size of the data_editor data, in MB.")
+@click.option("--options", default=100_000, help="Number of multiselect options.")
+@click.option("--repeat", default=20, help="Number of ids to compute per scenario.")
+def main(editor_mb: int, options: int, repeat: int) -> None:
+    config.get_config_options()
+    logger.set_log_level("error")
+
+    scenarios = [
+        (f"data_editor, {editor_mb} MB", "data_editor", _data_editor_kwargs(editor_mb)),
+        (
+            f"multiselect, {options} options",
+            "multiselect",
+            _multiselect_kwargs(options),
+        ),
+    ]
+    for label, element_type, kwargs in scenarios:
+        print_timings(
+            f"{label}, str()",
+            time_call(
+                lambda: _compute_widget_id_with_str(element_type, **kwargs), repeat
+            ),
+        )
+        print_timings(
+            f"{label}, digest",
+            time_call(lambda: compute_widget_id(element_type, **kwargs), repeat),
+        )
+
+
+if __name__ == "__main__":
+    main()
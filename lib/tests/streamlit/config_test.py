@@ -373,6 +373,11 @@ class ConfigTest(unittest.TestCase):
                 "runner.postScriptGC",
                 "runner.fastReruns",
                 "runner.enumCoercion",
+                "runner.maxCacheSize",
+                "runner.maxDiskCacheSize",
+                "runner.sharedCachePath",
+                "runner.sharedCacheLeaseTimeout",
+                "runner.sharedCacheStaleWhileRevalidate",
                 "magic.displayRootDocString",
                 "magic.displayLastExprIfNoSemicolon",
                 "mapbox.token",
@@ -391,8 +396,14 @@ class ConfigTest(unittest.TestCase):
                 "server.runOnSave",
                 "server.maxUploadSize",
                 "server.maxMessageSize",
+                "server.maxWebsocketBufferSize",
                 "server.enableStaticServing",
                 "server.enableArrowTruncation",
+                "server.arrowTruncationMode",
+                "server.enableArrowPaging",
+                "server.enableArrowChunking",
+                "server.enableArrowCompression",
+                "server.arrowCompressionThreshold",
                 "server.sslCertFile",
                 "server.sslKeyFile",
                 "ui.hideTopBar",
@@ -21,6 +21,8 @@ import pandas as pd
 import pyarrow as pa
 
 from streamlit.type_util import DataFormat
+from tests.streamlit.duckdb_mocks import DuckDBPyRelation
+from tests.streamlit.polars_mocks import DataFrame as PolarsDataFrame
 from tests.streamlit.pyspark_mocks import DataFrame as PysparkDataFrame
 from tests.streamlit.snowpandas_mocks import DataFrame as SnowpandasDataFrame
 from tests.streamlit.snowpandas_mocks import Series as SnowpandasSeries
@@ -209,6 +211,16 @@ SHARED_TEST_CASES = [
         PysparkDataFrame(pd.DataFrame(np.random.randn(2, 2))),
         TestCaseMetadata(2, 2, DataFormat.PYSPARK_OBJECT),
     ),
+    # Polars DataFrame:
+    (
+        PolarsDataFrame(pd.DataFrame(np.random.randn(2, 2))),
+        TestCaseMetadata(2, 2, DataFormat.ARROW_OBJECT),
+    ),
+    # DuckDB relation:
+    (
+        DuckDBPyRelation(pd.DataFrame({"a": ["x", "y", "z"], "b": [1, 2, 3]})),
+        TestCaseMetadata(3, 2, DataFormat.ARROW_OBJECT),
+    ),
 ]
 
 
@@ -15,9 +15,11 @@
 """Unit test of dg.add_rows()."""
 
 import pandas as pd
+import pyarrow as pa
 from parameterized import parameterized
 
 import streamlit as st
+from streamlit.errors import StreamlitAPIException
 from streamlit.type_util import bytes_to_data_frame
 from tests.delta_generator_test_case import DeltaGeneratorTestCase
 
@@ -44,19 +46,10 @@ class DeltaGeneratorAddRowsTest(DeltaGeneratorTestCase):
     def test_charts_with_implict_x_and_y(self, chart_command):
         expected = pd.DataFrame(
             {
-                "index--p5bJXXpQgvPz6yvQMFiy": [1, 2, 3, 1, 2, 3, 1, 2, 3],
-                "color--p5bJXXpQgvPz6yvQMFiy": [
-                    "a",
-                    "a",
-                    "a",
-                    "b",
-                    "b",
-                    "b",
-                    "c",
-                    "c",
-                    "c",
-                ],
-                "value--p5bJXXpQgvPz6yvQMFiy": [11, 12, 13, 21, 22, 23, 31, 32, 33],
+                "index--p5bJXXpQgvPz6yvQMFiy": [1, 2, 3],
+                "a": [11, 12, 13],
+                "b": [21, 22, 23],
+                "c": [31, 32, 33],
             }
         )
 
@@ -110,11 +103,12 @@ class DeltaGeneratorAddRowsTest(DeltaGeneratorTestCase):
     def test_charts_with_explicit_x_and_implicit_y(self, chart_command):
         expected = pd.DataFrame(
             {
-                "b": [21, 22, 23, 21, 22, 23],
-                "color--p5bJXXpQgvPz6yvQMFiy": ["a", "a", "a", "c", "c", "c"],
-                "value--p5bJXXpQgvPz6yvQMFiy": [11, 12, 13, 31, 32, 33],
+                "b": [21, 22, 23],
+                "a": [11, 12, 13],
+                "c": [31, 32, 33],
             }
         )
+        expected.index = pd.RangeIndex(1, 4)
 
         element = chart_command(DATAFRAME, x="b")
         element.add_rows(NEW_ROWS)
@@ -129,11 +123,12 @@ class DeltaGeneratorAddRowsTest(DeltaGeneratorTestCase):
     def test_charts_with_explicit_x_and_y_sequence(self, chart_command):
         expected = pd.DataFrame(
             {
-                "b": [21, 22, 23, 21, 22, 23],
-                "color--p5bJXXpQgvPz6yvQMFiy": ["a", "a", "a", "c", "c", "c"],
-                "value--p5bJXXpQgvPz6yvQMFiy": [11, 12, 13, 31, 32, 33],
+                "b": [21, 22, 23],
+                "a": [11, 12, 13],
+                "c": [31, 32, 33],
             }
         )
+        expected.index = pd.RangeIndex(1, 4)
 
         element = chart_command(DATAFRAME, x="b", y=["a", "c"])
         element.add_rows(NEW_ROWS)
@@ -150,11 +145,12 @@ class DeltaGeneratorAddRowsTest(DeltaGeneratorTestCase):
     ):
         expected = pd.DataFrame(
             {
-                "b": [21, 22, 23, 21, 22, 23],
-                "color--p5bJXXpQgvPz6yvQMFiy": ["a", "a", "a", "c", "c", "c"],
-                "value--p5bJXXpQgvPz6yvQMFiy": [11, 12, 13, 31, 32, 33],
+                "b": [21, 22, 23],
+                "a": [11, 12, 13],
+                "c": [31, 32, 33],
             }
         )
+        expected.index = pd.RangeIndex(1, 4)
 
         element = chart_command(DATAFRAME, x="b", y=["a", "c"], color=["#f00", "#0f0"])
         element.add_rows(NEW_ROWS)
@@ -168,12 +164,13 @@ class DeltaGeneratorAddRowsTest(DeltaGeneratorTestCase):
     def test_charts_with_explicit_x_and_y_sequence_and_size_set(self):
         expected = pd.DataFrame(
             {
-                "b": [21, 22, 23, 21, 22, 23],
-                "d": [41, 42, 43, 41, 42, 43],
-                "color--p5bJXXpQgvPz6yvQMFiy": ["a", "a", "a", "c", "c", "c"],
-                "value--p5bJXXpQgvPz6yvQMFiy": [11, 12, 13, 31, 32, 33],
+                "b": [21, 22, 23],
+                "d": [41, 42, 43],
+                "a": [11, 12, 13],
+                "c": [31, 32, 33],
             }
         )
+        expected.index = pd.RangeIndex(1, 4)
 
         element = st.scatter_chart(DATAFRAME2, x="b", y=["a", "c"], size="d")
         element.add_rows(NEW_ROWS2)
@@ -202,3 +199,63 @@ class DeltaGeneratorAddRowsTest(DeltaGeneratorTestCase):
         )
 
         pd.testing.assert_frame_equal(proto, expected)
+
+    def test_add_rows_with_max_rows(self):
+        """Test that streamed rows are limited to max_rows, and only the first
+        rows of the stream are sent with their schema."""
+        element = st.dataframe(DATAFRAME)
+
+        element.add_rows(NEW_ROWS, max_rows=2)
+        first_rows = self.get_delta_from_queue().arrow_add_rows
+        self.clear_queue()
+        element.add_rows(NEW_ROWS, max_rows=2)
+        second_rows = self.get_delta_from_queue().arrow_add_rows
+
+        self.assertEqual(first_rows.max_rows, 2)
+        self.assertFalse(first_rows.schema_omitted)
+        pd.testing.assert_frame_equal(
+            bytes_to_data_frame(first_rows.data.data),
+            NEW_ROWS.iloc[1:],
+        )
+
+        self.assertEqual(second_rows.max_rows, 2)
+        self.assertTrue(second_rows.schema_omitted)
+        self.assertEqual(
+            pa.ipc.open_stream(first_rows.data.data + second_rows.data.data)
+            .read_all()["a"]
+            .to_pylist(),
+            [12, 13, 12, 13],
+        )
+
+    def test_add_rows_with_max_rows_are_composed(self):
+        """Test that streamed rows that are still in the queue are sent as a
+        single add_rows."""
+        element = st.dataframe(DATAFRAME)
+
+        element.add_rows(NEW_ROWS, max_rows=10)
+        element.add_rows(NEW_ROWS, max_rows=10)
+
+        deltas = self.get_all_deltas_from_queue()
+        self.assertEqual(len(deltas), 2)
+        self.assertEqual(
+            bytes_to_data_frame(deltas[-1].arrow_add_rows.data.data)["a"].tolist(),
+            NEW_ROWS["a"].tolist() * 2,
+        )
+
+    def test_add_rows_without_max_rows_resends_schema(self):
+        """Test that streamed rows are sent with their schema after rows that
+        aren't streamed."""
+        element = st.line_chart(DATAFRAME)
+
+        element.add_rows(NEW_ROWS, max_rows=10)
+        element.add_rows(NEW_ROWS)
+        element.add_rows(NEW_ROWS, max_rows=10)
+
+        self.assertFalse(self.get_delta_from_queue().arrow_add_rows.schema_omitted)
+
+    def test_add_rows_with_invalid_max_rows(self):
+        """Test that max_rows must be positive."""
+        element = st.dataframe(DATAFRAME)
+
+        with self.assertRaises(StreamlitAPIException):
+            element.add_rows(NEW_ROWS, max_rows=0)
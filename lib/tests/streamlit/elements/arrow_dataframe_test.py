@@ -27,9 +27,13 @@ from parameterized import parameterized
 import streamlit as st
 from streamlit.elements.lib.column_config_utils import INDEX_IDENTIFIER
 from streamlit.errors import StreamlitAPIException
+from streamlit.runtime import Runtime
 from streamlit.type_util import bytes_to_data_frame, pyarrow_table_to_bytes
 from tests.delta_generator_test_case import DeltaGeneratorTestCase
-from tests.testutil import create_snowpark_session
+from tests.streamlit.duckdb_mocks import DuckDBPyRelation
+from tests.streamlit.polars_mocks import DataFrame as PolarsDataFrame
+from tests.streamlit.polars_mocks import Series as PolarsSeries
+from tests.testutil import create_snowpark_session, patch_config_options
 
 
 def mock_data_frame():
@@ -72,6 +76,123 @@ class ArrowDataFrameProtoTest(DeltaGeneratorTestCase):
         proto = self.get_delta_from_queue().new_element.arrow_data_frame
         self.assertEqual(proto.data, pyarrow_table_to_bytes(table))
 
+    @parameterized.expand(
+        [
+            ("polars", PolarsDataFrame),
+            ("duckdb", DuckDBPyRelation),
+        ]
+    )
+    def test_arrow_data_object(self, _, data_object_type):
+        """Test that Arrow data objects are serialized without converting them
+        to pandas, both in `st.dataframe` and in `add_rows`."""
+        df = pd.DataFrame({"a": ["x", "y"], "b": [1, 2]})
+        table = pa.Table.from_pandas(df, preserve_index=False)
+
+        element = st.dataframe(data_object_type(df))
+        proto = self.get_delta_from_queue().new_element.arrow_data_frame
+        self.assertEqual(proto.data, pyarrow_table_to_bytes(table))
+
+        element.add_rows(data_object_type(df))
+        add_rows_proto = self.get_delta_from_queue().arrow_add_rows.data
+        self.assertEqual(add_rows_proto.data, pyarrow_table_to_bytes(table))
+
+    def test_non_tabular_arrow_data_object(self):
+        """Test that an object streaming a single column of Arrow data is
+        converted through pandas, both in `st.dataframe` and in `add_rows`."""
+        series = pd.Series([1, 2], name="a")
+
+        element = st.dataframe(PolarsSeries(series))
+        proto = self.get_delta_from_queue().new_element.arrow_data_frame
+        pd.testing.assert_frame_equal(
+            bytes_to_data_frame(proto.data), series.to_frame()
+        )
+
+        element.add_rows(PolarsSeries(series))
+        add_rows_proto = self.get_delta_from_queue().arrow_add_rows.data
+        pd.testing.assert_frame_equal(
+            bytes_to_data_frame(add_rows_proto.data), series.to_frame()
+        )
+
+    @patch_config_options({"server.enableArrowPaging": True})
+    def test_paged_dataframe(self):
+        """Test that only the first rows of a large dataframe are sent, and
+        that the server keeps the whole table."""
+        df = pd.DataFrame({"a": range(20000)}, index=range(5, 20005))
+        st.dataframe(df)
+
+        proto = self.get_delta_from_queue().new_element.arrow_data_frame
+        self.assertEqual(proto.paged_table.num_rows, 20000)
+        pd.testing.assert_frame_equal(bytes_to_data_frame(proto.data), df.iloc[:1000])
+
+        rows = Runtime.instance().paged_table_mgr.get_rows(
+            proto.paged_table.id, 15000, 15010
+        )
+        pd.testing.assert_frame_equal(
+            bytes_to_data_frame(rows), df.iloc[15000:15010], check_index_type=False
+        )
+
+    @parameterized.expand(
+        [
+            ("disabled", False, 20000, "ignore"),
+            ("small table", True, 100, "ignore"),
+            ("selections", True, 20000, "rerun"),
+        ]
+    )
+    def test_dataframe_not_paged(self, _, enable_paging, num_rows, on_select):
+        """Test that dataframes are only paged if enabled, large enough, and
+        without selections."""
+        with patch_config_options({"server.enableArrowPaging": enable_paging}):
+            st.dataframe(pd.DataFrame({"a": range(num_rows)}), on_select=on_select)
+
+        proto = self.get_delta_from_queue().new_element.arrow_data_frame
+        self.assertFalse(proto.HasField("paged_table"))
+        self.assertEqual(bytes_to_data_frame(proto.data).shape[0], num_rows)
+
+    @patch_config_options({"server.enableArrowChunking": True})
+    @patch("streamlit.elements.arrow._ARROW_CHUNK_BYTES", 800)
+    def test_chunked_dataframe(self):
+        """Test that a large dataframe is sent in chunks, which are appended to
+        the element."""
+        df = pd.DataFrame({"a": range(1000)}, index=range(5, 1005))
+        st.dataframe(df)
+
+        deltas = self.get_all_deltas_from_queue()
+        element_delta = deltas[0]
+        add_rows_deltas = deltas[1:]
+
+        # The RangeIndex is only stored as metadata, so each chunk has 100 rows:
+        self.assertEqual(len(add_rows_deltas), 9)
+        self.assertTrue(all(delta.arrow_add_rows.is_chunk for delta in add_rows_deltas))
+        self.assertEqual(
+            {msg.metadata.delta_path[-1] for msg in self.forward_msg_queue._queue},
+            {0},
+        )
+        chunks = [element_delta.new_element.arrow_data_frame.data] + [
+            delta.arrow_add_rows.data.data for delta in add_rows_deltas
+        ]
+        pd.testing.assert_frame_equal(
+            pd.concat(bytes_to_data_frame(chunk) for chunk in chunks), df
+        )
+
+    @parameterized.expand(
+        [
+            ("disabled", False, 800, "ignore"),
+            ("small table", True, 1_000_000, "ignore"),
+            ("selections", True, 800, "rerun"),
+        ]
+    )
+    def test_dataframe_not_chunked(self, _, enable_chunking, chunk_bytes, on_select):
+        """Test that dataframes are only chunked if enabled, large enough, and
+        without selections."""
+        with patch_config_options(
+            {"server.enableArrowChunking": enable_chunking}
+        ), patch("streamlit.elements.arrow._ARROW_CHUNK_BYTES", chunk_bytes):
+            st.dataframe(pd.DataFrame({"a": range(1000)}), on_select=on_select)
+
+        self.assertEqual(len(self.get_all_deltas_from_queue()), 1)
+        proto = self.get_delta_from_queue().new_element.arrow_data_frame
+        self.assertEqual(bytes_to_data_frame(proto.data).shape[0], 1000)
+
     def test_hide_index_true(self):
         """Test that it can be called with hide_index=True param."""
         data_df = pd.DataFrame(
@@ -24,6 +24,7 @@ from pandas.io.formats.style_render import StylerRenderer as Styler
 import streamlit as st
 from streamlit.type_util import bytes_to_data_frame, pyarrow_table_to_bytes
 from tests.delta_generator_test_case import DeltaGeneratorTestCase
+from tests.streamlit.polars_mocks import DataFrame as PolarsDataFrame
 
 
 def mock_data_frame():
@@ -52,6 +53,18 @@ class ArrowTest(DeltaGeneratorTestCase):
         proto = self.get_delta_from_queue().new_element.arrow_table
         self.assertEqual(proto.data, pyarrow_table_to_bytes(table))
 
+    def test_arrow_data_object(self):
+        """Test that Arrow data objects are serialized without converting them
+        to pandas."""
+        df = pd.DataFrame({"a": ["x", "y"], "b": [1, 2]})
+        st.table(PolarsDataFrame(df))
+
+        proto = self.get_delta_from_queue().new_element.arrow_table
+        self.assertEqual(
+            proto.data,
+            pyarrow_table_to_bytes(pa.Table.from_pandas(df, preserve_index=False)),
+        )
+
     def test_uuid(self):
         df = mock_data_frame()
         styler = df.style
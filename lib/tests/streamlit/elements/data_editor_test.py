@@ -42,6 +42,7 @@ from streamlit.elements.widgets.data_editor import (
     _check_column_names,
     _check_type_compatibilities,
     _parse_value,
+    _parse_values,
 )
 from streamlit.errors import StreamlitAPIException
 from streamlit.proto.Arrow_pb2 import Arrow as ArrowProto
@@ -204,12 +205,134 @@ class DataEditorUtilTest(unittest.TestCase):
             {"col1": 11, "col2": "bar", "col3": True, "col4": "2023-03-20T14:28:23"},
         ]
 
-        _apply_row_additions(
+        df = _apply_row_additions(
             df, added_rows, determine_dataframe_schema(df, _get_arrow_schema(df))
         )
 
         self.assertEqual(len(df), 5)
 
+    def test_apply_row_additions_with_index(self):
+        """Test that added rows with an index value are appended, or replace the
+        row with the same index value."""
+        df = pd.DataFrame({"col1": [1, 2], "col2": ["a", "b"]}, index=["x", "y"])
+
+        added_rows: List[Dict[str, Any]] = [
+            {"_index": "z", "col1": 3, "col2": "c"},
+            {"_index": "x", "col1": 10},
+            # Rows without an index value are skipped:
+            {"col1": 4, "col2": "d"},
+            # The last row with the same index value wins:
+            {"_index": "z", "col1": 30, "col2": "cc"},
+        ]
+
+        df = _apply_row_additions(
+            df, added_rows, determine_dataframe_schema(df, _get_arrow_schema(df))
+        )
+
+        self.assertEqual(df.index.to_list(), ["x", "y", "z"])
+        self.assertEqual(df["col1"].to_list(), [10, 2, 30])
+        self.assertEqual(df["col2"].to_list(), [None, "b", "cc"])
+
+    def test_apply_row_additions_keeps_dtypes(self):
+        """Test that added rows keep the dtypes of the columns if possible."""
+        df = pd.DataFrame({"col1": [1, 2], "col2": [1.5, 2.5], "col3": [True, False]})
+
+        added_rows: List[Dict[str, Any]] = [
+            {"col1": 3, "col2": "3.5", "col3": True},
+            {"col1": 4, "col3": None},
+        ]
+
+        df = _apply_row_additions(
+            df, added_rows, determine_dataframe_schema(df, _get_arrow_schema(df))
+        )
+
+        self.assertEqual(df.index.to_list(), [0, 1, 2, 3])
+        self.assertEqual(df["col1"].dtype, "int64")
+        self.assertEqual(df["col1"].to_list(), [1, 2, 3, 4])
+        self.assertEqual(df["col2"].dtype, "float64")
+        self.assertEqual(df["col2"].to_list()[:3], [1.5, 2.5, 3.5])
+        self.assertTrue(pd.isna(df["col2"].iloc[3]))
+        # None can't be stored in a bool column:
+        self.assertEqual(df["col3"].to_list(), [True, False, True, None])
+
+    def test_apply_many_cell_edits(self):
+        """Test applying cell edits to many rows of a column at once."""
+        df = pd.DataFrame(
+            {
+                "col1": list(range(1000)),
+                "col2": pd.date_range("2020-01-01", periods=1000),
+            }
+        )
+
+        edited_rows: Mapping[int, Mapping[str, str | int | float | bool | None]] = {
+            row_pos: {"col1": str(row_pos * 2), "col2": "2021-02-03T04:05:06"}
+            for row_pos in range(0, 1000, 2)
+        }
+
+        _apply_cell_edits(
+            df, edited_rows, determine_dataframe_schema(df, _get_arrow_schema(df))
+        )
+
+        self.assertEqual(df["col1"].to_list()[:4], [0, 1, 4, 3])
+        self.assertEqual(df.iat[998, 0], 1996)
+        self.assertEqual(df.iat[0, 1], pd.Timestamp("2021-02-03T04:05:06"))
+        self.assertEqual(df.iat[1, 1], pd.Timestamp("2020-01-02"))
+
+    @parameterized.expand(
+        [
+            ([1, 2, 3],),
+            ([1.5, 2.5, 3.5],),
+        ]
+    )
+    def test_apply_cell_edits_clearing_numeric_cells(self, values: List[Any]):
+        """Test that clearing cells of a numeric column stores NaN in a float
+        column, no matter how many cells of the column are edited."""
+        for edited_rows in [
+            {1: {"col1": None}},
+            {0: {"col1": 10}, 1: {"col1": None}},
+            {0: {"col1": None}, 1: {"col1": None}},
+        ]:
+            df = pd.DataFrame({"col1": values})
+
+            _apply_cell_edits(
+                df, edited_rows, determine_dataframe_schema(df, _get_arrow_schema(df))
+            )
+
+            self.assertEqual(df["col1"].dtype, "float64")
+            self.assertTrue(pd.isna(df.iat[1, 0]))
+            self.assertEqual(df.iat[2, 0], values[2])
+
+    @parameterized.expand(
+        [
+            (["2021-01-01T10:20:30", "2021-01-01", None], ColumnDataKind.DATETIME),
+            (["2021-01-01T10:20:30Z", "2021-01-02T00:00:00Z"], ColumnDataKind.DATETIME),
+            # Different UTC offsets:
+            (
+                ["2021-01-01T10:20:30Z", "2021-01-01T10:20:30+01:00"],
+                ColumnDataKind.DATETIME,
+            ),
+            # Not ISO 8601:
+            (["Jan 1 2021", "2021-01-01"], ColumnDataKind.DATETIME),
+            (["2021-01-01T10:20:30.123456Z", "2021-01-01", ""], ColumnDataKind.DATE),
+            (["10:20:30", "10:20:30.123456", None], ColumnDataKind.TIME),
+            ([100000, "1 day"], ColumnDataKind.TIMEDELTA),
+            (["1", 2.5, None, "foo"], ColumnDataKind.INTEGER),
+            ([1, -2.7, None, True, 2**40], ColumnDataKind.INTEGER),
+            ([None, None], ColumnDataKind.INTEGER),
+            ([1, 1e20, -(2**64)], ColumnDataKind.INTEGER),
+            (["1.5", 2, None], ColumnDataKind.FLOAT),
+            ([1.5, 2, None, False], ColumnDataKind.FLOAT),
+            (["foo", 1, 2.5, True, None], ColumnDataKind.STRING),
+            ([True, False, None, "false", 0], ColumnDataKind.BOOLEAN),
+        ]
+    )
+    def test_parse_values(self, values: List[Any], column_data_kind: ColumnDataKind):
+        """Test that _parse_values parses the values like _parse_value."""
+        self.assertEqual(
+            _parse_values(values, column_data_kind),
+            [_parse_value(value, column_data_kind) for value in values],
+        )
+
     def test_apply_row_deletions(self):
         """Test applying row deletions to a DataFrame."""
         df = pd.DataFrame(
@@ -249,7 +372,7 @@ class DataEditorUtilTest(unittest.TestCase):
             }
         }
 
-        _apply_dataframe_edits(
+        df = _apply_dataframe_edits(
             df,
             {
                 "deleted_rows": deleted_rows,
@@ -434,6 +557,7 @@ class DataEditorTest(DeltaGeneratorTestCase):
             DataFormat.PYSPARK_OBJECT,
             DataFormat.SNOWPANDAS_OBJECT,
             DataFormat.SNOWPARK_OBJECT,
+            DataFormat.ARROW_OBJECT,
         ]:
             assert isinstance(return_data, pd.DataFrame)
             self.assertEqual(return_data.shape[0], metadata.expected_rows)
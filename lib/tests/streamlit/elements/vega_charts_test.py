@@ -14,6 +14,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import unittest
 from typing import Any, Callable
@@ -219,6 +220,32 @@ class AltairChartTest(DeltaGeneratorTestCase):
             chart_el_2.arrow_vega_lite_chart.spec,
         )
 
+    def test_dataset_named_by_its_content(self):
+        """Test that charts of the same data refer to it by the same name, and
+        that data changed in place gets a new name.
+        """
+        df = pd.DataFrame([["A", "B", "C", "D"], [28, 55, 43, 91]], index=["a", "b"]).T
+
+        st.altair_chart(alt.Chart(df).mark_bar().encode(x="a", y="b"))
+        bar_chart = self.get_delta_from_queue().new_element.arrow_vega_lite_chart
+        st.altair_chart(alt.Chart(df).mark_line().encode(x="a", y="b"))
+        line_chart = self.get_delta_from_queue().new_element.arrow_vega_lite_chart
+        self.assertEqual(bar_chart.datasets, line_chart.datasets)
+
+        df["b"] *= 100
+        st.altair_chart(alt.Chart(df).mark_line().encode(x="a", y="b"))
+        changed_chart = self.get_delta_from_queue().new_element.arrow_vega_lite_chart
+        self.assertNotEqual(bar_chart.datasets[0].name, changed_chart.datasets[0].name)
+        self.assertEqual(
+            [2800, 5500, 4300, 9100],
+            bytes_to_data_frame(changed_chart.datasets[0].data.data)["b"].tolist(),
+        )
+        # The dataset's name is the hash of its data:
+        self.assertEqual(
+            hashlib.md5(bar_chart.datasets[0].data.data).hexdigest(),
+            bar_chart.datasets[0].name,
+        )
+
     @parameterized.expand(
         [
             (True),
@@ -836,10 +863,7 @@ class BuiltInChartTest(DeltaGeneratorTestCase):
     ):
         """Test st.line_chart with implicit x and y."""
         df = pd.DataFrame([[20, 30, 50]], columns=["a", "b", "c"])
-        EXPECTED_DATAFRAME = pd.DataFrame(
-            [[20, "b", 30], [20, "c", 50]],
-            columns=["a", "color--p5bJXXpQgvPz6yvQMFiy", "value--p5bJXXpQgvPz6yvQMFiy"],
-        )
+        EXPECTED_DATAFRAME = pd.DataFrame([[20, 30, 50]], columns=["a", "b", "c"])
 
         chart_command(df, x="a", y=["b", "c"])
 
@@ -854,6 +878,19 @@ class BuiltInChartTest(DeltaGeneratorTestCase):
         self.assertEqual(
             chart_spec["encoding"]["color"]["field"], "color--p5bJXXpQgvPz6yvQMFiy"
         )
+        # The data is sent in wide format and folded by Vega-Lite.
+        self.assertEqual(
+            chart_spec["transform"],
+            [
+                {
+                    "fold": ["b", "c"],
+                    "as": [
+                        "color--p5bJXXpQgvPz6yvQMFiy",
+                        "value--p5bJXXpQgvPz6yvQMFiy",
+                    ],
+                }
+            ],
+        )
 
         self.assert_output_df_is_correct_and_input_is_untouched(
             orig_df=df, expected_df=EXPECTED_DATAFRAME, chart_proto=proto
@@ -865,10 +902,7 @@ class BuiltInChartTest(DeltaGeneratorTestCase):
     ):
         """Test st.line_chart with explicit x and implicit y."""
         df = pd.DataFrame([[20, 30, 50]], columns=["a", "b", "c"])
-        EXPECTED_DATAFRAME = pd.DataFrame(
-            [[20, "b", 30], [20, "c", 50]],
-            columns=["a", "color--p5bJXXpQgvPz6yvQMFiy", "value--p5bJXXpQgvPz6yvQMFiy"],
-        )
+        EXPECTED_DATAFRAME = pd.DataFrame([[20, 30, 50]], columns=["a", "b", "c"])
 
         chart_command(df, x="a")
 
@@ -919,12 +953,7 @@ class BuiltInChartTest(DeltaGeneratorTestCase):
         """Test st.line_chart with implicit x and explicit y sequence."""
         df = pd.DataFrame([[20, 30, 50, 60]], columns=["a", "b", "c", "d"])
         EXPECTED_DATAFRAME = pd.DataFrame(
-            [[0, "b", 30], [0, "c", 50]],
-            columns=[
-                "index--p5bJXXpQgvPz6yvQMFiy",
-                "color--p5bJXXpQgvPz6yvQMFiy",
-                "value--p5bJXXpQgvPz6yvQMFiy",
-            ],
+            [[0, 30, 50]], columns=["index--p5bJXXpQgvPz6yvQMFiy", "b", "c"]
         )
 
         chart_command(df, y=["b", "c"])
@@ -975,10 +1004,7 @@ class BuiltInChartTest(DeltaGeneratorTestCase):
     ):
         """Test support for explicit wide-format tables (i.e. y is a sequence)."""
         df = pd.DataFrame([[20, 30, 50, 60]], columns=["a", "b", "c", "d"])
-        EXPECTED_DATAFRAME = pd.DataFrame(
-            [[20, "b", 30], [20, "c", 50]],
-            columns=["a", "color--p5bJXXpQgvPz6yvQMFiy", "value--p5bJXXpQgvPz6yvQMFiy"],
-        )
+        EXPECTED_DATAFRAME = pd.DataFrame([[20, 30, 50]], columns=["a", "b", "c"])
 
         chart_command(df, x="a", y=["b", "c"])
 
@@ -993,6 +1019,19 @@ class BuiltInChartTest(DeltaGeneratorTestCase):
         self.assertEqual(
             chart_spec["encoding"]["color"]["field"], "color--p5bJXXpQgvPz6yvQMFiy"
         )
+        # The data is sent in wide format and folded by Vega-Lite.
+        self.assertEqual(
+            chart_spec["transform"],
+            [
+                {
+                    "fold": ["b", "c"],
+                    "as": [
+                        "color--p5bJXXpQgvPz6yvQMFiy",
+                        "value--p5bJXXpQgvPz6yvQMFiy",
+                    ],
+                }
+            ],
+        )
 
         self.assert_output_df_is_correct_and_input_is_untouched(
             orig_df=df, expected_df=EXPECTED_DATAFRAME, chart_proto=proto
@@ -1105,10 +1144,7 @@ class BuiltInChartTest(DeltaGeneratorTestCase):
         """Test color support for built-in charts with wide-format table."""
         df = pd.DataFrame([[20, 30, 50]], columns=["a", "b", "c"])
 
-        EXPECTED_DATAFRAME = pd.DataFrame(
-            [[20, "b", 30], [20, "c", 50]],
-            columns=["a", "color--p5bJXXpQgvPz6yvQMFiy", "value--p5bJXXpQgvPz6yvQMFiy"],
-        )
+        EXPECTED_DATAFRAME = pd.DataFrame([[20, 30, 50]], columns=["a", "b", "c"])
 
         chart_command(df, x="a", y=["b", "c"], color=["#f00", "#0ff"])
 
@@ -1227,16 +1263,32 @@ class BuiltInChartTest(DeltaGeneratorTestCase):
         self.assertEqual(chart_spec["encoding"]["x"]["sort"], ["c", "b", "a"])
         self.assertEqual(chart_spec["encoding"]["y"]["type"], "quantitative")
 
+    def test_chart_folds_columns_with_special_characters(self):
+        """Test that folded column names are escaped for Vega-Lite."""
+        df = pd.DataFrame([[20, 30, 50]], columns=["a", "b.c", "d[0]"])
+
+        st.line_chart(df, x="a")
+
+        proto = self.get_delta_from_queue().new_element.arrow_vega_lite_chart
+        chart_spec = json.loads(proto.spec)
+        self.assertEqual(chart_spec["transform"][0]["fold"], ["b\\.c", "d\\[0\\]"])
+
+    def test_chart_folds_columns_with_mixed_types(self):
+        """Test that the y encoding of folded columns with different types is nominal."""
+        df = pd.DataFrame({"a": [1, 2], "b": [3, 4], "c": ["x", "y"]})
+
+        st.line_chart(df, x="a")
+
+        proto = self.get_delta_from_queue().new_element.arrow_vega_lite_chart
+        chart_spec = json.loads(proto.spec)
+        self.assertEqual(chart_spec["encoding"]["y"]["type"], "nominal")
+
     def test_line_chart_with_named_index(self):
         """Test st.line_chart with a named index."""
         df = pd.DataFrame([[20, 30, 50]], columns=["a", "b", "c"])
         df.set_index("a", inplace=True)
 
-        EXPECTED_DATAFRAME = pd.DataFrame(
-            [[20, "b", 30], [20, "c", 50]],
-            index=[0, 1],
-            columns=["a", "color--p5bJXXpQgvPz6yvQMFiy", "value--p5bJXXpQgvPz6yvQMFiy"],
-        )
+        EXPECTED_DATAFRAME = pd.DataFrame([[20, 30, 50]], columns=["a", "b", "c"])
 
         st.line_chart(df)
 
@@ -1328,6 +1380,105 @@ class BuiltInChartTest(DeltaGeneratorTestCase):
                 "This does not look like a valid color argument", str(exc.exception)
             )
 
+    @parameterized.expand(
+        [
+            (st.area_chart, "lttb"),
+            (st.line_chart, "lttb"),
+            (st.scatter_chart, "lttb"),
+            (st.area_chart, "min-max"),
+            (st.line_chart, "min-max"),
+            (st.scatter_chart, "min-max"),
+        ]
+    )
+    def test_chart_with_downsample(self, chart_command: Callable, downsample: str):
+        """Test that each series is reduced to about as many points as the width."""
+        df = pd.DataFrame({"a": range(100), "b": [i % 7 for i in range(100)]})
+
+        chart_command(df, x="a", y="b", width=10, downsample=downsample)
+
+        proto = self.get_delta_from_queue().new_element.arrow_vega_lite_chart
+        output_df = bytes_to_data_frame(proto.datasets[0].data.data)
+        self.assertLessEqual(len(output_df), 10)
+        self.assertGreater(len(output_df), 2)
+        # The picked rows are kept in order.
+        self.assertTrue(output_df["a"].is_monotonic_increasing)
+
+    def test_chart_with_lttb_downsample_keeps_peaks_and_ends(self):
+        """Test that LTTB keeps the first, last and most prominent points."""
+        df = pd.DataFrame({"a": range(100), "b": [0] * 100})
+        df.loc[42, "b"] = 100
+
+        st.line_chart(df, x="a", y="b", width=5, downsample="lttb")
+
+        proto = self.get_delta_from_queue().new_element.arrow_vega_lite_chart
+        output_df = bytes_to_data_frame(proto.datasets[0].data.data)
+        self.assertEqual(len(output_df), 5)
+        self.assertEqual(output_df["a"].iloc[0], 0)
+        self.assertEqual(output_df["a"].iloc[-1], 99)
+        self.assertIn(42, output_df["a"].tolist())
+
+    def test_chart_with_min_max_downsample_keeps_extremes(self):
+        """Test that min-max keeps the smallest and largest values of each bucket."""
+        df = pd.DataFrame(
+            {
+                "a": pd.date_range("2024-01-01", periods=100, freq="min"),
+                "b": [0.0] * 100,
+            }
+        )
+        df.loc[10, "b"] = -5.0
+        df.loc[90, "b"] = 5.0
+
+        st.line_chart(df, x="a", y="b", width=4, downsample="min-max")
+
+        proto = self.get_delta_from_queue().new_element.arrow_vega_lite_chart
+        output_df = bytes_to_data_frame(proto.datasets[0].data.data)
+        self.assertLessEqual(len(output_df), 4)
+        self.assertIn(-5.0, output_df["b"].tolist())
+        self.assertIn(5.0, output_df["b"].tolist())
+
+    def test_chart_with_downsample_picks_rows_of_each_series(self):
+        """Test that folded columns and color groups are downsampled separately."""
+        df = pd.DataFrame(
+            {
+                "a": list(range(50)) * 2,
+                "b": [0] * 100,
+                "c": [0] * 100,
+                "d": ["x"] * 50 + ["y"] * 50,
+            }
+        )
+        df.loc[10, "b"] = 100
+        df.loc[20, "c"] = 100
+        df.loc[80, "b"] = 100
+
+        st.line_chart(df, x="a", y=["b", "c"], width=3, downsample="lttb")
+        proto = self.get_delta_from_queue().new_element.arrow_vega_lite_chart
+        output_df = bytes_to_data_frame(proto.datasets[0].data.data)
+        # Each y column keeps its own peak, and the first and last rows.
+        self.assertEqual(output_df["a"].tolist(), [0, 10, 20, 49])
+
+        st.line_chart(df, x="a", y="b", color="d", width=3, downsample="lttb")
+        proto = self.get_delta_from_queue().new_element.arrow_vega_lite_chart
+        output_df = bytes_to_data_frame(proto.datasets[0].data.data)
+        # Each color keeps its own peak, and its first and last rows.
+        self.assertEqual(output_df["a"].tolist(), [0, 10, 49, 0, 30, 49])
+
+    def test_chart_with_downsample_and_non_numeric_x(self):
+        """Test that data with a non-numeric x-axis isn't downsampled."""
+        df = pd.DataFrame({"a": [str(i) for i in range(100)], "b": range(100)})
+
+        st.line_chart(df, x="a", y="b", width=10, downsample="lttb")
+
+        proto = self.get_delta_from_queue().new_element.arrow_vega_lite_chart
+        output_df = bytes_to_data_frame(proto.datasets[0].data.data)
+        self.assertEqual(len(output_df), 100)
+
+    def test_chart_with_invalid_downsample(self):
+        """Test that an invalid downsample value raises an exception."""
+        df = pd.DataFrame({"a": range(10), "b": range(10)})
+
+        with self.assertRaises(StreamlitAPIException):
+            st.line_chart(df, x="a", y="b", downsample="average")
+
     def assert_output_df_is_correct_and_input_is_untouched(
         self, orig_df, expected_df, chart_proto
     ):
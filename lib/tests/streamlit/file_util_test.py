@@ -72,6 +72,22 @@ class FileUtilTest(unittest.TestCase):
             open().write.assert_called_once_with("some data")
             makedirs.assert_called_once_with(dirname, exist_ok=True)
 
+    @patch("streamlit.file_util.get_streamlit_file_path", mock_get_path)
+    def test_streamlit_write_atomic(self):
+        """Test streamlitfile_util.streamlit_write with atomic=True."""
+        with patch("streamlit.file_util.open", mock_open()) as open, patch(
+            "streamlit.util.os.makedirs"
+        ), patch("streamlit.file_util.os.replace") as replace, patch(
+            "streamlit.file_util.os.remove"
+        ):
+            with file_util.streamlit_write(FILENAME, atomic=True) as output:
+                output.write("some data")
+                replace.assert_not_called()
+
+            tmp_path = open.call_args[0][0]
+            self.assertTrue(tmp_path.startswith(FILENAME + "."))
+            replace.assert_called_once_with(tmp_path, FILENAME)
+
     @patch("streamlit.file_util.get_streamlit_file_path", mock_get_path)
     @patch("streamlit.env_util.IS_DARWIN", True)
     def test_streamlit_write_exception(self):
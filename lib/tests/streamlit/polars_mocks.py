@@ -0,0 +1,60 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from __future__ import annotations
+
+import pandas as pd
+import pyarrow as pa
+
+
+class DataFrame:
+    """This is dummy DataFrame class, which imitates polars.DataFrame class
+    for testing purposes. We use this to make sure that our code reads the
+    data of a polars dataframe as Arrow data, without converting it to pandas.
+
+    This allows testing of the functionality without having the library installed,
+    but it won't capture changes in the API of the library. This requires
+    integration tests.
+    """
+
+    __module__ = "polars.dataframe.frame"
+
+    def __init__(self, data: pd.DataFrame):
+        self._data: pd.DataFrame = data
+
+    def to_arrow(self) -> pa.Table:
+        return pa.Table.from_pandas(self._data, preserve_index=False)
+
+    def to_pandas(self) -> pd.DataFrame:
+        raise AssertionError("A polars dataframe shouldn't be converted to pandas.")
+
+
+class Series:
+    """This is dummy Series class, which imitates polars.Series class
+    for testing purposes. Its data is exported as an Arrow stream of a single
+    column, which can't be read as a table.
+    """
+
+    __module__ = "polars.series.series"
+
+    def __init__(self, data: pd.Series):
+        self._data: pd.Series = data
+
+    def __arrow_c_stream__(self, requested_schema: object = None) -> object:
+        return pa.chunked_array([pa.array(self._data)]).__arrow_c_stream__(
+            requested_schema
+        )
+
+    def to_pandas(self) -> pd.Series:
+        return self._data
@@ -26,6 +26,7 @@ import pytest
 import streamlit.runtime.app_session as app_session
 from streamlit import config
 from streamlit.proto.AppPage_pb2 import AppPage
+from streamlit.proto.Arrow_pb2 import Arrow as ArrowProto
 from streamlit.proto.BackMsg_pb2 import BackMsg
 from streamlit.proto.ClientState_pb2 import ClientState
 from streamlit.proto.Common_pb2 import FileURLs, FileURLsRequest, FileURLsResponse
@@ -35,6 +36,7 @@ from streamlit.runtime.app_session import AppSession, AppSessionState
 from streamlit.runtime.caching.storage.dummy_cache_storage import (
     MemoryCacheStorageManager,
 )
+from streamlit.runtime.forward_msg_cache import serialize_forward_msg_payload
 from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
 from streamlit.runtime.fragment import MemoryFragmentStorage
 from streamlit.runtime.media_file_manager import MediaFileManager
@@ -54,6 +56,7 @@ from streamlit.runtime.uploaded_file_manager import (
     UploadFileUrlInfo,
 )
 from streamlit.watcher.local_sources_watcher import LocalSourcesWatcher
+from tests.streamlit.message_mocks import create_dataframe_msg
 from tests.testutil import patch_config_options
 
 
@@ -470,6 +473,82 @@ class AppSessionTest(unittest.TestCase):
 
         self.assertEqual(msg.debug_last_backmsg_id, "some backmsg id")
 
+    def test_hashes_cacheable_fwd_msgs_on_enqueue(self):
+        session = _create_test_session()
+
+        with patch_config_options({"global.minCachedMessageSize": 0}):
+            cacheable_msg = create_dataframe_msg([1, 2, 3])
+            session._enqueue_forward_msg(cacheable_msg)
+
+        with patch_config_options({"global.minCachedMessageSize": 1000}):
+            small_msg = create_dataframe_msg([1, 2, 3])
+            session._enqueue_forward_msg(small_msg)
+
+        self.assertNotEqual("", cacheable_msg.hash)
+        self.assertEqual("", small_msg.hash)
+
+    def test_enqueues_option_list_before_widget(self):
+        """A widget's large options are enqueued in their own message, before
+        the widget's Delta.
+        """
+        session = _create_test_session()
+
+        msg = ForwardMsg()
+        msg.delta.new_element.selectbox.options[:] = ["a", "b", "c"]
+        with patch_config_options({"global.minCachedMessageSize": 0}):
+            session._enqueue_forward_msg(msg)
+
+        (
+            (option_list_msg, option_list_payload),
+            (widget_msg, _),
+        ) = session.flush_browser_queue_with_payloads()
+        self.assertEqual(["a", "b", "c"], option_list_msg.option_list.options)
+        # The option list is sent with the payload it was hashed with.
+        self.assertEqual(
+            serialize_forward_msg_payload(option_list_msg), option_list_payload
+        )
+        self.assertEqual(
+            option_list_msg.hash, widget_msg.delta.new_element.selectbox.options_hash
+        )
+
+    @patch_config_options(
+        {
+            "server.enableArrowCompression": True,
+            "server.arrowCompressionThreshold": 0,
+        }
+    )
+    @patch("streamlit.runtime.app_session.AppSession._create_scriptrunner")
+    def test_compresses_arrow_data_if_client_supports_it(
+        self, _mock_create_scriptrunner: MagicMock
+    ):
+        """Arrow data is only compressed if the client's last rerun request
+        said it supports the compression.
+        """
+        session = _create_test_session()
+
+        uncompressed_msg = create_dataframe_msg([1, 2, 3])
+        session._enqueue_forward_msg(uncompressed_msg)
+
+        client_state = ClientState()
+        client_state.supported_arrow_compressions.append(
+            ArrowProto.DataCompression.GZIP
+        )
+        session.request_rerun(client_state)
+        # Reruns started by the server keep the client's compressions.
+        session.request_rerun(None)
+
+        compressed_msg = create_dataframe_msg([1, 2, 3])
+        session._enqueue_forward_msg(compressed_msg)
+
+        self.assertEqual(
+            ArrowProto.DataCompression.NONE,
+            uncompressed_msg.delta.new_element.arrow_data_frame.data_compression,
+        )
+        self.assertEqual(
+            ArrowProto.DataCompression.GZIP,
+            compressed_msg.delta.new_element.arrow_data_frame.data_compression,
+        )
+
     @patch("streamlit.runtime.app_session.config.on_config_parsed")
     @patch("streamlit.runtime.app_session.source_util.register_pages_changed_callback")
     @patch(
@@ -787,6 +866,128 @@ class AppSessionScriptEventTest(IsolatedAsyncioTestCase):
 
         handle_event_spy.assert_called_once()
 
+    async def test_script_waits_for_full_browser_queue(self):
+        """The script thread should wait to enqueue messages while the browser
+        queue is above its high-water mark, until it's flushed."""
+        session = _create_test_session(asyncio.get_running_loop())
+        session._handle_scriptrunner_event_on_event_loop = MagicMock()
+
+        with patch_config_options({"server.maxWebsocketBufferSize": 1}):
+            session._enqueue_forward_msg(create_dataframe_msg(list(range(200_000))))
+        self.assertGreater(session._browser_queue.byte_size, int(1e6))
+
+        # Send a message from the script thread.
+        sender = MagicMock()
+        sender.is_stop_or_rerun_requested.return_value = False
+        thread = threading.Thread(
+            target=lambda: session._on_scriptrunner_event(
+                sender=sender,
+                event=ScriptRunnerEvent.ENQUEUE_FORWARD_MSG,
+                forward_msg=ForwardMsg(),
+            )
+        )
+        thread.start()
+        thread.join(timeout=0.1)
+        self.assertTrue(thread.is_alive())
+
+        session.flush_browser_queue_with_payloads()
+        thread.join(timeout=5)
+        self.assertFalse(thread.is_alive())
+
+        await asyncio.sleep(0)
+        session._handle_scriptrunner_event_on_event_loop.assert_called_once()
+
+    async def test_script_waits_for_chunk_to_be_written(self):
+        """After the script thread enqueues a chunk of a large table, it should
+        wait for the chunk to be flushed before it produces the next one."""
+        session = _create_test_session(asyncio.get_running_loop())
+        session._scriptrunner = MagicMock()
+        session._scriptrunner.is_stop_or_rerun_requested.return_value = False
+        chunk_msg = ForwardMsg()
+        chunk_msg.delta.arrow_add_rows.is_chunk = True
+
+        thread = threading.Thread(
+            target=lambda: session._on_scriptrunner_event(
+                sender=session._scriptrunner,
+                event=ScriptRunnerEvent.ENQUEUE_FORWARD_MSG,
+                forward_msg=chunk_msg,
+            )
+        )
+        thread.start()
+        thread.join(timeout=0.1)
+        self.assertTrue(thread.is_alive())
+
+        # A flush before the chunk is enqueued doesn't release the script.
+        session.flush_browser_queue_with_payloads()
+        await asyncio.sleep(0)
+        self.assertEqual([chunk_msg], session._browser_queue._queue)
+        thread.join(timeout=0.1)
+        self.assertTrue(thread.is_alive())
+
+        session.flush_browser_queue_with_payloads()
+        thread.join(timeout=5)
+        self.assertFalse(thread.is_alive())
+
+    @patch("streamlit.runtime.app_session._SCRIPT_WAIT_TIMEOUT_SECS", 0.01)
+    async def test_script_stops_waiting_for_chunk_when_interrupted(self):
+        """A script that waits for its chunk to be written should stop waiting
+        when it's asked to stop or rerun, even if the chunk is never flushed,
+        e.g. because the chunk was dropped after a fast rerun."""
+        session = _create_test_session(asyncio.get_running_loop())
+        sender = MagicMock()
+        sender.is_stop_or_rerun_requested.return_value = False
+        chunk_msg = ForwardMsg()
+        chunk_msg.delta.arrow_add_rows.is_chunk = True
+
+        thread = threading.Thread(
+            target=lambda: session._on_scriptrunner_event(
+                sender=sender,
+                event=ScriptRunnerEvent.ENQUEUE_FORWARD_MSG,
+                forward_msg=chunk_msg,
+            )
+        )
+        thread.start()
+        thread.join(timeout=0.1)
+        self.assertTrue(thread.is_alive())
+
+        sender.is_stop_or_rerun_requested.return_value = True
+        thread.join(timeout=5)
+        self.assertFalse(thread.is_alive())
+
+    async def test_script_stop_releases_waiting_script(self):
+        """A script that waits for the browser queue should be released when
+        it's asked to stop, so that it can handle the request."""
+        session = _create_test_session(asyncio.get_running_loop())
+        session._browser_queue_has_room.clear()
+
+        session.request_script_stop()
+
+        self.assertTrue(session._browser_queue_has_room.is_set())
+
+    @patch("streamlit.runtime.app_session._SCRIPT_WAIT_TIMEOUT_SECS", 0.01)
+    async def test_script_stops_waiting_for_full_browser_queue_on_shutdown(self):
+        """A script that waits for the browser queue should stop waiting when
+        the session shuts down, even if the queue is never flushed."""
+        session = _create_test_session(asyncio.get_running_loop())
+        session._browser_queue_has_room.clear()
+        sender = MagicMock()
+        sender.is_stop_or_rerun_requested.return_value = False
+
+        thread = threading.Thread(
+            target=lambda: session._on_scriptrunner_event(
+                sender=sender,
+                event=ScriptRunnerEvent.ENQUEUE_FORWARD_MSG,
+                forward_msg=ForwardMsg(),
+            )
+        )
+        thread.start()
+        thread.join(timeout=0.1)
+        self.assertTrue(thread.is_alive())
+
+        session._state = AppSessionState.SHUTDOWN_REQUESTED
+        thread.join(timeout=5)
+        self.assertFalse(thread.is_alive())
+
     async def test_event_handler_asserts_if_called_off_event_loop(self):
         """AppSession._handle_scriptrunner_event_on_event_loop will assert
         if it's called from another event loop (or no event loop).
@@ -825,8 +1026,9 @@ class AppSessionScriptEventTest(IsolatedAsyncioTestCase):
         CLEAR_QUEUE = object()
 
         mock_queue = MagicMock(spec=ForwardMsgQueue)
+        mock_queue.byte_size = 0
         mock_queue.enqueue = MagicMock(
-            side_effect=lambda msg: forward_msg_queue_events.append(msg)
+            side_effect=lambda msg, payload=None: forward_msg_queue_events.append(msg)
         )
         mock_queue.clear = MagicMock(
             side_effect=lambda retain_lifecycle_msgs: forward_msg_queue_events.append(
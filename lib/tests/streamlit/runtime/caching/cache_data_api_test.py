@@ -19,12 +19,16 @@ import logging
 import os
 import pickle
 import re
+import sqlite3
 import threading
 import unittest
 from typing import Any
 from unittest.mock import MagicMock, Mock, mock_open, patch
 
+import numpy as np
+import pandas as pd
 from parameterized import parameterized
+from testfixtures import TempDirectory
 
 import streamlit as st
 from streamlit import file_util
@@ -58,13 +62,17 @@ from streamlit.runtime.caching.storage.local_disk_cache_storage import (
     LocalDiskCacheStorageManager,
     get_cache_folder_path,
 )
+from streamlit.runtime.caching.storage.shared_cache_storage import (
+    SharedCacheStorage,
+    SharedCacheStorageManager,
+)
 from streamlit.runtime.scriptrunner import add_script_run_ctx
 from streamlit.runtime.stats import CacheStat
 from tests.delta_generator_test_case import DeltaGeneratorTestCase
 from tests.streamlit.runtime.caching.common_cache_test import (
     as_cached_result as _as_cached_result,
 )
-from tests.testutil import create_mock_script_run_ctx
+from tests.testutil import create_mock_script_run_ctx, patch_config_options
 
 
 def as_cached_result(value: Any) -> MultiCacheResults:
@@ -275,6 +283,89 @@ If you think this is actually a Streamlit bug, please
         assert foo(1) == 2
 
 
+class CacheDataKeepUnpickledTest(unittest.TestCase):
+    """st.cache_data(experimental_keep_unpickled=True) tests"""
+
+    def setUp(self) -> None:
+        add_script_run_ctx(threading.current_thread(), create_mock_script_run_ctx())
+        mock_runtime = MagicMock(spec=Runtime)
+        mock_runtime.cache_storage_manager = MemoryCacheStorageManager()
+        Runtime._instance = mock_runtime
+
+    def tearDown(self):
+        st.cache_data.clear()
+
+    def test_hit_does_not_unpickle(self):
+        """Cache hits on fast-copyable values don't unpickle the cached entry."""
+
+        @st.cache_data(experimental_keep_unpickled=True)
+        def f():
+            return np.arange(10)
+
+        f()
+        with patch.object(
+            cache_data_api.pickle, "loads", wraps=pickle.loads
+        ) as pickle_loads:
+            result = f()
+
+        pickle_loads.assert_not_called()
+        np.testing.assert_array_equal(np.arange(10), result)
+
+    def test_mutate_return(self):
+        """Mutating a returned value doesn't affect future accessors."""
+
+        @st.cache_data(experimental_keep_unpickled=True)
+        def f():
+            return pd.DataFrame({"a": [0, 1]})
+
+        r1 = f()
+        r1.loc[0, "a"] = 1
+        r2 = f()
+        r2.loc[1, "a"] = 2
+
+        self.assertEqual([1, 1], r1["a"].tolist())
+        self.assertEqual([0, 2], r2["a"].tolist())
+        self.assertEqual([0, 1], f()["a"].tolist())
+
+    def test_immutable_values_are_not_copied(self):
+        @st.cache_data(experimental_keep_unpickled=True)
+        def f():
+            return ("a", 1, (2.0, None))
+
+        self.assertIs(f(), f())
+
+    def test_other_values_are_unpickled(self):
+        """Values that can't be copied quickly are unpickled on every hit."""
+
+        @st.cache_data(experimental_keep_unpickled=True)
+        def f():
+            return [0, 1]
+
+        r1 = f()
+        r1[0] = 1
+        with patch.object(
+            cache_data_api.pickle, "loads", wraps=pickle.loads
+        ) as pickle_loads:
+            r2 = f()
+
+        pickle_loads.assert_called_once()
+        self.assertEqual([0, 1], r2)
+
+    def test_clear(self):
+        """Clearing the cache also drops the unpickled values."""
+        self.x = 0
+
+        @st.cache_data(experimental_keep_unpickled=True)
+        def f():
+            self.x += 1
+            return self.x
+
+        self.assertEqual(1, f())
+        self.assertEqual(1, f())
+        f.clear()
+        self.assertEqual(2, f())
+
+
 class CacheDataPersistTest(DeltaGeneratorTestCase):
     """st.cache_data disk persistence tests"""
 
@@ -399,13 +490,9 @@ class CacheDataPersistTest(DeltaGeneratorTestCase):
             st.cache_data.clear()
             mock_rmtree.assert_not_called()
 
-    @patch("streamlit.file_util.os.stat", MagicMock())
-    @patch(
-        "streamlit.file_util.open",
-        wraps=mock_open(read_data=pickle.dumps(as_cached_result("mock_pickled_value"))),
-    )
-    @patch("streamlit.runtime.caching.storage.local_disk_cache_storage.os.remove")
-    def test_clear_one_disk_cache(self, mock_os_remove: Mock, mock_open: Mock):
+    @patch("streamlit.runtime.caching.storage.local_disk_cache_storage.streamlit_write")
+    @patch("streamlit.runtime.caching.storage.local_disk_cache_storage.shutil.rmtree")
+    def test_clear_one_disk_cache(self, mock_rmtree: Mock, mock_write: Mock):
         """A memoized function's clear_cache() property should just clear
         that function's cache."""
 
@@ -416,38 +503,24 @@ class CacheDataPersistTest(DeltaGeneratorTestCase):
         foo(0)
         foo(1)
 
-        # We should've opened two files, one for each distinct "foo" call.
-        self.assertEqual(2, mock_open.call_count)
+        # We should've written two files, one for each distinct "foo" call.
+        self.assertEqual(2, mock_write.call_count)
 
-        # Get the names of the two files that were created. These will look
-        # something like '/mock/home/folder/.streamlit/cache/[long_hash].memo'
-        created_filenames = {
-            mock_open.call_args_list[0][0][0],
-            mock_open.call_args_list[1][0][0],
+        # Both files live in the function's own cache folder, which looks
+        # something like '/mock/home/folder/.streamlit/cache/[function_key]'
+        function_dirs = {
+            os.path.dirname(call_args[0][0]) for call_args in mock_write.call_args_list
         }
+        self.assertEqual(1, len(function_dirs))
 
-        created_files_base_names = [
-            os.path.basename(filename) for filename in created_filenames
-        ]
-
-        mock_os_remove.assert_not_called()
+        mock_rmtree.assert_not_called()
 
-        with patch(
-            "os.listdir", MagicMock(return_value=created_files_base_names)
-        ), patch("os.path.isdir", MagicMock(return_value=True)):
+        with patch("os.path.isdir", MagicMock(return_value=True)):
             # Clear foo's cache
             foo.clear()
 
-        # os.remove should have been called once for each of our created cache files
-        self.assertEqual(2, mock_os_remove.call_count)
-
-        removed_filenames = {
-            mock_os_remove.call_args_list[0][0][0],
-            mock_os_remove.call_args_list[1][0][0],
-        }
-
-        # The two files we removed should be the same two files we created.
-        self.assertEqual(created_filenames, removed_filenames)
+        # Clearing foo's cache should remove its folder, and only its folder.
+        mock_rmtree.assert_called_once_with(function_dirs.pop(), ignore_errors=True)
 
     @patch("streamlit.file_util.os.stat", MagicMock())
     @patch(
@@ -511,26 +584,6 @@ class CacheDataPersistTest(DeltaGeneratorTestCase):
         # Executes normally, without raising any errors
         foo(1)
 
-    @patch("streamlit.runtime.caching.storage.local_disk_cache_storage.streamlit_write")
-    def test_warning_memo_ttl_persist(self, _):
-        """Using @st.cache_data with ttl and persist produces a warning."""
-        with self.assertLogs(
-            "streamlit.runtime.caching.storage.local_disk_cache_storage",
-            level=logging.WARNING,
-        ) as logs:
-
-            @st.cache_data(ttl=60, persist="disk")
-            def user_function():
-                return 42
-
-            st.write(user_function())
-
-            output = "".join(logs.output)
-            self.assertIn(
-                "The cached function 'user_function' has a TTL that will be ignored.",
-                output,
-            )
-
     @parameterized.expand(
         [
             ("disk", "disk", True),
@@ -561,6 +614,90 @@ class CacheDataPersistTest(DeltaGeneratorTestCase):
             mock_write.assert_not_called()
 
 
+class CacheDataSharedStorageTest(DeltaGeneratorTestCase):
+    """st.cache_data with a storage shared by several processes"""
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.tempdir = TempDirectory(create=True)
+        self.path = os.path.join(self.tempdir.path, "cache.db")
+        mock_runtime = MagicMock(spec=Runtime)
+        mock_runtime.cache_storage_manager = SharedCacheStorageManager(self.path)
+        Runtime._instance = mock_runtime
+
+    def tearDown(self) -> None:
+        st.cache_data.clear()
+        super().tearDown()
+        self.tempdir.cleanup()
+
+    def test_compute_with_lease(self):
+        """A value is computed once, and the lease released afterwards."""
+        calls = []
+
+        @st.cache_data
+        def foo():
+            calls.append("foo")
+            return "value"
+
+        self.assertEqual("value", foo())
+        self.assertEqual("value", foo())
+        self.assertEqual(["foo"], calls)
+
+        with sqlite3.connect(self.path) as conn:
+            self.assertEqual(
+                0, conn.execute("SELECT COUNT(*) FROM leases").fetchone()[0]
+            )
+
+    @patch(
+        "streamlit.runtime.caching.cache_utils.COMPUTE_LEASE_POLL_INTERVAL_SECONDS", 0
+    )
+    def test_wait_for_lease_holder(self):
+        """If another process holds the lease to compute a value, we wait for
+        it to write the value, rather than computing it too."""
+        calls = []
+
+        @st.cache_data
+        def foo():
+            calls.append("foo")
+            return "computed by this process"
+
+        def acquire_lease(storage: SharedCacheStorage, key: str) -> bool:
+            # Another process holds the lease, and writes the value while we wait.
+            storage.set(
+                key, pickle.dumps(as_cached_result("computed by another process"))
+            )
+            return False
+
+        with patch.object(
+            SharedCacheStorage,
+            "acquire_lease",
+            autospec=True,
+            side_effect=acquire_lease,
+        ):
+            self.assertEqual("computed by another process", foo())
+        self.assertEqual([], calls)
+
+    def test_keep_unpickled_reads_other_process_writes(self):
+        """experimental_keep_unpickled doesn't hide values written by other
+        processes."""
+
+        @st.cache_data(experimental_keep_unpickled=True)
+        def foo():
+            return "computed by this process"
+
+        self.assertEqual("computed by this process", foo())
+
+        # Another process replaces the value.
+        with sqlite3.connect(self.path) as conn:
+            conn.execute(
+                "UPDATE entries SET value = ?",
+                (pickle.dumps(as_cached_result("computed by another process")),),
+            )
+        conn.close()
+
+        self.assertEqual("computed by another process", foo())
+
+
 class CacheDataStatsProviderTest(unittest.TestCase):
     def setUp(self):
         # Caching functions rely on an active script run ctx
@@ -618,6 +755,68 @@ class CacheDataStatsProviderTest(unittest.TestCase):
             set(expected), set(get_data_cache_stats_provider().get_stats())
         )
 
+    def test_max_bytes_evictions(self):
+        """Entries are evicted to stay within max_bytes, and evictions are
+        reported in the stats.
+        """
+        num_calls = 0
+        entry_size = get_byte_length(as_cached_result("a" * 100))
+
+        @st.cache_data(max_bytes=entry_size * 3 // 2)
+        def foo(char):
+            nonlocal num_calls
+            num_calls += 1
+            return char * 100
+
+        foo("a")
+        foo("b")
+        # foo("a") was evicted to make room for foo("b").
+        foo("b")
+        foo("a")
+        self.assertEqual(3, num_calls)
+
+        foo_cache_name = f"{foo.__module__}.{foo.__qualname__}"
+        self.assertEqual(
+            [
+                CacheStat(
+                    category_name="st_cache_data",
+                    cache_name=foo_cache_name,
+                    byte_length=entry_size,
+                    evictions=2,
+                )
+            ],
+            get_data_cache_stats_provider().get_stats(),
+        )
+
+    @patch_config_options({"runner.maxCacheSize": 1})
+    def test_max_cache_size(self):
+        """All caches together are limited by runner.maxCacheSize."""
+
+        @st.cache_data
+        def foo(n):
+            return b"x" * n
+
+        @st.cache_data
+        def bar():
+            return b"y" * 100
+
+        bar()
+        foo(400_000)
+        foo(400_001)
+        foo(400_002)
+
+        stats = {
+            stat.cache_name: stat
+            for stat in get_data_cache_stats_provider().get_stats()
+        }
+        foo_stat = stats[f"{foo.__module__}.{foo.__qualname__}"]
+        bar_stat = stats[f"{bar.__module__}.{bar.__qualname__}"]
+
+        # foo uses the most memory, so its oldest entry was evicted.
+        self.assertEqual(1, foo_stat.evictions)
+        self.assertEqual(0, bar_stat.evictions)
+        self.assertLessEqual(foo_stat.byte_length + bar_stat.byte_length, 1_000_000)
+
 
 class CacheDataValidateParamsTest(DeltaGeneratorTestCase):
     """st.cache_data disk persistence tests"""
@@ -0,0 +1,145 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for cache_memory_budget.py"""
+
+from __future__ import annotations
+
+import math
+import unittest
+
+from streamlit.runtime.caching.cache_memory_budget import (
+    BoundedTTLCache,
+    CacheMemoryBudget,
+)
+from tests.testutil import patch_config_options
+
+
+class BoundedTTLCacheTest(unittest.TestCase):
+    def test_max_entries(self):
+        """Without a getsizeof function, only the number of entries is limited."""
+        cache = BoundedTTLCache(max_entries=2, ttl_seconds=math.inf)
+        cache["a"] = b"1"
+        cache["b"] = b"2"
+        cache["c"] = b"3"
+
+        self.assertEqual(["b", "c"], list(cache))
+        self.assertEqual(1, cache.evictions)
+        self.assertEqual(0, cache.size_bytes)
+
+    def test_max_bytes_evicts_lru(self):
+        cache = BoundedTTLCache(
+            max_entries=math.inf, ttl_seconds=math.inf, max_bytes=10, getsizeof=len
+        )
+        cache["a"] = b"1234"
+        cache["b"] = b"1234"
+        # Access "a", so that "b" becomes the least-recently-used entry.
+        _ = cache["a"]
+        cache["c"] = b"1234"
+
+        self.assertEqual({"a", "c"}, set(cache))
+        self.assertEqual(8, cache.size_bytes)
+        self.assertEqual(1, cache.evictions)
+
+    def test_max_entries_and_max_bytes(self):
+        cache = BoundedTTLCache(
+            max_entries=2, ttl_seconds=math.inf, max_bytes=100, getsizeof=len
+        )
+        cache["a"] = b"1"
+        cache["b"] = b"1"
+        cache["c"] = b"1"
+
+        self.assertEqual(["b", "c"], list(cache))
+        self.assertEqual(2, cache.size_bytes)
+
+    def test_value_too_large(self):
+        """A value bigger than max_bytes isn't stored, and replaces the key's
+        existing value.
+        """
+        cache = BoundedTTLCache(
+            max_entries=math.inf, ttl_seconds=math.inf, max_bytes=4, getsizeof=len
+        )
+        cache["a"] = b"1"
+        cache["a"] = b"12345"
+
+        self.assertNotIn("a", cache)
+        self.assertEqual(0, cache.size_bytes)
+        self.assertEqual(1, cache.evictions)
+
+    def test_max_bytes_requires_getsizeof(self):
+        with self.assertRaises(ValueError):
+            BoundedTTLCache(max_entries=math.inf, ttl_seconds=math.inf, max_bytes=10)
+
+
+class _MockBudgetedCache:
+    def __init__(self, entry_sizes: list[int]):
+        self.entry_sizes = entry_sizes
+
+    def get_memory_usage(self) -> int:
+        return sum(self.entry_sizes)
+
+    def evict_lru_entry(self) -> int:
+        if not self.entry_sizes:
+            return 0
+        return self.entry_sizes.pop(0)
+
+
+class CacheMemoryBudgetTest(unittest.TestCase):
+    @patch_config_options({"runner.maxCacheSize": 1})
+    def test_evicts_from_largest_cache(self):
+        budget = CacheMemoryBudget()
+        small = _MockBudgetedCache([100_000])
+        large = _MockBudgetedCache([400_000, 300_000, 300_000])
+        budget.register(small)
+        budget.register(large)
+
+        budget.enforce()
+
+        self.assertEqual([100_000], small.entry_sizes)
+        self.assertEqual([300_000, 300_000], large.entry_sizes)
+
+    @patch_config_options({"runner.maxCacheSize": 1})
+    def test_evicts_from_several_caches(self):
+        budget = CacheMemoryBudget()
+        cache1 = _MockBudgetedCache([300_000, 300_000, 100_000])
+        cache2 = _MockBudgetedCache([650_000])
+        budget.register(cache1)
+        budget.register(cache2)
+
+        budget.enforce()
+
+        # cache1 is the largest at first. Once it has lost an entry, cache2 is.
+        self.assertEqual([300_000, 100_000], cache1.entry_sizes)
+        self.assertEqual([], cache2.entry_sizes)
+
+    @patch_config_options({"runner.maxCacheSize": 0})
+    def test_disabled(self):
+        budget = CacheMemoryBudget()
+        cache = _MockBudgetedCache([2_000_000])
+        budget.register(cache)
+
+        budget.enforce()
+
+        self.assertEqual([2_000_000], cache.entry_sizes)
+
+    @patch_config_options({"runner.maxCacheSize": 1})
+    def test_unregister(self):
+        budget = CacheMemoryBudget()
+        cache = _MockBudgetedCache([2_000_000])
+        budget.register(cache)
+        budget.unregister(cache)
+
+        budget.enforce()
+
+        self.assertEqual([2_000_000], cache.entry_sizes)
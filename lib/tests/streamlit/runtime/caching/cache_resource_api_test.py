@@ -35,7 +35,7 @@ from streamlit.vendor.pympler.asizeof import asizeof
 from tests.streamlit.runtime.caching.common_cache_test import (
     as_cached_result as _as_cached_result,
 )
-from tests.testutil import create_mock_script_run_ctx
+from tests.testutil import create_mock_script_run_ctx, patch_config_options
 
 
 def as_cached_result(value: Any) -> MultiCacheResults:
@@ -338,6 +338,57 @@ class CacheResourceStatsProviderTest(unittest.TestCase):
             set(expected), set(get_resource_cache_stats_provider().get_stats())
         )
 
+    def test_max_bytes_evictions(self):
+        """Entries are evicted to stay within max_bytes, and evictions are
+        reported in the stats.
+        """
+        num_calls = 0
+        max_bytes = get_byte_length(as_cached_result(list(range(100)))) * 3 // 2
+
+        @st.cache_resource(max_bytes=max_bytes)
+        def foo(n):
+            nonlocal num_calls
+            num_calls += 1
+            return list(range(100 + n))
+
+        foo(0)
+        foo(1)
+        # foo(0) was evicted to make room for foo(1).
+        foo(1)
+        foo(0)
+        self.assertEqual(3, num_calls)
+
+        foo_cache_name = f"{foo.__module__}.{foo.__qualname__}"
+        self.assertEqual(
+            [
+                CacheStat(
+                    category_name="st_cache_resource",
+                    cache_name=foo_cache_name,
+                    byte_length=get_byte_length(as_cached_result(list(range(100)))),
+                    evictions=2,
+                )
+            ],
+            get_resource_cache_stats_provider().get_stats(),
+        )
+
+    @patch_config_options({"runner.maxCacheSize": 1})
+    def test_entries_not_measured_without_max_bytes(self):
+        """Entries are only measured if the function sets max_bytes, even if
+        runner.maxCacheSize is set.
+        """
+
+        @st.cache_resource
+        def foo():
+            return list(range(100))
+
+        with patch(
+            "streamlit.runtime.caching.cache_resource_api._get_resource_size"
+        ) as get_resource_size:
+            foo()
+            foo()
+
+        get_resource_size.assert_not_called()
+
 
 def get_byte_length(value: Any) -> int:
     """Return the byte length of the pickled value."""
@@ -14,6 +14,8 @@
 
 """Tests that are common to both st.cache_data and st.cache_resource"""
 
+import functools
+import inspect
 import threading
 import time
 import unittest
@@ -21,9 +23,12 @@ from datetime import timedelta
 from typing import Any, List
 from unittest.mock import MagicMock, Mock, patch
 
+import numpy as np
+import pandas as pd
 from parameterized import parameterized
 
 import streamlit as st
+from streamlit.errors import StreamlitAPIException
 from streamlit.runtime import Runtime
 from streamlit.runtime.caching import cache_data, cache_resource
 from streamlit.runtime.caching.cache_errors import CacheReplayClosureError
@@ -119,6 +124,40 @@ class CommonCacheTest(DeltaGeneratorTestCase):
         self.assertEqual(foo(1.0), 1.0)
         self.assertEqual(foo(3.0), 3.0)
 
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_exact_hash_mode(self, _, cache_decorator):
+        """With the exact hash mode, large dataframes that only differ outside
+        of the hashed sample don't share a cache entry."""
+        num_rows = 200_000
+        df1 = pd.DataFrame({"a": np.zeros(num_rows)})
+        df2 = df1.copy()
+        df2.loc[1, "a"] = 1
+
+        @cache_decorator
+        def sampled(df):
+            return df["a"].sum()
+
+        @cache_decorator(experimental_hash_mode="exact")
+        def exact(df):
+            return df["a"].sum()
+
+        self.assertEqual(0, sampled(df1))
+        self.assertEqual(0, sampled(df2))
+        self.assertEqual(0, exact(df1))
+        self.assertEqual(1, exact(df2))
+
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_invalid_hash_mode(self, _, cache_decorator):
+        with self.assertRaises(StreamlitAPIException):
+
+            @cache_decorator(experimental_hash_mode="fast")
+            def foo():
+                return 42
+
     @parameterized.expand(
         [("cache_data", cache_data), ("cache_resource", cache_resource)]
     )
@@ -206,6 +245,60 @@ class CommonCacheTest(DeltaGeneratorTestCase):
         foo(1, 2, 3, kwarg1=4, _kwarg2=5, kwarg3=None, _kwarg4=7)
         self.assertEqual([5], call_count)
 
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_ignored_args_of_wrapped_function(self, _, cache_decorator):
+        """Args prefixed with _ are not used as part of the cache key of a
+        function that wraps another function."""
+        call_count = [0]
+
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                return func(*args, **kwargs)
+
+            return wrapper
+
+        @cache_decorator
+        @decorator
+        def foo(arg1, _arg2):
+            call_count[0] += 1
+
+        foo(1, 2)
+        foo(1, None)
+        self.assertEqual([1], call_count)
+
+        foo(None, 2)
+        self.assertEqual([2], call_count)
+
+    @parameterized.expand(
+        [("cache_data", cache_data), ("cache_resource", cache_resource)]
+    )
+    def test_function_defined_in_function(self, _, cache_decorator):
+        """Functions that are created from the same definition share the source
+        code that their cache keys are made from, and their cache."""
+        call_count = [0]
+
+        def query(arg):
+            @cache_decorator
+            def foo(arg):
+                call_count[0] += 1
+                return arg
+
+            return foo(arg)
+
+        with patch(
+            "streamlit.runtime.caching.cache_utils.inspect.getsource",
+            wraps=inspect.getsource,
+        ) as getsource:
+            self.assertEqual(1, query(1))
+            self.assertEqual(1, query(1))
+            self.assertEqual(2, query(2))
+
+        self.assertEqual([2], call_count)
+        getsource.assert_called_once()
+
     @parameterized.expand(
         [("cache_data", cache_data), ("cache_resource", cache_resource)]
     )
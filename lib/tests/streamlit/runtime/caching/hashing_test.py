@@ -33,6 +33,7 @@ import dateutil.tz
 import numpy as np
 import pandas
 import pandas as pd
+import pyarrow as pa
 import tzlocal
 from parameterized import parameterized
 from PIL import Image
@@ -50,14 +51,19 @@ from streamlit.runtime.caching.hashing import (
 from streamlit.runtime.uploaded_file_manager import UploadedFile, UploadedFileRec
 from streamlit.type_util import is_type
 from streamlit.util import HASHLIB_KWARGS
+from tests.streamlit import polars_mocks
 
 get_main_script_director = MagicMock(return_value=os.getcwd())
 
 
-def get_hash(value, hash_funcs=None, cache_type=None):
+def get_hash(value, hash_funcs=None, cache_type=None, hash_mode="sample"):
     hasher = hashlib.new("md5", **HASHLIB_KWARGS)
     update_hash(
-        value, hasher, cache_type=cache_type or MagicMock(), hash_funcs=hash_funcs
+        value,
+        hasher,
+        cache_type=cache_type or MagicMock(),
+        hash_funcs=hash_funcs,
+        hash_mode=hash_mode,
     )
     return hasher.digest()
 
@@ -348,8 +354,61 @@ class HashTest(unittest.TestCase):
         ]
     )
     def test_pandas_dataframe(self, df1, df2, expected):
-        result = get_hash(df1) == get_hash(df2)
-        self.assertEqual(result, expected)
+        for hash_mode in ("sample", "exact"):
+            result = get_hash(df1, hash_mode=hash_mode) == get_hash(
+                df2, hash_mode=hash_mode
+            )
+            self.assertEqual(result, expected, hash_mode)
+
+    def test_pandas_large_dataframe_exact(self):
+        """Exact hashing hashes every row of a large dataframe, while sampling
+        misses changes outside of the sample."""
+        df1 = pd.DataFrame(
+            {
+                "int": np.arange(_PANDAS_ROWS_LARGE),
+                "str": ["a"] * _PANDAS_ROWS_LARGE,
+                "date": pd.date_range(
+                    "2024-01-01", periods=_PANDAS_ROWS_LARGE, freq="s"
+                ),
+            }
+        )
+        df2 = df1.copy()
+        df2.loc[1, "str"] = "b"
+
+        self.assertEqual(get_hash(df1), get_hash(df2))
+        self.assertNotEqual(
+            get_hash(df1, hash_mode="exact"), get_hash(df2, hash_mode="exact")
+        )
+        self.assertEqual(
+            get_hash(df1, hash_mode="exact"), get_hash(df1.copy(), hash_mode="exact")
+        )
+
+    @parameterized.expand(
+        [
+            ("strings", pd.Series(["a", "b"]), pd.Series(["a", "c"])),
+            (
+                "categorical",
+                pd.Series(["a", "b"], dtype="category"),
+                pd.Series(["a", "a"], dtype="category"),
+            ),
+            ("nullable", pd.Series([1, None], dtype="Int64"), pd.Series([1, 2])),
+            ("unhashable", pd.Series([[1], [2]]), pd.Series([[1], [3]])),
+            (
+                "index",
+                pd.Series([1, 2], index=["a", "b"]),
+                pd.Series([1, 2], index=["a", "c"]),
+            ),
+            ("range index", pd.Series([1, 2]), pd.Series([1, 2], index=[1, 2])),
+        ]
+    )
+    def test_pandas_series_exact(self, _, series1, series2):
+        self.assertEqual(
+            get_hash(series1, hash_mode="exact"),
+            get_hash(series1.copy(), hash_mode="exact"),
+        )
+        self.assertNotEqual(
+            get_hash(series1, hash_mode="exact"), get_hash(series2, hash_mode="exact")
+        )
 
     def test_pandas_series(self):
         series1 = pd.Series([1, 2])
@@ -383,6 +442,70 @@ class HashTest(unittest.TestCase):
 
         self.assertEqual(get_hash(np4), get_hash(np5))
 
+    def test_numpy_exact(self):
+        """Exact hashing hashes every value of a large array."""
+        np1 = np.zeros(_NP_SIZE_LARGE)
+        np2 = np.zeros(_NP_SIZE_LARGE)
+        np2[1] = 1
+
+        self.assertNotEqual(
+            get_hash(np1, hash_mode="exact"), get_hash(np2, hash_mode="exact")
+        )
+        self.assertEqual(
+            get_hash(np1, hash_mode="exact"), get_hash(np1.copy(), hash_mode="exact")
+        )
+
+    def test_numpy_exact_non_contiguous(self):
+        array = np.arange(12).reshape(3, 4)
+
+        self.assertEqual(
+            get_hash(array.T, hash_mode="exact"),
+            get_hash(array.T.copy(), hash_mode="exact"),
+        )
+        self.assertNotEqual(
+            get_hash(array[:, :2], hash_mode="exact"),
+            get_hash(array[:, 2:], hash_mode="exact"),
+        )
+
+    def test_numpy_exact_objects(self):
+        """Arrays of Python objects are hashed by their values."""
+        np1 = np.array(["a", {"b": 1}], dtype=object)
+        np2 = np.array(["a", {"b": 1}], dtype=object)
+        np3 = np.array(["a", {"b": 2}], dtype=object)
+
+        self.assertEqual(
+            get_hash(np1, hash_mode="exact"), get_hash(np2, hash_mode="exact")
+        )
+        self.assertNotEqual(
+            get_hash(np1, hash_mode="exact"), get_hash(np3, hash_mode="exact")
+        )
+
+    def test_pyarrow_table_exact(self):
+        table1 = pa.table({"a": range(10)})
+        table2 = pa.table({"a": range(10)})
+
+        self.assertEqual(
+            get_hash(table1, hash_mode="exact"), get_hash(table2, hash_mode="exact")
+        )
+        # Slices of the same table share their buffers, but not their rows:
+        self.assertNotEqual(
+            get_hash(table1.slice(0, 5), hash_mode="exact"),
+            get_hash(table1.slice(5, 5), hash_mode="exact"),
+        )
+
+    def test_polars_dataframe_exact(self):
+        """Polars dataframes are hashed by their Arrow data."""
+        df1 = polars_mocks.DataFrame(pd.DataFrame({"a": [1, 2]}))
+        df2 = polars_mocks.DataFrame(pd.DataFrame({"a": [1, 2]}))
+        df3 = polars_mocks.DataFrame(pd.DataFrame({"a": [1, 3]}))
+
+        self.assertEqual(
+            get_hash(df1, hash_mode="exact"), get_hash(df2, hash_mode="exact")
+        )
+        self.assertNotEqual(
+            get_hash(df1, hash_mode="exact"), get_hash(df3, hash_mode="exact")
+        )
+
     def test_numpy_similar_dtypes(self):
         np1 = np.ones(10, dtype="u8")
         np2 = np.ones(10, dtype="i8")
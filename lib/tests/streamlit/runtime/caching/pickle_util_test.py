@@ -0,0 +1,72 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""pickle_util unit tests."""
+
+import pickle
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from streamlit.runtime.caching import pickle_util
+
+
+class PickleUtilTest(unittest.TestCase):
+    def test_in_band(self):
+        """Without out_of_band, dumps is pickle.dumps."""
+        value = {"a": np.arange(10)}
+        data = pickle_util.dumps(value)
+        self.assertEqual(data, pickle.dumps(value))
+        np.testing.assert_array_equal(pickle_util.loads(data)["a"], value["a"])
+
+    def test_out_of_band_without_buffers(self):
+        """Objects without buffers are pickled as usual."""
+        data = pickle_util.dumps({"a": "b"}, out_of_band=True)
+        self.assertEqual(pickle.loads(data), {"a": "b"})
+        self.assertEqual(pickle_util.loads(data), {"a": "b"})
+
+    def test_out_of_band_dataframe(self):
+        """DataFrames round-trip with their buffers out of band."""
+        df = pd.DataFrame(
+            {"ints": np.arange(100), "strs": [str(i) for i in range(100)]}
+        )
+        data = pickle_util.dumps(df, out_of_band=True)
+        pd.testing.assert_frame_equal(pickle_util.loads(data), df)
+
+    def test_out_of_band_buffers_are_aligned(self):
+        """Buffers unpickled from aligned memory are aligned."""
+        data = pickle_util.dumps([np.arange(3), np.arange(5.0)], out_of_band=True)
+        arrays = pickle_util.loads(bytearray(data))
+        for array in arrays:
+            self.assertEqual(0, (array.ctypes.data - arrays[0].ctypes.data) % 64, array)
+
+    def test_loads_readonly_data_copies_buffers(self):
+        """Buffers of read-only data are copied, so values are writable."""
+        data = pickle_util.dumps(np.arange(10), out_of_band=True)
+        array = pickle_util.loads(data)
+        self.assertTrue(array.flags.writeable)
+        array[0] = 42
+
+    def test_loads_writable_data_shares_buffers(self):
+        """Buffers of writable data are used without copying them."""
+        data = bytearray(pickle_util.dumps(np.arange(10), out_of_band=True))
+        array = pickle_util.loads(memoryview(data))
+        self.assertTrue(np.shares_memory(array, np.frombuffer(data, np.uint8)))
+
+    def test_loads_malformed(self):
+        """Truncated data raises an UnpicklingError."""
+        data = pickle_util.dumps(np.arange(10), out_of_band=True)
+        with self.assertRaises(pickle.UnpicklingError):
+            pickle_util.loads(data[:-8])
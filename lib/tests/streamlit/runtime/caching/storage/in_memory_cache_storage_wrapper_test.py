@@ -101,6 +101,24 @@ class InMemoryCacheStorageWrapperTest(unittest.TestCase):
             self.assertEqual(wrapped_storage.get("some-key"), b"some-value")
             mock_persist_get.assert_called_once()
 
+    def test_in_memory_cache_storage_wrapper_get_memoryview_in_persist_storage(self):
+        """
+        Test that storage.get() doesn't keep memoryviews returned by the
+        persist storage in memory, since the caller owns them.
+        """
+        context = self.get_storage_context()
+        persist_storage = LocalDiskCacheStorage(context)
+        wrapped_storage = InMemoryCacheStorageWrapper(
+            persist_storage=persist_storage, context=context
+        )
+
+        with patch.object(
+            persist_storage, "get", return_value=memoryview(bytearray(b"some-value"))
+        ) as mock_persist_get:
+            self.assertEqual(wrapped_storage.get("some-key"), b"some-value")
+            self.assertEqual(wrapped_storage.get("some-key"), b"some-value")
+            self.assertEqual(mock_persist_get.call_count, 2)
+
     def test_in_memory_cache_storage_wrapper_get_key_in_memory_storage(self):
         """
         Test that storage.get() returns the value from in_memory storage
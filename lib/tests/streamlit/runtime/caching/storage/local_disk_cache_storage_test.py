@@ -17,13 +17,16 @@ import logging
 import math
 import os.path
 import shutil
+import sqlite3
 import unittest
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 from testfixtures import TempDirectory
 
 from streamlit import util
 from streamlit.logger import get_logger
+from streamlit.runtime.caching import pickle_util
 from streamlit.runtime.caching.storage import (
     CacheStorageContext,
     CacheStorageError,
@@ -36,6 +39,7 @@ from streamlit.runtime.caching.storage.local_disk_cache_storage import (
     LocalDiskCacheStorage,
     LocalDiskCacheStorageManager,
 )
+from tests.testutil import patch_config_options
 
 
 class LocalDiskCacheStorageManagerTest(unittest.TestCase):
@@ -90,8 +94,8 @@ class LocalDiskCacheStorageManagerTest(unittest.TestCase):
         self.assertEqual(storage.max_entries, math.inf)
 
     def test_check_context_with_persist_and_ttl(self):
-        """Tests that LocalDiskCacheStorageManager.check_context() writes a warning
-        in logs when persist="disk" and ttl_seconds is not None
+        """Tests that LocalDiskCacheStorageManager.check_context() doesn't warn
+        when persist="disk" and ttl_seconds is not None, since TTL is supported.
         """
         context = CacheStorageContext(
             function_key="func-key",
@@ -101,32 +105,6 @@ class LocalDiskCacheStorageManagerTest(unittest.TestCase):
             max_entries=100,
         )
 
-        with self.assertLogs(
-            "streamlit.runtime.caching.storage.local_disk_cache_storage",
-            level=logging.WARNING,
-        ) as logs:
-            manager = LocalDiskCacheStorageManager()
-            manager.check_context(context)
-
-            output = "".join(logs.output)
-            self.assertIn(
-                "The cached function 'func-display-name' has a TTL that will be "
-                "ignored. Persistent cached functions currently don't support TTL.",
-                output,
-            )
-
-    def test_check_context_without_persist(self):
-        """Tests that LocalDiskCacheStorageManager.check_context() does not
-        write a warning in logs when persist is None and ttl_seconds is NOT None.
-        """
-        context = CacheStorageContext(
-            function_key="func-key",
-            function_display_name="func-display-name",
-            persist=None,
-            ttl_seconds=60,
-            max_entries=100,
-        )
-
         with self.assertLogs(
             "streamlit.runtime.caching.storage.local_disk_cache_storage",
             level=logging.WARNING,
@@ -141,11 +119,7 @@ class LocalDiskCacheStorageManagerTest(unittest.TestCase):
             ).warning("irrelevant warning so assertLogs passes")
 
             output = "".join(logs.output)
-            self.assertNotIn(
-                "The cached function 'func-display-name' has a TTL that will be "
-                "ignored. Persistent cached functions currently don't support TTL.",
-                output,
-            )
+            self.assertNotIn("TTL", output)
 
     @patch("shutil.rmtree", wraps=shutil.rmtree)
     def test_clear_all(self, mock_rmtree):
@@ -193,9 +167,9 @@ class LocalDiskPersistCacheStorageTest(unittest.TestCase):
     def test_storage_set(self):
         """Test that storage.set() writes the correct value to disk."""
         self.storage.set("new-key", b"new-value")
-        self.assertTrue(os.path.exists(self.tempdir.path + "/func-key-new-key.memo"))
+        self.assertTrue(os.path.exists(self.tempdir.path + "/func-key/new-key.memo"))
 
-        with open(self.tempdir.path + "/func-key-new-key.memo", "rb") as f:
+        with open(self.tempdir.path + "/func-key/new-key.memo", "rb") as f:
             self.assertEqual(f.read(), b"new-value")
 
     @patch(
@@ -217,9 +191,9 @@ class LocalDiskPersistCacheStorageTest(unittest.TestCase):
     def test_storage_delete(self):
         """Test that storage.delete() removes the correct file from disk."""
         self.storage.set("new-key", b"new-value")
-        self.assertTrue(os.path.exists(self.tempdir.path + "/func-key-new-key.memo"))
+        self.assertTrue(os.path.exists(self.tempdir.path + "/func-key/new-key.memo"))
         self.storage.delete("new-key")
-        self.assertFalse(os.path.exists(self.tempdir.path + "/func-key-new-key.memo"))
+        self.assertFalse(os.path.exists(self.tempdir.path + "/func-key/new-key.memo"))
 
         with self.assertRaises(CacheStorageKeyNotFoundError):
             self.storage.get("new-key")
@@ -228,16 +202,16 @@ class LocalDiskPersistCacheStorageTest(unittest.TestCase):
         """Test that storage.clear() removes all storage files from disk."""
         self.storage.set("some-key", b"some-value")
         self.storage.set("another-key", b"another-value")
-        self.assertTrue(os.path.exists(self.tempdir.path + "/func-key-some-key.memo"))
+        self.assertTrue(os.path.exists(self.tempdir.path + "/func-key/some-key.memo"))
         self.assertTrue(
-            os.path.exists(self.tempdir.path + "/func-key-another-key.memo")
+            os.path.exists(self.tempdir.path + "/func-key/another-key.memo")
         )
 
         self.storage.clear()
 
-        self.assertFalse(os.path.exists(self.tempdir.path + "/func-key-some-key.memo"))
+        self.assertFalse(os.path.exists(self.tempdir.path + "/func-key/some-key.memo"))
         self.assertFalse(
-            os.path.exists(self.tempdir.path + "/func-key-another-key.memo")
+            os.path.exists(self.tempdir.path + "/func-key/another-key.memo")
         )
 
         with self.assertRaises(CacheStorageKeyNotFoundError):
@@ -246,28 +220,273 @@ class LocalDiskPersistCacheStorageTest(unittest.TestCase):
         with self.assertRaises(CacheStorageKeyNotFoundError):
             self.storage.get("another-key")
 
-        # test that cache folder is empty
-        self.assertEqual(os.listdir(self.tempdir.path), [])
+        # test that only the index (and its write-ahead log) is left in the
+        # cache folder
+        self.assertEqual(
+            [
+                name
+                for name in os.listdir(self.tempdir.path)
+                if not name.startswith("index.db")
+            ],
+            [],
+        )
 
     def test_storage_clear_not_existing_cache_directory(self):
         """Test that clear() is not crashing if the cache directory does not exist."""
         self.tempdir.cleanup()
         self.storage.clear()
 
-    def test_storage_clear_call_listdir_existing_cache_directory(self):
-        """Test that clear() call os.listdir if cache folder does not exist."""
+    def test_storage_clear_only_removes_own_folder(self):
+        """Test that clear() removes this function's folder without listing or
+        touching the entries of other functions.
+        """
+        other_storage = LocalDiskCacheStorage(
+            CacheStorageContext(
+                function_key="other-func-key",
+                function_display_name="other-func-display-name",
+                persist="disk",
+            )
+        )
+        self.storage.set("some-key", b"some-value")
+        other_storage.set("some-key", b"other-value")
+
         with patch("os.listdir") as mock_listdir:
             self.storage.clear()
-        mock_listdir.assert_called_once()
+        mock_listdir.assert_not_called()
 
-    def test_storage_clear_not_call_listdir_not_existing_cache_directory(self):
-        """Test that clear() doesn't call os.listdir if cache folder does not exist."""
-        self.tempdir.cleanup()
+        self.assertFalse(os.path.exists(self.tempdir.path + "/func-key"))
+        self.assertEqual(other_storage.get("some-key"), b"other-value")
 
-        with patch("os.listdir") as mock_listdir:
-            self.storage.clear()
+    def test_storage_set_is_atomic(self):
+        """Test that storage.set() leaves neither a partially-written file nor
+        its temporary file behind when writing fails.
+        """
+        self.storage.set("some-key", b"some-value")
 
-        mock_listdir.assert_not_called()
+        with patch(
+            "streamlit.file_util.os.replace",
+            MagicMock(side_effect=OSError("mock exception")),
+        ), self.assertRaises(CacheStorageError):
+            self.storage.set("some-key", b"new-value")
+
+        self.assertEqual(self.storage.get("some-key"), b"some-value")
+        self.assertEqual(os.listdir(self.tempdir.path + "/func-key"), ["some-key.memo"])
+
+    @patch("streamlit.runtime.caching.storage.local_disk_cache_storage.time.time")
+    def test_storage_get_expired(self, mock_time):
+        """Test that storage.get() removes entries older than the TTL."""
+        storage = LocalDiskCacheStorage(
+            CacheStorageContext(
+                function_key="func-key",
+                function_display_name="func-display-name",
+                persist="disk",
+                ttl_seconds=60,
+            )
+        )
+        mock_time.return_value = 1000
+        storage.set("some-key", b"some-value")
+
+        mock_time.return_value = 1059
+        self.assertEqual(storage.get("some-key"), b"some-value")
+
+        mock_time.return_value = 1061
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            storage.get("some-key")
+        self.assertFalse(os.path.exists(self.tempdir.path + "/func-key/some-key.memo"))
+
+    @patch("streamlit.runtime.caching.storage.local_disk_cache_storage.time.time")
+    def test_storage_set_evicts_expired(self, mock_time):
+        """Test that storage.set() removes the function's expired entries."""
+        storage = LocalDiskCacheStorage(
+            CacheStorageContext(
+                function_key="func-key",
+                function_display_name="func-display-name",
+                persist="disk",
+                ttl_seconds=60,
+            )
+        )
+        mock_time.return_value = 1000
+        storage.set("old-key", b"old-value")
+        mock_time.return_value = 1100
+        storage.set("new-key", b"new-value")
+
+        self.assertEqual(os.listdir(self.tempdir.path + "/func-key"), ["new-key.memo"])
+
+    @patch("streamlit.runtime.caching.storage.local_disk_cache_storage.time.time")
+    def test_storage_set_evicts_over_max_entries(self, mock_time):
+        """Test that storage.set() keeps only the `max_entries` most recently
+        used entries.
+        """
+        storage = LocalDiskCacheStorage(
+            CacheStorageContext(
+                function_key="func-key",
+                function_display_name="func-display-name",
+                persist="disk",
+                max_entries=2,
+            )
+        )
+        mock_time.return_value = 1
+        storage.set("key-1", b"value-1")
+        mock_time.return_value = 2
+        storage.set("key-2", b"value-2")
+        mock_time.return_value = 3
+        storage.get("key-1")
+        mock_time.return_value = 4
+        storage.set("key-3", b"value-3")
+
+        self.assertEqual(storage.get("key-1"), b"value-1")
+        self.assertEqual(storage.get("key-3"), b"value-3")
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            storage.get("key-2")
+
+    @patch("streamlit.runtime.caching.storage.local_disk_cache_storage.time.time")
+    def test_storage_get_writes_access_times_in_batches(self, mock_time):
+        """Test that storage.get() doesn't write every access time to the
+        index, but the evictions see them.
+        """
+
+        def get_accessed_at() -> float:
+            with sqlite3.connect(os.path.join(self.tempdir.path, "index.db")) as conn:
+                return conn.execute("SELECT accessed_at FROM entries").fetchone()[0]
+
+        mock_time.return_value = 100
+        self.storage.set("some-key", b"some-value")
+        self.storage.get("some-key")
+        mock_time.return_value = 102
+        self.storage.get("some-key")
+        self.assertEqual(get_accessed_at(), 100)
+
+        mock_time.return_value = 106
+        self.storage.get("some-key")
+        self.assertEqual(get_accessed_at(), 106)
+
+    @patch_config_options({"runner.maxDiskCacheSize": 1})
+    @patch("streamlit.runtime.caching.storage.local_disk_cache_storage.time.time")
+    def test_storage_set_evicts_over_max_disk_cache_size(self, mock_time):
+        """Test that storage.set() removes the least-recently-used entries of
+        all functions to stay within runner.maxDiskCacheSize.
+        """
+        other_storage = LocalDiskCacheStorage(
+            CacheStorageContext(
+                function_key="other-func-key",
+                function_display_name="other-func-display-name",
+                persist="disk",
+            )
+        )
+        value = b"x" * 400_000
+        mock_time.return_value = 1
+        other_storage.set("key-1", value)
+        mock_time.return_value = 2
+        self.storage.set("key-2", value)
+        mock_time.return_value = 3
+        self.storage.set("key-3", value)
+
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            other_storage.get("key-1")
+        self.assertEqual(self.storage.get("key-2"), value)
+        self.assertEqual(self.storage.get("key-3"), value)
+        other_storage.clear()
+
+    @patch("streamlit.runtime.caching.storage.local_disk_cache_storage._CAN_MMAP", True)
+    @patch(
+        "streamlit.runtime.caching.storage.local_disk_cache_storage._MMAP_MIN_SIZE", 4
+    )
+    def test_storage_get_mapped(self):
+        """Test that storage.get() returns a private memory-mapping of big values,
+        which unpickles into writable objects without copying their buffers.
+        """
+        array = np.arange(1000)
+        self.storage.set("some-key", pickle_util.dumps(array, out_of_band=True))
+
+        mapped = self.storage.get("some-key")
+        self.assertIsInstance(mapped, memoryview)
+        self.assertFalse(mapped.readonly)
+
+        unpickled = pickle_util.loads(mapped)
+        np.testing.assert_array_equal(unpickled, array)
+        self.assertTrue(np.shares_memory(unpickled, np.frombuffer(mapped, np.uint8)))
+
+        # Mutating the value changes neither the file nor later reads.
+        unpickled[:] = 0
+        np.testing.assert_array_equal(
+            pickle_util.loads(self.storage.get("some-key")), array
+        )
+
+    @patch(
+        "streamlit.runtime.caching.storage.local_disk_cache_storage._CAN_MMAP", False
+    )
+    @patch(
+        "streamlit.runtime.caching.storage.local_disk_cache_storage._MMAP_MIN_SIZE", 4
+    )
+    def test_storage_get_not_mapped_where_files_cant_be_mapped(self):
+        """Test that storage.get() reads big values into bytes where files can't
+        be mapped, which the in-memory cache layer keeps for later hits.
+        """
+        array = np.arange(1000)
+        value = pickle_util.dumps(array, out_of_band=True)
+        self.storage.set("some-key", value)
+        self.assertEqual(self.storage.get("some-key"), value)
+
+        storage = InMemoryCacheStorageWrapper(
+            persist_storage=self.storage, context=self.context
+        )
+        self.assertEqual(storage.get("some-key"), value)
+        with patch.object(self.storage, "get") as mock_get:
+            np.testing.assert_array_equal(
+                pickle_util.loads(storage.get("some-key")), array
+            )
+        mock_get.assert_not_called()
+
+    @patch("streamlit.runtime.caching.storage.local_disk_cache_storage._CAN_MMAP", True)
+    def test_storage_get_not_mapped(self):
+        """Test that storage.get() reads small values into bytes."""
+        self.storage.set("some-key", b"some-value")
+        self.assertIsInstance(self.storage.get("some-key"), bytes)
+
+    def test_storage_reuses_index_connections(self):
+        """Test that the index connection is reused across operations, and
+        that a connection to a removed index isn't."""
+        with patch(
+            "streamlit.runtime.caching.storage.local_disk_cache_storage.sqlite3.connect",
+            wraps=sqlite3.connect,
+        ) as mock_connect:
+            self.storage.set("some-key", b"some-value")
+            self.storage.get("some-key")
+            self.storage.delete("some-key")
+            self.assertEqual(mock_connect.call_count, 1)
+
+            LocalDiskCacheStorageManager().clear_all()
+            self.storage.set("some-key", b"some-value")
+            self.assertEqual(mock_connect.call_count, 2)
+            self.assertEqual(self.storage.get("some-key"), b"some-value")
+
+    def test_storage_moves_legacy_cache_files(self):
+        """Test that cache files in the cache folder itself, written before
+        each function had its own folder, are moved to the function's folder."""
+        with open(os.path.join(self.tempdir.path, "func-key-some-key.memo"), "wb") as f:
+            f.write(b"some-value")
+        with open(os.path.join(self.tempdir.path, "other-key-key.memo"), "wb") as f:
+            f.write(b"other-value")
+
+        self.assertEqual(self.storage.get("some-key"), b"some-value")
+        self.assertEqual(os.listdir(self.tempdir.path + "/func-key"), ["some-key.memo"])
+        self.assertTrue(os.path.exists(self.tempdir.path + "/other-key-key.memo"))
+
+        self.storage.clear()
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            self.storage.get("some-key")
+
+    def test_storage_without_index(self):
+        """Test that the storage still works when its index can't be used."""
+        with patch(
+            "streamlit.runtime.caching.storage.local_disk_cache_storage.sqlite3.connect",
+            MagicMock(side_effect=sqlite3.OperationalError("mock exception")),
+        ):
+            self.storage.set("some-key", b"some-value")
+            self.assertEqual(self.storage.get("some-key"), b"some-value")
+            self.storage.clear()
+            with self.assertRaises(CacheStorageKeyNotFoundError):
+                self.storage.get("some-key")
 
     def test_storage_close(self):
         """Test that storage.close() does not raise any exception."""
@@ -0,0 +1,341 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for SharedCacheStorage and SharedCacheStorageManager"""
+import os
+import subprocess
+import sys
+import unittest
+from unittest.mock import patch
+
+from testfixtures import TempDirectory
+
+from streamlit.runtime.caching.storage import (
+    CacheStorageContext,
+    CacheStorageError,
+    CacheStorageKeyNotFoundError,
+)
+from streamlit.runtime.caching.storage.shared_cache_storage import (
+    SharedCacheStorage,
+    SharedCacheStorageManager,
+)
+from streamlit.runtime.stats import CacheStat
+
+# Run in a fresh interpreter rather than with multiprocessing, which re-imports
+# the __main__ module of the test runner in the child process.
+_SET_IN_OTHER_PROCESS_SCRIPT = """
+import sys
+
+from streamlit.runtime.caching.storage import CacheStorageContext
+from streamlit.runtime.caching.storage.shared_cache_storage import (
+    SharedCacheStorageManager,
+)
+
+path, key, value = sys.argv[1:]
+context = CacheStorageContext(
+    function_key="func-key", function_display_name="func-display-name"
+)
+SharedCacheStorageManager(path).create(context).set(key, value.encode())
+"""
+
+
+def _create_context(**kwargs) -> CacheStorageContext:
+    return CacheStorageContext(
+        function_key="func-key", function_display_name="func-display-name", **kwargs
+    )
+
+
+class SharedCacheStorageManagerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.tempdir = TempDirectory(create=True)
+        self.path = os.path.join(self.tempdir.path, "shared", "cache.db")
+        self.manager = SharedCacheStorageManager(self.path)
+
+    def tearDown(self) -> None:
+        super().tearDown()
+        self.tempdir.cleanup()
+
+    def test_create(self):
+        """Tests that create() returns a SharedCacheStorage with correct
+        parameters from context, creating the database folder."""
+        storage = self.manager.create(_create_context(ttl_seconds=60, max_entries=5))
+        self.assertIsInstance(storage, SharedCacheStorage)
+        self.assertEqual(storage.ttl_seconds, 60)
+        self.assertEqual(storage.max_entries, 5)
+        self.assertTrue(os.path.isdir(os.path.dirname(self.path)))
+
+    def test_clear_all(self):
+        """Tests that clear_all() removes the entries of all functions."""
+        storage = self.manager.create(_create_context())
+        other_storage = self.manager.create(
+            CacheStorageContext(
+                function_key="other-func-key",
+                function_display_name="other-func-display-name",
+            )
+        )
+        storage.set("some-key", b"some-value")
+        other_storage.set("some-key", b"other-value")
+
+        self.manager.clear_all()
+
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            storage.get("some-key")
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            other_storage.get("some-key")
+
+    def test_clear_all_without_database(self):
+        """Tests that clear_all() doesn't create the database."""
+        self.manager.clear_all()
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_entries_are_shared_between_processes(self):
+        """Tests that an entry written by another process is a cache hit."""
+        storage = self.manager.create(_create_context())
+
+        subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                _SET_IN_OTHER_PROCESS_SCRIPT,
+                self.path,
+                "some-key",
+                "some-value",
+            ],
+            check=True,
+            timeout=30,
+        )
+
+        self.assertEqual(storage.get("some-key"), b"some-value")
+
+
+class SharedCacheStorageTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.tempdir = TempDirectory(create=True)
+        self.path = os.path.join(self.tempdir.path, "cache.db")
+        self.storage = SharedCacheStorage(_create_context(), self.path)
+
+    def tearDown(self):
+        super().tearDown()
+        self.tempdir.cleanup()
+
+    def test_storage_get_not_found(self):
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            self.storage.get("some-key")
+
+    def test_storage_set_get(self):
+        self.storage.set("some-key", b"some-value")
+        self.assertEqual(self.storage.get("some-key"), b"some-value")
+
+    def test_storage_set_override(self):
+        self.storage.set("some-key", b"some-value")
+        self.storage.set("some-key", b"new-value")
+        self.assertEqual(self.storage.get("some-key"), b"new-value")
+
+    def test_storages_share_entries(self):
+        """Storages of the same function on the same database share entries,
+        and storages of other functions don't see them."""
+        self.storage.set("some-key", b"some-value")
+
+        same_function_storage = SharedCacheStorage(_create_context(), self.path)
+        self.assertEqual(same_function_storage.get("some-key"), b"some-value")
+
+        other_function_storage = SharedCacheStorage(
+            CacheStorageContext(
+                function_key="other-func-key",
+                function_display_name="other-func-display-name",
+            ),
+            self.path,
+        )
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            other_function_storage.get("some-key")
+
+    def test_storage_delete(self):
+        self.storage.set("some-key", b"some-value")
+        self.storage.delete("some-key")
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            self.storage.get("some-key")
+
+    def test_storage_clear(self):
+        """clear() removes only the entries of its function."""
+        other_storage = SharedCacheStorage(
+            CacheStorageContext(
+                function_key="other-func-key",
+                function_display_name="other-func-display-name",
+            ),
+            self.path,
+        )
+        self.storage.set("some-key", b"some-value")
+        other_storage.set("some-key", b"other-value")
+
+        self.storage.clear()
+
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            self.storage.get("some-key")
+        self.assertEqual(other_storage.get("some-key"), b"other-value")
+
+    @patch("streamlit.runtime.caching.storage.shared_cache_storage.time.time")
+    def test_storage_get_expired(self, mock_time):
+        storage = SharedCacheStorage(_create_context(ttl_seconds=60), self.path)
+        mock_time.return_value = 1000
+        storage.set("some-key", b"some-value")
+
+        mock_time.return_value = 1059
+        self.assertEqual(storage.get("some-key"), b"some-value")
+
+        mock_time.return_value = 1061
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            storage.get("some-key")
+
+        # The expired entry was removed.
+        mock_time.return_value = 1000
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            storage.get("some-key")
+
+    @patch("streamlit.runtime.caching.storage.shared_cache_storage.time.time")
+    def test_storage_set_evicts_over_max_entries(self, mock_time):
+        storage = SharedCacheStorage(_create_context(max_entries=2), self.path)
+        mock_time.return_value = 1
+        storage.set("key-1", b"value-1")
+        mock_time.return_value = 2
+        storage.set("key-2", b"value-2")
+        mock_time.return_value = 3
+        storage.get("key-1")
+        mock_time.return_value = 4
+        storage.set("key-3", b"value-3")
+
+        self.assertEqual(storage.get("key-1"), b"value-1")
+        self.assertEqual(storage.get("key-3"), b"value-3")
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            storage.get("key-2")
+
+    def test_acquire_lease(self):
+        """Only one process at a time holds the lease for a key."""
+        self.assertTrue(self.storage.acquire_lease("some-key"))
+        # Taking a lease we hold again succeeds.
+        self.assertTrue(self.storage.acquire_lease("some-key"))
+        # Leases of other keys are independent.
+        self.assertTrue(self.storage.acquire_lease("other-key"))
+
+        with patch(
+            "streamlit.runtime.caching.storage.shared_cache_storage._get_lease_owner",
+            return_value="other-process",
+        ):
+            self.assertFalse(self.storage.acquire_lease("some-key"))
+            # Other processes can't release our lease.
+            self.storage.release_lease("some-key")
+            self.assertFalse(self.storage.acquire_lease("some-key"))
+
+        self.storage.release_lease("some-key")
+        with patch(
+            "streamlit.runtime.caching.storage.shared_cache_storage._get_lease_owner",
+            return_value="other-process",
+        ):
+            self.assertTrue(self.storage.acquire_lease("some-key"))
+
+    @patch("streamlit.runtime.caching.storage.shared_cache_storage.time.time")
+    def test_acquire_expired_lease(self, mock_time):
+        """A lease that has expired can be taken by another process."""
+        storage = SharedCacheStorage(_create_context(), self.path, lease_seconds=10)
+        mock_time.return_value = 1000
+        self.assertTrue(storage.acquire_lease("some-key"))
+
+        with patch(
+            "streamlit.runtime.caching.storage.shared_cache_storage._get_lease_owner",
+            return_value="other-process",
+        ):
+            mock_time.return_value = 1009
+            self.assertFalse(storage.acquire_lease("some-key"))
+            mock_time.return_value = 1011
+            self.assertTrue(storage.acquire_lease("some-key"))
+
+    @patch("streamlit.runtime.caching.storage.shared_cache_storage.time.time")
+    def test_stale_while_revalidate(self, mock_time):
+        """With stale_while_revalidate, an expired value is returned while
+        another process holds the lease to recompute it."""
+        storage = SharedCacheStorage(
+            _create_context(ttl_seconds=60), self.path, stale_while_revalidate=True
+        )
+        mock_time.return_value = 1000
+        storage.set("some-key", b"old-value")
+
+        mock_time.return_value = 1100
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            storage.get("some-key")
+
+        with patch(
+            "streamlit.runtime.caching.storage.shared_cache_storage._get_lease_owner",
+            return_value="other-process",
+        ):
+            self.assertTrue(storage.acquire_lease("some-key"))
+        self.assertEqual(storage.get("some-key"), b"old-value")
+
+        storage.set("some-key", b"new-value")
+        self.assertEqual(storage.get("some-key"), b"new-value")
+
+    @patch("streamlit.runtime.caching.storage.shared_cache_storage.time.time")
+    def test_stale_while_revalidate_purges_old_entries(self, mock_time):
+        """With stale_while_revalidate, expired entries are kept for another
+        ttl to be served while they're recomputed, then removed on write."""
+        storage = SharedCacheStorage(
+            _create_context(ttl_seconds=60),
+            self.path,
+            lease_seconds=10,
+            stale_while_revalidate=True,
+        )
+        mock_time.return_value = 1000
+        storage.set("old-key", b"old-value")
+        mock_time.return_value = 1050
+        storage.set("newer-key", b"newer-value")
+
+        # Both entries are expired, but only the first is past the grace period.
+        mock_time.return_value = 1121
+        storage.set("new-key", b"new-value")
+
+        with patch(
+            "streamlit.runtime.caching.storage.shared_cache_storage._get_lease_owner",
+            return_value="other-process",
+        ):
+            self.assertTrue(storage.acquire_lease("old-key"))
+            self.assertTrue(storage.acquire_lease("newer-key"))
+        with self.assertRaises(CacheStorageKeyNotFoundError):
+            storage.get("old-key")
+        self.assertEqual(storage.get("newer-key"), b"newer-value")
+
+    def test_storage_error(self):
+        """Errors of the database raise CacheStorageError."""
+        storage = SharedCacheStorage(
+            _create_context(), os.path.join(self.tempdir.path, "missing", "cache.db")
+        )
+        with self.assertRaises(CacheStorageError) as e:
+            storage.get("some-key")
+        self.assertEqual(str(e.exception), "Unable to read from cache")
+
+        with self.assertRaises(CacheStorageError) as e:
+            storage.set("some-key", b"some-value")
+        self.assertEqual(str(e.exception), "Unable to write to cache")
+
+    def test_get_stats(self):
+        self.storage.set("some-key", b"some-value")
+        self.assertEqual(
+            self.storage.get_stats(),
+            [
+                CacheStat(
+                    category_name="st_cache_data",
+                    cache_name="func-display-name",
+                    byte_length=len(b"some-value"),
+                )
+            ],
+        )
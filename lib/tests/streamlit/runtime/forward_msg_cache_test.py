@@ -23,6 +23,7 @@ from streamlit.runtime.forward_msg_cache import (
     ForwardMsgCache,
     create_reference_msg,
     populate_hash_if_needed,
+    serialize_forward_msg_payload,
 )
 from streamlit.runtime.stats import CacheStat
 from streamlit.testing.v1.util import patch_config_options
@@ -51,6 +52,31 @@ class ForwardMsgCacheTest(unittest.TestCase):
         msg2 = create_dataframe_msg([1, 2, 3], 2)
         self.assertEqual(populate_hash_if_needed(msg1), populate_hash_if_needed(msg2))
 
+    def test_msg_hash_from_payload(self):
+        """Test that the hash can be computed from a precomputed payload"""
+        msg1 = create_dataframe_msg([1, 2, 3])
+        msg2 = create_dataframe_msg([1, 2, 3])
+        payload = serialize_forward_msg_payload(msg1)
+        self.assertEqual(
+            populate_hash_if_needed(msg1, payload), populate_hash_if_needed(msg2)
+        )
+
+    def test_payload_excludes_hash_and_metadata(self):
+        """Test that the payload doesn't depend on the hash or metadata"""
+        msg = create_dataframe_msg([1, 2, 3], 1)
+        payload = serialize_forward_msg_payload(msg)
+
+        populate_hash_if_needed(msg)
+        msg.metadata.cacheable = True
+        self.assertEqual(payload, serialize_forward_msg_payload(msg))
+
+        # The message itself is left untouched.
+        self.assertNotEqual("", msg.hash)
+        self.assertTrue(msg.metadata.cacheable)
+        self.assertEqual(
+            payload, serialize_forward_msg_payload(create_dataframe_msg([1, 2, 3], 2))
+        )
+
     def test_reference_msg(self):
         """Test creation of 'reference' ForwardMsgs"""
         msg = create_dataframe_msg([1, 2, 3], 34)
@@ -79,6 +105,33 @@ class ForwardMsgCacheTest(unittest.TestCase):
         cache.add_message(msg, session, 0)
         self.assertEqual(msg, cache.get_message(msg_hash))
 
+    def test_get_payload(self):
+        """Test MessageCache.get_payload"""
+        cache = ForwardMsgCache()
+        session = _create_mock_session()
+        msg = create_dataframe_msg([1, 2, 3])
+
+        msg_hash = populate_hash_if_needed(msg)
+        self.assertIsNone(cache.get_payload(msg_hash))
+
+        cache.add_message(msg, session, 0)
+        self.assertEqual(
+            serialize_forward_msg_payload(msg), cache.get_payload(msg_hash)
+        )
+
+    def test_add_message_with_payload(self):
+        """Test that MessageCache.add_message stores the given payload as is"""
+        cache = ForwardMsgCache()
+        msg = create_dataframe_msg([1, 2, 3])
+        payload = serialize_forward_msg_payload(msg)
+
+        cache.add_message(msg, _create_mock_session(), 0, payload)
+        cache.add_message(
+            create_dataframe_msg([1, 2, 3]), _create_mock_session(), 0, b"ignored"
+        )
+
+        self.assertIs(payload, cache.get_payload(msg.hash))
+
     def test_clear(self):
         """Test MessageCache.clear"""
         cache = ForwardMsgCache()
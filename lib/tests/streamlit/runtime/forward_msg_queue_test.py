@@ -14,16 +14,23 @@
 
 """Unit test of ForwardMsgQueue.py."""
 
+from __future__ import annotations
+
 import copy
 import unittest
 from typing import Tuple
 
+import pyarrow as pa
 from parameterized import parameterized
 
 from streamlit.cursor import make_delta_path
 from streamlit.elements import arrow
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 from streamlit.proto.RootContainer_pb2 import RootContainer
+from streamlit.runtime.forward_msg_cache import (
+    populate_hash_if_needed,
+    serialize_forward_msg_payload,
+)
 from streamlit.runtime.forward_msg_queue import ForwardMsgQueue
 
 # For the messages below, we don't really care about their contents so much as
@@ -57,6 +64,25 @@ arrow.marshall(
 ADD_ROWS_MSG.metadata.delta_path[:] = make_delta_path(RootContainer.MAIN, (), 0)
 
 
+def _create_streamed_rows_msg(
+    data: dict, max_rows: int, previous_schema: bytes | None
+) -> Tuple[ForwardMsg, bytes | None]:
+    msg = ForwardMsg()
+    schema = arrow.marshall_streamed_rows(
+        msg.delta.arrow_add_rows, data, max_rows, previous_schema
+    )
+    msg.metadata.delta_path[:] = make_delta_path(RootContainer.MAIN, (), 0)
+    return msg, schema
+
+
+STREAMED_ROWS_MSG1, _STREAMED_ROWS_SCHEMA = _create_streamed_rows_msg(
+    {"col1": [3, 4, 5], "col2": [13, 14, 15]}, 10, None
+)
+STREAMED_ROWS_MSG2, _ = _create_streamed_rows_msg(
+    {"col1": [6, 7], "col2": [16, 17]}, 10, _STREAMED_ROWS_SCHEMA
+)
+
+
 class ForwardMsgQueueTest(unittest.TestCase):
     def test_simple_enqueue(self):
         """Enqueue a single ForwardMsg."""
@@ -166,6 +192,91 @@ class ForwardMsgQueueTest(unittest.TestCase):
         self.assertEqual(ADD_BLOCK_MSG, queue[0])
         self.assertEqual(other_msg, queue[1])
 
+    def test_compose_streamed_rows(self):
+        """Rows streamed to the same dataset without their schema should be
+        appended to the add_rows that is already in the queue."""
+        fmq = ForwardMsgQueue()
+        fmq.enqueue(DF_DELTA_MSG)
+        fmq.enqueue(STREAMED_ROWS_MSG1)
+        fmq.enqueue(STREAMED_ROWS_MSG2)
+
+        queue = fmq.flush()
+        self.assertEqual(2, len(queue))
+        add_rows = queue[1].delta.arrow_add_rows
+        self.assertFalse(add_rows.schema_omitted)
+        self.assertEqual(10, add_rows.max_rows)
+        self.assertEqual(
+            [3, 4, 5, 6, 7],
+            pa.ipc.open_stream(add_rows.data.data).read_all()["col1"].to_pylist(),
+        )
+
+        # The messages in the queue aren't modified.
+        self.assertTrue(STREAMED_ROWS_MSG2.delta.arrow_add_rows.schema_omitted)
+        self.assertEqual(
+            3,
+            pa.ipc.open_stream(STREAMED_ROWS_MSG1.delta.arrow_add_rows.data.data)
+            .read_all()
+            .num_rows,
+        )
+
+    @parameterized.expand([(True,), (False,)])
+    def test_compose_streamed_rows_stays_bounded(self, with_schema: bool):
+        """The oldest streamed rows beyond max_rows should be dropped when
+        rows are composed, so the queued add_rows doesn't grow without limit."""
+        first_data = {"col1": [0, 1], "col2": [10, 11]}
+        first_msg, schema = _create_streamed_rows_msg(first_data, 5, None)
+        first_batch_msg, _ = _create_streamed_rows_msg(first_data, 5, schema)
+        first_msg_data = first_msg.delta.arrow_add_rows.data.data
+        schema_data = first_msg_data[
+            : len(first_msg_data) - len(first_batch_msg.delta.arrow_add_rows.data.data)
+        ]
+
+        fmq = ForwardMsgQueue()
+        fmq.enqueue(DF_DELTA_MSG)
+        fmq.enqueue(first_msg if with_schema else first_batch_msg)
+        for i in range(2, 100, 2):
+            msg, _ = _create_streamed_rows_msg(
+                {"col1": [i, i + 1], "col2": [i + 10, i + 11]}, 5, schema
+            )
+            fmq.enqueue(msg)
+
+        queue = fmq.flush()
+        self.assertEqual(2, len(queue))
+        add_rows = queue[1].delta.arrow_add_rows
+        self.assertEqual(not with_schema, add_rows.schema_omitted)
+        self.assertEqual([2, 2, 2], list(add_rows.batch_rows))
+
+        data = add_rows.data.data if with_schema else schema_data + add_rows.data.data
+        self.assertEqual(
+            [94, 95, 96, 97, 98, 99],
+            pa.ipc.open_stream(data).read_all()["col1"].to_pylist(),
+        )
+
+    def test_dont_compose_streamed_rows_with_schema(self):
+        """Rows that are sent with their schema, or that aren't streamed,
+        shouldn't be composed with the add_rows before them."""
+        fmq = ForwardMsgQueue()
+        fmq.enqueue(DF_DELTA_MSG)
+        fmq.enqueue(STREAMED_ROWS_MSG1)
+        fmq.enqueue(STREAMED_ROWS_MSG1)
+        fmq.enqueue(ADD_ROWS_MSG)
+        fmq.enqueue(STREAMED_ROWS_MSG2)
+
+        queue = fmq.flush()
+        self.assertEqual(5, len(queue))
+
+    def test_dont_compose_streamed_rows_with_other_max_rows(self):
+        """Rows streamed with another max_rows shouldn't be composed."""
+        other_msg, _ = _create_streamed_rows_msg(
+            {"col1": [6, 7], "col2": [16, 17]}, 5, _STREAMED_ROWS_SCHEMA
+        )
+        fmq = ForwardMsgQueue()
+        fmq.enqueue(STREAMED_ROWS_MSG1)
+        fmq.enqueue(other_msg)
+
+        queue = fmq.flush()
+        self.assertEqual(2, len(queue))
+
     def test_multiple_containers(self):
         """Deltas should only be coalesced if they're in the same container"""
         fmq = ForwardMsgQueue()
@@ -204,6 +315,122 @@ class ForwardMsgQueueTest(unittest.TestCase):
         assert_deltas(RootContainer.MAIN, (), 1)
         assert_deltas(RootContainer.SIDEBAR, (0, 0, 1), 4)
 
+    def test_flush_option_lists_first(self):
+        """OptionList messages are flushed before the Deltas that refer to them,
+        even if such a Delta replaced an older one in the queue.
+        """
+        fmq = ForwardMsgQueue()
+
+        option_list_msg = ForwardMsg()
+        option_list_msg.hash = "options"
+        option_list_msg.option_list.options[:] = ["a", "b"]
+
+        TEXT_DELTA_MSG1.metadata.delta_path[:] = make_delta_path(
+            RootContainer.MAIN, (), 0
+        )
+        TEXT_DELTA_MSG2.metadata.delta_path[:] = make_delta_path(
+            RootContainer.MAIN, (), 0
+        )
+
+        fmq.enqueue(NEW_SESSION_MSG)
+        fmq.enqueue(TEXT_DELTA_MSG1)
+        fmq.enqueue(option_list_msg)
+        fmq.enqueue(TEXT_DELTA_MSG2)
+        self.assertEqual(3, len(fmq))
+
+        queue = fmq.flush()
+        self.assertEqual(
+            [option_list_msg, NEW_SESSION_MSG, TEXT_DELTA_MSG2],
+            queue,
+        )
+        self.assertTrue(fmq.is_empty())
+
+    def test_dedupe_option_lists(self):
+        """An OptionList message is only queued once."""
+        fmq = ForwardMsgQueue()
+
+        option_list_msg = ForwardMsg()
+        option_list_msg.hash = "options"
+        option_list_msg.option_list.options[:] = ["a", "b"]
+
+        fmq.enqueue(option_list_msg)
+        fmq.enqueue(copy.deepcopy(option_list_msg))
+        self.assertEqual(1, len(fmq.flush()))
+
+    def test_clear_option_lists(self):
+        """OptionList messages aren't retained when the queue is cleared."""
+        fmq = ForwardMsgQueue()
+
+        option_list_msg = ForwardMsg()
+        option_list_msg.hash = "options"
+        option_list_msg.option_list.options[:] = ["a", "b"]
+
+        fmq.enqueue(option_list_msg)
+        fmq.clear(retain_lifecycle_msgs=True)
+        self.assertTrue(fmq.is_empty())
+
+    def test_flush_with_payloads(self):
+        """Messages are flushed with the payloads they were enqueued with, as
+        long as they weren't replaced by another message."""
+        df_msg = copy.deepcopy(DF_DELTA_MSG)
+        df_msg.metadata.delta_path[:] = make_delta_path(RootContainer.MAIN, (), 1)
+        df_payload = serialize_forward_msg_payload(df_msg)
+        populate_hash_if_needed(df_msg, df_payload)
+        replaced_msg = copy.deepcopy(TEXT_DELTA_MSG1)
+        populate_hash_if_needed(replaced_msg)
+
+        fmq = ForwardMsgQueue()
+        fmq.enqueue(NEW_SESSION_MSG)
+        fmq.enqueue(replaced_msg, b"replaced-payload")
+        fmq.enqueue(TEXT_DELTA_MSG2)
+        fmq.enqueue(df_msg, df_payload)
+
+        self.assertEqual(
+            [(NEW_SESSION_MSG, None), (TEXT_DELTA_MSG2, None), (df_msg, df_payload)],
+            fmq.flush_with_payloads(),
+        )
+        self.assertEqual([], fmq.flush_with_payloads())
+
+    def test_flush_composed_msg_with_payload(self):
+        """A message that replaces another one at the same delta path is
+        flushed with its payload."""
+        old_msg = copy.deepcopy(TEXT_DELTA_MSG1)
+        new_msg = copy.deepcopy(TEXT_DELTA_MSG2)
+        new_msg.metadata.delta_path[:] = old_msg.metadata.delta_path
+        new_payload = serialize_forward_msg_payload(new_msg)
+        populate_hash_if_needed(new_msg, new_payload)
+
+        fmq = ForwardMsgQueue()
+        fmq.enqueue(old_msg)
+        fmq.enqueue(new_msg, new_payload)
+
+        self.assertEqual([(new_msg, new_payload)], fmq.flush_with_payloads())
+
+    def test_byte_size(self):
+        """The queue should track the size of the messages it holds."""
+        fmq = ForwardMsgQueue()
+        self.assertEqual(0, fmq.byte_size)
+
+        fmq.enqueue(NEW_SESSION_MSG)
+        fmq.enqueue(TEXT_DELTA_MSG1)
+        self.assertEqual(
+            NEW_SESSION_MSG.ByteSize() + TEXT_DELTA_MSG1.ByteSize(), fmq.byte_size
+        )
+
+        # TEXT_DELTA_MSG2 replaces TEXT_DELTA_MSG1.
+        fmq.enqueue(TEXT_DELTA_MSG2)
+        self.assertEqual(
+            NEW_SESSION_MSG.ByteSize() + TEXT_DELTA_MSG2.ByteSize(), fmq.byte_size
+        )
+
+        # Streamed rows are appended to the rows in the queue.
+        fmq.enqueue(STREAMED_ROWS_MSG1)
+        fmq.enqueue(STREAMED_ROWS_MSG2)
+        self.assertEqual(sum(msg.ByteSize() for msg in fmq._queue), fmq.byte_size)
+
+        fmq.clear()
+        self.assertEqual(0, fmq.byte_size)
+
     def test_clear_retain_lifecycle_msgs(self):
         fmq = ForwardMsgQueue()
 
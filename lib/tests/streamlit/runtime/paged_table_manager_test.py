@@ -0,0 +1,140 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for PagedTableManager"""
+
+import unittest
+from unittest import mock
+
+import pandas as pd
+import pyarrow as pa
+from parameterized import parameterized
+
+from streamlit.runtime.paged_table_manager import (
+    PagedTableError,
+    PagedTableManager,
+    get_column_names,
+)
+from streamlit.type_util import bytes_to_data_frame
+
+
+def _create_table() -> pa.Table:
+    df = pd.DataFrame(
+        {"a": [3, 1, None, 2], "b": ["x", "y", "z", "w"]},
+        index=pd.Index([10, 11, 12, 13], name="idx"),
+    )
+    return pa.Table.from_pandas(df, preserve_index=True)
+
+
+class PagedTableManagerTest(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.manager = PagedTableManager()
+
+    def test_get_rows(self):
+        """Test that a window of rows is returned with its index."""
+        table_id = self.manager.add(_create_table(), "1.2")
+
+        df = bytes_to_data_frame(self.manager.get_rows(table_id, 1, 3))
+
+        self.assertEqual(df.index.to_list(), [11, 12])
+        self.assertEqual(df["b"].to_list(), ["y", "z"])
+
+    def test_get_sorted_rows(self):
+        """Test that rows are sorted by the column at the given position, with
+        null values last."""
+        table_id = self.manager.add(_create_table(), "1.2")
+
+        ascending = bytes_to_data_frame(self.manager.get_rows(table_id, 0, 4, 1))
+        descending = bytes_to_data_frame(
+            self.manager.get_rows(table_id, 0, 2, 1, ascending=False)
+        )
+        by_index = bytes_to_data_frame(
+            self.manager.get_rows(table_id, 0, 4, 0, ascending=False)
+        )
+
+        self.assertEqual(ascending.index.to_list(), [11, 13, 10, 12])
+        self.assertEqual(descending.index.to_list(), [10, 13])
+        self.assertEqual(by_index.index.to_list(), [13, 12, 11, 10])
+
+    def test_sort_indices_are_reused(self):
+        """Test that a table is only sorted once for the same sort order."""
+        table_id = self.manager.add(_create_table(), "1.2")
+
+        with mock.patch.object(self.manager, "_sort", wraps=self.manager._sort) as sort:
+            self.manager.get_rows(table_id, 0, 2, 1)
+            self.manager.get_rows(table_id, 2, 4, 1)
+            self.assertEqual(sort.call_count, 1)
+
+            self.manager.get_rows(table_id, 0, 2, 1, ascending=False)
+            self.assertEqual(sort.call_count, 2)
+
+    @parameterized.expand(
+        [
+            ("unknown table", "unknown", 0, 1, None),
+            ("negative start", None, -1, 1, None),
+            ("end before start", None, 2, 1, None),
+            ("too many rows", None, 0, 10001, None),
+            ("invalid sort column", None, 0, 1, 5),
+        ]
+    )
+    def test_invalid_requests(self, _, table_id, start, end, sort_column):
+        """Test that invalid requests raise a PagedTableError."""
+        added_table_id = self.manager.add(_create_table(), "1.2")
+
+        with self.assertRaises(PagedTableError):
+            self.manager.get_rows(table_id or added_table_id, start, end, sort_column)
+
+    def test_add_same_table_reuses_id(self):
+        """Test that adding an equal table at the same coordinates returns the
+        same ID, and that a different table gets a new ID."""
+        table_id = self.manager.add(_create_table(), "1.2")
+
+        self.assertEqual(self.manager.add(_create_table(), "1.2"), table_id)
+        self.assertNotEqual(self.manager.add(_create_table(), "1.3"), table_id)
+        self.assertNotEqual(self.manager.add(_create_table().slice(1), "1.2"), table_id)
+
+    def test_remove_orphaned_tables(self):
+        """Test that tables are removed once the session no longer displays
+        them."""
+        old_table_id = self.manager.add(_create_table(), "1.2")
+
+        # A new script run replaces the table:
+        self.manager.clear_session_refs()
+        new_table_id = self.manager.add(_create_table().slice(1), "1.2")
+        self.manager.remove_orphaned_tables()
+
+        with self.assertRaises(PagedTableError):
+            self.manager.get_rows(old_table_id, 0, 1)
+        self.manager.get_rows(new_table_id, 0, 1)
+
+        # The session ends:
+        self.manager.clear_session_refs()
+        self.manager.remove_orphaned_tables()
+
+        with self.assertRaises(PagedTableError):
+            self.manager.get_rows(new_table_id, 0, 1)
+
+    def test_get_column_names(self):
+        """Test that index columns come first, and a RangeIndex is ignored."""
+        df = pd.DataFrame({"a": [1], "b": [2]}).set_index("b", append=True)
+
+        self.assertEqual(
+            get_column_names(pa.Table.from_pandas(df)),
+            ["__index_level_0__", "b", "a"],
+        )
+        self.assertEqual(
+            get_column_names(pa.Table.from_pandas(pd.DataFrame({"a": [1]}))),
+            ["a"],
+        )
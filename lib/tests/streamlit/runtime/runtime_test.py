@@ -34,7 +34,10 @@ from streamlit.runtime import (
 from streamlit.runtime.caching.storage.local_disk_cache_storage import (
     LocalDiskCacheStorageManager,
 )
-from streamlit.runtime.forward_msg_cache import populate_hash_if_needed
+from streamlit.runtime.forward_msg_cache import (
+    populate_hash_if_needed,
+    serialize_forward_msg_payload,
+)
 from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
 from streamlit.runtime.memory_session_storage import MemorySessionStorage
 from streamlit.runtime.memory_uploaded_file_manager import MemoryUploadedFileManager
@@ -430,18 +433,19 @@ class RuntimeTest(RuntimeTestCase):
         await self.runtime.start()
 
         client = MagicMock(spec=SessionClient)
+        client.is_write_buffer_full.return_value = False
         session_id = self.runtime.connect_session(client, MagicMock())
 
         # Send the client a message. All should be well.
         self.enqueue_forward_msg(session_id, create_dataframe_msg([1, 2, 3]))
         await self.tick_runtime_loop()
 
-        client.write_forward_msg.assert_called_once()
+        client.write_serialized_forward_msg.assert_called_once()
         self.assertTrue(self.runtime.is_active_session(session_id))
 
         # Send another message - but this time the client will raise an error.
         raise_disconnected_error = MagicMock(side_effect=SessionClientDisconnectedError)
-        client.write_forward_msg = raise_disconnected_error
+        client.write_serialized_forward_msg = raise_disconnected_error
         self.enqueue_forward_msg(session_id, create_dataframe_msg([1, 2, 3]))
         await self.tick_runtime_loop()
 
@@ -467,6 +471,81 @@ class RuntimeTest(RuntimeTestCase):
         # It is expected that there are a couple of tasks, but not one per loop:
         self.assertLess(len(asyncio.all_tasks()), 10)
 
+    async def test_only_flushes_sessions_with_pending_msgs(self):
+        """Test that the Runtime loop only flushes the queues of sessions
+        that have enqueued messages.
+        """
+        await self.runtime.start()
+
+        busy_client = MockSessionClient()
+        busy_session_id = self.runtime.connect_session(
+            client=busy_client, user_info=MagicMock()
+        )
+        idle_session_id = self.runtime.connect_session(
+            client=MockSessionClient(), user_info=MagicMock()
+        )
+        await self.tick_runtime_loop()
+
+        idle_session = self.runtime._session_mgr.get_session_info(
+            idle_session_id
+        ).session
+        with patch.object(
+            idle_session, "flush_browser_queue_with_payloads"
+        ) as idle_flush:
+            self.enqueue_forward_msg(busy_session_id, create_dataframe_msg([1, 2, 3]))
+            await self.tick_runtime_loop()
+
+        idle_flush.assert_not_called()
+        self.assertEqual(1, len(busy_client.forward_msgs))
+
+    async def test_enqueued_messages_wake_up_loop_once(self):
+        """Test that sessions enqueueing messages before the Runtime loop
+        flushes them only schedule a single wakeup.
+        """
+        await self.runtime.start()
+        session_id = self.runtime.connect_session(
+            client=MockSessionClient(), user_info=MagicMock()
+        )
+        await self.tick_runtime_loop()
+
+        eventloop = self.runtime._get_async_objs().eventloop
+        with patch.object(eventloop, "call_soon_threadsafe") as call_soon_threadsafe:
+            self.runtime._enqueued_some_message(session_id)
+            self.runtime._enqueued_some_message("another_session_id")
+            self.runtime._enqueued_some_message(session_id)
+
+        call_soon_threadsafe.assert_called_once()
+        self.assertEqual(
+            [session_id, "another_session_id"],
+            self.runtime._pop_sessions_with_pending_msgs(),
+        )
+        self.assertEqual([], self.runtime._pop_sessions_with_pending_msgs())
+
+    async def test_holds_msgs_while_client_write_buffer_full(self):
+        """Test that the Runtime doesn't send messages to a client whose write
+        buffer is full, and resumes once the client has drained it.
+        """
+        await self.runtime.start()
+
+        client = MockSessionClient()
+        session_id = self.runtime.connect_session(client=client, user_info=MagicMock())
+        await self.tick_runtime_loop()
+
+        with patch.object(client, "is_write_buffer_full", return_value=True):
+            # Two Deltas for the same element: only the latter should be sent.
+            self.enqueue_forward_msg(session_id, create_dataframe_msg([1, 2, 3], 0))
+            self.enqueue_forward_msg(session_id, create_dataframe_msg([4, 5, 6], 0))
+            await self.tick_runtime_loop()
+            self.assertEqual([], client.forward_msgs)
+
+        self.runtime.handle_session_client_drained(session_id)
+        await self.tick_runtime_loop()
+
+        self.assertEqual(1, len(client.forward_msgs))
+        self.assertEqual(
+            create_dataframe_msg([4, 5, 6], 0).delta, client.forward_msgs[0].delta
+        )
+
     async def test_forwardmsg_hashing(self):
         """Test that outgoing ForwardMsgs contain hashes."""
         await self.runtime.start()
@@ -543,6 +622,53 @@ class RuntimeTest(RuntimeTestCase):
             # And the same *metadata* as msg2:
             self.assertEqual(msg2.metadata, cached.metadata)
 
+    async def test_shared_forwardmsg_encoded_once(self):
+        """Test that a message is only encoded when it's enqueued, and not again
+        on the eventloop, and that every session receives the same encoded
+        payload.
+        """
+        with patch_config_options({"global.minCachedMessageSize": 0}):
+            await self.runtime.start()
+
+            clients = [MagicMock(spec=SessionClient) for _ in range(3)]
+            for client in clients:
+                client.is_write_buffer_full.return_value = False
+            session_ids = [
+                self.runtime.connect_session(client=client, user_info=MagicMock())
+                for client in clients
+            ]
+
+            with patch(
+                "streamlit.runtime.runtime.serialize_forward_msg_payload",
+                wraps=serialize_forward_msg_payload,
+            ) as serialize_payload, patch(
+                "streamlit.runtime.app_session.serialize_forward_msg_payload",
+                wraps=serialize_forward_msg_payload,
+            ) as serialize_enqueued_payload:
+                for session_id in session_ids:
+                    self.enqueue_forward_msg(
+                        session_id, create_dataframe_msg([1, 2, 3], 1)
+                    )
+                # The loop yields between the sessions it flushes, so it may
+                # take a few ticks to reach all of them on a busy machine.
+                for _ in range(10):
+                    await self.tick_runtime_loop()
+                    if all(
+                        client.write_serialized_forward_msg.called for client in clients
+                    ):
+                        break
+
+            serialize_payload.assert_not_called()
+            self.assertEqual(len(session_ids), serialize_enqueued_payload.call_count)
+
+            payload = self.runtime.message_cache.get_payload(
+                clients[0].write_serialized_forward_msg.call_args.args[0].hash
+            )
+            self.assertIsNotNone(payload)
+            for client in clients:
+                msg_bytes = client.write_serialized_forward_msg.call_args.args[1]
+                self.assertTrue(msg_bytes.startswith(payload))
+
     async def test_forwardmsg_cache_clearing(self):
         """Test that the ForwardMsgCache gets properly cleared when scripts
         finish running.
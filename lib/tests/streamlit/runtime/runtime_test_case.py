@@ -48,7 +48,7 @@ class MockSessionManager(SessionManager):
         session_storage: SessionStorage,
         uploaded_file_manager: UploadedFileManager,
         script_cache: ScriptCache,
-        message_enqueued_callback: Optional[Callable[[], None]],
+        message_enqueued_callback: Optional[Callable[[str], None]],
     ) -> None:
         self._uploaded_file_mgr = uploaded_file_manager
         self._script_cache = script_cache
@@ -128,10 +128,9 @@ class RuntimeTestCase(IsolatedAsyncioTestCase):
         """Sleep just long enough to guarantee that the Runtime's loop
         has a chance to run.
         """
-        # Our sleep time needs to be longer than the longest sleep time inside the
-        # Runtime loop, which is 0.01 + (1 tick * number of connected sessions).
-        # 0.03 is near-instant, and conservative enough that the tick will happen
-        # under our test circumstances.
+        # The Runtime loop only yields for a tick between the sessions it
+        # flushes, so 0.03 is near-instant, and conservative enough that the
+        # tick will happen under our test circumstances.
         await asyncio.sleep(0.03)
 
     def enqueue_forward_msg(self, session_id: str, msg: ForwardMsg) -> None:
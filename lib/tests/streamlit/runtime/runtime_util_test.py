@@ -14,11 +14,24 @@
 
 """Unit tests for runtime_util.py."""
 
+import gzip
 import unittest
+from unittest.mock import patch
 
+import pandas as pd
+from parameterized import parameterized
+
+from streamlit.elements import arrow
+from streamlit.proto.Arrow_pb2 import Arrow as ArrowProto
 from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
 from streamlit.runtime import runtime_util
-from streamlit.runtime.runtime_util import is_cacheable_msg, serialize_forward_msg
+from streamlit.runtime.forward_msg_cache import serialize_forward_msg_payload
+from streamlit.runtime.runtime_util import (
+    compress_arrow_data,
+    extract_option_list,
+    is_cacheable_msg,
+    serialize_forward_msg,
+)
 from tests.streamlit.message_mocks import create_dataframe_msg
 from tests.testutil import patch_config_options
 
@@ -32,6 +45,186 @@ class RuntimeUtilTest(unittest.TestCase):
         with patch_config_options({"global.minCachedMessageSize": 1000}):
             self.assertFalse(is_cacheable_msg(create_dataframe_msg([1, 2, 3])))
 
+    def test_should_not_cache_arrow_chunks(self):
+        """The chunks of a large table are never cached."""
+        msg = ForwardMsg()
+        msg.delta.arrow_add_rows.data.data = b"some rows"
+        with patch_config_options({"global.minCachedMessageSize": 0}):
+            self.assertTrue(is_cacheable_msg(msg))
+            msg.delta.arrow_add_rows.is_chunk = True
+            self.assertFalse(is_cacheable_msg(msg))
+
+    def test_should_cache_msg_with_payload(self):
+        """is_cacheable_msg uses the payload length if the payload is given."""
+        msg = create_dataframe_msg([1, 2, 3])
+        payload = serialize_forward_msg_payload(msg)
+        with patch_config_options({"global.minCachedMessageSize": len(payload)}):
+            self.assertTrue(is_cacheable_msg(msg, payload))
+
+        with patch_config_options({"global.minCachedMessageSize": len(payload) + 1}):
+            self.assertFalse(is_cacheable_msg(msg, payload))
+
+    def test_serialize_forward_msg_roundtrip(self):
+        """The serialized payload and envelope parse back into the original msg."""
+        msg = create_dataframe_msg([1, 2, 3], 5)
+        msg.metadata.cacheable = True
+
+        deserialized_msg = ForwardMsg()
+        deserialized_msg.ParseFromString(serialize_forward_msg(msg))
+
+        self.assertNotEqual("", msg.hash)
+        self.assertEqual(msg, deserialized_msg)
+
+    def test_serialize_forward_msg_reuses_payload(self):
+        """serialize_forward_msg doesn't serialize the message body again if
+        it's given the payload.
+        """
+        msg = create_dataframe_msg([1, 2, 3])
+        payload = serialize_forward_msg_payload(msg)
+
+        with patch(
+            "streamlit.runtime.runtime_util.serialize_forward_msg_payload"
+        ) as serialize_payload:
+            msg_bytes = serialize_forward_msg(msg, payload)
+
+        serialize_payload.assert_not_called()
+        self.assertTrue(msg_bytes.startswith(payload))
+
+    def test_extract_option_list(self):
+        """A widget's large options are moved into an OptionList message, which
+        the widget refers to by hash.
+        """
+        msg = ForwardMsg()
+        msg.delta.new_element.selectbox.options[:] = ["a", "b", "c"]
+
+        with patch_config_options({"global.minCachedMessageSize": 0}):
+            option_list = extract_option_list(msg)
+
+        self.assertIsNotNone(option_list)
+        option_list_msg, payload = option_list
+        self.assertEqual(["a", "b", "c"], option_list_msg.option_list.options)
+        self.assertNotEqual("", option_list_msg.hash)
+        self.assertEqual(serialize_forward_msg_payload(option_list_msg), payload)
+
+        selectbox = msg.delta.new_element.selectbox
+        self.assertEqual([], selectbox.options)
+        self.assertEqual(option_list_msg.hash, selectbox.options_hash)
+
+    def test_extract_option_list_same_options_same_hash(self):
+        """Widgets with the same options refer to the same OptionList message."""
+        multiselect_msg = ForwardMsg()
+        multiselect_msg.delta.new_element.multiselect.options[:] = ["a", "b"]
+        radio_msg = ForwardMsg()
+        radio_msg.delta.new_element.radio.options[:] = ["a", "b"]
+
+        with patch_config_options({"global.minCachedMessageSize": 0}):
+            multiselect_option_list = extract_option_list(multiselect_msg)
+            radio_option_list = extract_option_list(radio_msg)
+
+        self.assertEqual(multiselect_option_list, radio_option_list)
+        self.assertEqual(
+            multiselect_msg.delta.new_element.multiselect.options_hash,
+            radio_msg.delta.new_element.radio.options_hash,
+        )
+
+    def test_extract_small_option_list(self):
+        """Options too small to be cached are left in the widget."""
+        msg = ForwardMsg()
+        msg.delta.new_element.selectbox.options[:] = ["a", "b", "c"]
+
+        with patch_config_options({"global.minCachedMessageSize": 1000}):
+            self.assertIsNone(extract_option_list(msg))
+
+        self.assertEqual(["a", "b", "c"], msg.delta.new_element.selectbox.options)
+        self.assertEqual("", msg.delta.new_element.selectbox.options_hash)
+
+    def test_extract_option_list_other_msg(self):
+        """Messages other than option widgets are left unchanged."""
+        msg = create_dataframe_msg([1, 2, 3])
+        msg_copy = ForwardMsg()
+        msg_copy.CopyFrom(msg)
+
+        with patch_config_options({"global.minCachedMessageSize": 0}):
+            self.assertIsNone(extract_option_list(msg))
+
+        self.assertEqual(msg_copy, msg)
+
+    @patch_config_options(
+        {
+            "server.enableArrowCompression": True,
+            "server.arrowCompressionThreshold": 0,
+        }
+    )
+    def test_compress_arrow_data(self):
+        """The Arrow data of a dataframe is gzip compressed."""
+        msg = create_dataframe_msg([1, 2, 3])
+        data = msg.delta.new_element.arrow_data_frame.data
+
+        compress_arrow_data(msg, [ArrowProto.DataCompression.GZIP])
+
+        arrow_proto = msg.delta.new_element.arrow_data_frame
+        self.assertEqual(ArrowProto.DataCompression.GZIP, arrow_proto.data_compression)
+        self.assertEqual(data, gzip.decompress(arrow_proto.data))
+
+        # Compressing the same data again gives the same bytes, so that the
+        # message still has the same hash:
+        other_msg = create_dataframe_msg([1, 2, 3])
+        compress_arrow_data(other_msg, [ArrowProto.DataCompression.GZIP])
+        self.assertEqual(msg, other_msg)
+
+    @patch_config_options(
+        {
+            "server.enableArrowCompression": True,
+            "server.arrowCompressionThreshold": 0,
+        }
+    )
+    def test_compress_arrow_data_of_chart_and_added_rows(self):
+        """The Arrow data and datasets of charts, and added rows, are compressed."""
+        chart_msg = ForwardMsg()
+        chart = chart_msg.delta.new_element.arrow_vega_lite_chart
+        arrow.marshall(chart.data, pd.DataFrame({"a": [1, 2]}))
+        arrow.marshall(chart.datasets.add().data, pd.DataFrame({"b": [3, 4]}))
+        add_rows_msg = ForwardMsg()
+        arrow.marshall(add_rows_msg.delta.arrow_add_rows.data, pd.DataFrame([5]))
+
+        compress_arrow_data(chart_msg, [ArrowProto.DataCompression.GZIP])
+        compress_arrow_data(add_rows_msg, [ArrowProto.DataCompression.GZIP])
+
+        self.assertEqual(
+            [ArrowProto.DataCompression.GZIP] * 3,
+            [
+                chart.data.data_compression,
+                chart.datasets[0].data.data_compression,
+                add_rows_msg.delta.arrow_add_rows.data.data_compression,
+            ],
+        )
+
+    @parameterized.expand(
+        [
+            ("disabled", False, 0, [ArrowProto.DataCompression.GZIP]),
+            ("too small", True, 1_000_000, [ArrowProto.DataCompression.GZIP]),
+            ("unsupported by client", True, 0, []),
+        ]
+    )
+    def test_dont_compress_arrow_data(
+        self, _name: str, enabled: bool, threshold: int, supported_compressions
+    ):
+        """Arrow data is left uncompressed if compression is disabled, the data is
+        smaller than the threshold, or the client can't decompress it."""
+        msg = create_dataframe_msg([1, 2, 3])
+        msg_copy = ForwardMsg()
+        msg_copy.CopyFrom(msg)
+
+        with patch_config_options(
+            {
+                "server.enableArrowCompression": enabled,
+                "server.arrowCompressionThreshold": threshold,
+            }
+        ):
+            compress_arrow_data(msg, supported_compressions)
+
+        self.assertEqual(msg_copy, msg)
+
     def test_should_limit_msg_size(self):
         max_message_size_mb = 50
 
@@ -204,6 +204,22 @@ class ScriptRequestsTest(unittest.TestCase):
         reqs.request_rerun(RerunData(fragment_id_queue=[]))
         self.assertEqual(reqs._rerun_data.fragment_id_queue, [])
 
+    def test_is_stop_or_rerun_requested(self):
+        """Only STOP requests and RERUN requests of the full script interrupt
+        the script."""
+        reqs = ScriptRequests()
+        self.assertFalse(reqs.is_stop_or_rerun_requested())
+
+        reqs.request_rerun(RerunData(fragment_id_queue=["my_fragment_id"]))
+        self.assertFalse(reqs.is_stop_or_rerun_requested())
+
+        reqs.request_rerun(RerunData())
+        self.assertTrue(reqs.is_stop_or_rerun_requested())
+
+        reqs = ScriptRequests()
+        reqs.request_stop()
+        self.assertTrue(reqs.is_stop_or_rerun_requested())
+
     def test_on_script_yield_with_no_request(self):
         """Return None; remain in the CONTINUE state."""
         reqs = ScriptRequests()
@@ -315,6 +315,28 @@ class WidgetHelperTests(unittest.TestCase):
         id = compute_widget_id("button", label="the label")
         assert id.startswith(GENERATED_WIDGET_ID_PREFIX)
 
+    def test_compute_widget_id_is_stable(self):
+        kwargs = dict(label="the label", options=["a", "b"], data=b"\x00\x01")
+        assert compute_widget_id("multiselect", **kwargs) == compute_widget_id(
+            "multiselect", **kwargs
+        )
+
+    def test_compute_widget_id_distinguishes_arguments(self):
+        """Arguments whose concatenated representations are the same produce
+        different ids."""
+        ids = {
+            compute_widget_id("multiselect", options=["a", "bc"]),
+            compute_widget_id("multiselect", options=["ab", "c"]),
+            compute_widget_id("multiselect", options=["abc"]),
+            compute_widget_id("multiselect", options="abc"),
+            compute_widget_id("multiselect", options=b"abc"),
+            compute_widget_id("multiselect", options=["a", 1]),
+            compute_widget_id("multiselect", options=["a", "1"]),
+            compute_widget_id("multiselect", options=[], default="a"),
+            compute_widget_id("multiselect", options=["a"], default=""),
+        }
+        assert len(ids) == 9
+
 
 class ComputeWidgetIdTests(DeltaGeneratorTestCase):
     """Enforce that new arguments added to the signature of a widget function are taken
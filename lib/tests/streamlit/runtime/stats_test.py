@@ -107,3 +107,19 @@ class StatsManagerTest(unittest.TestCase):
                 CacheStat("provider3", "boo", 7),
             },
         )
+
+    def test_group_stats_sums_evictions(self):
+        """Should sum the evictions of grouped stats."""
+        stats = [
+            CacheStat("provider1", "foo", 1),
+            CacheStat("provider1", "foo", 0, evictions=2),
+            CacheStat("provider1", "bar", 2),
+        ]
+
+        self.assertEqual(
+            set(group_stats(stats)),
+            {
+                CacheStat("provider1", "foo", 1, evictions=2),
+                CacheStat("provider1", "bar", 2),
+            },
+        )
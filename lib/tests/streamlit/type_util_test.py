@@ -316,6 +316,27 @@ class TypeUtilTest(unittest.TestCase):
         assert isinstance(converted, pd.DataFrame)
         assert converted.empty
 
+    def test_convert_anything_to_df_non_tabular_arrow_streams(self):
+        """Test that Arrow objects which stream a single column are converted
+        through pandas, instead of being read as a table."""
+        chunked_array = pa.chunked_array([[1, 2]])
+        assert not type_util.is_arrow_data_object(chunked_array)
+        pd.testing.assert_series_equal(
+            type_util.convert_anything_to_df(chunked_array), pd.Series([1, 2])
+        )
+
+        class ColumnStream:
+            def __arrow_c_stream__(self, requested_schema=None):
+                return chunked_array.__arrow_c_stream__(requested_schema)
+
+            def to_pandas(self):
+                return chunked_array.to_pandas()
+
+        pd.testing.assert_frame_equal(
+            type_util.convert_anything_to_df(ColumnStream()),
+            pd.Series([1, 2]).to_frame(),
+        )
+
     @parameterized.expand(
         [
             # Complex numbers:
@@ -615,6 +636,7 @@ class TypeUtilTest(unittest.TestCase):
                 type_util.DataFormat.PANDAS_STYLER,
                 type_util.DataFormat.SNOWPANDAS_OBJECT,
                 type_util.DataFormat.MODIN_OBJECT,
+                type_util.DataFormat.ARROW_OBJECT,
                 type_util.DataFormat.EMPTY,
             ]:
                 assert isinstance(converted_data, pd.DataFrame)
@@ -738,6 +760,101 @@ class TypeUtilTest(unittest.TestCase):
         l = type_util.ensure_indexable(StrOpt)
         self.assertEqual(list(StrOpt), l)
 
+    @parameterized.expand(
+        [
+            ("range index", pd.RangeIndex(10, 110, 2)),
+            ("int index", pd.Index(range(50, 0, -1))),
+        ]
+    )
+    def test_pyarrow_table_to_bytes_chunks(self, _, index):
+        """Test that a table is split into chunks of about the given size,
+        which restore the table and its index when they are appended."""
+        df = pd.DataFrame({"a": range(50), "b": [float(i) for i in range(50)]})
+        df.index = index
+        table = pa.Table.from_pandas(df)
+
+        chunks = list(type_util.pyarrow_table_to_bytes_chunks(table, table.nbytes // 5))
+
+        self.assertEqual(len(chunks), 5)
+        pd.testing.assert_frame_equal(
+            pd.concat(type_util.bytes_to_data_frame(chunk) for chunk in chunks),
+            df,
+            check_index_type=False,
+        )
+
+    def test_pyarrow_table_to_bytes_chunks_empty_table(self):
+        """Test that an empty table is serialized as a single chunk."""
+        table = pa.Table.from_pandas(pd.DataFrame({"a": []}))
+
+        chunks = list(type_util.pyarrow_table_to_bytes_chunks(table, 100))
+
+        self.assertEqual(len(chunks), 1)
+        self.assertEqual(type_util.bytes_to_data_frame(chunks[0]).shape, (0, 1))
+
+    def test_pyarrow_table_to_streamed_rows_bytes(self):
+        """Test that the schema of streamed rows is only sent if it changes,
+        regardless of the bounds of their RangeIndex."""
+        first_table = pa.Table.from_pandas(pd.DataFrame({"a": [1, 2]}))
+        second_table = pa.Table.from_pandas(
+            pd.DataFrame({"a": [3, 4]}, index=pd.RangeIndex(2, 4))
+        )
+        other_table = pa.Table.from_pandas(pd.DataFrame({"a": [5.0]}))
+
+        (
+            first_bytes,
+            schema,
+            schema_omitted,
+        ) = type_util.pyarrow_table_to_streamed_rows_bytes(first_table, 10, None)
+        self.assertFalse(schema_omitted)
+        pd.testing.assert_frame_equal(
+            type_util.bytes_to_data_frame(first_bytes), first_table.to_pandas()
+        )
+
+        (
+            second_bytes,
+            second_schema,
+            schema_omitted,
+        ) = type_util.pyarrow_table_to_streamed_rows_bytes(second_table, 10, schema)
+        self.assertTrue(schema_omitted)
+        self.assertEqual(second_schema, schema)
+        # The record batches are read with the schema sent before.
+        self.assertEqual(
+            pa.ipc.open_stream(first_bytes + second_bytes).read_all()["a"].to_pylist(),
+            [1, 2, 3, 4],
+        )
+
+        (
+            _,
+            other_schema,
+            schema_omitted,
+        ) = type_util.pyarrow_table_to_streamed_rows_bytes(other_table, 10, schema)
+        self.assertFalse(schema_omitted)
+        self.assertNotEqual(other_schema, schema)
+
+    def test_pyarrow_table_to_streamed_rows_bytes_max_rows(self):
+        """Test that only the last max_rows rows are serialized."""
+        table = pa.Table.from_pandas(pd.DataFrame({"a": range(10)}))
+
+        data, _, _ = type_util.pyarrow_table_to_streamed_rows_bytes(table, 3, None)
+
+        pd.testing.assert_frame_equal(
+            type_util.bytes_to_data_frame(data),
+            pd.DataFrame({"a": [7, 8, 9]}, index=pd.RangeIndex(7, 10)),
+        )
+
+    def test_pyarrow_table_to_streamed_rows_bytes_dictionary(self):
+        """Test that the schema of dictionary-encoded rows is always sent."""
+        table = pa.Table.from_pandas(pd.DataFrame({"a": pd.Categorical(["x", "y"])}))
+
+        _, schema, _ = type_util.pyarrow_table_to_streamed_rows_bytes(table, 10, None)
+        data, _, schema_omitted = type_util.pyarrow_table_to_streamed_rows_bytes(
+            table, 10, schema
+        )
+
+        self.assertIsNone(schema)
+        self.assertFalse(schema_omitted)
+        self.assertEqual(type_util.bytes_to_data_frame(data)["a"].tolist(), ["x", "y"])
+
 
 class TestArrowTruncation(DeltaGeneratorTestCase):
     """Test class for the automatic arrow truncation feature."""
@@ -820,6 +937,71 @@ class TestArrowTruncation(DeltaGeneratorTestCase):
         self.assertEqual(truncated_table.nbytes, original_table.nbytes)
         self.assertEqual(truncated_table.num_rows, original_table.num_rows)
 
+    @parameterized.expand(
+        [
+            ("head", list(range(125000))),
+            # The index is stored in a column, so rows take up 16 bytes:
+            ("headTail", list(range(31250)) + list(range(168750, 200000))),
+            ("sample", [round(i * 199999 / 62499) for i in range(62500)]),
+        ]
+    )
+    def test_truncation_modes(self, mode, expected_index):
+        """Test that each truncation mode keeps as many rows as fit into the
+        max message size, along with their index values."""
+        # 8 bytes per row, and 1 MB for the table after the message overhead:
+        original_df = pd.DataFrame({"col 1": range(200000)})
+
+        with patch_config_options(
+            {
+                "server.maxMessageSize": 2,
+                "server.enableArrowTruncation": True,
+                "server.arrowTruncationMode": mode,
+            }
+        ):
+            truncated_table = type_util._maybe_truncate_table(
+                pa.Table.from_pandas(original_df)
+            )
+
+        truncated_df = truncated_table.to_pandas()
+        self.assertEqual(truncated_df.index.to_list(), expected_index)
+        self.assertEqual(truncated_df["col 1"].to_list(), expected_index)
+
+        el = self.get_delta_from_queue().new_element
+        self.assertIn("due to data size limitations", el.markdown.body)
+
+    @patch_config_options(
+        {"server.maxMessageSize": 2, "server.enableArrowTruncation": True}
+    )
+    def test_truncate_string_table(self):
+        """Test that the row sizes of string columns are computed from the
+        lengths of their values."""
+        # The first rows are much larger than the last ones:
+        original_df = pd.DataFrame(
+            {"col 1": ["x" * 1000] * 500 + ["x"] * 100000, "col 2": 1.0}
+        )
+
+        truncated_table = type_util._maybe_truncate_table(
+            pa.Table.from_pandas(original_df)
+        )
+
+        # 1012 bytes for each large row, and 13 bytes for each small row:
+        self.assertEqual(truncated_table.num_rows, 500 + (1000000 - 500 * 1012) // 13)
+        self.assertLessEqual(truncated_table.nbytes, 1000000)
+
+    @patch_config_options(
+        {
+            "server.maxMessageSize": 2,
+            "server.enableArrowTruncation": True,
+            "server.arrowTruncationMode": "invalid",
+        }
+    )
+    def test_invalid_truncation_mode(self):
+        """Test that an invalid truncation mode raises an exception."""
+        original_df = pd.DataFrame({"col 1": range(200000)})
+
+        with self.assertRaises(StreamlitAPIException):
+            type_util._maybe_truncate_table(pa.Table.from_pandas(original_df))
+
     @patch_config_options(
         {"server.maxMessageSize": 3, "server.enableArrowTruncation": True}
     )
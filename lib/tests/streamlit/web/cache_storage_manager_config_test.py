@@ -0,0 +1,40 @@
+# Copyright (c) Streamlit Inc. (2018-2022) Snowflake Inc. (2022-2024)
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import unittest
+
+from streamlit.runtime.caching.storage.local_disk_cache_storage import (
+    LocalDiskCacheStorageManager,
+)
+from streamlit.runtime.caching.storage.shared_cache_storage import (
+    SharedCacheStorageManager,
+)
+from streamlit.web.cache_storage_manager_config import (
+    create_default_cache_storage_manager,
+)
+from tests.testutil import patch_config_options
+
+
+class CreateDefaultCacheStorageManagerTest(unittest.TestCase):
+    def test_local_by_default(self):
+        self.assertIsInstance(
+            create_default_cache_storage_manager(), LocalDiskCacheStorageManager
+        )
+
+    @patch_config_options({"runner.sharedCachePath": "shared/cache.db"})
+    def test_shared_cache_path(self):
+        manager = create_default_cache_storage_manager()
+        self.assertIsInstance(manager, SharedCacheStorageManager)
+        self.assertEqual(manager.path, os.path.abspath("shared/cache.db"))
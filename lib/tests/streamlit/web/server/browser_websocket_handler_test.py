@@ -12,8 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 from unittest.mock import ANY, MagicMock, patch
 
+import tornado.concurrent
 import tornado.httpserver
 import tornado.testing
 import tornado.web
@@ -92,6 +94,49 @@ class BrowserWebSocketHandlerTest(ServerTestCase):
 
                 write_message_mock.assert_called_once()
 
+    @patch_config_options({"server.maxWebsocketBufferSize": 1})
+    @tornado.testing.gen_test
+    async def test_write_buffer_backpressure(self):
+        """The handler should report a full write buffer while too many bytes
+        are waiting to be written, and tell the Runtime once they've drained.
+        """
+        with self._patch_app_session():
+            await self.server.start()
+            await self.ws_connect()
+
+            session_info = self.server._runtime._session_mgr.list_active_sessions()[0]
+            websocket_handler: BrowserWebSocketHandler = session_info.client
+
+            mock_runtime = MagicMock(spec=Runtime)
+            websocket_handler._runtime = mock_runtime
+
+            # Writes only complete when we resolve their futures.
+            pending_writes = []
+
+            def write_message(*args, **kwargs):
+                future = tornado.concurrent.Future()
+                pending_writes.append(future)
+                return future
+
+            with patch.object(websocket_handler, "write_message", write_message):
+                websocket_handler.write_serialized_forward_msg(
+                    ForwardMsg(), b"x" * 600_000
+                )
+                self.assertFalse(websocket_handler.is_write_buffer_full())
+                websocket_handler.write_serialized_forward_msg(
+                    ForwardMsg(), b"x" * 600_000
+                )
+                self.assertTrue(websocket_handler.is_write_buffer_full())
+
+            pending_writes[0].set_result(None)
+            # Let the Future's done callbacks run.
+            await asyncio.sleep(0)
+
+            self.assertFalse(websocket_handler.is_write_buffer_full())
+            mock_runtime.handle_session_client_drained.assert_called_once_with(
+                websocket_handler._session_id
+            )
+
     @tornado.testing.gen_test
     async def test_backmsg_deserialization_exception(self):
         """If BackMsg deserialization raises an Exception, we should call the Runtime's
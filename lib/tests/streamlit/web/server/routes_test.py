@@ -17,21 +17,27 @@ import os
 import tempfile
 from unittest.mock import MagicMock
 
+import pandas as pd
+import pyarrow as pa
 import tornado.httpserver
 import tornado.testing
 import tornado.web
 import tornado.websocket
 
 from streamlit.runtime.forward_msg_cache import ForwardMsgCache, populate_hash_if_needed
+from streamlit.runtime.paged_table_manager import PagedTableManager
 from streamlit.runtime.runtime_util import serialize_forward_msg
+from streamlit.type_util import bytes_to_data_frame
 from streamlit.web.server.routes import _DEFAULT_ALLOWED_MESSAGE_ORIGINS
 from streamlit.web.server.server import (
     HEALTH_ENDPOINT,
     HOST_CONFIG_ENDPOINT,
     MESSAGE_ENDPOINT,
+    TABLE_ENDPOINT,
     HealthHandler,
     HostConfigHandler,
     MessageCacheHandler,
+    PagedTableHandler,
     StaticFileHandler,
 )
 from tests.streamlit.message_mocks import create_dataframe_msg
@@ -121,6 +127,45 @@ class MessageCacheHandlerTest(tornado.testing.AsyncHTTPTestCase):
         self.assertEqual(404, self.fetch("/_stcore/message?id=non_existent").code)
 
 
+class PagedTableHandlerTest(tornado.testing.AsyncHTTPTestCase):
+    def get_app(self):
+        self._paged_table_mgr = PagedTableManager()
+        return tornado.web.Application(
+            [
+                (
+                    rf"/{TABLE_ENDPOINT}",
+                    PagedTableHandler,
+                    dict(paged_table_mgr=self._paged_table_mgr),
+                )
+            ]
+        )
+
+    def test_paged_table(self):
+        df = pd.DataFrame({"a": [3, 1, 2]})
+        table_id = self._paged_table_mgr.add(
+            pa.Table.from_pandas(df, preserve_index=True), "1.2"
+        )
+
+        response = self.fetch(f"/_stcore/table?id={table_id}&start=1&end=3")
+        self.assertEqual(200, response.code)
+        self.assertEqual(bytes_to_data_frame(response.body)["a"].to_list(), [1, 2])
+
+        response = self.fetch(
+            f"/_stcore/table?id={table_id}&start=0&end=2"
+            "&sort_column=1&ascending=false"
+        )
+        self.assertEqual(200, response.code)
+        self.assertEqual(bytes_to_data_frame(response.body)["a"].to_list(), [3, 2])
+
+        # Invalid requests
+        self.assertEqual(400, self.fetch("/_stcore/table?id=x&start=0").code)
+        self.assertEqual(400, self.fetch("/_stcore/table?id=x&start=a&end=1").code)
+        self.assertEqual(404, self.fetch("/_stcore/table?id=x&start=0&end=1").code)
+        self.assertEqual(
+            404, self.fetch(f"/_stcore/table?id={table_id}&start=2&end=1").code
+        )
+
+
 class StaticFileHandlerTest(tornado.testing.AsyncHTTPTestCase):
     def setUp(self) -> None:
         self._tmpdir = tempfile.TemporaryDirectory()
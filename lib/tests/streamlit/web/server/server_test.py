@@ -238,12 +238,15 @@ class ServerTest(ServerTestCase):
             session_info = self.server._runtime._session_mgr.list_active_sessions()[0]
 
             with patch.object(
-                session_info.session, "flush_browser_queue"
+                session_info.session, "flush_browser_queue_with_payloads"
             ) as flush_browser_queue, patch.object(
                 session_info.client, "write_message"
             ) as ws_write_message:
-                # Patch flush_browser_queue to simulate a pending message.
-                flush_browser_queue.return_value = [create_dataframe_msg([1, 2, 3])]
+                # Patch flush_browser_queue_with_payloads to simulate a pending
+                # message.
+                flush_browser_queue.return_value = [
+                    (create_dataframe_msg([1, 2, 3]), None)
+                ]
 
                 # Patch the session's WebsocketHandler to raise a
                 # WebSocketClosedError when we write to it.
@@ -253,7 +256,7 @@ class ServerTest(ServerTestCase):
                 # and the Websocket client's write_message will be called,
                 # raising our WebSocketClosedError.
                 while not flush_browser_queue.called:
-                    self.server._runtime._get_async_objs().need_send_data.set()
+                    self.server._runtime._enqueued_some_message(session_info.session.id)
                     await asyncio.sleep(0)
 
                 flush_browser_queue.assert_called_once()
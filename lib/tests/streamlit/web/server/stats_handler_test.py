@@ -95,6 +95,40 @@ class StatsHandlerTest(tornado.testing.AsyncHTTPTestCase):
 
         self.assertEqual(expected_body, response.body)
 
+    def test_has_eviction_stats(self):
+        """Caches that have evicted entries get a cache_evictions counter."""
+        self.mock_stats = [
+            CacheStat(
+                category_name="st_cache_data",
+                cache_name="foo",
+                byte_length=128,
+                evictions=3,
+            ),
+            CacheStat(
+                category_name="st_cache_data",
+                cache_name="bar",
+                byte_length=256,
+            ),
+        ]
+
+        response = self.fetch("/_stcore/metrics")
+        self.assertEqual(200, response.code)
+
+        expected_body = (
+            "# TYPE cache_memory_bytes gauge\n"
+            "# UNIT cache_memory_bytes bytes\n"
+            "# HELP Total memory consumed by a cache.\n"
+            'cache_memory_bytes{cache_type="st_cache_data",cache="foo"} 128\n'
+            'cache_memory_bytes{cache_type="st_cache_data",cache="bar"} 256\n'
+            "# TYPE cache_evictions counter\n"
+            "# HELP Number of entries removed from a cache to stay within its "
+            "size limits.\n"
+            'cache_evictions_total{cache_type="st_cache_data",cache="foo"} 3\n'
+            "# EOF\n"
+        ).encode("utf-8")
+
+        self.assertEqual(expected_body, response.body)
+
     def test_new_metrics_endpoint_should_not_display_deprecation_warning(self):
         response = self.fetch("/_stcore/metrics")
         self.assertNotIn("link", response.headers)